@@ -14,9 +14,8 @@ except Exception as e:
     traceback.print_exc(file=sys.stderr)
     raise
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from sqlalchemy.ext.asyncio import AsyncSession
-import pandas as pd
 import numpy as np
 import uuid
 import json
@@ -24,10 +23,9 @@ import logging
 from pathlib import Path
 from collections import Counter
 import os
-from sklearn.preprocessing import StandardScaler
-from sklearn.neighbors import NearestNeighbors
-from sklearn.cluster import KMeans
-from sklearn.metrics import pairwise_distances
+
+if TYPE_CHECKING:
+    import pandas as pd  # 런타임에는 사용하는 엔드포인트 안에서 import (서버 시작 시간 단축)
 
 try:
     from app.db.session import get_session
@@ -41,54 +39,15 @@ except Exception as e:
     traceback.print_exc(file=sys.stderr)
     raise
 
-try:
-    from app.clustering.integrated_pipeline import IntegratedClusteringPipeline
-except Exception as e:
-    traceback.print_exc(file=sys.stderr)
-    raise
-
-try:
-    from app.clustering.data_preprocessor import preprocess_for_clustering
-except Exception as e:
-    traceback.print_exc(file=sys.stderr)
-    raise
-
-try:
-    from app.clustering.filters.panel_filter import PanelFilter
-except Exception as e:
-    traceback.print_exc(file=sys.stderr)
-    raise
-
-try:
-    from app.clustering.processors.vector_processor import VectorProcessor
-except Exception as e:
-    traceback.print_exc(file=sys.stderr)
-    raise
-
-try:
-    from app.clustering.algorithms.kmeans import KMeansAlgorithm
-except Exception as e:
-    traceback.print_exc(file=sys.stderr)
-    raise
-
-try:
-    from app.clustering.algorithms.minibatch_kmeans import MiniBatchKMeansAlgorithm
-except Exception as e:
-    traceback.print_exc(file=sys.stderr)
-    raise
-
-try:
-    from app.clustering.algorithms.hdbscan import HDBSCANAlgorithm
-except Exception as e:
-    traceback.print_exc(file=sys.stderr)
-    raise
-
 try:
     from app.clustering.artifacts import save_artifacts, new_session_dir
 except Exception as e:
     traceback.print_exc(file=sys.stderr)
     raise
 
+# ⭐ sklearn을 가져오는 모듈(integrated_pipeline, data_preprocessor, vector_processor, kmeans, minibatch_kmeans, hdbscan)과
+# pandas(filters.panel_filter 포함)는 서버 시작 시간을 줄이기 위해 사용하는 엔드포인트 안에서 import
+
 try:
     router = APIRouter(prefix="/api/clustering", tags=["clustering"])
 except Exception as e:
@@ -245,6 +204,7 @@ async def cluster_from_csv(
             panel_data = df_raw.to_dict('records')
             logger.info(f"[전처리] dict 변환 완료: {len(panel_data)}개 레코드")
             
+            from app.clustering.data_preprocessor import preprocess_for_clustering
             df = preprocess_for_clustering(panel_data, verbose=False)
             logger.info(f"[전처리 완료] 전처리된 데이터 행 수: {len(df)}, 열 수: {len(df.columns) if len(df) > 0 else 0}")
             if len(df) > 0:
@@ -316,12 +276,20 @@ async def cluster_from_csv(
 
 
 async def _execute_clustering(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     req: ClusterRequest,
     debug_info: Dict[str, Any],
     logger: logging.Logger
 ):
     """공통 클러스터링 실행 로직"""
+    import pandas as pd
+    from app.clustering.filters.panel_filter import PanelFilter
+    from app.clustering.integrated_pipeline import IntegratedClusteringPipeline
+    from app.clustering.processors.vector_processor import VectorProcessor
+    from app.clustering.algorithms.kmeans import KMeansAlgorithm
+    from app.clustering.algorithms.minibatch_kmeans import MiniBatchKMeansAlgorithm
+    from app.clustering.algorithms.hdbscan import HDBSCANAlgorithm
+
     # 3. 알고리즘 선택
     algorithm = None
     if req.algo != "auto":
@@ -547,6 +515,7 @@ async def cluster_panels(
         
         # 2. 데이터 전처리 (원시 데이터 -> 클러스터링용 DataFrame)
         try:
+            from app.clustering.data_preprocessor import preprocess_for_clustering
             df = preprocess_for_clustering(panel_data, verbose=False)
             logger.info(f"[전처리 완료] 전처리된 데이터 행 수: {len(df)}, 열 수: {len(df.columns) if len(df) > 0 else 0}")
             debug_info['preprocessed_data_count'] = len(df)
@@ -864,6 +833,7 @@ async def get_panel_cluster_mapping(req: PanelClusterMappingRequest):
     """
     검색된 패널 ID들의 클러스터 매핑 정보 반환
     """
+    import pandas as pd
     logger = logging.getLogger(__name__)
     
     try:
@@ -1139,6 +1109,7 @@ async def load_full_data_cached_from_db():
         - available_features: 사용 가능한 피처 리스트
         - scaler: StandardScaler 객체
     """
+    import pandas as pd
     logger = logging.getLogger(__name__)
     logger.info(f"[데이터 로드] NeonDB에서 데이터 로드 시작")
     
@@ -1248,6 +1219,8 @@ async def load_full_data_cached_from_db():
     if len(available_features) < 3:
         raise ValueError(f"숫자형 피처가 부족합니다: {len(available_features)}개 (최소 3개 필요)")
     
+    from sklearn.preprocessing import StandardScaler
+
     X = df[available_features].fillna(df[available_features].mean()).values
     scaler = StandardScaler()
     X_scaled = scaler.fit_transform(X)
@@ -1341,39 +1314,24 @@ async def cluster_around_search(req: ClusterAroundSearchRequest):
         # 1. Precomputed HDBSCAN 데이터 로드 (NeonDB에서 조회)
         # ✅ 최적화: 원본 데이터 로드 불필요, Precomputed UMAP 좌표와 클러스터 매핑만 사용
         logger.info(f"[1단계] Precomputed 데이터 로드 시작 (NeonDB)")
-        from app.utils.clustering_loader import get_precomputed_session_id, load_umap_coordinates_from_db, load_panel_cluster_mappings_from_db
+        from app.utils.clustering_loader import load_precomputed_bundle
         
-        # Precomputed 세션 ID 조회
+        # 세션 메타데이터 + UMAP 좌표/클러스터 번들 (한 연결, 버전이 같으면 프로세스 캐시)
         precomputed_name = "hdbscan_default"
-        session_id = await get_precomputed_session_id(precomputed_name)
+        bundle = await load_precomputed_bundle(precomputed_name)
         
-        if not session_id:
-            error_msg = f"Precomputed 세션을 찾을 수 없습니다: name={precomputed_name}. NeonDB에 데이터가 마이그레이션되었는지 확인하세요."
+        if bundle is None:
+            error_msg = f"Precomputed 세션 또는 UMAP 좌표를 찾을 수 없습니다: name={precomputed_name}. NeonDB에 데이터가 마이그레이션되었는지 확인하세요."
             logger.error(f"[확장 클러스터링] {error_msg}")
             raise HTTPException(status_code=404, detail=error_msg)
         
+        session_id = bundle.session_id
         logger.info(f"[확장 클러스터링] Precomputed 세션 ID 찾음: {session_id}")
         
-        # UMAP 좌표 로드
-        umap_df = await load_umap_coordinates_from_db(session_id)
-        if umap_df is None or umap_df.empty:
-            error_msg = f"NeonDB에서 UMAP 좌표를 찾을 수 없습니다: session_id={session_id}"
-            logger.error(f"[확장 클러스터링] {error_msg}")
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        # 클러스터 매핑 로드
-        cluster_df = await load_panel_cluster_mappings_from_db(session_id)
-        if cluster_df is None or cluster_df.empty:
+        # 모든 UMAP 좌표 사용 (클러스터 매핑이 없는 패널은 -1)
+        if bundle.n_mapped == 0:
             logger.warning(f"[확장 클러스터링] 클러스터 매핑 데이터 없음, -1로 설정")
-            cluster_df = pd.DataFrame(columns=['mb_sn', 'cluster'])
-        
-        # 데이터 병합
-        if not cluster_df.empty:
-            df_precomputed = umap_df.merge(cluster_df, on='mb_sn', how='left')
-            df_precomputed['cluster'] = df_precomputed['cluster'].fillna(-1).astype(int)
-        else:
-            df_precomputed = umap_df.copy()
-            df_precomputed['cluster'] = -1
+        df_precomputed = bundle.to_frame(mapped_only=False)
         
         logger.info(f"[확장 클러스터링] Precomputed 데이터 로드 완료: {len(df_precomputed)}행")
         
@@ -1382,34 +1340,47 @@ async def cluster_around_search(req: ClusterAroundSearchRequest):
         logger.info(f"  - 요청된 패널 ID 수: {len(req.search_panel_ids)}개")
         logger.info(f"  - 요청된 패널 ID 샘플: {req.search_panel_ids[:5]}")
         
-        # df_precomputed의 mb_sn을 정규화하여 매칭 테이블 생성
-        df_precomputed['mb_sn_normalized'] = df_precomputed['mb_sn'].astype(str).str.strip().str.lower()
-        precomputed_panel_set = set(df_precomputed['mb_sn_normalized'].unique())
+        # ⭐ mb_sn을 프로세스 전역 int32 ID로 변환 (이후 매칭/클러스터 확장은 정수 배열 연산, 문자열은 응답 직전에만 사용)
+        from app.services.panel_id_registry import get_panel_id_registry, normalize_mb_sn
+        from app.utils.cluster_response import cluster_stats as cluster_stats_by_label
+        registry = get_panel_id_registry()
+        df_precomputed['panel_idx'] = registry.encode(df_precomputed['mb_sn'], intern=True)
+        precomputed_ids = df_precomputed['panel_idx'].to_numpy()
+        precomputed_id_set = np.unique(precomputed_ids)
+        
+        logger.info(f"[2단계] Precomputed 데이터 패널 수: {len(precomputed_id_set)}개")
+        logger.info(f"[2단계] Precomputed 패널 ID 샘플: {registry.decode(precomputed_id_set[:10])}")
         
-        logger.info(f"[2단계] Precomputed 데이터 패널 수: {len(precomputed_panel_set)}개")
-        logger.info(f"[2단계] Precomputed 패널 ID 샘플: {list(precomputed_panel_set)[:10]}")
+        # 검색된 패널 ID 변환 (정확히 일치하는 패널은 np.isin으로 한 번에 매칭)
+        requested_ids = registry.encode(req.search_panel_ids)
+        exact_found = np.isin(requested_ids, precomputed_id_set)
         
-        # 검색된 패널의 mb_sn 추출 (정규화)
-        search_panel_mb_sns = set()
+        search_panel_ids = set(requested_ids[exact_found].tolist())
         not_found_panels = []
         found_panels = []
+        found_exact_ids = []  # 정확히 일치한 검색 패널 ID (요청 순서, 5단계 결과 구성용)
+        found_panels_exact = []  # 정확히 일치한 검색 패널 (요청 값 그대로, 5단계 결과 구성용)
+        precomputed_panel_names = None  # 부분 매칭이 필요할 때만 문자열 목록 생성
         
-        for panel_id in req.search_panel_ids:
-            panel_id_normalized = str(panel_id).strip().lower()
+        for panel_id, panel_idx, is_exact in zip(req.search_panel_ids, requested_ids.tolist(), exact_found.tolist()):
+            if is_exact:
+                found_panels.append(panel_id)
+                found_panels_exact.append(panel_id)
+                found_exact_ids.append(panel_idx)
+                continue
+            
+            # 부분 매칭 시도 (앞 10자리만 비교)
+            if precomputed_panel_names is None:
+                precomputed_panel_names = registry.decode(precomputed_id_set)
+            panel_id_normalized = normalize_mb_sn(panel_id)
+            panel_id_prefix = panel_id_normalized[:10] if len(panel_id_normalized) > 10 else panel_id_normalized
+            matching_panels = [p for p in precomputed_panel_names if panel_id_prefix in p or p in panel_id_prefix]
             
-            if panel_id_normalized in precomputed_panel_set:
-                search_panel_mb_sns.add(panel_id_normalized)
+            if matching_panels:
+                search_panel_ids.add(registry.intern(matching_panels[0]))
                 found_panels.append(panel_id)
             else:
-                # 부분 매칭 시도 (앞 10자리만 비교)
-                panel_id_prefix = panel_id_normalized[:10] if len(panel_id_normalized) > 10 else panel_id_normalized
-                matching_panels = [p for p in precomputed_panel_set if panel_id_prefix in p or p in panel_id_prefix]
-                
-                if matching_panels:
-                    search_panel_mb_sns.add(matching_panels[0])
-                    found_panels.append(panel_id)
-                else:
-                    not_found_panels.append(panel_id)
+                not_found_panels.append(panel_id)
         
         logger.info(f"[2단계 결과]")
         logger.info(f"  - 찾은 패널: {len(found_panels)}개")
@@ -1419,49 +1390,43 @@ async def cluster_around_search(req: ClusterAroundSearchRequest):
             logger.warning(f"  - 찾지 못한 패널 샘플: {not_found_panels[:5]}")
         
         # 매칭 실패 시 전체 precomputed 데이터 반환
-        if len(search_panel_mb_sns) == 0:
+        if len(search_panel_ids) == 0:
             logger.warning(f"[⚠️ 2단계] 모든 패널을 찾지 못함 - 전체 precomputed 데이터 반환")
-            requested_set = set(str(pid).strip().lower() for pid in req.search_panel_ids)
-            common = requested_set & precomputed_panel_set
+            requested_set = set(normalize_mb_sn(pid) for pid in req.search_panel_ids)
+            common_count = int(np.isin(precomputed_id_set, requested_ids).sum())
             
             logger.warning(f"  - 요청된 ID 수: {len(requested_set)}")
-            logger.warning(f"  - Precomputed 데이터 ID 수: {len(precomputed_panel_set)}")
-            logger.warning(f"  - 겹치는 ID 수: {len(common)}")
-            logger.warning(f"  - 겹치지 않는 요청 ID 샘플: {list(requested_set - precomputed_panel_set)[:10]}")
+            logger.warning(f"  - Precomputed 데이터 ID 수: {len(precomputed_id_set)}")
+            logger.warning(f"  - 겹치는 ID 수: {common_count}")
+            logger.warning(f"  - 겹치지 않는 요청 ID 샘플: {list(requested_set)[:10]}")
             
             # 전체 precomputed 데이터 반환
             logger.info(f"[전체 데이터 반환] precomputed UMAP 데이터 전체 반환")
             
             has_cluster_col = 'cluster' in df_precomputed.columns
+            clusters = df_precomputed['cluster'].to_numpy() if has_cluster_col else np.full(len(df_precomputed), -1)
+            is_search = np.isin(precomputed_ids, requested_ids)
             
-            result_panels = []
-            for _, row in df_precomputed.iterrows():
-                panel_id = str(row['mb_sn']).strip()
-                is_search = panel_id.lower() in requested_set
-                cluster_value = int(row['cluster']) if has_cluster_col else -1
-                
-                result_panels.append({
+            result_panels = [
+                {
                     'panel_id': panel_id,
-                    'umap_x': float(row['umap_x']),
-                    'umap_y': float(row['umap_y']),
+                    'umap_x': umap_x,
+                    'umap_y': umap_y,
                     'cluster': cluster_value,
-                    'is_search_result': bool(is_search),
+                    'is_search_result': search_flag,
                     'original_cluster': cluster_value
-                })
+                }
+                for panel_id, umap_x, umap_y, cluster_value, search_flag in zip(
+                    df_precomputed['mb_sn'].astype(str).str.strip().tolist(),
+                    df_precomputed['umap_x'].to_numpy(dtype=np.float64).tolist(),
+                    df_precomputed['umap_y'].to_numpy(dtype=np.float64).tolist(),
+                    clusters.astype(np.int64).tolist(),
+                    is_search.tolist()
+                )
+            ]
             
-            cluster_stats = {}
-            if has_cluster_col:
-                for cluster_id in df_precomputed['cluster'].unique():
-                    cluster_mask = df_precomputed['cluster'] == cluster_id
-                    cluster_panels = [p for p in result_panels if p['cluster'] == cluster_id]
-                    search_count = sum(1 for p in cluster_panels if p['is_search_result'])
-                    
-                    cluster_stats[int(cluster_id)] = {
-                        'size': int(cluster_mask.sum()),
-                        'percentage': float(cluster_mask.sum() / len(df_precomputed) * 100),
-                        'search_count': search_count,
-                        'search_percentage': float(search_count / max(1, cluster_mask.sum()) * 100)
-                    }
+            # 클러스터별 통계 (np.unique + np.bincount 한 번으로 집계)
+            cluster_stats = cluster_stats_by_label(clusters, is_search) if has_cluster_col else {}
             
             return {
                 'success': True,
@@ -1476,103 +1441,81 @@ async def cluster_around_search(req: ClusterAroundSearchRequest):
                 'features_used': [],
                 'dispersion_warning': False,
                 'dispersion_ratio': 1.0,
-                'warning': f'검색 패널을 클러스터링 데이터에서 찾을 수 없어 전체 데이터를 표시합니다. 요청된 {len(requested_set)}개 중 {len(common)}개만 데이터에 존재합니다.'
+                'warning': f'검색 패널을 클러스터링 데이터에서 찾을 수 없어 전체 데이터를 표시합니다. 요청된 {len(requested_set)}개 중 {common_count}개만 데이터에 존재합니다.'
             }
         
         if len(not_found_panels) > 0:
             logger.warning(f"[⚠️ 2단계 경고] {len(not_found_panels)}개 패널을 찾지 못했습니다. (계속 진행)")
         
-        logger.info(f"[✅ 2단계 완료] 검색 패널 찾기 완료: {len(search_panel_mb_sns)}개")
+        logger.info(f"[✅ 2단계 완료] 검색 패널 찾기 완료: {len(search_panel_ids)}개")
         
         # 3. Precomputed HDBSCAN 결과에서 검색된 패널이 속한 클러스터 찾기 (재클러스터링 없이)
         logger.info(f"[3단계] HDBSCAN 결과에서 검색된 패널의 클러스터 찾기 (재클러스터링 없음)")
         
-        # Precomputed 데이터에서 검색된 패널이 속한 클러스터 찾기
+        # Precomputed 데이터에서 검색된 패널이 속한 클러스터 찾기 (정수 ID 배열 연산)
         has_cluster_col = 'cluster' in df_precomputed.columns
         searched_cluster_ids = set()
+        search_id_array = np.fromiter(search_panel_ids, dtype=np.int32, count=len(search_panel_ids))
         
         if has_cluster_col:
-            for _, row in df_precomputed.iterrows():
-                panel_id = str(row['mb_sn_normalized']).lower()
-                if panel_id in search_panel_mb_sns:
-                    cluster_id = int(row['cluster'])
-                    if cluster_id != -1:  # 노이즈 제외
-                        searched_cluster_ids.add(cluster_id)
+            clusters = df_precomputed['cluster'].to_numpy()
+            searched_clusters = np.unique(clusters[np.isin(precomputed_ids, search_id_array)])
+            searched_cluster_ids = {int(cluster_id) for cluster_id in searched_clusters if cluster_id != -1}  # 노이즈 제외
         else:
             logger.warning(f"[3단계] cluster 컬럼이 없어 클러스터 기반 확장을 수행할 수 없습니다.")
         
         logger.info(f"[3단계 완료] 검색된 패널이 속한 클러스터: {sorted(searched_cluster_ids)}")
         
         # 4. 해당 클러스터의 모든 패널 추출 (재클러스터링 없이 HDBSCAN 결과 그대로 사용)
-        extended_panel_ids = set()
         if has_cluster_col:
-            for _, row in df_precomputed.iterrows():
-                panel_id = str(row['mb_sn_normalized']).lower()
-                cluster_id = int(row['cluster'])
-                if cluster_id in searched_cluster_ids:
-                    extended_panel_ids.add(panel_id)
+            extended_mask = np.isin(clusters, np.fromiter(searched_cluster_ids, dtype=np.int64, count=len(searched_cluster_ids)))
+            extended_panel_ids = set(np.unique(precomputed_ids[extended_mask]).tolist())
         else:
             # cluster 컬럼이 없으면 검색된 패널만 포함
-            extended_panel_ids = search_panel_mb_sns.copy()
+            extended_panel_ids = search_panel_ids.copy()
         
         logger.info(f"[HDBSCAN 결과 사용] 재클러스터링 없이 기존 HDBSCAN 결과 사용")
-        logger.info(f"  - 검색 패널: {len(search_panel_mb_sns)}개")
+        logger.info(f"  - 검색 패널: {len(search_panel_ids)}개")
         logger.info(f"  - 클러스터 수: {len(searched_cluster_ids)}개")
         logger.info(f"  - 확장 패널: {len(extended_panel_ids)}개")
         
         # 5. 결과 구성 (정상적으로 매칭된 검색 패널만 포함)
-        result_panels = []
+        # 패널 ID별 첫 번째 행 위치 (기존과 동일하게 중복 시 첫 행 사용), 검색 패널 행은 searchsorted로 한 번에 조회
+        unique_ids, first_positions = np.unique(precomputed_ids, return_index=True)
+        found_id_array = np.asarray(found_exact_ids, dtype=unique_ids.dtype)
+        found_positions = first_positions[np.searchsorted(unique_ids, found_id_array)]
+        
+        found_clusters = clusters[found_positions].astype(np.int64) if has_cluster_col else np.full(len(found_positions), -1, dtype=np.int64)
         
         # 검색된 패널 중 정상적으로 매칭된 패널만 UMAP에 표시
-        for panel_id in found_panels:
-            panel_id_normalized = str(panel_id).strip().lower()
-            
-            # df_precomputed에서 해당 패널 찾기
-            matching_rows = df_precomputed[df_precomputed['mb_sn_normalized'] == panel_id_normalized]
-            
-            if not matching_rows.empty:
-                row = matching_rows.iloc[0]
-                cluster_id = int(row['cluster']) if has_cluster_col else -1
-                
-                result_panels.append({
-                    'panel_id': str(panel_id).strip(),
-                    'umap_x': float(row['umap_x']),
-                    'umap_y': float(row['umap_y']),
-                    'cluster': cluster_id,
-                    'is_search_result': True,  # 검색된 패널이므로 항상 True
-                    'original_cluster': cluster_id
-                })
+        result_panels = [
+            {
+                'panel_id': str(panel_id).strip(),
+                'umap_x': umap_x,
+                'umap_y': umap_y,
+                'cluster': cluster_id,
+                'is_search_result': True,  # 검색된 패널이므로 항상 True
+                'original_cluster': cluster_id
+            }
+            for panel_id, umap_x, umap_y, cluster_id in zip(
+                found_panels_exact,
+                df_precomputed['umap_x'].to_numpy(dtype=np.float64)[found_positions].tolist(),
+                df_precomputed['umap_y'].to_numpy(dtype=np.float64)[found_positions].tolist(),
+                found_clusters.tolist()
+            )
+        ]
         
         logger.info(f"[5단계] 정상적으로 매칭된 검색 패널: {len(result_panels)}개")
         
-        # 7. 클러스터별 통계 (정상적으로 매칭된 검색 패널 기준)
-        cluster_stats = {}
-        if result_panels:
-            # result_panels의 클러스터별로 통계 계산
-            cluster_panel_map = {}
-            for panel in result_panels:
-                cluster_id = panel['cluster']
-                if cluster_id not in cluster_panel_map:
-                    cluster_panel_map[cluster_id] = []
-                cluster_panel_map[cluster_id].append(panel)
-            
-            for cluster_id, cluster_panels in cluster_panel_map.items():
-                search_count = sum(1 for p in cluster_panels if p['is_search_result'])
-                
-                cluster_stats[int(cluster_id)] = {
-                    'size': len(cluster_panels),
-                    'percentage': float(len(cluster_panels) / len(result_panels) * 100) if result_panels else 0.0,
-                    'search_count': search_count,
-                    'search_percentage': float(search_count / max(1, len(cluster_panels)) * 100)
-                }
+        # 7. 클러스터별 통계 (정상적으로 매칭된 검색 패널 기준, np.unique + np.bincount 한 번으로 집계)
+        cluster_stats = cluster_stats_by_label(found_clusters, np.ones(len(found_clusters), dtype=bool))
         
         best_k = len(searched_cluster_ids)
         
-        # 8. HDBSCAN 메타데이터에서 품질 지표 가져오기 (NeonDB에서)
-        from app.utils.clustering_loader import load_clustering_session_from_db
+        # 8. HDBSCAN 메타데이터에서 품질 지표 가져오기 (1단계 번들의 세션 메타데이터)
         quality_metrics = {}
         try:
-            session_data = await load_clustering_session_from_db(session_id)
+            session_data = bundle.session
             if session_data:
                 quality_metrics['silhouette_score'] = session_data.get('silhouette_score')
                 quality_metrics['davies_bouldin_score'] = session_data.get('davies_bouldin_score')
@@ -1588,8 +1531,8 @@ async def cluster_around_search(req: ClusterAroundSearchRequest):
             'success': True,
             'session_id': session_id,
             'n_total_panels': len(result_panels),
-            'n_search_panels': len(search_panel_mb_sns),
-            'n_extended_panels': len(extended_panel_ids) - len(search_panel_mb_sns),
+            'n_search_panels': len(search_panel_ids),
+            'n_extended_panels': len(extended_panel_ids) - len(search_panel_ids),
             'n_clusters': best_k,
             'silhouette_score': quality_metrics.get('silhouette_score'),
             'davies_bouldin_score': quality_metrics.get('davies_bouldin_score'),
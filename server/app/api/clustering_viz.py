@@ -4,16 +4,17 @@
 """
 import json
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
-import pandas as pd
-import pandas.api.types as pd_types
 import numpy as np
 
 from app.clustering.artifacts import load_artifacts
 
+if TYPE_CHECKING:
+    import pandas as pd  # 런타임에는 사용하는 엔드포인트 안에서 import (서버 시작 시간 단축)
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/clustering/viz", tags=["clustering-viz"])
 
@@ -51,8 +52,9 @@ EFFECT_THRESHOLDS = {
 }
 
 
-def summarize_feature(df: pd.DataFrame, col: str) -> Optional[dict]:
+def summarize_feature(df: "pd.DataFrame", col: str) -> Optional[dict]:
     """전체 df 및 각 클러스터 df에 대해 feature별 요약 통계를 계산"""
+    import pandas.api.types as pd_types
     if col not in df.columns:
         return None
     
@@ -245,7 +247,7 @@ def binary_effect(cluster_stat: dict, overall_stat: dict, min_p: float = 0.05) -
 
 
 def collect_balanced_distinctive_features(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     cluster_id: int,
     profile_features: dict,
     overall_stats: dict,
@@ -344,7 +346,7 @@ def collect_balanced_distinctive_features(
 
 # 기존 함수는 호환성을 위해 유지
 def collect_distinctive_features(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     cluster_id: int,
     profile_features: dict,
     overall_stats: dict,
@@ -846,7 +848,7 @@ def build_cluster_name(
 
 def build_storytelling_insights(
     cluster_id: int,
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     distinctive: List[dict],
     cluster_stats: Dict[str, dict],
     overall_stats: Dict[str, dict],
@@ -1335,7 +1337,7 @@ def build_marketing_segments(
 # 기존 함수는 호환성을 위해 유지
 def build_insights(
     cluster_id: int,
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     distinctive: List[dict],
     cluster_stats: Dict[str, dict],
     overall_stats: Dict[str, dict],
@@ -1425,6 +1427,7 @@ async def get_cluster_profiles(session_id: str) -> JSONResponse:
     """
     클러스터별 피처 프로파일 데이터 반환 (v2 엔진)
     """
+    import pandas as pd
     logger.info(f"[클러스터 프로필 요청] session_id: {session_id}")
     
     try:
@@ -1607,6 +1610,7 @@ async def get_cluster_distribution(session_id: str):
     """
     클러스터 분포 데이터 반환 (막대그래프 + 파이차트용)
     """
+    import pandas as pd
     try:
         artifacts = load_artifacts(session_id)
         if not artifacts:
@@ -1663,6 +1667,7 @@ async def get_correlation_matrix(session_id: str):
     """
     피처 간 상관계수 매트릭스 반환
     """
+    import pandas as pd
     try:
         artifacts = load_artifacts(session_id)
         if not artifacts:
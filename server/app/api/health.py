@@ -6,8 +6,27 @@ router = APIRouter()
 
 @router.get("/health")
 async def ping():
-    """기본 Health check"""
-    return {"ok": True}
+    """
+    기본 Health check + startup 워밍업 컴포넌트별 준비 상태
+
+    ready: 워밍업 대상이 모두 끝났는지 여부 (실패한 컴포넌트는 첫 요청 시 로드)
+    db_pool: 공유 DB 엔진 연결 풀 메트릭 (네트워크 호출 없음)
+    precomputed_cache: Precomputed 응답 캐시 상태 (비활성화 시 None)
+    """
+    from app.services.warmup import WARMUP_FAILED, get_warmup_status, is_warm
+    from app.db.engine_registry import get_engine_registry
+    from app.services.precomputed_cache import get_precomputed_cache
+
+    warmup = get_warmup_status()
+    precomputed_cache = get_precomputed_cache()
+    return {
+        "ok": True,
+        "ready": is_warm(),
+        "degraded": [name for name, state in warmup.items() if state["status"] == WARMUP_FAILED],
+        "warmup": warmup,
+        "db_pool": get_engine_registry().metrics(),
+        "precomputed_cache": precomputed_cache.info() if precomputed_cache else None
+    }
 
 
 @router.get("/healthz")
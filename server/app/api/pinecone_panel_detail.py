@@ -4,9 +4,9 @@ from datetime import datetime
 import logging
 import numpy as np
 
-from app.core.config import PINECONE_API_KEY, PINECONE_INDEX_NAME, load_category_config
+from app.core.config import load_category_config
+from app.services.pinecone_provider import get_pinecone_provider
 from app.utils.merged_data_loader import load_merged_data
-from pinecone import Pinecone
 
 logger = logging.getLogger(__name__)
 
@@ -44,13 +44,10 @@ def get_panel_from_pinecone(panel_id: str) -> Optional[Dict[str, Any]]:
         logger.info(f"[Panel Detail] 패널 상세 정보 조회 시작: {panel_id}")
         category_config = load_category_config()
         
-        # Pinecone 인덱스 연결
-        pc = Pinecone(api_key=PINECONE_API_KEY)
-        index = pc.Index(PINECONE_INDEX_NAME)
-        
-        # 인덱스 차원 동적으로 가져오기
-        stats = index.describe_index_stats()
-        dimension = stats.get('dimension', 1536)
+        # Pinecone 인덱스 연결 (공유 제공자, 차원은 최초 1회만 조회)
+        provider = get_pinecone_provider()
+        index = provider.index()
+        dimension = provider.dimension()
         
         # 랜덤 벡터 생성 (메타데이터만 필요하므로)
         random_vector = np.random.rand(dimension).astype(np.float32).tolist()
@@ -2,13 +2,21 @@
 from typing import List, Dict, Any
 from datetime import datetime
 import logging
-import numpy as np
 
 from app.services.pinecone_searcher import PineconePanelSearcher
-from app.core.config import PINECONE_API_KEY, PINECONE_INDEX_NAME, load_category_config
+from app.services.panel_hydrator import PanelHydrator
+from app.services.pinecone_provider import get_pinecone_provider
+from app.core.config import (
+    PINECONE_API_KEY,
+    PINECONE_INDEX_NAME,
+    PINECONE_HYDRATION_CHUNK_SIZE,
+    PINECONE_HYDRATION_MAX_WORKERS,
+    PINECONE_VECTOR_ID_TEMPLATE,
+    PINECONE_VECTOR_ID_PREFIX,
+    load_category_config
+)
 # ⭐ merged_data는 패널 상세정보 조회 시(/api/panels/{panel_id})에만 NeonDB에서 로드
 # 검색 결과에서는 Pinecone 메타데이터만 사용
-from pinecone import Pinecone
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +35,8 @@ def _is_no_response(text: str) -> bool:
 # Pinecone 검색기 싱글톤
 _pinecone_searcher: PineconePanelSearcher = None
 
-# Pinecone 인덱스 싱글톤 (성능 최적화)
-_pinecone_client = None
-_pinecone_index = None
-_pinecone_dimension = None
+# 패널 메타데이터 조회기 싱글톤 (Pinecone 인덱스는 공유 제공자 사용)
+_panel_hydrator = None
 
 def _get_pinecone_searcher() -> PineconePanelSearcher:
     """Pinecone 검색기 싱글톤 인스턴스 반환"""
@@ -41,12 +47,33 @@ def _get_pinecone_searcher() -> PineconePanelSearcher:
         _pinecone_searcher = PineconePanelSearcher(
             PINECONE_API_KEY,
             PINECONE_INDEX_NAME,
-            category_config
+            category_config,
+            index_provider=get_pinecone_provider()
         )
     
     return _pinecone_searcher
 
 
+def _get_panel_hydrator() -> PanelHydrator:
+    """패널 메타데이터 조회기 싱글톤 반환 (공유 Pinecone 인덱스 재사용)"""
+    global _panel_hydrator
+    
+    if _panel_hydrator is None:
+        # ⭐ 공유 제공자의 인덱스/연결 풀 재사용 (차원은 최초 1회만 조회)
+        provider = get_pinecone_provider()
+        _panel_hydrator = PanelHydrator(
+            provider.index(),
+            dimension=provider.dimension(),
+            chunk_size=PINECONE_HYDRATION_CHUNK_SIZE,
+            max_workers=PINECONE_HYDRATION_MAX_WORKERS,
+            id_template=PINECONE_VECTOR_ID_TEMPLATE,
+            id_prefix_template=PINECONE_VECTOR_ID_PREFIX
+        )
+        logger.info(f"[Panel Details] 메타데이터 조회 모드: {_panel_hydrator.mode}")
+    
+    return _panel_hydrator
+
+
 async def _get_panel_details_from_pinecone(
     mb_sn_list: List[str],
     page: int,
@@ -78,96 +105,6 @@ async def _get_panel_details_from_pinecone(
             "count": 0
         }
     
-    category_config = load_category_config()
-    
-    # ⭐ Pinecone 인덱스 연결 최적화 (싱글톤 패턴 사용)
-    # Pinecone 클라이언트는 재사용 가능하므로 매번 생성하지 않음
-    global _pinecone_client, _pinecone_index, _pinecone_dimension
-    
-    if _pinecone_index is None:
-        _pinecone_client = Pinecone(api_key=PINECONE_API_KEY)
-        _pinecone_index = _pinecone_client.Index(PINECONE_INDEX_NAME)
-        # 인덱스 차원 동적으로 가져오기 (한 번만)
-        stats = _pinecone_index.describe_index_stats()
-        _pinecone_dimension = stats.get('dimension', 1536)
-    
-    index = _pinecone_index
-    dimension = _pinecone_dimension
-    
-    # Pinecone에서 인구 topic으로 메타데이터 조회
-    # 랜덤 벡터로 검색 (메타데이터만 필요)
-    random_vector = np.random.rand(dimension).astype(np.float32).tolist()
-    norm = np.linalg.norm(random_vector)
-    if norm > 0:
-        random_vector = (np.array(random_vector) / norm).tolist()
-    
-    # 모든 topic에서 메타데이터 조회
-    panel_metadata_map = {}  # mb_sn -> 모든 메타데이터 병합
-    
-    # 각 카테고리의 topic으로 메타데이터 수집
-    logger.info(f"[Panel Details] 메타데이터 수집 시작: {len(mb_sn_list)}개 패널, {len(category_config)}개 카테고리")
-    try:
-        category_count = 0
-        for category_name, category_info in category_config.items():
-            category_count += 1
-            pinecone_topic = category_info.get("pinecone_topic")
-            if not pinecone_topic:
-                continue
-            
-            try:
-                topic_results = index.query(
-                    vector=random_vector,
-                    top_k=len(mb_sn_list) * 2,  # 충분히 많이 가져오기
-                    include_metadata=True,
-                    filter={
-                        "topic": pinecone_topic,
-                        "mb_sn": {"$in": mb_sn_list}
-                    }
-                )
-                
-                # mb_sn별로 메타데이터 병합
-                for match in topic_results.matches:
-                    mb_sn = match.metadata.get("mb_sn", "")
-                    if not mb_sn:
-                        continue
-                    
-                    if mb_sn not in panel_metadata_map:
-                        panel_metadata_map[mb_sn] = {
-                            "_index_values": []  # welcome1, welcome2, quickpoll 구분용
-                        }
-                    
-                    # index 필드 수집 (welcome1, welcome2, quickpoll 구분용)
-                    if "index" in match.metadata:
-                        index_val = match.metadata.get("index")
-                        if index_val and index_val not in panel_metadata_map[mb_sn]["_index_values"]:
-                            panel_metadata_map[mb_sn]["_index_values"].append(index_val)
-                    
-                    # 메타데이터 병합 (시스템 필드 제외)
-                    for key, value in match.metadata.items():
-                        if key not in ["topic", "index", "mb_sn"]:  # 시스템 필드 제외
-                            # 중복 키는 나중 값으로 덮어쓰기 (또는 리스트로 병합)
-                            if key in panel_metadata_map[mb_sn]:
-                                # 이미 있는 경우, 리스트면 병합, 아니면 덮어쓰기
-                                existing = panel_metadata_map[mb_sn][key]
-                                if isinstance(existing, list) and isinstance(value, list):
-                                    panel_metadata_map[mb_sn][key] = list(set(existing + value))
-                                elif isinstance(existing, list):
-                                    if value not in existing:
-                                        panel_metadata_map[mb_sn][key] = existing + [value]
-                                else:
-                                    panel_metadata_map[mb_sn][key] = value
-                            else:
-                                panel_metadata_map[mb_sn][key] = value
-            except Exception as e:
-                logger.warning(f"{category_name} ({pinecone_topic}) 메타데이터 조회 실패: {e}")
-    except Exception as e:
-        logger.warning(f"Pinecone 메타데이터 조회 실패: {e}, 빈 메타데이터 사용")
-    
-    # 결과 변환 (Pinecone 메타데이터만 사용)
-    # ⭐ 성능 최적화: 검색 결과에서는 기본 메타데이터만 반환
-    # 응답, AI 요약 등은 패널 상세 정보창에서만 로딩 (/api/panels/{panel_id})
-    logger.info(f"[Panel Details] 메타데이터 수집 완료: {len(panel_metadata_map)}개 패널, 결과 변환 시작 (응답 제외)")
-    
     # ⭐ 노트북 기반 유사도로 정렬 후 페이지네이션 적용
     # similarity_scores가 있으면 유사도 기준으로 정렬, 없으면 원래 순서 유지
     if similarity_scores:
@@ -190,6 +127,26 @@ async def _get_panel_details_from_pinecone(
     
     logger.info(f"[Panel Details] 페이지네이션: 전체 {total_count}개 중 {start_idx}~{end_idx}번째 ({len(paginated_mb_sn_list)}개) 처리")
     
+    # ⭐ 현재 페이지 패널만 메타데이터 조회 (비용이 전체 결과 수가 아닌 페이지 크기에 비례)
+    category_config = load_category_config()
+    topics = [
+        category_info.get("pinecone_topic")
+        for category_info in category_config.values()
+        if category_info.get("pinecone_topic")
+    ]
+    
+    logger.info(f"[Panel Details] 메타데이터 수집 시작: {len(paginated_mb_sn_list)}개 패널, {len(topics)}개 topic")
+    panel_metadata_map = {}  # mb_sn -> 모든 메타데이터 병합
+    try:
+        panel_metadata_map = await _get_panel_hydrator().hydrate(paginated_mb_sn_list, topics)
+    except Exception as e:
+        logger.warning(f"Pinecone 메타데이터 조회 실패: {e}, 빈 메타데이터 사용")
+    
+    # 결과 변환 (Pinecone 메타데이터만 사용)
+    # ⭐ 성능 최적화: 검색 결과에서는 기본 메타데이터만 반환
+    # 응답, AI 요약 등은 패널 상세 정보창에서만 로딩 (/api/panels/{panel_id})
+    logger.info(f"[Panel Details] 메타데이터 수집 완료: {len(panel_metadata_map)}개 패널, 결과 변환 시작 (응답 제외)")
+    
     # ⭐ merged 데이터도 함께 로드하여 metadata에 병합 (SummaryBar 통계 계산을 위해)
     # 배치로 merged 데이터 조회
     from app.utils.merged_data_loader import get_panels_from_merged_db_batch
@@ -2,14 +2,25 @@
 Precomputed 클러스터링 데이터 로드 API
 실시간 클러스터링 대신 미리 계산된 데이터를 제공
 """
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
-import pandas as pd
+from fastapi import APIRouter, HTTPException, Query, Header
+from fastapi.responses import JSONResponse, Response
 import json
 from pathlib import Path
 import logging
 from typing import Optional, Dict, List, Any
 
+from app.services.precomputed_cache import get_precomputed_cache
+from app.utils.cluster_response import (
+    sample_indices,
+    umap_point_records,
+    umap_point_columns,
+    coordinate_pairs,
+    cluster_size_list,
+    resolve_point_format,
+    encode_umap_binary,
+    UMAP_BINARY_MEDIA_TYPE,
+)
+
 router = APIRouter(prefix="/api/precomputed", tags=["precomputed"])
 logger = logging.getLogger(__name__)
 
@@ -73,64 +84,34 @@ def _calculate_opportunity_areas(
     return opportunities
 
 
-@router.get("/clustering")
-async def get_precomputed_clustering(sample: Optional[int] = None):
+async def _build_precomputed_clustering(sample: Optional[int] = None, point_format: str = "json"):
     """
     Precomputed 클러스터링 결과 반환 (NeonDB에서 로드)
     
     Args:
         sample: 샘플링할 포인트 수 (None이면 전체 반환)
+        point_format: UMAP 포인트 전송 형식 (json / columnar / binary)
     """
     logger.info(f"[Precomputed 클러스터링 요청] NeonDB에서 데이터 로드 시도")
     
     try:
-        # 1. NeonDB에서 데이터 로드
-        from app.utils.clustering_loader import (
-            get_precomputed_session_id,
-            load_clustering_session_from_db,
-            load_umap_coordinates_from_db,
-            load_panel_cluster_mappings_from_db
-        )
+        # 1. NeonDB에서 세션 메타데이터 + UMAP 좌표/클러스터 번들 로드 (한 연결, 버전이 같으면 프로세스 캐시)
+        from app.utils.clustering_loader import load_precomputed_bundle
         
         precomputed_name = "hdbscan_default"
-        session_id = await get_precomputed_session_id(precomputed_name)
-        
-        if not session_id:
-            error_msg = f"Precomputed 세션을 찾을 수 없습니다: name={precomputed_name}. NeonDB에 데이터가 마이그레이션되었는지 확인하세요."
-            logger.error(f"[Precomputed 클러스터링 오류] {error_msg}")
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        logger.info(f"[Precomputed 클러스터링] Precomputed 세션 ID 찾음: {session_id}")
+        bundle = await load_precomputed_bundle(precomputed_name)
         
-        # 2. 세션 메타데이터 로드
-        session_data = await load_clustering_session_from_db(session_id)
-        if not session_data:
-            error_msg = f"NeonDB에서 세션 정보를 찾을 수 없습니다: session_id={session_id}"
+        if bundle is None:
+            error_msg = f"Precomputed 세션 또는 UMAP 좌표를 찾을 수 없습니다: name={precomputed_name}. NeonDB에 데이터가 마이그레이션되었는지 확인하세요."
             logger.error(f"[Precomputed 클러스터링 오류] {error_msg}")
             raise HTTPException(status_code=404, detail=error_msg)
         
-        logger.info(f"[Precomputed 클러스터링] 세션 메타데이터 로드 완료")
-        
-        # 3. UMAP 좌표 로드
-        umap_df = await load_umap_coordinates_from_db(session_id)
-        if umap_df is None or umap_df.empty:
-            error_msg = f"NeonDB에서 UMAP 좌표를 찾을 수 없습니다: session_id={session_id}"
-            logger.error(f"[Precomputed 클러스터링 오류] {error_msg}")
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        logger.info(f"[Precomputed 클러스터링] UMAP 좌표 로드 완료: {len(umap_df)}개 좌표")
-        
-        # 4. 클러스터 매핑 로드
-        mappings_df = await load_panel_cluster_mappings_from_db(session_id)
-        if mappings_df is None or mappings_df.empty:
-            error_msg = f"NeonDB에서 클러스터 매핑을 찾을 수 없습니다: session_id={session_id}"
-            logger.error(f"[Precomputed 클러스터링 오류] {error_msg}")
-            raise HTTPException(status_code=404, detail=error_msg)
+        session_id = bundle.session_id
+        session_data = bundle.session
+        logger.info(f"[Precomputed 클러스터링] 번들 로드 완료: session_id={session_id}, 좌표 {len(bundle)}개")
         
-        logger.info(f"[Precomputed 클러스터링] 클러스터 매핑 로드 완료: {len(mappings_df)}개 매핑")
-        
-        # 5. 데이터 병합
-        df = umap_df.merge(mappings_df, on='mb_sn', how='inner')
+        # 2. 클러스터 매핑이 있는 좌표만 사용 (좌표/매핑 inner merge와 동일)
+        df = bundle.to_frame()
         
         if df.empty:
             error_msg = f"UMAP 좌표와 클러스터 매핑을 병합할 수 없습니다: session_id={session_id}"
@@ -139,28 +120,32 @@ async def get_precomputed_clustering(sample: Optional[int] = None):
         
         logger.info(f"[Precomputed 클러스터링] 데이터 병합 완료: {len(df)}행")
         
-        # 6. UMAP 데이터 추출
-        logger.debug(f"[Precomputed 클러스터링] UMAP 데이터 추출 시작")
-        umap_data = [
-            {
-                'x': float(row['umap_x']),
-                'y': float(row['umap_y']),
-                'cluster': int(row['cluster']),
-                'panelId': str(row['mb_sn']),
-            }
-            for _, row in df.iterrows()
-        ]
+        # 3. 샘플링 옵션이 있으면 샘플 인덱스 선택 (seed 42, 재현 가능한 샘플링)
+        sample_idx = sample_indices(len(df), sample)
+        if sample_idx is not None:
+            points = df.iloc[sample_idx]
+            logger.info(f"[Precomputed 클러스터링] 샘플링 적용: {len(points)}개 포인트 (요청: {sample}개)")
+        else:
+            points = df
         
-        logger.info(f"[Precomputed 클러스터링] UMAP 데이터 추출 완료: {len(umap_data)}개 포인트")
+        # 4. UMAP 데이터 추출 (열 배열 기반, binary는 7단계에서 직접 인코딩)
+        logger.debug(f"[Precomputed 클러스터링] UMAP 데이터 추출 시작 (format={point_format})")
+        point_columns = (
+            points['mb_sn'].to_numpy(),
+            points['umap_x'].to_numpy(),
+            points['umap_y'].to_numpy(),
+            points['cluster'].to_numpy()
+        )
+        if point_format == "json":
+            umap_data = {'umap_coordinates': umap_point_records(*point_columns)}
+        elif point_format == "columnar":
+            umap_data = {'umap_columns': umap_point_columns(*point_columns)}
+        else:
+            umap_data = {}
         
-        # 7. 샘플링 옵션이 있으면 샘플링
-        if sample is not None and sample > 0 and sample < len(umap_data):
-            import random
-            random.seed(42)  # 재현 가능한 샘플링
-            umap_data = random.sample(umap_data, sample)
-            logger.info(f"[Precomputed 클러스터링] 샘플링 적용: {len(umap_data)}개 포인트 (요청: {sample}개)")
+        logger.info(f"[Precomputed 클러스터링] UMAP 데이터 추출 완료: {len(points)}개 포인트")
         
-        # 8. 메타데이터 구성 (세션 데이터에서)
+        # 5. 메타데이터 구성 (세션 데이터에서)
         metadata = {
             'method': session_data.get('algorithm', 'HDBSCAN'),
             'silhouette_score': session_data.get('silhouette_score'),
@@ -170,27 +155,14 @@ async def get_precomputed_clustering(sample: Optional[int] = None):
             'n_noise': session_data.get('n_noise', 0),
         }
         
-        # 9. 클러스터 정보 생성 (매핑 데이터에서 계산)
-        cluster_counts = df['cluster'].value_counts().to_dict()
-        total = len(df)
-        clusters = []
-        for cluster_id, count in cluster_counts.items():
-            if cluster_id == -1:  # 노이즈는 제외하거나 별도 처리
-                continue
-            clusters.append({
-                'id': int(cluster_id),
-                'size': int(count),
-                'percentage': float(count / total * 100)
-            })
-        
-        # 클러스터 ID 순으로 정렬
-        clusters.sort(key=lambda x: x['id'])
+        # 6. 클러스터 정보 생성 (매핑 데이터에서 계산, 노이즈 제외, 클러스터 ID 순)
+        clusters = cluster_size_list(df['cluster'].to_numpy())
         
-        # 10. 응답 데이터 구성
+        # 7. 응답 데이터 구성
         response_data = {
             'success': True,
             'data': {
-                'umap_coordinates': umap_data,
+                **umap_data,
                 'clusters': clusters,
                 'metadata': metadata,
                 'n_samples': len(df),
@@ -199,25 +171,28 @@ async def get_precomputed_clustering(sample: Optional[int] = None):
                 'silhouette_score': metadata.get('silhouette_score'),
                 'davies_bouldin_index': metadata.get('davies_bouldin_index'),
                 'calinski_harabasz_index': metadata.get('calinski_harabasz_index'),
-                'n_noise': metadata.get('n_noise', 0)
+                'n_noise': metadata.get('n_noise', 0),
+                'format': point_format
             }
         }
         
-        # 11. 응답 크기 확인 및 로깅
-        try:
-            import sys
-            import json as json_module
-            test_json = json_module.dumps(response_data, ensure_ascii=False)
-            estimated_size_mb = sys.getsizeof(test_json) / (1024 * 1024)
-            logger.info(f"[Precomputed 클러스터링] 응답 데이터 크기: {estimated_size_mb:.2f} MB ({len(test_json):,} bytes)")
-            
-            if estimated_size_mb > 10:
-                logger.warning(f"[Precomputed 클러스터링] 응답 데이터가 큽니다 ({estimated_size_mb:.2f} MB). 전송 중 문제가 발생할 수 있습니다.")
-        except Exception as size_err:
-            logger.warning(f"[Precomputed 클러스터링] 응답 크기 계산 실패: {str(size_err)}")
+        # 8. 직렬화 (한 번만) 후 실제 본문 크기 로깅
+        if point_format == "binary":
+            # 포인트 외 응답은 헤더 JSON, 패널 ID는 /panel-ids 사전의 위치 (샘플링 시에만 포함)
+            response_data['data']['panel_ids_version'] = list(bundle.version)
+            response = Response(
+                content=encode_umap_binary(response_data, *point_columns[1:], panel_index=sample_idx),
+                media_type=UMAP_BINARY_MEDIA_TYPE
+            )
+        else:
+            response = JSONResponse(response_data)
         
-        # JSONResponse 반환 (압축은 FastAPI/uvicorn이 자동으로 처리)
-        return JSONResponse(response_data)
+        size_mb = len(response.body) / (1024 * 1024)
+        logger.info(f"[Precomputed 클러스터링] 응답 데이터 크기: {size_mb:.2f} MB ({len(response.body):,} bytes, format={point_format})")
+        if size_mb > 10:
+            logger.warning(f"[Precomputed 클러스터링] 응답 데이터가 큽니다 ({size_mb:.2f} MB). format=columnar 또는 binary 사용을 권장합니다.")
+        
+        return response
     
     except HTTPException:
         raise
@@ -231,51 +206,32 @@ async def get_precomputed_clustering(sample: Optional[int] = None):
         )
 
 
-@router.get("/umap")
-async def get_precomputed_umap():
+async def _build_precomputed_umap(point_format: str = "json"):
     """
     Precomputed UMAP 좌표만 반환 (NeonDB에서 로드)
+    
+    Args:
+        point_format: UMAP 포인트 전송 형식 (json / columnar / binary)
     """
     logger.info(f"[Precomputed UMAP 요청] NeonDB에서 UMAP 좌표 로드 시도")
     
     try:
-        # 1. NeonDB에서 데이터 로드
-        from app.utils.clustering_loader import (
-            get_precomputed_session_id,
-            load_umap_coordinates_from_db,
-            load_panel_cluster_mappings_from_db
-        )
+        # 1. NeonDB에서 UMAP 좌표/클러스터 번들 로드 (한 연결, 버전이 같으면 프로세스 캐시)
+        from app.utils.clustering_loader import load_precomputed_bundle
         
         precomputed_name = "hdbscan_default"
-        session_id = await get_precomputed_session_id(precomputed_name)
-        
-        if not session_id:
-            error_msg = f"Precomputed 세션을 찾을 수 없습니다: name={precomputed_name}. NeonDB에 데이터가 마이그레이션되었는지 확인하세요."
-            logger.error(f"[Precomputed UMAP 오류] {error_msg}")
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        logger.info(f"[Precomputed UMAP] Precomputed 세션 ID 찾음: {session_id}")
+        bundle = await load_precomputed_bundle(precomputed_name)
         
-        # 2. UMAP 좌표 로드
-        umap_df = await load_umap_coordinates_from_db(session_id)
-        if umap_df is None or umap_df.empty:
-            error_msg = f"NeonDB에서 UMAP 좌표를 찾을 수 없습니다: session_id={session_id}"
+        if bundle is None:
+            error_msg = f"Precomputed 세션 또는 UMAP 좌표를 찾을 수 없습니다: name={precomputed_name}. NeonDB에 데이터가 마이그레이션되었는지 확인하세요."
             logger.error(f"[Precomputed UMAP 오류] {error_msg}")
             raise HTTPException(status_code=404, detail=error_msg)
         
-        logger.info(f"[Precomputed UMAP] UMAP 좌표 로드 완료: {len(umap_df)}개 좌표")
+        session_id = bundle.session_id
+        logger.info(f"[Precomputed UMAP] 번들 로드 완료: session_id={session_id}, 좌표 {len(bundle)}개")
         
-        # 3. 클러스터 매핑 로드
-        mappings_df = await load_panel_cluster_mappings_from_db(session_id)
-        if mappings_df is None or mappings_df.empty:
-            error_msg = f"NeonDB에서 클러스터 매핑을 찾을 수 없습니다: session_id={session_id}"
-            logger.error(f"[Precomputed UMAP 오류] {error_msg}")
-            raise HTTPException(status_code=404, detail=error_msg)
-        
-        logger.info(f"[Precomputed UMAP] 클러스터 매핑 로드 완료: {len(mappings_df)}개 매핑")
-        
-        # 4. 데이터 병합 (mb_sn 기준)
-        df = umap_df.merge(mappings_df, on='mb_sn', how='inner')
+        # 2. 클러스터 매핑이 있는 좌표만 사용 (mb_sn 기준 inner merge와 동일)
+        df = bundle.to_frame()
         
         if df.empty:
             error_msg = f"UMAP 좌표와 클러스터 매핑을 병합할 수 없습니다: session_id={session_id}"
@@ -284,26 +240,37 @@ async def get_precomputed_umap():
         
         logger.info(f"[Precomputed UMAP] 데이터 병합 완료: {len(df)}개 포인트")
         
-        # 5. 응답 형식으로 변환
-        coordinates = []
-        panel_ids = []
-        labels = []
+        # 3. 응답 형식으로 변환 (열 배열 기반)
+        logger.info(f"[Precomputed UMAP] 데이터 추출 완료: {len(df)}개 포인트 (format={point_format})")
         
-        for _, row in df.iterrows():
-            try:
-                coordinates.append([float(row['umap_x']), float(row['umap_y'])])
-                panel_ids.append(str(row['mb_sn']))
-                labels.append(int(row['cluster']))
-            except (ValueError, KeyError) as e:
-                logger.warning(f"[Precomputed UMAP] 행 처리 실패: {str(e)}")
-                continue
+        if point_format == "binary":
+            # 패널 ID는 /panel-ids 사전과 같은 순서
+            return Response(
+                content=encode_umap_binary(
+                    {'panel_ids_version': list(bundle.version)},
+                    df['umap_x'].to_numpy(),
+                    df['umap_y'].to_numpy(),
+                    df['cluster'].to_numpy()
+                ),
+                media_type=UMAP_BINARY_MEDIA_TYPE
+            )
         
-        logger.info(f"[Precomputed UMAP] 데이터 추출 완료: {len(coordinates)}개 포인트")
+        if point_format == "columnar":
+            return JSONResponse({
+                **umap_point_columns(
+                    df['mb_sn'].to_numpy(),
+                    df['umap_x'].to_numpy(),
+                    df['umap_y'].to_numpy(),
+                    df['cluster'].to_numpy(),
+                    cluster_key='labels'
+                ),
+                'format': point_format
+            })
         
         return JSONResponse({
-            'coordinates': coordinates,
-            'panel_ids': panel_ids,
-            'labels': labels
+            'coordinates': coordinate_pairs(df['umap_x'].to_numpy(), df['umap_y'].to_numpy()),
+            'panel_ids': df['mb_sn'].astype(str).tolist(),
+            'labels': df['cluster'].astype('int64').tolist()
         })
     
     except HTTPException:
@@ -318,8 +285,7 @@ async def get_precomputed_umap():
         )
 
 
-@router.get("/comparison/{cluster_a}/{cluster_b}")
-async def get_precomputed_comparison(cluster_a: int, cluster_b: int):
+async def _build_precomputed_comparison(cluster_a: int, cluster_b: int):
     """
     Precomputed 비교 분석 결과 반환 (NeonDB 우선 사용)
     """
@@ -331,15 +297,8 @@ async def get_precomputed_comparison(cluster_a: int, cluster_b: int):
         # 1. NeonDB에서 비교 데이터 로드 시도
         try:
             from app.utils.clustering_loader import get_precomputed_session_id
-            from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-            from sqlalchemy.orm import sessionmaker
+            from app.db.engine_registry import get_async_engine
             from sqlalchemy import text
-            import os
-            from dotenv import load_dotenv
-            import asyncio
-            import sys
-            
-            load_dotenv(override=True)
             
             precomputed_name = "hdbscan_default"
             session_id = await get_precomputed_session_id(precomputed_name)
@@ -347,21 +306,12 @@ async def get_precomputed_comparison(cluster_a: int, cluster_b: int):
             if session_id:
                 logger.info(f"[Precomputed 비교 분석] NeonDB에서 비교 데이터 로드 시도: session_id={session_id}")
                 
-                uri = os.getenv("ASYNC_DATABASE_URI")
-                if uri:
-                    if uri.startswith("postgresql://"):
-                        uri = uri.replace("postgresql://", "postgresql+psycopg://", 1)
-                    elif "postgresql+asyncpg" in uri:
-                        uri = uri.replace("postgresql+asyncpg", "postgresql+psycopg", 1)
-                    
-                    if sys.platform == 'win32':
-                        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-                    
-                    temp_engine = create_async_engine(uri, echo=False, pool_pre_ping=True, poolclass=None)
-                    
+                # 공유 엔진 (연결 풀 재사용)
+                engine = get_async_engine()
+                if engine is not None:
                     try:
-                        async with temp_engine.begin() as conn:
-                            await conn.execute(text('SET search_path TO "merged", public'))
+                        async with engine.begin() as conn:
+                            await conn.execute(text('SET LOCAL search_path TO "merged", public'))
                             
                             # cluster_comparisons 테이블에서 비교 데이터 조회
                             result = await conn.execute(
@@ -502,9 +452,6 @@ async def get_precomputed_comparison(cluster_a: int, cluster_b: int):
                                 logger.info(f"[Precomputed 비교 분석] NeonDB에서 비교 데이터 로드 성공: {len(comparison_array)}개 피처")
                     except Exception as db_error:
                         logger.warning(f"[Precomputed 비교 분석] NeonDB 조회 실패: {str(db_error)}, 파일 시스템 fallback 시도")
-                    finally:
-                        if temp_engine:
-                            await temp_engine.dispose()
         except Exception as e:
             logger.warning(f"[Precomputed 비교 분석] NeonDB 로드 시도 실패: {str(e)}, 파일 시스템 fallback 시도")
         
@@ -599,8 +546,7 @@ async def get_precomputed_comparison(cluster_a: int, cluster_b: int):
         )
 
 
-@router.get("/profiles")
-async def get_precomputed_profiles():
+async def _build_precomputed_profiles():
     """
     Precomputed 클러스터 프로필 반환 (NeonDB 우선 사용)
     """
@@ -1013,3 +959,141 @@ async def get_precomputed_profiles():
             detail=f"프로필 데이터 로드 실패: {error_type} - {error_msg}"
         )
 
+
+async def _build_precomputed_panel_ids():
+    """
+    Precomputed 패널 ID 사전 반환 (binary 형식 UMAP 응답의 포인트 순서/panel_index 기준)
+    """
+    try:
+        from app.utils.clustering_loader import load_precomputed_bundle
+        
+        precomputed_name = "hdbscan_default"
+        bundle = await load_precomputed_bundle(precomputed_name)
+        
+        if bundle is None:
+            error_msg = f"Precomputed 세션 또는 UMAP 좌표를 찾을 수 없습니다: name={precomputed_name}. NeonDB에 데이터가 마이그레이션되었는지 확인하세요."
+            logger.error(f"[Precomputed 패널 ID 오류] {error_msg}")
+            raise HTTPException(status_code=404, detail=error_msg)
+        
+        # 클러스터 매핑이 있는 패널만 (/clustering, /umap 포인트와 같은 순서)
+        panel_ids = bundle.panel_ids[bundle.mapped].astype(str).tolist()
+        logger.info(f"[Precomputed 패널 ID] 사전 생성: {len(panel_ids)}개")
+        
+        return JSONResponse({
+            'version': list(bundle.version),
+            'panel_ids': panel_ids
+        })
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        error_type = type(e).__name__
+        error_msg = str(e)
+        logger.error(f"[Precomputed 패널 ID 예외 발생] {error_type}: {error_msg}", exc_info=True)
+        raise HTTPException(
+            status_code=500, 
+            detail=f"패널 ID 로드 실패: {error_type} - {error_msg}"
+        )
+
+
+async def _cached_response(key: str, build):
+    """버전 캐시를 거쳐 응답 반환 (캐시 비활성화 시 매번 생성)"""
+    cache = get_precomputed_cache()
+    if cache is None:
+        return await build()
+    return await cache.get_or_build(key, build)
+
+
+def _resolve_point_format(point_format: Optional[str], accept: Optional[str]) -> str:
+    try:
+        return resolve_point_format(point_format, accept)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _normalize_sample(sample: Optional[int]) -> Optional[int]:
+    """
+    전체 포인트를 반환하는 sample 값(None, 0 이하, 포인트 수 이상)을 None 하나로 통일
+
+    ⭐ 클라이언트가 정하는 sample 값마다 전체 크기 응답이 따로 캐시되지 않도록 캐시 키 생성 전에 정규화
+    (포인트 수는 이미 로드된 번들 기준, 아직 로드 전이면 양수 값은 그대로 사용)
+    """
+    if sample is None or sample <= 0:
+        return None
+    from app.utils.clustering_loader import peek_precomputed_bundle
+    bundle = peek_precomputed_bundle("hdbscan_default")
+    if bundle is not None and sample >= bundle.n_mapped:
+        return None
+    return sample
+
+
+@router.get("/clustering")
+async def get_precomputed_clustering(
+    sample: Optional[int] = None,
+    point_format: Optional[str] = Query(None, alias="format", description="json(기본) / columnar / binary"),
+    accept: Optional[str] = Header(None)
+):
+    """
+    Precomputed 클러스터링 결과 반환 (NeonDB에서 로드)
+
+    ⭐ 세션 버전 (session_id, updated_at)이 같으면 직렬화된 응답을 메모리에서 반환
+
+    UMAP 포인트 전송 형식 (format 쿼리 파라미터 또는 Accept: application/octet-stream):
+    - json: data.umap_coordinates = [{x, y, cluster, panelId}, ...]
+    - columnar: data.umap_columns = {x: [...], y: [...], cluster: [...], panel_ids: [...]}
+    - binary: float32 좌표 + int32 클러스터 (나머지 필드는 헤더 JSON, 패널 ID는 /panel-ids 사전)
+    """
+    resolved_format = _resolve_point_format(point_format, accept)
+    sample = _normalize_sample(sample)
+    response = await _cached_response(
+        f"clustering:{sample}:{resolved_format}",
+        lambda: _build_precomputed_clustering(sample, resolved_format)
+    )
+    response.headers["Vary"] = "Accept"
+    return response
+
+
+@router.get("/umap")
+async def get_precomputed_umap(
+    point_format: Optional[str] = Query(None, alias="format", description="json(기본) / columnar / binary"),
+    accept: Optional[str] = Header(None)
+):
+    """
+    Precomputed UMAP 좌표 반환 (세션 버전별 캐시, 전송 형식은 /clustering과 동일)
+    """
+    resolved_format = _resolve_point_format(point_format, accept)
+    response = await _cached_response(
+        f"umap:{resolved_format}",
+        lambda: _build_precomputed_umap(resolved_format)
+    )
+    response.headers["Vary"] = "Accept"
+    return response
+
+
+@router.get("/panel-ids")
+async def get_precomputed_panel_ids():
+    """
+    Precomputed 패널 ID 사전 반환 (세션 버전별 캐시)
+
+    binary 응답 헤더의 panel_ids_version과 version이 같을 때만 재사용
+    """
+    return await _cached_response("panel_ids", _build_precomputed_panel_ids)
+
+
+@router.get("/comparison/{cluster_a}/{cluster_b}")
+async def get_precomputed_comparison(cluster_a: int, cluster_b: int):
+    """
+    Precomputed 비교 분석 결과 반환 (세션 버전별 캐시)
+    """
+    return await _cached_response(
+        f"comparison:{cluster_a}:{cluster_b}",
+        lambda: _build_precomputed_comparison(cluster_a, cluster_b)
+    )
+
+
+@router.get("/profiles")
+async def get_precomputed_profiles():
+    """
+    Precomputed 클러스터 프로필 반환 (세션 버전별 캐시)
+    """
+    return await _cached_response("profiles", _build_precomputed_profiles)
@@ -1,19 +1,42 @@
 """패널 검색 API 엔드포인트"""
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional
 import json
 import logging
 import asyncio
+import threading
 from app.core.config import (
     PINECONE_SEARCH_ENABLED,
     PINECONE_API_KEY,
     PINECONE_INDEX_NAME,
     ANTHROPIC_API_KEY,
     OPENAI_API_KEY,
+    PINECONE_FILTER_MODE,
+    PINECONE_FILTER_MAX_WORKERS,
+    PINECONE_SCORE_FUSION,
+    PINECONE_FILTER_SELECTIVITY_ORDER,
+    SEARCH_ASYNC_ENABLED,
+    SEARCH_TIMEOUT,
+    SEARCH_STAGE_TIMEOUTS,
+    SEARCH_TEXT_MAX_WORKERS,
+    SEARCH_PLANNER_MODE,
+    EMBEDDING_BATCH_ENABLED,
+    PINECONE_EXHAUSTIVE_CHUNK_SIZE,
+    PINECONE_IN_CHUNK_SIZE,
+    PINECONE_IN_MAX_WORKERS,
+    PINECONE_RELAXATION_MAX_CANDIDATES,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL_SECONDS,
+    SEARCH_CACHE_MAX_BYTES,
     load_category_config
 )
 from app.services.pinecone_filter_converter import PineconeFilterConverter
+from app.services.llm_cache import get_llm_cache
+from app.services.embedding_cache import get_embedding_cache
+from app.services.panel_metadata_index import get_panel_metadata_index
+from app.services.pinecone_provider import get_pinecone_provider
+from app.services.search_cache import SearchResultCache, make_search_cache_key
+from app.services.single_flight import SingleFlight
 from app.api.pinecone_panel_details import _get_panel_details_from_pinecone
 
 logger = logging.getLogger(__name__)
@@ -35,23 +58,18 @@ async def get_search_status():
         if PINECONE_SEARCH_ENABLED:
             try:
                 if PINECONE_API_KEY:
-                    # 실제 Pinecone 연결 테스트
+                    # 실제 Pinecone 연결 테스트 (공유 제공자, 통계는 TTL 캐시)
                     try:
-                        from pinecone import Pinecone
-                        pc = Pinecone(api_key=PINECONE_API_KEY)
-                        index = pc.Index(PINECONE_INDEX_NAME)
+                        provider = get_pinecone_provider()
                         
                         # 인덱스 통계 조회로 연결 확인
-                        stats = index.describe_index_stats()
+                        stats = provider.stats()
                         
                         status["pinecone_available"] = True
                         status["pinecone_index_name"] = PINECONE_INDEX_NAME
                         status["pinecone_connected"] = True
-                        status["pinecone_stats"] = {
-                            "dimension": stats.get("dimension", "unknown"),
-                            "total_vector_count": stats.get("total_vector_count", 0),
-                            "index_fullness": stats.get("index_fullness", 0)
-                        }
+                        status["pinecone_stats"] = stats
+                        status["pinecone_provider"] = provider.info()
                     except Exception as conn_error:
                         status["pinecone_available"] = False
                         status["pinecone_connected"] = False
@@ -102,116 +120,91 @@ async def get_search_status():
 
 @router.get("/api/search/cache")
 async def get_cache_status():
-    """검색 캐시 상태 확인"""
-    import threading
-    global _pinecone_cache, _cache_lock
-    
-    if _cache_lock is None:
-        _cache_lock = threading.Lock()
-    
-    with _cache_lock:
-        cache_keys = list(_pinecone_cache.keys())
-        cache_size = len(_pinecone_cache)
-        cache_max_size = _cache_max_size
-        
-        # 캐시 항목 요약 정보
-        cache_items = []
-        for key, value in _pinecone_cache.items():
-            cache_items.append({
-                "key": key,
-                "query": key.split(":")[0] if ":" in key else key,
-                "top_k": value.get("top_k", "unknown"),
-                "result_count": len(value.get("results", [])),
-                "timestamp": value.get("timestamp", "unknown")
-            })
-        
-        return {
-            "cache_enabled": True,
-            "cache_size": cache_size,
-            "cache_max_size": cache_max_size,
-            "cache_usage_percent": round((cache_size / cache_max_size) * 100, 2) if cache_max_size > 0 else 0,
-            "cache_keys": cache_keys,
-            "cache_items": cache_items
-        }
+    """검색 캐시 상태 확인 (hit rate, 용량, 항목 요약)"""
+    cache = _get_search_cache()
+    items = cache.items()
+    return {
+        "cache_enabled": True,
+        **cache.stats(),
+        "single_flight": _search_flight.stats(),
+        "cache_keys": [item["key"] for item in items],
+        "cache_items": items
+    }
 
 
 @router.delete("/api/search/cache")
 async def clear_cache():
     """검색 캐시 초기화"""
-    import threading
-    global _pinecone_cache, _cache_lock
-    
-    if _cache_lock is None:
-        _cache_lock = threading.Lock()
+    cache_size_before = _get_search_cache().clear()
+    logger.info(f"[Cache] 캐시 초기화 완료: {cache_size_before}개 항목 삭제")
     
-    with _cache_lock:
-        cache_size_before = len(_pinecone_cache)
-        _pinecone_cache.clear()
-        logger.info(f"[Cache] 캐시 초기화 완료: {cache_size_before}개 항목 삭제")
-        
+    return {
+        "success": True,
+        "message": f"캐시가 초기화되었습니다. ({cache_size_before}개 항목 삭제)",
+        "cache_size_before": cache_size_before,
+        "cache_size_after": 0
+    }
+
+
+@router.get("/api/search/llm-cache")
+async def get_llm_cache_status():
+    """LLM 단계 결과 캐시 및 임베딩 캐시 상태 확인 (단계별 hit/miss)"""
+    cache = get_llm_cache()
+    if cache is None:
+        embedding_cache = get_embedding_cache()
         return {
-            "success": True,
-            "message": f"캐시가 초기화되었습니다. ({cache_size_before}개 항목 삭제)",
-            "cache_size_before": cache_size_before,
-            "cache_size_after": 0
+            "cache_enabled": False,
+            "embedding_cache": embedding_cache.stats() if embedding_cache is not None else None
         }
+    embedding_cache = get_embedding_cache()
+    return {
+        "cache_enabled": True,
+        **cache.stats(),
+        "embedding_cache": embedding_cache.stats() if embedding_cache is not None else None
+    }
+
+
+@router.delete("/api/search/llm-cache")
+async def clear_llm_cache(stage: Optional[str] = None):
+    """LLM 단계 결과 캐시 초기화 (stage 지정 시 해당 단계만: metadata, classify, text, plan)"""
+    cache = get_llm_cache()
+    if cache is None:
+        return {"success": False, "message": "LLM 캐시가 비활성화되어 있습니다."}
+    removed = cache.clear(stage)
+    return {
+        "success": True,
+        "message": f"LLM 캐시가 초기화되었습니다. ({removed}개 항목 삭제)",
+        "stage": stage,
+        "removed": removed
+    }
 
 
 # 파이프라인 싱글톤 (재사용)
 _pipeline_instance: Optional[Any] = None
 _pipeline_lock = None
 
-# Pinecone 검색 결과 캐시 (쿼리 -> mb_sn 리스트)
-_pinecone_cache: Dict[str, Dict[str, Any]] = {}
-_cache_lock = None
-_cache_max_size = 100  # 최대 캐시 크기
+# Pinecone 검색 결과 캐시 (쿼리 + top_k + 필터 -> {"mb_sns", "scores"})
+_search_cache: Optional[SearchResultCache] = None
+_search_cache_lock = threading.Lock()
 
 
-def _get_cache_key(query: str, top_k: int) -> str:
-    """캐시 키 생성"""
-    return f"{query.strip().lower()}:{top_k}"
+# 동일 검색 동시 요청 병합 (키는 검색 캐시와 동일)
+_search_flight = SingleFlight("검색 single-flight")
 
 
-def _get_cached_result(query: str, top_k: int) -> Optional[List[str]]:
-    """캐시에서 검색 결과 가져오기"""
-    import threading
-    global _pinecone_cache, _cache_lock
-    
-    if _cache_lock is None:
-        _cache_lock = threading.Lock()
-    
-    cache_key = _get_cache_key(query, top_k)
-    
-    with _cache_lock:
-        if cache_key in _pinecone_cache:
-            cached = _pinecone_cache[cache_key]
-            return cached.get('results')
+def _get_search_cache() -> SearchResultCache:
+    """검색 결과 캐시 싱글톤 반환 (지연 초기화)"""
+    global _search_cache
     
-    return None
-
-
-def _set_cached_result(query: str, top_k: int, results: List[str]):
-    """검색 결과를 캐시에 저장"""
-    import threading
-    global _pinecone_cache, _cache_lock
-    
-    if _cache_lock is None:
-        _cache_lock = threading.Lock()
-    
-    cache_key = _get_cache_key(query, top_k)
-    
-    with _cache_lock:
-        # 캐시 크기 제한 (LRU 방식)
-        if len(_pinecone_cache) >= _cache_max_size:
-            # 가장 오래된 항목 제거 (FIFO)
-            oldest_key = next(iter(_pinecone_cache))
-            del _pinecone_cache[oldest_key]
-        
-        _pinecone_cache[cache_key] = {
-            'results': results,
-            'top_k': top_k,
-            'timestamp': datetime.now().isoformat()
-        }
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchResultCache(
+                    max_entries=SEARCH_CACHE_MAX_ENTRIES,
+                    ttl_seconds=SEARCH_CACHE_TTL_SECONDS,
+                    max_bytes=SEARCH_CACHE_MAX_BYTES
+                )
+    return _search_cache
 
 
 def _get_pipeline():
@@ -236,13 +229,58 @@ def _get_pipeline():
                     pinecone_index_name=PINECONE_INDEX_NAME,
                     category_config=category_config,
                     anthropic_api_key=ANTHROPIC_API_KEY,
-                    openai_api_key=OPENAI_API_KEY
+                    openai_api_key=OPENAI_API_KEY,
+                    result_filter_mode=PINECONE_FILTER_MODE,
+                    result_filter_max_workers=PINECONE_FILTER_MAX_WORKERS,
+                    score_fusion=PINECONE_SCORE_FUSION,
+                    selectivity_order=PINECONE_FILTER_SELECTIVITY_ORDER,
+                    stage_timeouts=SEARCH_STAGE_TIMEOUTS,
+                    text_max_workers=SEARCH_TEXT_MAX_WORKERS,
+                    planner_mode=SEARCH_PLANNER_MODE,
+                    llm_cache=get_llm_cache(),
+                    embedding_cache=get_embedding_cache(),
+                    embedding_batch=EMBEDDING_BATCH_ENABLED,
+                    metadata_index=get_panel_metadata_index(),
+                    exhaustive_chunk_size=PINECONE_EXHAUSTIVE_CHUNK_SIZE,
+                    in_chunk_size=PINECONE_IN_CHUNK_SIZE,
+                    in_max_workers=PINECONE_IN_MAX_WORKERS,
+                    relaxation_max_candidates=PINECONE_RELAXATION_MAX_CANDIDATES,
+                    index_provider=get_pinecone_provider()
                 )
-                logger.info("Pinecone 파이프라인 초기화 완료")
+                logger.info(f"Pinecone 파이프라인 초기화 완료 (결과 필터 모드: {PINECONE_FILTER_MODE}, 플래너: {SEARCH_PLANNER_MODE})")
     
     return _pipeline_instance
 
 
+async def _run_pipeline_search(
+    pipeline,
+    query_text: str,
+    top_k: Optional[int],
+    external_filters: Optional[Dict[str, Dict[str, Any]]]
+):
+    """
+    파이프라인 검색 실행 (전체 타임아웃 적용)
+
+    SEARCH_ASYNC_ENABLED면 pipeline.asearch를 이벤트 루프에서 직접 실행하여
+    타임아웃/클라이언트 연결 종료 시 진행 중인 LLM/Pinecone 호출까지 취소됨.
+    아니면 기존처럼 스레드풀에서 pipeline.search 실행.
+    """
+    if SEARCH_ASYNC_ENABLED:
+        return await asyncio.wait_for(
+            pipeline.asearch(query_text, top_k=top_k, external_filters=external_filters),
+            timeout=SEARCH_TIMEOUT
+        )
+
+    loop = asyncio.get_event_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(
+            None,
+            lambda: pipeline.search(query_text, top_k=top_k, external_filters=external_filters)
+        ),
+        timeout=SEARCH_TIMEOUT
+    )
+
+
 async def _search_with_pinecone(
     query_text: str,
     top_k: int = 100,
@@ -266,59 +304,31 @@ async def _search_with_pinecone(
     if not PINECONE_SEARCH_ENABLED:
         return None
     
+    # 프론트엔드 필터를 Pinecone 필터로 변환 (캐시 키에 포함)
+    external_filters = _convert_filters(filters_dict)
+    cache = _get_search_cache()
+    cache_key = make_search_cache_key(query_text, top_k, external_filters)
+    
     # 캐시 확인 (강제 새로고침이 아니고 캐시 사용이 활성화된 경우)
     if use_cache and not force_refresh:
-        cached_result = _get_cached_result(query_text, top_k)
+        cached_result = cache.get(cache_key)
         if cached_result is not None:
             return cached_result
     
     try:
-        import asyncio
-        import time
-        
-        # 싱글톤 파이프라인 가져오기
-        pipeline = _get_pipeline()
-        
-        # 프론트엔드 필터를 Pinecone 필터로 변환
-        external_filters = None
-        if filters_dict:
-            # ⭐ 빈 필터 체크: 실제로 값이 있는 필터만 있는지 확인
-            has_actual_filters = any(
-                (isinstance(v, list) and len(v) > 0) or
-                (isinstance(v, bool) and v is True) or
-                (isinstance(v, (int, float)) and v > 0) or
-                (isinstance(v, str) and v.strip())
-                for v in filters_dict.values()
-            )
-            
-            if has_actual_filters:
-                converter = PineconeFilterConverter()
-                external_filters = converter.convert_to_pinecone_filters(filters_dict)
-            else:
-                external_filters = None
-        
-        # 동기 함수를 비동기로 실행 (LLM 호출 등 블로킹 작업 포함)
-        # 타임아웃 설정: 240초 (LLM 호출이 여러 단계에서 발생하므로 여유있게 설정)
-        executor_start_time = time.time()
-        loop = asyncio.get_event_loop()
-        try:
-            search_result = await asyncio.wait_for(
-                loop.run_in_executor(
-            None, 
-            lambda: pipeline.search(query_text, top_k=top_k, external_filters=external_filters)
-                ),
-                timeout=240.0  # 240초 타임아웃
-            )
-        except asyncio.TimeoutError:
-            executor_time = time.time() - executor_start_time
-            logger.error(f"[Pinecone 검색] pipeline.search 타임아웃: {executor_time:.2f}초 경과 (240초 초과)")
-            raise Exception(f"검색이 타임아웃되었습니다 (240초 초과). 서버 로그를 확인하세요.")
+        # ⭐ 동일 키로 진행 중인 검색이 있으면 합류 (중복 LLM/임베딩/Pinecone 호출 방지)
+        search_result = await _search_flight.do(
+            cache_key,
+            lambda: _run_search_uncached(query_text, top_k, external_filters)
+        )
         
-        # 검색 성공 시 캐시에 저장 (호환성을 위해 mb_sn 리스트만 캐시)
-        if search_result is not None and use_cache:
-            mb_sns = search_result.get("mb_sns", []) if isinstance(search_result, dict) else search_result
-            if mb_sns:
-                _set_cached_result(query_text, top_k, mb_sns)
+        # 검색 성공 시 캐시에 저장 (mb_sns + scores + relaxations 등 결과 전체)
+        if isinstance(search_result, dict) and search_result.get("mb_sns") and use_cache:
+            cache.set(cache_key, search_result, meta={
+                "query": query_text,
+                "top_k": top_k,
+                "filters": external_filters
+            })
         
         return search_result
         
@@ -326,13 +336,54 @@ async def _search_with_pinecone(
         logger.error(f"Pinecone 검색 실패: {e}", exc_info=True)
         # 오류 발생 시에도 캐시된 결과가 있으면 반환 (fallback)
         if use_cache and not force_refresh:
-            cached_result = _get_cached_result(query_text, top_k)
+            cached_result = cache.get(cache_key)
             if cached_result is not None:
                 logger.warning(f"[Pinecone 캐시] 검색 실패, 캐시된 결과 반환: '{query_text}'")
                 return cached_result
         return None
 
 
+async def _run_search_uncached(
+    query_text: str,
+    top_k: Optional[int],
+    external_filters: Optional[Dict[str, Dict[str, Any]]]
+):
+    """파이프라인 검색 실제 실행 (single-flight 대상)"""
+    import time
+    
+    # 싱글톤 파이프라인 가져오기
+    pipeline = _get_pipeline()
+    
+    # 타임아웃 설정: SEARCH_TIMEOUT (LLM 호출이 여러 단계에서 발생하므로 여유있게 설정)
+    executor_start_time = time.time()
+    try:
+        return await _run_pipeline_search(pipeline, query_text, top_k, external_filters)
+    except asyncio.TimeoutError:
+        executor_time = time.time() - executor_start_time
+        logger.error(f"[Pinecone 검색] pipeline 검색 타임아웃: {executor_time:.2f}초 경과 ({SEARCH_TIMEOUT:.0f}초 초과)")
+        raise Exception(f"검색이 타임아웃되었습니다 ({SEARCH_TIMEOUT:.0f}초 초과). 서버 로그를 확인하세요.")
+
+
+def _convert_filters(filters_dict: Optional[Dict[str, Any]]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """프론트엔드 필터를 카테고리별 Pinecone 필터로 변환 (실제 값이 없으면 None)"""
+    if not filters_dict:
+        return None
+    
+    # ⭐ 빈 필터 체크: 실제로 값이 있는 필터만 있는지 확인
+    has_actual_filters = any(
+        (isinstance(v, list) and len(v) > 0) or
+        (isinstance(v, bool) and v is True) or
+        (isinstance(v, (int, float)) and v > 0) or
+        (isinstance(v, str) and v.strip())
+        for v in filters_dict.values()
+    )
+    if not has_actual_filters:
+        return None
+    
+    converter = PineconeFilterConverter()
+    return converter.convert_to_pinecone_filters(filters_dict) or None
+
+
 @router.post("/api/search")
 async def api_search_post(
     payload: Dict[str, Any]
@@ -382,12 +433,14 @@ async def api_search_post(
                 filters_dict=filters_dict  # 필터 전달
             )
             # 결과 형식 확인 (기존 List[str] 또는 새로운 Dict 형태)
+            relaxations = []
             if pinecone_result is None:
                 pinecone_mb_sns = None
                 pinecone_scores = {}
             elif isinstance(pinecone_result, dict):
                 pinecone_mb_sns = pinecone_result.get("mb_sns", [])
                 pinecone_scores = pinecone_result.get("scores", {})
+                relaxations = pinecone_result.get("relaxations", [])
             else:
                 # 기존 형식 (List[str]) - 호환성 유지
                 pinecone_mb_sns = pinecone_result
@@ -395,20 +448,27 @@ async def api_search_post(
             
             if pinecone_mb_sns:
                 # 필터링된 결과를 기존 API 형식으로 변환 (Pinecone 메타데이터 사용)
+                # ⭐ 요청한 페이지 창만 하이드레이션 (Pinecone 조회 비용이 전체 결과가 아닌 limit에 비례)
+                import math
+                total_count = len(pinecone_mb_sns)
+                total_pages = math.ceil(total_count / limit) if limit > 0 else 1
                 panel_details = await _get_panel_details_from_pinecone(
-                    pinecone_mb_sns, 1, len(pinecone_mb_sns), similarity_scores=pinecone_scores
+                    pinecone_mb_sns, page, limit, similarity_scores=pinecone_scores
                 )
                 
                 response_data = {
                     "query": query_text,
-                    "page": 1,
-                    "page_size": len(panel_details["results"]),
-                    "count": len(panel_details["results"]),
-                    "total": len(panel_details["results"]),
-                    "pages": 1,
+                    "page": page,
+                    "page_size": limit,
+                    "count": panel_details["count"],
+                    "total": total_count,
+                    "pages": total_pages,
                     "mode": "pinecone",
                     "results": panel_details["results"]
                 }
+                # ⭐ 메타데이터 필터 결과가 0개라 조건을 완화한 카테고리 (어떤 조건을 빼거나 넓혔는지)
+                if relaxations:
+                    response_data["relaxations"] = relaxations
                 
                 return response_data
             else:
@@ -435,20 +495,18 @@ async def api_search_post(
                 if external_filters:
                     # 빈 쿼리로 Pinecone 검색 (필터만 적용)
                     # ⭐ 필터만 검색하는 경우 조건에 부합하는 모든 패널 반환 (top_k=None)
-                    import asyncio
                     pipeline = _get_pipeline()
-                    loop = asyncio.get_event_loop()
                     
                     # 빈 쿼리로 검색 (필터만 적용, 전체 반환)
-                    search_result = await loop.run_in_executor(
-                        None,
-                        lambda: pipeline.search("", top_k=None, external_filters=external_filters)
-                    )
+                    search_result = await _run_pipeline_search(pipeline, "", None, external_filters)
                     
                     # pipeline.search()는 {"mb_sns": [...], "scores": {...}} 형태로 반환
+                    # ⭐ 전수 모드 결과는 "total"(조건 만족 패널 수)과 "exact": True를 함께 반환
+                    total_exact = False
                     if isinstance(search_result, dict):
                         mb_sn_list = search_result.get("mb_sns", [])
                         scores = search_result.get("scores", {})
+                        total_exact = bool(search_result.get("exact", False))
                     elif isinstance(search_result, list):
                         # 호환성을 위해 리스트 형태도 처리
                         mb_sn_list = search_result
@@ -461,7 +519,7 @@ async def api_search_post(
                         
                         # ⭐ 전체 mb_sn_list를 전달하고, _get_panel_details_from_pinecone 내부에서 페이지네이션 처리
                         # 전체 개수를 실제 검색 결과 개수로 설정
-                        total_count = len(mb_sn_list)
+                        total_count = search_result.get("total", len(mb_sn_list)) if total_exact else len(mb_sn_list)
                         import math
                         total_pages = math.ceil(total_count / limit) if limit > 0 else 1
                         
@@ -480,6 +538,7 @@ async def api_search_post(
                             "page_size": limit,
                             "count": panel_details["count"],
                             "total": total_count,  # 전체 검색 결과 개수
+                            "total_exact": total_exact,  # false면 Pinecone top_k 상한으로 잘렸을 수 있음
                             "pages": total_pages,
                             "mode": "pinecone_filter",
                             "results": panel_details["results"]
@@ -1,45 +1,39 @@
-"""클러스터링 모듈"""
-from .core import (
-    DynamicClusteringPipeline,
-    DynamicFeatureSelector,
-    DynamicKOptimizer,
-    decide_clustering_strategy
-)
-from .integrated_pipeline import IntegratedClusteringPipeline
-from .filters import PanelFilter, BaseFilter
-from .processors import VectorProcessor, EmbeddingProcessor, BaseProcessor
-from .algorithms import (
-    KMeansAlgorithm,
-    MiniBatchKMeansAlgorithm,
-    HDBSCANAlgorithm,
-    BaseClusteringAlgorithm
-)
-from .artifacts import save_artifacts, load_artifacts, new_session_dir
-from .compare import compare_groups
+"""클러스터링 모듈
 
-__all__ = [
+⭐ 하위 모듈(sklearn/scipy/hdbscan 의존)은 처음 접근할 때 import (서버 시작 시간 단축)
+   `from app.clustering import KMeansAlgorithm`처럼 기존 사용법은 그대로 동작
+"""
+from ._lazy import lazy_exports
+
+# 공개 이름 → 정의된 하위 모듈
+_LAZY_EXPORTS = {
     # Core
-    'DynamicClusteringPipeline',
-    'DynamicFeatureSelector',
-    'DynamicKOptimizer',
-    'decide_clustering_strategy',
+    'DynamicClusteringPipeline': '.core',
+    'DynamicFeatureSelector': '.core',
+    'DynamicKOptimizer': '.core',
+    'decide_clustering_strategy': '.core',
     # Integrated
-    'IntegratedClusteringPipeline',
+    'IntegratedClusteringPipeline': '.integrated_pipeline',
     # Filters
-    'PanelFilter',
-    'BaseFilter',
+    'PanelFilter': '.filters',
+    'BaseFilter': '.filters',
     # Processors
-    'VectorProcessor',
-    'EmbeddingProcessor',
-    'BaseProcessor',
+    'VectorProcessor': '.processors',
+    'EmbeddingProcessor': '.processors',
+    'BaseProcessor': '.processors',
     # Algorithms
-    'KMeansAlgorithm',
-    'MiniBatchKMeansAlgorithm',
-    'HDBSCANAlgorithm',
-    'BaseClusteringAlgorithm',
+    'KMeansAlgorithm': '.algorithms',
+    'MiniBatchKMeansAlgorithm': '.algorithms',
+    'HDBSCANAlgorithm': '.algorithms',
+    'BaseClusteringAlgorithm': '.algorithms',
     # Utils
-    'save_artifacts',
-    'load_artifacts',
-    'new_session_dir',
-    'compare_groups',
-]
+    'save_artifacts': '.artifacts',
+    'load_artifacts': '.artifacts',
+    'new_session_dir': '.artifacts',
+    'compare_groups': '.compare',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS, globals())
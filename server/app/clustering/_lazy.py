@@ -0,0 +1,36 @@
+"""패키지 __init__용 지연 import 도우미 (PEP 562 모듈 __getattr__)"""
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str], namespace: Dict[str, Any]) -> Tuple[Callable, Callable]:
+    """
+    공개 이름을 처음 접근할 때 하위 모듈에서 가져오는 __getattr__/__dir__ 생성
+
+    Args:
+        package: 패키지 이름 (__name__)
+        exports: 공개 이름 → 상대 모듈 경로 (예: {"KMeansAlgorithm": ".kmeans"})
+        namespace: 패키지 globals() (가져온 값을 캐시해 이후 접근은 일반 속성 조회)
+
+    Returns:
+        (__getattr__, __dir__)
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name, package), name)
+        else:
+            # 하위 모듈 속성 접근 (예: app.clustering.core) - 기존 eager import와 동일하게 동작
+            try:
+                value = importlib.import_module(f".{name}", package)
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
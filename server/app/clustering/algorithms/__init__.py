@@ -1,8 +1,16 @@
-"""클러스터링 알고리즘 모듈"""
+"""클러스터링 알고리즘 모듈
+
+⭐ sklearn/hdbscan 의존 구현체는 처음 접근할 때 import
+"""
+from .._lazy import lazy_exports
+
 from .base import BaseClusteringAlgorithm
-from .kmeans import KMeansAlgorithm
-from .minibatch_kmeans import MiniBatchKMeansAlgorithm
-from .hdbscan import HDBSCANAlgorithm
+
+_LAZY_EXPORTS = {
+    'KMeansAlgorithm': '.kmeans',
+    'MiniBatchKMeansAlgorithm': '.minibatch_kmeans',
+    'HDBSCANAlgorithm': '.hdbscan',
+}
 
 __all__ = [
     'BaseClusteringAlgorithm',
@@ -12,5 +20,4 @@ __all__ = [
 ]
 
 
-
-
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS, globals())
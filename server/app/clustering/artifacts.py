@@ -1,14 +1,15 @@
 """아티팩트 저장/로드"""
 import uuid
 import json
-import joblib
 import logging
 import asyncio
 from pathlib import Path
-from typing import Optional, Dict, Any
-import pandas as pd
+from typing import Optional, Dict, Any, TYPE_CHECKING
 import numpy as np
 
+if TYPE_CHECKING:
+    import pandas as pd  # 런타임에는 DataFrame을 다루는 함수 안에서 import (서버 시작 시간 단축)
+
 logger = logging.getLogger(__name__)
 
 BASE = Path("runs")
@@ -31,7 +32,7 @@ def new_session_dir() -> Path:
 
 def save_artifacts(
     session_dir: Path, 
-    df: pd.DataFrame, 
+    df: "pd.DataFrame", 
     labels: Optional[np.ndarray], 
     meta: Dict[str, Any]
 ) -> None:
@@ -49,6 +50,7 @@ def save_artifacts(
     meta : dict
         메타데이터
     """
+    import pandas as pd
     # 1. 데이터 저장
     if df is not None:
         data_path = session_dir / "data.csv"
@@ -77,6 +79,7 @@ def save_artifacts(
     # 4. 모델 저장 (있는 경우)
     if 'model' in meta:
         model_path = session_dir / "model.joblib"
+        import joblib
         joblib.dump(meta['model'], model_path)
 
 
@@ -94,6 +97,7 @@ def load_artifacts(session_id: str) -> Optional[Dict[str, Any]]:
     dict, optional
         아티팩트 딕셔너리 (None이면 찾을 수 없음)
     """
+    import pandas as pd
     logger.info(f"[Artifacts] 아티팩트 로드 시작: session_id={session_id}")
     
     # 1. NeonDB에서 로드 시도
@@ -175,6 +179,7 @@ def load_artifacts(session_id: str) -> Optional[Dict[str, Any]]:
     model_path = session_dir / "model.joblib"
     if model_path.exists():
         logger.debug(f"[Artifacts] 모델 파일 로드: {model_path}")
+        import joblib
         artifacts['model'] = joblib.load(model_path)
     
     if artifacts:
@@ -187,6 +192,7 @@ def load_artifacts(session_id: str) -> Optional[Dict[str, Any]]:
 
 def _make_json_serializable(obj: Any) -> Any:
     """JSON 직렬화 가능하게 변환"""
+    import pandas as pd
     if isinstance(obj, (np.integer, np.floating)):
         return float(obj)
     elif isinstance(obj, np.ndarray):
@@ -1,18 +1,19 @@
 """
 클러스터링 코어 모듈
 동적 클러스터링 파이프라인 및 관련 유틸리티
+
+⭐ sklearn 의존 하위 모듈은 처음 접근할 때 import
 """
+from .._lazy import lazy_exports
 
-from .pipeline import DynamicClusteringPipeline
-from .feature_selector import DynamicFeatureSelector
-from .k_optimizer import DynamicKOptimizer
-from .strategy_manager import decide_clustering_strategy
+_LAZY_EXPORTS = {
+    'DynamicClusteringPipeline': '.pipeline',
+    'DynamicFeatureSelector': '.feature_selector',
+    'DynamicKOptimizer': '.k_optimizer',
+    'decide_clustering_strategy': '.strategy_manager',
+}
 
-__all__ = [
-    'DynamicClusteringPipeline',
-    'DynamicFeatureSelector',
-    'DynamicKOptimizer',
-    'decide_clustering_strategy',
-]
+__all__ = list(_LAZY_EXPORTS)
 
 
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS, globals())
@@ -1,10 +1,17 @@
-"""프로세서 모듈"""
-from .base import BaseProcessor
-from .vector_processor import VectorProcessor
-from .embedding_processor import EmbeddingProcessor
+"""프로세서 모듈
 
-__all__ = ['BaseProcessor', 'VectorProcessor', 'EmbeddingProcessor']
+⭐ sklearn 의존 구현체는 처음 접근할 때 import
+"""
+from .._lazy import lazy_exports
 
+from .base import BaseProcessor
 
+_LAZY_EXPORTS = {
+    'VectorProcessor': '.vector_processor',
+    'EmbeddingProcessor': '.embedding_processor',
+}
+
+__all__ = ['BaseProcessor', 'VectorProcessor', 'EmbeddingProcessor']
 
 
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS, globals())
@@ -37,6 +37,19 @@ def fq(schema: str, table: str) -> str:
     return f'"{schema}"."{table}"'
 
 
+# NeonDB 공유 비동기 엔진 (app/db/engine_registry.py, 모든 로더/세션이 같은 연결 풀 사용)
+DB_POOL_SIZE: Final[int] = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW: Final[int] = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# 풀에서 연결을 기다리는 최대 시간 (초)
+DB_POOL_TIMEOUT: Final[float] = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# 연결 재생성 주기 (초, Neon compute 자동 중지(기본 5분) 전에 교체)
+DB_POOL_RECYCLE: Final[int] = int(os.getenv("DB_POOL_RECYCLE", "280"))
+# 연결별 statement_timeout (ms, 0이면 서버 기본값, PgBouncer 트랜잭션 모드 pooler에서는 0 권장)
+DB_STATEMENT_TIMEOUT_MS: Final[int] = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+# true면 연결 풀 없이 매번 연결 (PgBouncer/Neon pooler 앞단에서 필요할 때만)
+DB_USE_NULL_POOL: Final[bool] = os.getenv("DB_USE_NULL_POOL", "false").lower() in ("true", "1", "yes", "on")
+
+
 # 전처리/가중치/버전 설정
 PREPROC_VERSION: Final[str] = os.getenv("PREPROC_VERSION", "v1.0")
 KEYWORD_BUNDLE: Final[str] = os.getenv("KEYWORD_BUNDLE", "kr_default_v1")
@@ -64,6 +77,95 @@ PINECONE_SEARCH_ENABLED: Final[bool] = os.getenv("PINECONE_SEARCH_ENABLED", "tru
 PINECONE_API_KEY: Final[str] = os.getenv("PINECONE_API_KEY", "")
 PINECONE_INDEX_NAME: Final[str] = os.getenv("PINECONE_INDEX_NAME", "panel-profiles")
 PINECONE_ENVIRONMENT: Final[str] = os.getenv("PINECONE_ENVIRONMENT", "us-east-1")
+# 공유 Pinecone 인덱스 제공자 (인덱스 통계 캐시 TTL(초), 인덱스 HTTP 연결 풀 크기(0=SDK 기본값), gRPC 사용 여부)
+PINECONE_STATS_TTL: Final[float] = float(os.getenv("PINECONE_STATS_TTL", "60"))
+PINECONE_POOL_MAXSIZE: Final[int] = int(os.getenv("PINECONE_POOL_MAXSIZE", "0"))
+PINECONE_USE_GRPC: Final[bool] = os.getenv("PINECONE_USE_GRPC", "false").lower() in ("true", "1", "yes", "on")
+
+# 카테고리 결과 필터 실행 모드 ("progressive": 단계적 축소(직렬), "parallel": 카테고리 동시 검색 후 로컬 교집합)
+PINECONE_FILTER_MODE: Final[str] = os.getenv("PINECONE_FILTER_MODE", "progressive").lower()
+PINECONE_FILTER_MAX_WORKERS: Final[int] = int(os.getenv("PINECONE_FILTER_MAX_WORKERS", "5"))
+# progressive 모드에서 로컬 메타데이터 인덱스 선택도가 낮은 카테고리부터 실행 (LOCAL_FILTER_INDEX_ENABLED 필요)
+PINECONE_FILTER_SELECTIVITY_ORDER: Final[bool] = os.getenv("PINECONE_FILTER_SELECTIVITY_ORDER", "true").lower() in ("true", "1", "yes", "on")
+# 최종 정렬 점수 결합 방식 ("last", "max", "mean", "rrf")
+PINECONE_SCORE_FUSION: Final[str] = os.getenv("PINECONE_SCORE_FUSION", "last").lower()
+# 후보 mb_sn $in 필터 분할 (후보가 chunk 크기를 넘으면 chunk별 동시 쿼리 후 점수 기준 top_k 병합)
+PINECONE_IN_CHUNK_SIZE: Final[int] = int(os.getenv("PINECONE_IN_CHUNK_SIZE", "1000"))
+PINECONE_IN_MAX_WORKERS: Final[int] = int(os.getenv("PINECONE_IN_MAX_WORKERS", "4"))
+# 메타데이터 필터 결과가 0개일 때 동시에 시도할 완화 후보 수 (선택도 순, 필터 전체 제거는 항상 추가)
+PINECONE_RELAXATION_MAX_CANDIDATES: Final[int] = int(os.getenv("PINECONE_RELAXATION_MAX_CANDIDATES", "4"))
+
+# 검색 결과 메타데이터 조회 (현재 페이지 패널만, topic × chunk 동시 요청)
+PINECONE_HYDRATION_CHUNK_SIZE: Final[int] = int(os.getenv("PINECONE_HYDRATION_CHUNK_SIZE", "100"))
+PINECONE_HYDRATION_MAX_WORKERS: Final[int] = int(os.getenv("PINECONE_HYDRATION_MAX_WORKERS", "8"))
+# 벡터 ID 규칙 (설정 시 fetch / list 사용, 비어있으면 topic + mb_sn $in 필터 쿼리)
+# 예: PINECONE_VECTOR_ID_TEMPLATE="{mb_sn}_{topic}", PINECONE_VECTOR_ID_PREFIX="{mb_sn}#"
+PINECONE_VECTOR_ID_TEMPLATE: Final[str] = os.getenv("PINECONE_VECTOR_ID_TEMPLATE", "")
+PINECONE_VECTOR_ID_PREFIX: Final[str] = os.getenv("PINECONE_VECTOR_ID_PREFIX", "")
+
+# 비동기 검색 파이프라인 (true: pipeline.asearch로 이벤트 루프에서 실행, false: 기존 스레드풀 실행)
+SEARCH_ASYNC_ENABLED: Final[bool] = os.getenv("SEARCH_ASYNC_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+# 1~2단계 실행 방식 ("staged": 메타데이터 추출 → 카테고리 분류, "fused": LLM 1회 결합 호출)
+SEARCH_PLANNER_MODE: Final[str] = os.getenv("SEARCH_PLANNER_MODE", "staged").lower()
+# LLM 단계 결과 캐시 (메타데이터 추출, 카테고리 분류, 텍스트 생성, 결합 플래너)
+LLM_CACHE_ENABLED: Final[bool] = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+LLM_CACHE_MAX_ENTRIES: Final[int] = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+LLM_CACHE_TTL_SECONDS: Final[float] = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+# SQLite 디스크 계층 경로 (비어있으면 메모리 계층만 사용)
+LLM_CACHE_SQLITE_PATH: Final[str] = os.getenv("LLM_CACHE_SQLITE_PATH", "")
+# 임베딩 생성 (배치 요청: 캐시 미스 텍스트를 한 번의 요청으로 임베딩)
+EMBEDDING_BATCH_ENABLED: Final[bool] = os.getenv("EMBEDDING_BATCH_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+# 임베딩 캐시 (텍스트+모델 해시 → float32 벡터)
+EMBEDDING_CACHE_ENABLED: Final[bool] = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+EMBEDDING_CACHE_MAX_ENTRIES: Final[int] = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000"))
+# memmap .npy 저장소 디렉터리 (비어있으면 메모리 계층만 사용, 워커 프로세스별로 별도 디렉터리 사용)
+EMBEDDING_CACHE_DIR: Final[str] = os.getenv("EMBEDDING_CACHE_DIR", "")
+EMBEDDING_CACHE_DISK_CAPACITY: Final[int] = int(os.getenv("EMBEDDING_CACHE_DISK_CAPACITY", "20000"))
+# 검색 결과 캐시 (LRU + TTL + 바이트 예산)
+SEARCH_CACHE_MAX_ENTRIES: Final[int] = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "100"))
+SEARCH_CACHE_TTL_SECONDS: Final[float] = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "600"))
+SEARCH_CACHE_MAX_BYTES: Final[int] = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# 필터만 검색 로컬 메타데이터 인덱스 (merged.panel_data 기반, 평가 불가 필터는 Pinecone 사용)
+LOCAL_FILTER_INDEX_ENABLED: Final[bool] = os.getenv("LOCAL_FILTER_INDEX_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+# 전수 모드에서 로컬 인덱스에 없는 조건(coverage 등)을 Pinecone으로 확인할 때 요청당 mb_sn 수
+PINECONE_EXHAUSTIVE_CHUNK_SIZE: Final[int] = int(os.getenv("PINECONE_EXHAUSTIVE_CHUNK_SIZE", "1000"))
+# 패널 ID(mb_sn) ↔ int32 레지스트리 (startup에서 merged.panel_data mb_sn으로 생성)
+PANEL_ID_REGISTRY_PRELOAD: Final[bool] = os.getenv("PANEL_ID_REGISTRY_PRELOAD", "true").lower() in ("true", "1", "yes", "on")
+# memmap .npy 저장소 경로 (비어있으면 메모리 사전, 있으면 재시작/워커 간 재사용)
+PANEL_ID_REGISTRY_PATH: Final[str] = os.getenv("PANEL_ID_REGISTRY_PATH", "")
+# Precomputed 클러스터링 산출물 캐시 (app/services/precomputed_cache.py, 직렬화된 응답을 세션 버전별로 보관)
+PRECOMPUTED_CACHE_ENABLED: Final[bool] = os.getenv("PRECOMPUTED_CACHE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+# 세션 버전(session_id, updated_at) 확인 주기 (초, 0이면 요청마다 확인)
+PRECOMPUTED_VERSION_PROBE_INTERVAL: Final[float] = float(os.getenv("PRECOMPUTED_VERSION_PROBE_INTERVAL", "5"))
+# 보관할 응답 수 (비교 분석 클러스터 쌍/샘플 크기별로 하나씩, LRU)
+PRECOMPUTED_CACHE_MAX_PAYLOADS: Final[int] = int(os.getenv("PRECOMPUTED_CACHE_MAX_PAYLOADS", "512"))
+# 보관할 응답 바이트 합 상한 (전체 포인트 JSON 응답은 수 MB)
+PRECOMPUTED_CACHE_MAX_BYTES: Final[int] = int(os.getenv("PRECOMPUTED_CACHE_MAX_BYTES", str(128 * 1024 * 1024)))
+# startup 워밍업 컴포넌트 (쉼표 구분, 비우면 비활성화)
+# db, pinecone, category_config, pipeline, merged_data, metadata_index, panel_id_registry, precomputed_umap
+# ml_libs (sklearn/scipy/hdbscan)는 기본값에서 제외 - 클러스터링 첫 요청 시 로드, 필요하면 비차단 모드와 함께 추가
+STARTUP_WARMUP_COMPONENTS: Final[tuple[str, ...]] = tuple(
+    name.strip() for name in os.getenv(
+        "STARTUP_WARMUP_COMPONENTS",
+        "db,pinecone,category_config,pipeline,merged_data,metadata_index,panel_id_registry,precomputed_umap"
+    ).split(",") if name.strip()
+)
+# 컴포넌트별 워밍업 타임아웃 (초, 0이면 무제한)
+STARTUP_WARMUP_TIMEOUT: Final[float] = float(os.getenv("STARTUP_WARMUP_TIMEOUT", "120"))
+# true면 워밍업이 끝난 뒤 요청 수신, false면 백그라운드 워밍업
+STARTUP_WARMUP_BLOCKING: Final[bool] = os.getenv("STARTUP_WARMUP_BLOCKING", "true").lower() in ("true", "1", "yes", "on")
+# 3단계 텍스트 생성 동시 LLM 호출 수
+SEARCH_TEXT_MAX_WORKERS: Final[int] = int(os.getenv("SEARCH_TEXT_MAX_WORKERS", "5"))
+# 전체 검색 타임아웃 (초)
+SEARCH_TIMEOUT: Final[float] = float(os.getenv("SEARCH_TIMEOUT", "240"))
+# 단계별 타임아웃 (초, "text"는 search/asearch 공통, 나머지는 asearch 전용)
+SEARCH_STAGE_TIMEOUTS: Final[dict[str, float]] = {
+    "metadata": float(os.getenv("SEARCH_TIMEOUT_METADATA", "35")),
+    "classify": float(os.getenv("SEARCH_TIMEOUT_CLASSIFY", "35")),
+    "text": float(os.getenv("SEARCH_TIMEOUT_TEXT", "35")),
+    "embedding": float(os.getenv("SEARCH_TIMEOUT_EMBEDDING", "30")),
+    "search": float(os.getenv("SEARCH_TIMEOUT_PINECONE", "120")),
+}
 
 # 카테고리 설정 - 프로젝트 루트 기준 상대 경로
 def _get_project_root() -> Path:
@@ -0,0 +1,286 @@
+"""NeonDB 공유 비동기 엔진 레지스트리 (연결 풀 재사용 + 풀 메트릭)"""
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Dict, Any, Optional
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+logger = logging.getLogger(__name__)
+
+
+def build_async_uri() -> Optional[str]:
+    """
+    비동기 DB URI 구성 (psycopg 사용)
+
+    우선순위:
+    1. ASYNC_DATABASE_URI (전체 URI, postgresql:// / postgresql+asyncpg:// → postgresql+psycopg://)
+    2. PG* / DB_* 환경변수 조합
+
+    Note: asyncpg는 Python 3.13 호환성 문제로 psycopg 사용
+
+    Returns:
+        URI 또는 None (유효하지 않은 경우)
+    """
+    from dotenv import load_dotenv
+    load_dotenv(override=True)
+
+    # 1) 전체 URI가 들어온 경우 드라이버만 psycopg로 맞춤
+    uri = os.getenv("ASYNC_DATABASE_URI")
+    if uri:
+        if uri.startswith("postgresql://"):
+            uri = uri.replace("postgresql://", "postgresql+psycopg://", 1)
+        elif "postgresql+asyncpg" in uri:
+            uri = uri.replace("postgresql+asyncpg", "postgresql+psycopg", 1)
+    else:
+        # 2) PG* / DB_*로 조합 (기본값 포함)
+        user = os.getenv("PGUSER") or os.getenv("DB_USER", "postgres")
+        pwd = os.getenv("PGPASSWORD") or os.getenv("DB_PASSWORD", "")
+        host = os.getenv("PGHOST") or os.getenv("DB_HOST", "localhost")
+        port = os.getenv("PGPORT") or os.getenv("DB_PORT", "5432")
+        db = os.getenv("PGDATABASE") or os.getenv("DB_NAME", "postgres")
+        ssl = os.getenv("PGSSLMODE") or os.getenv("DB_SSLMODE", "require")
+        uri = f"postgresql+psycopg://{user}:{pwd}@{host}:{port}/{db}?sslmode={ssl}"
+
+    if not uri or ":///" in uri or "://@/" in uri:
+        return None
+    return uri
+
+
+class EngineRegistry:
+    """
+    프로세스 전역 비동기 엔진 관리
+
+    - 서버 이벤트 루프(처음 엔진을 요청한 루프)는 QueuePool 엔진 하나를 공유 (TLS/인증은 연결 생성 시 한 번)
+    - 비동기 연결은 생성한 이벤트 루프에 묶이므로, 다른 루프(동기 래퍼의 asyncio.run 등)는
+      루프별 NullPool 엔진 사용 (기존 요청별 엔진과 같은 비용, 연결이 루프 밖으로 새지 않음)
+    - 서버 루프가 닫히면(스크립트에서 asyncio.run 반복) 다음 요청 루프로 다시 바인딩
+    - 모든 연결에 statement_timeout 적용, pool_pre_ping으로 끊긴 연결 자동 교체
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 280,
+        statement_timeout_ms: int = 30000,
+        use_null_pool: bool = False
+    ):
+        """
+        Args:
+            pool_size: 유지할 연결 수
+            max_overflow: pool_size를 넘어 추가로 열 수 있는 연결 수
+            pool_timeout: 풀에서 연결을 기다리는 최대 시간 (초)
+            pool_recycle: 연결 재생성 주기 (초)
+            statement_timeout_ms: 연결별 statement_timeout (ms, 0이면 설정 안 함)
+            use_null_pool: True면 서버 루프에서도 연결 풀 미사용
+        """
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.statement_timeout_ms = max(0, int(statement_timeout_ms))
+        self.use_null_pool = use_null_pool
+
+        self._lock = threading.Lock()
+        self._uri: Optional[str] = None
+        self._uri_resolved = False
+        self._engine: Optional[AsyncEngine] = None
+        self._sessionmaker: Optional[async_sessionmaker] = None
+        self._loop_ref: Optional[weakref.ref] = None
+        self._side_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = weakref.WeakKeyDictionary()
+        self._created_at: Optional[float] = None
+        self._rebinds = 0
+        self._counters = {"connects": 0, "checkouts": 0, "invalidations": 0, "side_engines": 0}
+
+    @property
+    def uri(self) -> Optional[str]:
+        """DB URI (최초 1회 환경변수에서 구성)"""
+        if not self._uri_resolved:
+            with self._lock:
+                if not self._uri_resolved:
+                    self._uri = build_async_uri()
+                    self._uri_resolved = True
+                    if self._uri is None:
+                        logger.warning("[DB] ASYNC_DATABASE_URI 미설정, DB 기능 비활성화")
+        return self._uri
+
+    @property
+    def configured(self) -> bool:
+        return self.uri is not None
+
+    def get_engine(self) -> Optional[AsyncEngine]:
+        """현재 이벤트 루프에서 사용할 엔진 (DB 미설정 시 None)"""
+        uri = self.uri
+        if uri is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            bound_loop = self._loop_ref() if self._loop_ref is not None else None
+            if self._engine is not None and (bound_loop is None or bound_loop.is_closed()):
+                # 닫힌 루프의 연결은 정리할 수 없으므로 엔진만 버리고 현재 루프로 다시 바인딩
+                logger.info("[DB] 이전 이벤트 루프가 종료되어 공유 엔진을 다시 생성")
+                self._engine = None
+                self._sessionmaker = None
+                self._rebinds += 1
+                bound_loop = None
+
+            if self._engine is None:
+                self._engine = self._create_engine(uri, pooled=not self.use_null_pool)
+                self._sessionmaker = async_sessionmaker(bind=self._engine, class_=AsyncSession, expire_on_commit=False)
+                self._loop_ref = weakref.ref(loop)
+                self._created_at = time.time()
+                return self._engine
+
+            if bound_loop is loop:
+                return self._engine
+
+            engine = self._side_engines.get(loop)
+            if engine is None:
+                engine = self._create_engine(uri, pooled=False)
+                self._side_engines[loop] = engine
+                self._counters["side_engines"] += 1
+            return engine
+
+    def get_sessionmaker(self) -> Optional[async_sessionmaker]:
+        """현재 이벤트 루프용 세션 팩토리 (DB 미설정 시 None)"""
+        engine = self.get_engine()
+        if engine is None:
+            return None
+        if engine is self._engine:
+            return self._sessionmaker
+        return async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    def _create_engine(self, uri: str, pooled: bool) -> AsyncEngine:
+        if pooled:
+            engine = create_async_engine(
+                uri,
+                echo=False,
+                pool_pre_ping=True,
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=self.pool_timeout,
+                pool_recycle=self.pool_recycle,
+            )
+            logger.info(
+                f"[DB] 공유 엔진 생성: pool_size={self.pool_size}, max_overflow={self.max_overflow}, "
+                f"recycle={self.pool_recycle}s, statement_timeout={self.statement_timeout_ms}ms"
+            )
+        else:
+            engine = create_async_engine(uri, echo=False, pool_pre_ping=True, poolclass=NullPool)
+        self._attach_events(engine)
+        return engine
+
+    def _attach_events(self, engine: AsyncEngine) -> None:
+        counters = self._counters
+        statement_timeout_ms = self.statement_timeout_ms
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            counters["connects"] += 1
+            if statement_timeout_ms:
+                cursor = dbapi_connection.cursor()
+                cursor.execute(f"SET statement_timeout = {statement_timeout_ms}")
+                cursor.close()
+                # psycopg 연결은 autocommit이 아니므로 SET이 풀 반환 시 롤백되지 않게 확정
+                dbapi_connection.commit()
+
+        @event.listens_for(engine.sync_engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            counters["checkouts"] += 1
+
+        @event.listens_for(engine.sync_engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            counters["invalidations"] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """연결 풀 메트릭 (헬스/상태 API용, 네트워크 호출 없음)"""
+        metrics: Dict[str, Any] = {
+            "configured": self._uri is not None if self._uri_resolved else None,
+            "engine": self._engine is not None,
+            "pool": None,
+            "rebinds": self._rebinds,
+            **self._counters,
+        }
+        engine = self._engine
+        if engine is not None:
+            pool = engine.sync_engine.pool
+            metrics["pool"] = {
+                "class": type(pool).__name__,
+                "status": pool.status(),
+            }
+            for name in ("size", "checkedin", "checkedout", "overflow"):
+                getter = getattr(pool, name, None)
+                if callable(getter):
+                    metrics["pool"][name] = getter()
+            metrics["age_seconds"] = round(time.time() - self._created_at, 1) if self._created_at else None
+        return metrics
+
+    async def dispose(self) -> None:
+        """현재 루프의 엔진 정리 (lifespan shutdown)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            engine = self._engine
+            bound_loop = self._loop_ref() if self._loop_ref is not None else None
+            if bound_loop is loop:
+                self._engine = None
+                self._sessionmaker = None
+                self._loop_ref = None
+            else:
+                engine = None
+            side_engine = self._side_engines.pop(loop, None)
+
+        for target in (engine, side_engine):
+            if target is not None:
+                await target.dispose()
+        if engine is not None:
+            logger.info("[DB] 공유 엔진 정리 완료")
+
+
+# 프로세스 전역 레지스트리 싱글톤 (설정 기반)
+_engine_registry: Optional[EngineRegistry] = None
+_engine_registry_lock = threading.Lock()
+
+
+def get_engine_registry() -> EngineRegistry:
+    """설정(DB_POOL_SIZE 등)으로 만든 전역 엔진 레지스트리 반환"""
+    global _engine_registry
+
+    if _engine_registry is None:
+        from app.core.config import (
+            DB_POOL_SIZE,
+            DB_MAX_OVERFLOW,
+            DB_POOL_TIMEOUT,
+            DB_POOL_RECYCLE,
+            DB_STATEMENT_TIMEOUT_MS,
+            DB_USE_NULL_POOL,
+        )
+
+        with _engine_registry_lock:
+            if _engine_registry is None:
+                _engine_registry = EngineRegistry(
+                    pool_size=DB_POOL_SIZE,
+                    max_overflow=DB_MAX_OVERFLOW,
+                    pool_timeout=DB_POOL_TIMEOUT,
+                    pool_recycle=DB_POOL_RECYCLE,
+                    statement_timeout_ms=DB_STATEMENT_TIMEOUT_MS,
+                    use_null_pool=DB_USE_NULL_POOL
+                )
+    return _engine_registry
+
+
+def get_async_engine() -> Optional[AsyncEngine]:
+    """현재 이벤트 루프용 공유 엔진 (DB 미설정 시 None)"""
+    return get_engine_registry().get_engine()
+
+
+def get_async_sessionmaker() -> Optional[async_sessionmaker]:
+    """현재 이벤트 루프용 공유 세션 팩토리 (DB 미설정 시 None)"""
+    return get_engine_registry().get_sessionmaker()
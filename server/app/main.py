@@ -43,11 +43,34 @@ load_dotenv(ENV_PATH, override=True)
 async def lifespan(app: FastAPI):
     """
     앱 수명주기 관리 (startup/shutdown)
+
+    startup: STARTUP_WARMUP_COMPONENTS를 동시에 워밍업 (컴포넌트별 상태는 /health에서 확인)
+    - STARTUP_WARMUP_BLOCKING=true면 워밍업이 끝난 뒤 요청을 받음 (배포 직후 첫 요청 지연 제거)
+    - false면 백그라운드에서 진행 (/health의 ready가 false인 동안은 첫 요청 시 로드될 수 있음)
     """
+    from app.core.config import STARTUP_WARMUP_COMPONENTS, STARTUP_WARMUP_TIMEOUT, STARTUP_WARMUP_BLOCKING
+    from app.services.warmup import run_warmup
+
     # startup
+    warmup_task = None
+    if STARTUP_WARMUP_COMPONENTS:
+        if STARTUP_WARMUP_BLOCKING:
+            await run_warmup(STARTUP_WARMUP_COMPONENTS, timeout=STARTUP_WARMUP_TIMEOUT)
+        else:
+            warmup_task = asyncio.create_task(run_warmup(STARTUP_WARMUP_COMPONENTS, timeout=STARTUP_WARMUP_TIMEOUT))
     yield
     
     # shutdown
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
+    # 공유 DB 엔진 연결 풀 정리
+    from app.db.engine_registry import get_engine_registry
+    await get_engine_registry().dispose()
+
+    # 공유 Pinecone 비동기 인덱스(aiohttp 세션) 정리
+    from app.services.pinecone_provider import close_pinecone_provider
+    await close_pinecone_provider()
 
 
 # FastAPI 앱 초기화 (lifespan 포함)
@@ -1,24 +1,32 @@
 """카테고리 분류기"""
 import json
-from typing import Dict, Any, List, Optional
-from anthropic import Anthropic
+from typing import Dict, Any, List, Optional, Tuple
+from anthropic import Anthropic, AsyncAnthropic
 import logging
 
+from .llm_cache import LLMStageCache, STAGE_CLASSIFY
+
 logger = logging.getLogger(__name__)
 
 
 class CategoryClassifier:
     """LLM으로 메타데이터를 카테고리별로 분류"""
 
-    def __init__(self, category_config: Dict[str, Any], api_key: str):
+    # 프롬프트/매핑 변경 시 올려서 LLM 캐시 무효화
+    PROMPT_VERSION = "v1"
+
+    def __init__(self, category_config: Dict[str, Any], api_key: str, cache: Optional[LLMStageCache] = None):
         """
         Args:
             category_config: 카테고리 설정 딕셔너리
             api_key: Anthropic API 키
+            cache: LLM 단계 결과 캐시 (None이면 캐시 미사용)
         """
         self.category_config = category_config
         self.client = Anthropic(api_key=api_key)
+        self.async_client = AsyncAnthropic(api_key=api_key)  # asearch 경로용 비동기 클라이언트
         self.model = "claude-haiku-4-5-20251001"  # ⭐ haiku 사용
+        self.cache = cache
 
     def _build_prompt(self, metadata: Dict[str, Any]) -> str:
         """카테고리 설명 + 메타데이터를 포함한 LLM용 프롬프트 생성"""
@@ -80,51 +88,103 @@ JSON만 반환하세요:
         if not metadata:
             return {}
 
+        cache_key, cached = self._cache_lookup(metadata)
+        if cached is not None:
+            return cached
         prompt = self._build_prompt(metadata)
 
         try:
             # LLM 호출
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                temperature=0.2,
-                messages=[{"role": "user", "content": prompt}],
-                timeout=30.0  # 30초 타임아웃
-            )
-            
+            response = self.client.messages.create(**self._request_kwargs(prompt))
             raw_output = response.content[0].text.strip()
+            classified, mapped = self._map_output(raw_output, metadata)
+            return self._cache_store(cache_key, classified) if mapped else classified
 
-            # JSON 파싱
-            try:
-                mapping_tokens = self._parse_llm_output(raw_output)
-            except Exception as parse_err:
-                logger.warning(f"[카테고리 분류] JSON 파싱 실패: {parse_err}, 원본: {raw_output[:200]}")
-                raise
-
-            # 토큰들을 실제 메타데이터 키로 매핑
-            categorized: Dict[str, List[str]] = {}
-            used_keys: set = set()
-
-            for cat, tokens in mapping_tokens.items():
-                for token in tokens:
-                    meta_key = self._match_llm_token_to_key(token, metadata, used_keys)
-                    if meta_key is None:
-                        continue
-                    categorized.setdefault(cat, []).append(f"{meta_key}: {metadata[meta_key]}")
-                    used_keys.add(meta_key)
-
-            # 아무 것도 매핑 안 됐으면 rule-based로 폴백
-            if not categorized:
-                logger.warning(f"[WARN] LLM 기반 분류 결과 매핑 실패 -> rule-based로 대체 (메타데이터: {metadata}, 매핑 토큰: {mapping_tokens})")
-                return self._rule_based_classify(metadata)
-
-            logger.info(f"[카테고리 분류] {dict(categorized)}")
-            return categorized
+        except Exception as e:
+            logger.warning(f"[WARN] LLM 분류/파싱 실패 ({e}) -> rule-based로 대체")
+            return self._rule_based_classify(metadata)
+
+    async def aclassify(self, metadata: Dict[str, Any]) -> Dict[str, List[str]]:
+        """classify()의 비동기 버전 (AsyncAnthropic 사용)"""
+        if not metadata:
+            return {}
+
+        cache_key, cached = self._cache_lookup(metadata)
+        if cached is not None:
+            return cached
+        prompt = self._build_prompt(metadata)
+
+        try:
+            response = await self.async_client.messages.create(**self._request_kwargs(prompt))
+            raw_output = response.content[0].text.strip()
+            classified, mapped = self._map_output(raw_output, metadata)
+            return self._cache_store(cache_key, classified) if mapped else classified
 
         except Exception as e:
             logger.warning(f"[WARN] LLM 분류/파싱 실패 ({e}) -> rule-based로 대체")
             return self._rule_based_classify(metadata)
 
+    def _cache_lookup(self, metadata: Dict[str, Any]):
+        """캐시 조회 → (캐시 키, 캐시된 분류 결과 또는 None). 카테고리 구성이 바뀌면 키도 바뀜"""
+        if self.cache is None:
+            return None, None
+        payload = {"metadata": metadata, "categories": sorted(self.category_config.keys())}
+        cache_key = LLMStageCache.make_key(STAGE_CLASSIFY, self.model, self.PROMPT_VERSION, payload)
+        cached = self.cache.get(STAGE_CLASSIFY, cache_key)
+        if cached is not None:
+            logger.info(f"[카테고리 분류] 캐시 적중: {cached}")
+        return cache_key, cached
+
+    def _cache_store(self, cache_key: Optional[str], classified: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """LLM 분류 결과 캐시 저장 (rule-based 폴백 결과는 호출 측에서 걸러 저장하지 않음)"""
+        if self.cache is not None and cache_key and classified:
+            self.cache.set(STAGE_CLASSIFY, cache_key, classified)
+        return classified
+
+    def _request_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """분류 LLM 요청 파라미터 (동기/비동기 공통)"""
+        return {
+            "model": self.model,
+            "max_tokens": 1024,
+            "temperature": 0.2,
+            "messages": [{"role": "user", "content": prompt}],
+            "timeout": 30.0  # 30초 타임아웃
+        }
+
+    def _map_output(self, raw_output: str, metadata: Dict[str, Any]) -> Tuple[Dict[str, List[str]], bool]:
+        """
+        LLM 출력을 파싱하여 {"카테고리명": ["키: 값", ...]}으로 매핑 (파싱 실패 시 예외)
+
+        Returns:
+            (분류 결과, LLM 토큰 매핑 성공 여부 - False면 rule-based 폴백 결과라 캐시하지 않음)
+        """
+        # JSON 파싱
+        try:
+            mapping_tokens = self._parse_llm_output(raw_output)
+        except Exception as parse_err:
+            logger.warning(f"[카테고리 분류] JSON 파싱 실패: {parse_err}, 원본: {raw_output[:200]}")
+            raise
+
+        # 토큰들을 실제 메타데이터 키로 매핑
+        categorized: Dict[str, List[str]] = {}
+        used_keys: set = set()
+
+        for cat, tokens in mapping_tokens.items():
+            for token in tokens:
+                meta_key = self._match_llm_token_to_key(token, metadata, used_keys)
+                if meta_key is None:
+                    continue
+                categorized.setdefault(cat, []).append(f"{meta_key}: {metadata[meta_key]}")
+                used_keys.add(meta_key)
+
+        # 아무 것도 매핑 안 됐으면 rule-based로 폴백
+        if not categorized:
+            logger.warning(f"[WARN] LLM 기반 분류 결과 매핑 실패 -> rule-based로 대체 (메타데이터: {metadata}, 매핑 토큰: {mapping_tokens})")
+            return self._rule_based_classify(metadata), False
+
+        logger.info(f"[카테고리 분류] {dict(categorized)}")
+        return categorized, True
+
     def _parse_llm_output(self, raw_output: str) -> Dict[str, List[str]]:
         """LLM이 반환한 raw 문자열을 JSON으로 파싱"""
         # 코드블록 제거
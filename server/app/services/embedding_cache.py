@@ -0,0 +1,207 @@
+"""임베딩 캐시 (텍스트+모델 해시 → float32 벡터, 메모리 LRU + 선택적 memmap .npy 저장소)"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_key(model: str, text: str) -> str:
+    """콘텐츠 주소 키 (모델 + 텍스트의 sha256)"""
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    콘텐츠 주소 기반 임베딩 캐시
+
+    - 메모리 계층: key -> float32 벡터 (OrderedDict LRU, max_entries)
+    - 디스크 계층 (store_dir 지정 시):
+        vectors.npy  : (capacity, dimension) float32 memmap (np.lib.format.open_memmap)
+        keys.txt     : 행 순서대로 키를 한 줄씩 추가 (append-only)
+      벡터 행을 먼저 쓰고 flush 한 뒤 키를 추가하므로, keys.txt에 있는 키는 항상 완전한 벡터를 가리킴.
+      용량이 가득 차면 디스크 저장만 중단 (메모리 계층은 계속 동작)
+      ⚠️ 쓰기 잠금은 프로세스 내부 Lock뿐이므로 여러 워커 프로세스가 같은 디렉터리를 공유하면 안 됨
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        store_dir: Optional[str] = None,
+        dimension: int = 1536,
+        disk_capacity: int = 20000
+    ):
+        """
+        Args:
+            max_entries: 메모리 계층 최대 벡터 수
+            store_dir: memmap 저장소 디렉터리 (None이면 메모리 계층만 사용)
+            dimension: 임베딩 차원
+            disk_capacity: 디스크 저장소 최대 행 수
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.dimension = int(dimension)
+        self.disk_capacity = int(disk_capacity)
+        self.store_dir = store_dir or None
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._disk_rows: Dict[str, int] = {}
+        self._disk: Optional[np.ndarray] = None
+        self._keys_path: Optional[str] = None
+        self._disk_full_logged = False
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.store_dir:
+            self._open_store()
+
+    def _open_store(self) -> None:
+        """memmap 저장소 열기 (없으면 생성, 차원/용량 불일치 시 디스크 계층 비활성화)"""
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            vectors_path = os.path.join(self.store_dir, "vectors.npy")
+            self._keys_path = os.path.join(self.store_dir, "keys.txt")
+
+            if os.path.exists(vectors_path):
+                disk = np.lib.format.open_memmap(vectors_path, mode="r+")
+                if disk.dtype != np.float32 or disk.ndim != 2 or disk.shape[1] != self.dimension:
+                    logger.warning(f"[임베딩 캐시] 저장소 형식 불일치 {disk.shape}/{disk.dtype}, 디스크 계층 비활성화")
+                    return
+            else:
+                disk = np.lib.format.open_memmap(
+                    vectors_path, mode="w+", dtype=np.float32, shape=(self.disk_capacity, self.dimension)
+                )
+
+            rows: Dict[str, int] = {}
+            if os.path.exists(self._keys_path):
+                with open(self._keys_path, "r", encoding="utf-8") as f:
+                    for row, line in enumerate(f):
+                        key = line.strip()
+                        if key and row < disk.shape[0]:
+                            rows[key] = row
+
+            self._disk = disk
+            self._disk_rows = rows
+            self.disk_capacity = disk.shape[0]
+            logger.info(f"[임베딩 캐시] memmap 저장소 사용: {vectors_path} ({len(rows)}/{self.disk_capacity}행)")
+        except Exception as e:
+            logger.warning(f"[임베딩 캐시] memmap 저장소 초기화 실패, 메모리 계층만 사용: {e}")
+            self._disk = None
+            self._disk_rows = {}
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """여러 키 조회 (찾은 키만 반환)"""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    found[key] = vector
+                    continue
+
+                row = self._disk_rows.get(key)
+                if row is not None and self._disk is not None:
+                    vector = np.array(self._disk[row], dtype=np.float32)
+                    self._put_memory(key, vector)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    found[key] = vector
+                    continue
+
+                self.misses += 1
+        return found
+
+    def put_many(self, vectors: Dict[str, List[float]]) -> None:
+        """여러 벡터 저장 (메모리 + 디스크 write-through)"""
+        with self._lock:
+            new_keys = []
+            for key, values in vectors.items():
+                vector = np.asarray(values, dtype=np.float32)
+                self._put_memory(key, vector)
+                if self._disk is not None and key not in self._disk_rows and vector.shape == (self.dimension,):
+                    new_keys.append((key, vector))
+
+            if new_keys:
+                self._append_disk(new_keys)
+
+    def stats(self) -> Dict[str, object]:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk_size": len(self._disk_rows) if self._disk is not None else None,
+                "disk_capacity": self.disk_capacity if self._disk is not None else None,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _put_memory(self, key: str, vector: np.ndarray) -> None:
+        """메모리 계층 저장 (LRU 초과분 제거, 락 보유 상태에서 호출)"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _append_disk(self, items: List[tuple]) -> None:
+        """디스크 저장소에 행 추가 (락 보유 상태에서 호출)"""
+        start = len(self._disk_rows)
+        available = self.disk_capacity - start
+        if available <= 0:
+            if not self._disk_full_logged:
+                logger.warning(f"[임베딩 캐시] memmap 저장소 용량 초과 ({self.disk_capacity}행), 디스크 저장 중단")
+                self._disk_full_logged = True
+            return
+
+        items = items[:available]
+        try:
+            for offset, (_, vector) in enumerate(items):
+                self._disk[start + offset] = vector
+            self._disk.flush()
+            with open(self._keys_path, "a", encoding="utf-8") as f:
+                for offset, (key, _) in enumerate(items):
+                    f.write(key + "\n")
+                    self._disk_rows[key] = start + offset
+        except Exception as e:
+            logger.warning(f"[임베딩 캐시] memmap 저장 실패: {e}")
+
+
+# 프로세스 전역 캐시 싱글톤 (설정 기반 지연 초기화)
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """설정(EMBEDDING_CACHE_*)에 따른 전역 임베딩 캐시 반환 (비활성화 시 None)"""
+    global _embedding_cache
+
+    from app.core.config import (
+        EMBEDDING_CACHE_ENABLED,
+        EMBEDDING_CACHE_MAX_ENTRIES,
+        EMBEDDING_CACHE_DIR,
+        EMBEDDING_CACHE_DISK_CAPACITY,
+    )
+
+    if not EMBEDDING_CACHE_ENABLED:
+        return None
+
+    if _embedding_cache is None:
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = EmbeddingCache(
+                    max_entries=EMBEDDING_CACHE_MAX_ENTRIES,
+                    store_dir=EMBEDDING_CACHE_DIR,
+                    disk_capacity=EMBEDDING_CACHE_DISK_CAPACITY,
+                )
+    return _embedding_cache
@@ -1,22 +1,30 @@
 """임베딩 생성기"""
-from typing import Dict, List
-from openai import OpenAI
+from typing import Dict, List, Optional
+from openai import OpenAI, AsyncOpenAI
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 import logging
 
+from .embedding_cache import EmbeddingCache, embedding_key
+
 logger = logging.getLogger(__name__)
 
 
 class EmbeddingGenerator:
-    """OpenAI text-embedding-3-small로 임베딩 생성 (병렬 처리)"""
+    """OpenAI text-embedding-3-small로 임베딩 생성 (배치 요청 또는 병렬 처리, 콘텐츠 주소 캐시)"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[EmbeddingCache] = None, batch: bool = True):
         """
         Args:
             api_key: OpenAI API 키
+            cache: 임베딩 캐시 (None이면 캐시 미사용)
+            batch: True면 캐시 미스 텍스트를 한 번의 요청(input=리스트)으로 임베딩, False면 텍스트별 병렬 요청
         """
         self.client = OpenAI(api_key=api_key)
+        self.async_client = AsyncOpenAI(api_key=api_key)  # asearch 경로용 비동기 클라이언트
         self.model = "text-embedding-3-small"
+        self.cache = cache
+        self.batch = batch
 
     def _generate_single(self, category: str, text: str) -> tuple[str, List[float]]:
         """단일 임베딩 생성 (병렬 처리용)"""
@@ -31,9 +39,42 @@ class EmbeddingGenerator:
             logger.error(f"❌ [{category}] 임베딩 생성 실패: {e}")
             return (category, None)
 
+    async def _agenerate_single(self, category: str, text: str) -> tuple[str, List[float]]:
+        """단일 임베딩 생성 (비동기)"""
+        try:
+            response = await self.async_client.embeddings.create(
+                model=self.model,
+                input=text
+            )
+            embedding = response.data[0].embedding
+            return (category, embedding)
+        except Exception as e:
+            logger.error(f"❌ [{category}] 임베딩 생성 실패: {e}")
+            return (category, None)
+
+    def _generate_batch(self, texts: List[str]) -> Dict[str, List[float]]:
+        """여러 텍스트를 한 번의 요청으로 임베딩 (응답 data[i].index로 입력 순서 매핑)"""
+        try:
+            response = self.client.embeddings.create(model=self.model, input=texts)
+            return {texts[item.index]: item.embedding for item in response.data}
+        except Exception as e:
+            logger.error(f"❌ 배치 임베딩 생성 실패 ({len(texts)}개): {e}")
+            return {}
+
+    async def _agenerate_batch(self, texts: List[str]) -> Dict[str, List[float]]:
+        """_generate_batch()의 비동기 버전"""
+        try:
+            response = await self.async_client.embeddings.create(model=self.model, input=texts)
+            return {texts[item.index]: item.embedding for item in response.data}
+        except Exception as e:
+            logger.error(f"❌ 배치 임베딩 생성 실패 ({len(texts)}개): {e}")
+            return {}
+
     def generate(self, texts: Dict[str, str]) -> Dict[str, List[float]]:
         """
-        카테고리별 임베딩 생성 (병렬 처리)
+        카테고리별 임베딩 생성
+
+        동일한 텍스트는 한 번만 임베딩하고, 캐시에 있는 텍스트는 요청하지 않음.
         
         Args:
             texts: 카테고리별 텍스트 딕셔너리
@@ -41,20 +82,80 @@ class EmbeddingGenerator:
         Returns:
             카테고리별 임베딩 딕셔너리
         """
-        result = {}
-        
-        # 병렬 처리로 임베딩 생성
-        with ThreadPoolExecutor(max_workers=min(len(texts), 5)) as executor:
-            futures = {
-                executor.submit(self._generate_single, category, text): category
-                for category, text in texts.items()
-                if text
-            }
-            
-            for future in as_completed(futures):
-                category, embedding = future.result()
-                if embedding:
-                    result[category] = embedding
+        unique_texts, vectors = self._lookup_cache(texts)
+        missing = [text for text in unique_texts if text not in vectors]
+
+        if missing:
+            if self.batch:
+                fresh = self._generate_batch(missing)
+            else:
+                # 텍스트별 병렬 요청
+                fresh = {}
+                with ThreadPoolExecutor(max_workers=min(len(missing), 5)) as executor:
+                    futures = [executor.submit(self._generate_single, text, text) for text in missing]
+                    for future in as_completed(futures):
+                        text, embedding = future.result()
+                        if embedding:
+                            fresh[text] = embedding
+            vectors.update(self._store_cache(fresh))
+
+        return self._assemble(texts, vectors)
+
+    async def agenerate(self, texts: Dict[str, str]) -> Dict[str, List[float]]:
+        """
+        generate()의 비동기 버전 (AsyncOpenAI 사용, 스레드 사용 안 함)
+
+        Args:
+            texts: 카테고리별 텍스트 딕셔너리
+
+        Returns:
+            카테고리별 임베딩 딕셔너리
+        """
+        unique_texts, vectors = self._lookup_cache(texts)
+        missing = [text for text in unique_texts if text not in vectors]
+
+        if missing:
+            if self.batch:
+                fresh = await self._agenerate_batch(missing)
+            else:
+                pairs = await asyncio.gather(*(self._agenerate_single(text, text) for text in missing))
+                fresh = {text: embedding for text, embedding in pairs if embedding}
+            vectors.update(self._store_cache(fresh))
+
+        return self._assemble(texts, vectors)
+
+    def _lookup_cache(self, texts: Dict[str, str]):
+        """
+        고유 텍스트 목록과 캐시 적중 벡터 반환
+
+        Returns:
+            (고유 텍스트 리스트(입력 순서), {텍스트: 임베딩})
+        """
+        unique_texts = list(dict.fromkeys(text for text in texts.values() if text))
+        if len(unique_texts) < len([t for t in texts.values() if t]):
+            logger.info(f"[임베딩] 중복 텍스트 제거: {len([t for t in texts.values() if t])}개 → {len(unique_texts)}개")
+
+        if self.cache is None or not unique_texts:
+            return unique_texts, {}
+
+        keys = {text: embedding_key(self.model, text) for text in unique_texts}
+        found = self.cache.get_many(list(keys.values()))
+        vectors = {text: found[key].tolist() for text, key in keys.items() if key in found}
+        if vectors:
+            logger.info(f"[임베딩] 캐시 적중: {len(vectors)}/{len(unique_texts)}개")
+        return unique_texts, vectors
 
-        return result
+    def _store_cache(self, fresh: Dict[str, List[float]]) -> Dict[str, List[float]]:
+        """새로 생성한 임베딩 캐시 저장"""
+        if self.cache is not None and fresh:
+            self.cache.put_many({embedding_key(self.model, text): embedding for text, embedding in fresh.items()})
+        return fresh
 
+    @staticmethod
+    def _assemble(texts: Dict[str, str], vectors: Dict[str, List[float]]) -> Dict[str, List[float]]:
+        """텍스트별 임베딩을 카테고리별로 배치 (입력 순서 유지)"""
+        return {
+            category: vectors[text]
+            for category, text in texts.items()
+            if text and text in vectors
+        }
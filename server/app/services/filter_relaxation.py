@@ -0,0 +1,152 @@
+"""메타데이터 필터 완화 플래너 (0개 결과 시 조건을 하나씩 빼거나 넓혀 재검색)"""
+import contextvars
+import math
+import re
+from typing import Dict, Any, List, Optional
+import logging
+
+from .panel_metadata_index import PanelMetadataIndex
+
+logger = logging.getLogger(__name__)
+
+# 숫자 범위 조건 완화 비율 (경계값 기준, 최소 1)
+RANGE_BROADEN_RATIO = 0.2
+
+# 적용된 완화 기록 (검색 요청 단위, 파이프라인이 start_relaxation_log()로 시작)
+_relaxation_log: contextvars.ContextVar[Optional[List[Dict[str, Any]]]] = contextvars.ContextVar(
+    "relaxation_log", default=None
+)
+
+
+def start_relaxation_log() -> List[Dict[str, Any]]:
+    """현재 검색 요청의 완화 기록 시작 (이후 같은 컨텍스트의 record_relaxation() 결과가 쌓임)"""
+    log: List[Dict[str, Any]] = []
+    _relaxation_log.set(log)
+    return log
+
+
+def record_relaxation(entry: Dict[str, Any]) -> None:
+    """완화 결과 기록 (기록 중이 아니면 무시)"""
+    log = _relaxation_log.get()
+    if log is not None:
+        log.append(entry)
+
+
+def _broaden_age_group(condition: Any) -> Optional[Any]:
+    """연령대 조건에 인접 연령대 추가 (예: "30대" → ["20대", "30대", "40대"])"""
+    if isinstance(condition, dict):
+        if set(condition) != {"$in"}:
+            return None
+        values = list(condition["$in"] or [])
+    else:
+        values = [condition]
+
+    broadened = list(values)
+    for value in values:
+        match = re.fullmatch(r"(\d+)대", str(value))
+        if not match:
+            return None
+        decade = int(match.group(1))
+        for neighbor in (decade - 10, decade + 10):
+            label = f"{neighbor}대"
+            if neighbor > 0 and label not in broadened:
+                broadened.append(label)
+    return {"$in": broadened} if len(broadened) > len(values) else None
+
+
+def _broaden_range(condition: Any) -> Optional[Dict[str, Any]]:
+    """숫자 범위 조건($gt/$gte/$lt/$lte)의 경계를 RANGE_BROADEN_RATIO만큼 바깥으로 이동"""
+    if not isinstance(condition, dict) or not condition:
+        return None
+    broadened = {}
+    for op, operand in condition.items():
+        if op not in ("$gt", "$gte", "$lt", "$lte") or isinstance(operand, bool) or not isinstance(operand, (int, float)):
+            return None
+        width = max(abs(operand) * RANGE_BROADEN_RATIO, 1)
+        value = operand - width if op in ("$gt", "$gte") else operand + width
+        broadened[op] = int(value) if isinstance(operand, int) else value
+    return broadened
+
+
+class FilterRelaxationPlanner:
+    """
+    메타데이터 필터 완화 계획 생성
+
+    - 조건(필드) 하나씩: 넓히기(연령대 인접 구간, 숫자 범위 확장) → 빼기 순으로 후보 생성
+    - 로컬 메타데이터 인덱스의 선택도(조건 만족 비율)가 낮은 조건, 즉 결과를 가장 많이 줄이는 조건부터 완화
+    - 완화 후에도 로컬 추정 결과가 0개인 후보는 뒤로 보냄
+    - 마지막 후보는 항상 메타데이터 필터 전체 제거 (기존 Fallback과 동일)
+    - 호출 측은 상위 max_candidates개 + 전체 제거를 동시에 실행하고 계획 순서상 첫 번째 비어있지 않은 결과 사용
+    """
+
+    def __init__(self, metadata_index: Optional[PanelMetadataIndex] = None, max_candidates: int = 4):
+        """
+        Args:
+            metadata_index: 선택도 추정용 로컬 메타데이터 인덱스 (None이면 필터에 적힌 순서대로 완화)
+            max_candidates: 전체 제거 외에 동시에 시도할 완화 후보 수
+        """
+        self.metadata_index = metadata_index
+        self.max_candidates = max(0, int(max_candidates))
+
+    def plan(self, metadata_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        완화 후보 목록 (실행 순서 = 우선순위)
+
+        Returns:
+            [{"label": 설명, "dropped": [필드], "broadened": [필드], "filter": 완화된 필터 또는 None}]
+        """
+        metadata_filter = metadata_filter or {}
+        candidates = []
+        for position, (key, condition) in enumerate(metadata_filter.items()):
+            broadened = self._broaden(key, condition)
+            options = [("broadened", broadened)] if broadened is not None else []
+            # 조건이 하나뿐이면 빼기는 전체 제거와 같으므로 넓히기만 생성
+            if len(metadata_filter) > 1:
+                options.append(("dropped", None))
+
+            selectivity = self._selectivity({key: condition})
+            for rank, (kind, new_condition) in enumerate(options):
+                relaxed = dict(metadata_filter)
+                if kind == "dropped":
+                    relaxed.pop(key)
+                else:
+                    relaxed[key] = new_condition
+                estimate = self._selectivity(relaxed)
+                # 추정 0개 후보는 뒤로 → 선택도 낮은 조건 먼저 → 필터에 적힌 순서 → 넓히기, 빼기 순
+                order = (
+                    estimate == 0.0,
+                    selectivity if selectivity is not None else math.inf,
+                    position,
+                    rank,
+                )
+                candidates.append((order, {
+                    "label": f"{key} {'확장' if kind == 'broadened' else '제외'}",
+                    "dropped": [key] if kind == "dropped" else [],
+                    "broadened": [key] if kind == "broadened" else [],
+                    "filter": relaxed,
+                    "selectivity": selectivity,
+                    "estimate": estimate,
+                }))
+
+        # (정렬 키, 후보) 쌍으로 정렬 - 정렬 키는 위치/순위까지 포함해 항상 유일하므로 후보 dict는 비교하지 않음
+        candidates.sort(key=lambda pair: pair[0])
+        plan = [candidate for _, candidate in candidates[:self.max_candidates]]
+        plan.append({
+            "label": "메타데이터 필터 제외",
+            "dropped": list(metadata_filter),
+            "broadened": [],
+            "filter": None,
+            "selectivity": None,
+            "estimate": 1.0,
+        })
+        return plan
+
+    def _broaden(self, key: str, condition: Any) -> Optional[Any]:
+        if key == "연령대":
+            return _broaden_age_group(condition)
+        return _broaden_range(condition)
+
+    def _selectivity(self, filter_dict: Dict[str, Any]) -> Optional[float]:
+        if self.metadata_index is None:
+            return None
+        return self.metadata_index.selectivity(filter_dict)
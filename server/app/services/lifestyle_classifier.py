@@ -4,10 +4,9 @@ import json
 import re
 import logging
 import numpy as np
-from anthropic import Anthropic
-from pinecone import Pinecone
 
-from app.core.config import PINECONE_API_KEY, PINECONE_INDEX_NAME, load_category_config
+from app.core.config import load_category_config
+from app.services.pinecone_provider import get_pinecone_provider
 
 logger = logging.getLogger(__name__)
 
@@ -103,13 +102,10 @@ def load_texts_by_mb_sn(panel_id: str, max_results: int = 200) -> List[Dict[str,
     try:
         category_config = load_category_config()
         
-        # Pinecone 인덱스 연결
-        pc = Pinecone(api_key=PINECONE_API_KEY)
-        index = pc.Index(PINECONE_INDEX_NAME)
-        
-        # 인덱스 차원 동적으로 가져오기
-        stats = index.describe_index_stats()
-        dimension = stats.get('dimension', 1536)
+        # Pinecone 인덱스 연결 (공유 제공자, 차원은 최초 1회만 조회)
+        provider = get_pinecone_provider()
+        index = provider.index()
+        dimension = provider.dimension()
         
         # 랜덤 벡터로 검색 (메타데이터만 필요)
         random_vector = np.random.rand(dimension).astype(np.float32).tolist()
@@ -250,6 +246,8 @@ class LifestyleClassifier:
         Args:
             api_key: Anthropic API 키
         """
+        # ⭐ anthropic SDK는 import 비용이 커서(~0.4초) 분류기 생성 시점에 로드 (panels 라우터 시작 시간 단축)
+        from anthropic import Anthropic
         self.client = Anthropic(api_key=api_key)
         self.model = "claude-opus-4-1-20250805"
         logger.debug(f"[LifestyleClassifier] 초기화 완료, 모델: {self.model}")
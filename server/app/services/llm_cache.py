@@ -0,0 +1,254 @@
+"""LLM 단계 결과 캐시 (메모리 LRU + 선택적 SQLite 디스크 계층)"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 캐시 단계 이름 (통계/플러시 단위)
+STAGE_METADATA = "metadata"    # MetadataExtractor.extract
+STAGE_CLASSIFY = "classify"    # CategoryClassifier.classify
+STAGE_TEXT = "text"            # CategoryTextGenerator.generate
+STAGE_PLAN = "plan"            # FusedQueryPlanner.plan
+
+_MISSING = object()
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (앞뒤 공백 제거, 연속 공백 축약, 소문자화)"""
+    return re.sub(r"\s+", " ", (query or "").strip()).lower()
+
+
+class LLMStageCache:
+    """
+    LLM 단계 출력 캐시
+
+    - 키: sha256(단계, 모델 ID, 프롬프트 버전, 정규화된 입력)
+    - 값: JSON 직렬화 가능한 객체 (조회 시 매번 새 객체로 역직렬화하므로 호출 측에서 수정해도 안전)
+    - 메모리 계층: OrderedDict 기반 LRU (max_entries)
+    - 디스크 계층: sqlite_path 지정 시 SQLite에 write-through, 메모리 미스 시 조회 후 메모리로 승격
+    - TTL 초과 항목은 조회 시 만료 처리
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 86400.0, sqlite_path: Optional[str] = None):
+        """
+        Args:
+            max_entries: 메모리 계층 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (초, 0 이하면 만료 없음)
+            sqlite_path: SQLite 파일 경로 (None이면 메모리 계층만 사용)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.sqlite_path = sqlite_path or None
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (stage, json 문자열, 저장 시각)
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if self.sqlite_path:
+            try:
+                directory = os.path.dirname(self.sqlite_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(self.sqlite_path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_stage_cache ("
+                    "key TEXT PRIMARY KEY, stage TEXT NOT NULL, value TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_stage_cache_stage ON llm_stage_cache(stage)")
+                self._conn.commit()
+                logger.info(f"[LLM 캐시] SQLite 디스크 계층 사용: {self.sqlite_path}")
+            except Exception as e:
+                logger.warning(f"[LLM 캐시] SQLite 초기화 실패, 메모리 계층만 사용: {e}")
+                self._conn = None
+
+    @staticmethod
+    def make_key(stage: str, model: str, prompt_version: str, payload: Any) -> str:
+        """캐시 키 생성 (payload는 JSON 직렬화 가능해야 함, dict 키 순서 무관)"""
+        raw = json.dumps(
+            [stage, model, prompt_version, payload],
+            ensure_ascii=False, sort_keys=True, default=str
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, stage: str, key: str, default: Any = None) -> Any:
+        """캐시 조회 (미스/만료 시 default)"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry[2], now):
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._count(stage, "hits")
+                return json.loads(entry[1])
+
+            value = self._get_from_disk(key, now)
+            if value is not _MISSING:
+                stage_name, value_json, created_at = value
+                self._put_memory(key, (stage_name, value_json, created_at))
+                self._count(stage, "hits")
+                self._count(stage, "disk_hits")
+                return json.loads(value_json)
+
+            self._count(stage, "misses")
+            return default
+
+    def set(self, stage: str, key: str, value: Any) -> None:
+        """캐시 저장 (JSON 직렬화 실패 시 저장하지 않음)"""
+        try:
+            value_json = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"[LLM 캐시] 직렬화 불가 값은 저장하지 않음 ({stage}): {e}")
+            return
+
+        created_at = time.time()
+        with self._lock:
+            self._put_memory(key, (stage, value_json, created_at))
+            self._count(stage, "sets")
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO llm_stage_cache (key, stage, value, created_at) VALUES (?, ?, ?, ?)",
+                        (key, stage, value_json, created_at)
+                    )
+                    self._conn.commit()
+                except Exception as e:
+                    logger.warning(f"[LLM 캐시] SQLite 저장 실패: {e}")
+
+    def clear(self, stage: Optional[str] = None) -> int:
+        """캐시 비우기 (stage 지정 시 해당 단계만). 삭제된 메모리 항목 수 반환"""
+        with self._lock:
+            if stage is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [k for k, entry in self._entries.items() if entry[0] == stage]
+                for k in keys:
+                    del self._entries[k]
+                removed = len(keys)
+
+            if self._conn is not None:
+                try:
+                    if stage is None:
+                        self._conn.execute("DELETE FROM llm_stage_cache")
+                    else:
+                        self._conn.execute("DELETE FROM llm_stage_cache WHERE stage = ?", (stage,))
+                    self._conn.commit()
+                except Exception as e:
+                    logger.warning(f"[LLM 캐시] SQLite 삭제 실패: {e}")
+
+        logger.info(f"[LLM 캐시] 초기화: {removed}개 항목 삭제 (단계: {stage or '전체'})")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 및 단계별 hit/miss 통계"""
+        with self._lock:
+            per_stage_size: Dict[str, int] = {}
+            for entry in self._entries.values():
+                per_stage_size[entry[0]] = per_stage_size.get(entry[0], 0) + 1
+
+            stages = {}
+            for stage in sorted(set(self._stats) | set(per_stage_size)):
+                counts = dict(self._stats.get(stage, {}))
+                hits = counts.get("hits", 0)
+                lookups = hits + counts.get("misses", 0)
+                stages[stage] = {
+                    "hits": hits,
+                    "misses": counts.get("misses", 0),
+                    "disk_hits": counts.get("disk_hits", 0),
+                    "sets": counts.get("sets", 0),
+                    "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                    "size": per_stage_size.get(stage, 0),
+                }
+
+            disk_size = None
+            if self._conn is not None:
+                try:
+                    disk_size = self._conn.execute("SELECT COUNT(*) FROM llm_stage_cache").fetchone()[0]
+                except Exception:
+                    disk_size = None
+
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "sqlite_path": self.sqlite_path if self._conn is not None else None,
+                "disk_size": disk_size,
+                "stages": stages,
+            }
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _put_memory(self, key: str, entry: tuple) -> None:
+        """메모리 계층 저장 (LRU 초과분 제거, 락 보유 상태에서 호출)"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _get_from_disk(self, key: str, now: float):
+        """SQLite 계층 조회 (락 보유 상태에서 호출)"""
+        if self._conn is None:
+            return _MISSING
+        try:
+            row = self._conn.execute(
+                "SELECT stage, value, created_at FROM llm_stage_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except Exception as e:
+            logger.warning(f"[LLM 캐시] SQLite 조회 실패: {e}")
+            return _MISSING
+        if row is None:
+            return _MISSING
+        if self._is_expired(row[2], now):
+            try:
+                self._conn.execute("DELETE FROM llm_stage_cache WHERE key = ?", (key,))
+                self._conn.commit()
+            except Exception:
+                pass
+            return _MISSING
+        return row
+
+    def _count(self, stage: str, name: str) -> None:
+        counts = self._stats.setdefault(stage, {})
+        counts[name] = counts.get(name, 0) + 1
+
+
+# 프로세스 전역 캐시 싱글톤 (설정 기반 지연 초기화)
+_llm_cache: Optional[LLMStageCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMStageCache]:
+    """설정(LLM_CACHE_*)에 따른 전역 LLM 단계 캐시 반환 (비활성화 시 None)"""
+    global _llm_cache
+
+    from app.core.config import (
+        LLM_CACHE_ENABLED,
+        LLM_CACHE_MAX_ENTRIES,
+        LLM_CACHE_TTL_SECONDS,
+        LLM_CACHE_SQLITE_PATH,
+    )
+
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMStageCache(
+                    max_entries=LLM_CACHE_MAX_ENTRIES,
+                    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+                    sqlite_path=LLM_CACHE_SQLITE_PATH,
+                )
+    return _llm_cache
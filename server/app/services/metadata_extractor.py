@@ -2,20 +2,26 @@
 import json
 import re
 import time
-from typing import Dict, Any
-from anthropic import Anthropic
+from typing import Dict, Any, Optional
+from anthropic import Anthropic, AsyncAnthropic
 import logging
 
+from .llm_cache import LLMStageCache, STAGE_METADATA, normalize_query
+
 logger = logging.getLogger(__name__)
 
 
 class MetadataExtractor:
     """LLM으로 검색 쿼리에서 메타데이터 추출"""
 
-    def __init__(self, api_key: str):
+    # 프롬프트/후처리 변경 시 올려서 LLM 캐시 무효화
+    PROMPT_VERSION = "v1"
+
+    def __init__(self, api_key: str, cache: Optional[LLMStageCache] = None):
         """
         Args:
             api_key: Anthropic API 키
+            cache: LLM 단계 결과 캐시 (None이면 캐시 미사용)
         """
         if not api_key:
             logger.error("[MetadataExtractor] API 키가 비어있습니다!")
@@ -23,7 +29,9 @@ class MetadataExtractor:
             logger.warning(f"[MetadataExtractor] API 키가 너무 짧습니다 (길이: {len(api_key)})")
         
         self.client = Anthropic(api_key=api_key)
+        self.async_client = AsyncAnthropic(api_key=api_key)  # asearch 경로용 비동기 클라이언트
         self.model = "claude-haiku-4-5-20251001"  # ⭐ haiku 사용  
+        self.cache = cache
 
     def extract(self, query: str) -> Dict[str, Any]:
         """
@@ -36,7 +44,117 @@ class MetadataExtractor:
             메타데이터 딕셔너리 (예: {"지역": "서울", "지역구": "강남구", "나이": 27, "연령대": "20대", "성별": "남", "결혼여부": "기혼"})
         """
         extract_start = time.time()
+        cache_key, cached = self._cache_lookup(query)
+        if cached is not None:
+            return cached
+        prompt = self._build_prompt(query)
+
+        try:
+            if not self._has_api_key():
+                return {}
+            
+            llm_call_start = time.time()
+            try:
+                response = self.client.messages.create(**self._request_kwargs(prompt))
+                text = response.content[0].text
+            except Exception as llm_error:
+                llm_call_time = time.time() - llm_call_start
+                logger.error(f"[메타데이터 추출] Anthropic API 호출 실패: {llm_call_time:.2f}초, 에러: {llm_error}")
+                raise
+            
+            return self._cache_store(cache_key, self._parse_response(text))
+
+        except Exception as e:
+            return self._handle_error(e, extract_start)
+
+    async def aextract(self, query: str) -> Dict[str, Any]:
+        """
+        extract()의 비동기 버전 (AsyncAnthropic 사용, 이벤트 루프를 블로킹하지 않음)
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            메타데이터 딕셔너리 (extract()와 동일)
+        """
+        extract_start = time.time()
+        cache_key, cached = self._cache_lookup(query)
+        if cached is not None:
+            return cached
+        prompt = self._build_prompt(query)
+
+        try:
+            if not self._has_api_key():
+                return {}
+
+            llm_call_start = time.time()
+            try:
+                response = await self.async_client.messages.create(**self._request_kwargs(prompt))
+                text = response.content[0].text
+            except Exception as llm_error:
+                llm_call_time = time.time() - llm_call_start
+                logger.error(f"[메타데이터 추출] Anthropic API 호출 실패: {llm_call_time:.2f}초, 에러: {llm_error}")
+                raise
+
+            return self._cache_store(cache_key, self._parse_response(text))
+
+        except Exception as e:
+            return self._handle_error(e, extract_start)
+
+    def _cache_lookup(self, query: str):
+        """캐시 조회 → (캐시 키, 캐시된 메타데이터 또는 None)"""
+        if self.cache is None:
+            return None, None
+        cache_key = LLMStageCache.make_key(STAGE_METADATA, self.model, self.PROMPT_VERSION, normalize_query(query))
+        cached = self.cache.get(STAGE_METADATA, cache_key)
+        if cached is not None:
+            logger.info(f"[메타데이터 추출] 캐시 적중: {cached}")
+        return cache_key, cached
+
+    def _cache_store(self, cache_key: Optional[str], metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """추출 결과 캐시 저장 (빈 결과는 저장하지 않음)"""
+        if self.cache is not None and cache_key and metadata:
+            self.cache.set(STAGE_METADATA, cache_key, metadata)
+        return metadata
+
+    def _request_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """메타데이터 추출 LLM 요청 파라미터 (동기/비동기 공통)"""
+        return {
+            "model": self.model,
+            "max_tokens": 2048,  # ⭐ 노트북과 동일: 2048
+            "temperature": 0.0,
+            "messages": [{"role": "user", "content": prompt}],
+            "timeout": 30.0  # 30초 타임아웃
+        }
+
+    def _has_api_key(self) -> bool:
+        """API 키 유효성 검사"""
+        if not self.client or not hasattr(self.client, 'api_key') or not self.client.api_key:
+            logger.warning("[메타데이터 추출] Anthropic API 키가 설정되지 않았습니다. 빈 메타데이터 반환")
+            return False
         
+        # 실제 사용되는 API 키 확인
+        actual_api_key = getattr(self.client, 'api_key', None)
+        if not actual_api_key:
+            logger.error("[메타데이터 추출] 클라이언트에 API 키가 없습니다!")
+            return False
+        return True
+
+    def _handle_error(self, e: Exception, extract_start: float) -> Dict[str, Any]:
+        """추출 실패 로깅 후 빈 메타데이터 반환 (검색은 계속 진행)"""
+        extract_time = time.time() - extract_start
+        error_msg = str(e)
+        logger.error(f"[메타데이터 추출] 오류 발생: {extract_time:.2f}초, 에러: {e}", exc_info=True)
+        # 인증 오류인 경우 경고만 출력하고 빈 메타데이터 반환
+        if "401" in error_msg or "authentication" in error_msg.lower() or "invalid x-api-key" in error_msg.lower():
+            logger.warning(f"[메타데이터 추출] Anthropic API 인증 오류: {error_msg}. 빈 메타데이터로 계속 진행")
+        else:
+            # 다른 오류도 경고로 처리 (검색은 계속 진행)
+            logger.warning(f"[메타데이터 추출] 추출 실패 (계속 진행): {error_msg}")
+        return {}
+
+    def _build_prompt(self, query: str) -> str:
+        """메타데이터 추출 프롬프트 생성"""
         prompt = f"""당신은 자연어 질의에서 메타데이터를 추출하는 전문가입니다.
 
 자연어 질의를 분석하여 모든 정보를 메타데이터로 추출하세요.
@@ -501,154 +619,121 @@ class MetadataExtractor:
 
 JSON만 반환하세요. 다른 설명은 하지 마세요.
 """
-
+        return prompt
+
+    def _parse_response(self, text: str) -> Dict[str, Any]:
+        """LLM 응답 텍스트를 JSON 파싱 후 키/값 정규화"""
+        # JSON 파싱 (코드블록 제거)
+        if '```json' in text:
+            json_text = text.split('```json')[1].split('```')[0].strip()
+        elif '```' in text:
+            json_text = text.split('```')[1].strip()
+        else:
+            json_text = text.strip()
+        
         try:
-            # API 키 유효성 검사
-            if not self.client or not hasattr(self.client, 'api_key') or not self.client.api_key:
-                logger.warning("[메타데이터 추출] Anthropic API 키가 설정되지 않았습니다. 빈 메타데이터 반환")
-                return {}
-            
-            # 실제 사용되는 API 키 확인
-            actual_api_key = getattr(self.client, 'api_key', None)
-            if not actual_api_key:
-                logger.error("[메타데이터 추출] 클라이언트에 API 키가 없습니다!")
-                return {}
-            
-            llm_call_start = time.time()
-            try:
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=2048,  # ⭐ 노트북과 동일: 2048
-                    temperature=0.0,
-                    messages=[{"role": "user", "content": prompt}],
-                    timeout=30.0  # 30초 타임아웃
-                )
-                text = response.content[0].text
-            except Exception as llm_error:
-                llm_call_time = time.time() - llm_call_start
-                logger.error(f"[메타데이터 추출] Anthropic API 호출 실패: {llm_call_time:.2f}초, 에러: {llm_error}")
-                raise
-            
-            # JSON 파싱 (코드블록 제거)
-            if '```json' in text:
-                json_text = text.split('```json')[1].split('```')[0].strip()
-            elif '```' in text:
-                json_text = text.split('```')[1].strip()
-            else:
-                json_text = text.strip()
-            
-            try:
-                metadata = json.loads(json_text)
-            except json.JSONDecodeError as json_err:
-                logger.warning(f"[메타데이터 추출] JSON 파싱 실패: {json_err}, 원본 텍스트: {json_text[:200]}")
-                # 빈 JSON이나 잘못된 형식인 경우 빈 딕셔너리 반환
-                metadata = {}
-            
-            if not metadata:
-                logger.warning(f"[메타데이터 추출] LLM이 빈 메타데이터를 반환했습니다. 원본 응답: {text[:300]}")
-            
-            # ===== 후처리: 키 이름 및 값 정규화 =====
-            
-            # 1. 지역 키 정규화
-            if "거주지" in metadata and "지역" not in metadata:
-                metadata["지역"] = metadata.pop("거주지")
-            if "거주" in metadata and "지역" not in metadata:
-                metadata["지역"] = metadata.pop("거주")
-
-            # 2. 결혼여부 키 정규화
-            marriage_keys = ["결혼상태", "결혼상황", "혼인", "혼인여부", "결혼"]
-            for key in marriage_keys:
-                if key in metadata and "결혼여부" not in metadata:
-                    metadata["결혼여부"] = metadata.pop(key)
-                    break
-
-            # 3. 결혼여부 값 정규화
-            if "결혼여부" in metadata:
-                marriage = metadata["결혼여부"]
-                if isinstance(marriage, str):
-                    if marriage in ["결혼함", "결혼", "결혼한", "기혼자", "유부남", "유부녀"]:
-                        metadata["결혼여부"] = "기혼"
-                    elif marriage in ["미혼인", "결혼 안함", "미혼자"]:
-                        metadata["결혼여부"] = "미혼"
-
-            # 4. 가족수 키 정규화
-            household_keys = ["가구형태", "가구유형", "거주형태", "가구구성"]
-            for key in household_keys:
-                if key in metadata and "가족수" not in metadata:
-                    value = metadata.pop(key)
-                    if isinstance(value, str):
-                        match = re.search(r'(\d+)인', value)
-                        if match:
-                            metadata["가족수"] = int(match.group(1))
-                    break
-
-            # 5. ⭐ 직업 정규화 (15개 보기로 매핑)
-            if "직업" in metadata:
-                job = metadata["직업"]
-                job_normalized = self._normalize_job(job)
-                if job_normalized != job:
-                    metadata["직업"] = job_normalized
-
-            # 6. 성별 정규화
-            if "성별" in metadata:
-                gender = metadata["성별"]
-                if isinstance(gender, str):
-                    if gender in ["남성", "남자", "male", "M"]:
-                        metadata["성별"] = "남"
-                    elif gender in ["여성", "여자", "female", "F"]:
-                        metadata["성별"] = "여"
-                elif isinstance(gender, list):
-                    normalized = []
-                    for g in gender:
-                        if g in ["남성", "남자", "male", "M"]:
-                            normalized.append("남")
-                        elif g in ["여성", "여자", "female", "F"]:
-                            normalized.append("여")
-                        else:
-                            normalized.append(g)
-                    metadata["성별"] = normalized
-
-            # 7. 인원수 키 정규화 (공백 제거)
-            # "인원 수", " 인원수" 등 공백이 있는 키를 "인원수"로 정규화
-            for key in list(metadata.keys()):
-                if "인원" in key and "수" in key and key != "인원수":
-                    if "인원수" not in metadata:
-                        metadata["인원수"] = metadata.pop(key)
-                    else:
-                        metadata.pop(key)  # 중복 키 제거
-            
-            # 8. 인원수 정규화 (문자열을 정수로 변환)
-            if "인원수" in metadata:
-                count = metadata["인원수"]
-                if isinstance(count, str):
-                    # "10명", "10개" 등에서 숫자만 추출
-                    match = re.search(r'(\d+)', count)
+            metadata = json.loads(json_text)
+        except json.JSONDecodeError as json_err:
+            logger.warning(f"[메타데이터 추출] JSON 파싱 실패: {json_err}, 원본 텍스트: {json_text[:200]}")
+            # 빈 JSON이나 잘못된 형식인 경우 빈 딕셔너리 반환
+            metadata = {}
+        
+        if not metadata:
+            logger.warning(f"[메타데이터 추출] LLM이 빈 메타데이터를 반환했습니다. 원본 응답: {text[:300]}")
+        
+        return self._normalize_metadata(metadata)
+
+    def _normalize_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """추출된 메타데이터의 키 이름 및 값 정규화 (in-place, 결합 플래너와 공용)"""
+        # ===== 후처리: 키 이름 및 값 정규화 =====
+        
+        # 1. 지역 키 정규화
+        if "거주지" in metadata and "지역" not in metadata:
+            metadata["지역"] = metadata.pop("거주지")
+        if "거주" in metadata and "지역" not in metadata:
+            metadata["지역"] = metadata.pop("거주")
+
+        # 2. 결혼여부 키 정규화
+        marriage_keys = ["결혼상태", "결혼상황", "혼인", "혼인여부", "결혼"]
+        for key in marriage_keys:
+            if key in metadata and "결혼여부" not in metadata:
+                metadata["결혼여부"] = metadata.pop(key)
+                break
+
+        # 3. 결혼여부 값 정규화
+        if "결혼여부" in metadata:
+            marriage = metadata["결혼여부"]
+            if isinstance(marriage, str):
+                if marriage in ["결혼함", "결혼", "결혼한", "기혼자", "유부남", "유부녀"]:
+                    metadata["결혼여부"] = "기혼"
+                elif marriage in ["미혼인", "결혼 안함", "미혼자"]:
+                    metadata["결혼여부"] = "미혼"
+
+        # 4. 가족수 키 정규화
+        household_keys = ["가구형태", "가구유형", "거주형태", "가구구성"]
+        for key in household_keys:
+            if key in metadata and "가족수" not in metadata:
+                value = metadata.pop(key)
+                if isinstance(value, str):
+                    match = re.search(r'(\d+)인', value)
                     if match:
-                        metadata["인원수"] = int(match.group(1))
+                        metadata["가족수"] = int(match.group(1))
+                break
+
+        # 5. ⭐ 직업 정규화 (15개 보기로 매핑)
+        if "직업" in metadata:
+            job = metadata["직업"]
+            job_normalized = self._normalize_job(job)
+            if job_normalized != job:
+                metadata["직업"] = job_normalized
+
+        # 6. 성별 정규화
+        if "성별" in metadata:
+            gender = metadata["성별"]
+            if isinstance(gender, str):
+                if gender in ["남성", "남자", "male", "M"]:
+                    metadata["성별"] = "남"
+                elif gender in ["여성", "여자", "female", "F"]:
+                    metadata["성별"] = "여"
+            elif isinstance(gender, list):
+                normalized = []
+                for g in gender:
+                    if g in ["남성", "남자", "male", "M"]:
+                        normalized.append("남")
+                    elif g in ["여성", "여자", "female", "F"]:
+                        normalized.append("여")
                     else:
-                        # 숫자를 찾을 수 없으면 제거
-                        metadata.pop("인원수")
-                elif isinstance(count, (int, float)):
-                    # 이미 숫자면 정수로 변환
-                    metadata["인원수"] = int(count)
+                        normalized.append(g)
+                metadata["성별"] = normalized
+
+        # 7. 인원수 키 정규화 (공백 제거)
+        # "인원 수", " 인원수" 등 공백이 있는 키를 "인원수"로 정규화
+        for key in list(metadata.keys()):
+            if "인원" in key and "수" in key and key != "인원수":
+                if "인원수" not in metadata:
+                    metadata["인원수"] = metadata.pop(key)
+                else:
+                    metadata.pop(key)  # 중복 키 제거
+        
+        # 8. 인원수 정규화 (문자열을 정수로 변환)
+        if "인원수" in metadata:
+            count = metadata["인원수"]
+            if isinstance(count, str):
+                # "10명", "10개" 등에서 숫자만 추출
+                match = re.search(r'(\d+)', count)
+                if match:
+                    metadata["인원수"] = int(match.group(1))
                 else:
-                    # 다른 타입이면 제거
+                    # 숫자를 찾을 수 없으면 제거
                     metadata.pop("인원수")
-            
-            extract_time = time.time() - extract_start
-            return metadata
-
-        except Exception as e:
-            extract_time = time.time() - extract_start if 'extract_start' in locals() else 0
-            error_msg = str(e)
-            logger.error(f"[메타데이터 추출] 오류 발생: {extract_time:.2f}초, 에러: {e}", exc_info=True)
-            # 인증 오류인 경우 경고만 출력하고 빈 메타데이터 반환
-            if "401" in error_msg or "authentication" in error_msg.lower() or "invalid x-api-key" in error_msg.lower():
-                logger.warning(f"[메타데이터 추출] Anthropic API 인증 오류: {error_msg}. 빈 메타데이터로 계속 진행")
+            elif isinstance(count, (int, float)):
+                # 이미 숫자면 정수로 변환
+                metadata["인원수"] = int(count)
             else:
-                # 다른 오류도 경고로 처리 (검색은 계속 진행)
-                logger.warning(f"[메타데이터 추출] 추출 실패 (계속 진행): {error_msg}")
-            return {}
+                # 다른 타입이면 제거
+                metadata.pop("인원수")
+        
+        return metadata
 
     def _normalize_job(self, job: str) -> str:
         """직업을 15개 보기 중 하나로 정규화"""
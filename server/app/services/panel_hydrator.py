@@ -0,0 +1,190 @@
+"""검색 결과 패널 메타데이터 배치 조회 (Pinecone)"""
+import asyncio
+from typing import Dict, Any, List, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+HYDRATION_MODE_QUERY = "query"  # topic + mb_sn $in 필터 쿼리 (벡터 ID 규칙 불필요)
+HYDRATION_MODE_FETCH = "fetch"  # 결정적 벡터 ID로 fetch
+HYDRATION_MODE_LIST = "list"    # ID prefix로 list 후 fetch (서버리스 인덱스)
+
+# 메타데이터 병합 시 제외하는 시스템 필드
+SYSTEM_FIELDS = ("topic", "index", "mb_sn")
+
+
+def merge_panel_metadata(panel_metadata_map: Dict[str, Dict[str, Any]], metadata: Dict[str, Any]) -> None:
+    """벡터 하나의 메타데이터를 mb_sn별 병합 결과에 반영 (in-place)"""
+    mb_sn = metadata.get("mb_sn", "")
+    if not mb_sn:
+        return
+
+    if mb_sn not in panel_metadata_map:
+        panel_metadata_map[mb_sn] = {
+            "_index_values": []  # welcome1, welcome2, quickpoll 구분용
+        }
+    merged = panel_metadata_map[mb_sn]
+
+    # index 필드 수집 (welcome1, welcome2, quickpoll 구분용)
+    index_val = metadata.get("index")
+    if index_val and index_val not in merged["_index_values"]:
+        merged["_index_values"].append(index_val)
+
+    # 메타데이터 병합 (시스템 필드 제외)
+    for key, value in metadata.items():
+        if key in SYSTEM_FIELDS:
+            continue
+        if key in merged:
+            # 이미 있는 경우, 리스트면 병합, 아니면 덮어쓰기
+            existing = merged[key]
+            if isinstance(existing, list) and isinstance(value, list):
+                merged[key] = list(set(existing + value))
+            elif isinstance(existing, list):
+                if value not in existing:
+                    merged[key] = existing + [value]
+            else:
+                merged[key] = value
+        else:
+            merged[key] = value
+
+
+class PanelHydrator:
+    """
+    mb_sn 목록의 Pinecone 메타데이터를 topic별로 모아 병합
+
+    - 호출 측에서 페이지 범위로 자른 mb_sn만 전달 (비용이 페이지 크기에 비례)
+    - mb_sn을 chunk_size 단위로 나누고, (topic × chunk) 요청을 max_workers개까지 동시 실행
+    - 모드:
+        query: {"topic": t, "mb_sn": {"$in": chunk}} 필터 쿼리 (기본, 벡터 ID 규칙 불필요)
+        fetch: id_template(예: "{mb_sn}_{topic}")으로 만든 ID를 fetch
+        list : id_prefix_template(예: "{mb_sn}#")으로 ID 목록 조회 후 fetch
+    """
+
+    def __init__(
+        self,
+        index,
+        dimension: int = 1536,
+        chunk_size: int = 100,
+        max_workers: int = 8,
+        id_template: str = "",
+        id_prefix_template: str = ""
+    ):
+        """
+        Args:
+            index: Pinecone Index 객체
+            dimension: 인덱스 차원 (query 모드 더미 벡터용)
+            chunk_size: 요청 하나에 담을 mb_sn 수
+            max_workers: 동시 Pinecone 요청 수
+            id_template: fetch 모드 벡터 ID 템플릿 ({mb_sn}, {topic} 사용)
+            id_prefix_template: list 모드 ID prefix 템플릿 ({mb_sn}, {topic} 사용)
+        """
+        self.index = index
+        self.dimension = dimension
+        self.chunk_size = max(1, int(chunk_size))
+        self.max_workers = max(1, int(max_workers))
+        self.id_template = id_template
+        self.id_prefix_template = id_prefix_template
+
+        if id_template:
+            self.mode = HYDRATION_MODE_FETCH
+        elif id_prefix_template:
+            self.mode = HYDRATION_MODE_LIST
+        else:
+            self.mode = HYDRATION_MODE_QUERY
+
+    async def hydrate(self, mb_sns: List[str], topics: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        mb_sn별 병합 메타데이터 조회
+
+        Returns:
+            {mb_sn: {메타데이터..., "_index_values": [...]}}
+        """
+        panel_metadata_map: Dict[str, Dict[str, Any]] = {}
+        mb_sns = list(dict.fromkeys(mb_sns))
+        if not mb_sns or not topics:
+            return panel_metadata_map
+
+        chunks = [mb_sns[i:i + self.chunk_size] for i in range(0, len(mb_sns), self.chunk_size)]
+        semaphore = asyncio.Semaphore(self.max_workers)
+        random_vector = self._dummy_vector() if self.mode == HYDRATION_MODE_QUERY else None
+
+        # prefix에 topic이 없으면 mb_sn당 한 번만 list (모든 topic 벡터를 한꺼번에 조회)
+        if self.mode == HYDRATION_MODE_LIST and "{topic}" not in self.id_prefix_template:
+            request_topics: List[Optional[str]] = [None]
+        else:
+            request_topics = list(topics)
+        topic_rank = {topic: rank for rank, topic in enumerate(topics)}
+
+        async def _run(topic: Optional[str], chunk: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(self._load_chunk, topic, chunk, random_vector, topic_rank)
+                except Exception as e:
+                    logger.warning(f"[Hydration] {topic or '전체 topic'} 메타데이터 조회 실패 ({len(chunk)}개): {e}")
+                    return []
+
+        results = await asyncio.gather(*(_run(topic, chunk) for topic in request_topics for chunk in chunks))
+
+        # topic 순서대로 병합해야 덮어쓰기 결과가 기존(카테고리 순차 조회)과 동일
+        all_metadata = [metadata for metadata_list in results for metadata in metadata_list]
+        all_metadata.sort(key=lambda m: topic_rank.get(m.get("topic"), len(topic_rank)))
+        for metadata in all_metadata:
+            merge_panel_metadata(panel_metadata_map, metadata)
+
+        logger.info(
+            f"[Hydration] 완료 ({self.mode}): {len(mb_sns)}개 패널 × {len(topics)}개 topic, "
+            f"요청 {len(results)}회 (chunk={self.chunk_size}), 결과 {len(panel_metadata_map)}개 패널"
+        )
+        return panel_metadata_map
+
+    def _load_chunk(
+        self,
+        topic: Optional[str],
+        chunk: List[str],
+        random_vector: Optional[List[float]],
+        topic_rank: Dict[str, int]
+    ) -> List[Dict[str, Any]]:
+        """topic 하나(None이면 전체) × mb_sn chunk 하나의 메타데이터 목록 조회 (스레드에서 실행)"""
+        if self.mode == HYDRATION_MODE_QUERY:
+            response = self.index.query(
+                vector=random_vector,
+                top_k=len(chunk) * 2,  # 충분히 많이 가져오기
+                include_metadata=True,
+                include_values=False,
+                filter={
+                    "topic": topic,
+                    "mb_sn": {"$in": chunk}
+                }
+            )
+            return [match.metadata for match in response.matches if match.metadata]
+
+        if self.mode == HYDRATION_MODE_FETCH:
+            ids = [self.id_template.format(mb_sn=mb_sn, topic=topic) for mb_sn in chunk]
+        else:
+            ids = []
+            for mb_sn in chunk:
+                prefix = self.id_prefix_template.format(mb_sn=mb_sn, topic=topic or "")
+                for page_ids in self.index.list(prefix=prefix):
+                    ids.extend(page_ids)
+
+        metadata_list = []
+        # fetch는 ID 수가 많으면 URL이 길어지므로 chunk_size 단위로 나눠 요청
+        for start in range(0, len(ids), self.chunk_size):
+            response = self.index.fetch(ids=ids[start:start + self.chunk_size])
+            for vector in response.vectors.values():
+                metadata = getattr(vector, "metadata", None) or {}
+                # 요청한 topic(들)에 해당하는 벡터만 사용
+                vector_topic = metadata.get("topic", topic)
+                if metadata and (vector_topic == topic if topic else vector_topic in topic_rank):
+                    metadata_list.append(metadata)
+        return metadata_list
+
+    def _dummy_vector(self) -> List[float]:
+        """query 모드용 단위 랜덤 벡터 (유사도는 사용하지 않음)"""
+        vector = np.random.rand(self.dimension).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        return vector.tolist()
@@ -0,0 +1,170 @@
+"""패널 ID(mb_sn) ↔ int32 인터닝 레지스트리 (프로세스 전역, 선택적 memmap .npy 저장소)"""
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 등록되지 않은 mb_sn의 ID
+MISSING_ID = -1
+
+
+def normalize_mb_sn(value: Any) -> str:
+    """mb_sn 정규화 (앞뒤 공백 제거, 소문자화) - 레지스트리 키 기준"""
+    return str(value).strip().lower()
+
+
+class PanelIdRegistry:
+    """
+    mb_sn ↔ int32 ID 사전
+
+    - 기본 사전: 정규화된 mb_sn을 정렬한 고정폭 유니코드 배열 (ID = 배열 위치)
+      → encode는 np.searchsorted로 벡터화, decode는 배열 인덱싱
+      → store_path 지정 시 .npy로 저장하고 이후 np.load(mmap_mode="r")로 열어 워커 간 페이지 캐시 공유
+    - 추가 사전: 기본 사전에 없는 mb_sn은 intern 시 뒤쪽 ID(len(기본 사전) 이후)로 등록 (프로세스 내 고정)
+    - 핫 패스는 int32 배열/np.isin으로 처리하고, 응답 직전에만 decode로 문자열 변환
+    """
+
+    def __init__(self, mb_sns: Iterable[Any] = (), store_path: Optional[str] = None):
+        """
+        Args:
+            mb_sns: 기본 사전에 넣을 mb_sn 목록 (store_path에 저장소가 있으면 무시)
+            store_path: memmap .npy 저장소 경로 (None이면 메모리에만 생성)
+        """
+        self.store_path = store_path or None
+        self._lock = threading.Lock()
+        self._overflow: Dict[str, int] = {}
+        self._overflow_keys: List[str] = []
+        self._keys = self._load_or_build(mb_sns)
+
+    def _load_or_build(self, mb_sns: Iterable[Any]) -> np.ndarray:
+        """저장소가 있으면 memmap으로 열고, 없으면 정렬된 키 배열 생성 (store_path 지정 시 저장)"""
+        if self.store_path and os.path.exists(self.store_path):
+            try:
+                keys = np.load(self.store_path, mmap_mode="r")
+                if keys.dtype.kind == "U" and keys.ndim == 1:
+                    logger.info(f"[패널 ID] memmap 사전 사용: {self.store_path} ({len(keys)}개)")
+                    return keys
+                logger.warning(f"[패널 ID] 사전 형식 불일치 {keys.dtype}/{keys.shape}, 새로 생성")
+            except Exception as e:
+                logger.warning(f"[패널 ID] 사전 로드 실패, 새로 생성: {e}")
+
+        normalized = sorted({normalize_mb_sn(mb_sn) for mb_sn in mb_sns if mb_sn is not None and str(mb_sn).strip()})
+        keys = np.array(normalized, dtype=str) if normalized else np.empty(0, dtype="<U1")
+
+        if self.store_path and len(keys):
+            try:
+                os.makedirs(os.path.dirname(self.store_path) or ".", exist_ok=True)
+                tmp_path = f"{self.store_path}.tmp.npy"
+                np.save(tmp_path, keys)
+                os.replace(tmp_path, self.store_path)
+                keys = np.load(self.store_path, mmap_mode="r")
+                logger.info(f"[패널 ID] 사전 저장: {self.store_path} ({len(keys)}개)")
+            except Exception as e:
+                logger.warning(f"[패널 ID] 사전 저장 실패, 메모리 사전 사용: {e}")
+        return keys
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._overflow_keys)
+
+    def encode(self, mb_sns: Iterable[Any], intern: bool = False) -> np.ndarray:
+        """
+        mb_sn 목록 → int32 ID 배열
+
+        Args:
+            mb_sns: mb_sn 목록 (정규화는 내부에서 수행)
+            intern: True면 사전에 없는 mb_sn을 추가 사전에 등록, False면 MISSING_ID(-1)
+        """
+        normalized = np.array([normalize_mb_sn(mb_sn) for mb_sn in mb_sns], dtype=str)
+        ids = np.full(len(normalized), MISSING_ID, dtype=np.int32)
+        if len(normalized) == 0:
+            return ids
+
+        if len(self._keys):
+            positions = np.searchsorted(self._keys, normalized)
+            in_range = positions < len(self._keys)
+            hit = np.zeros(len(normalized), dtype=bool)
+            hit[in_range] = self._keys[positions[in_range]] == normalized[in_range]
+            ids[hit] = positions[hit]
+        else:
+            hit = np.zeros(len(normalized), dtype=bool)
+
+        if not hit.all():
+            for i in np.flatnonzero(~hit):
+                ids[i] = self._overflow_id(str(normalized[i]), intern)
+        return ids
+
+    def intern(self, mb_sn: Any) -> int:
+        """mb_sn 하나의 ID (없으면 등록)"""
+        return int(self.encode([mb_sn], intern=True)[0])
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """int32 ID 배열 → 정규화된 mb_sn 목록 (응답 경계에서 사용)"""
+        ids = np.asarray(ids, dtype=np.int64)
+        base = len(self._keys)
+        if len(ids) and (ids < 0).any():
+            raise KeyError("등록되지 않은 패널 ID(-1)는 decode할 수 없습니다")
+        if len(ids) and ids.max() < base:
+            return self._keys[ids].tolist()
+        return [str(self._keys[i]) if i < base else self._overflow_keys[i - base] for i in ids.tolist()]
+
+    def stats(self) -> Dict[str, Any]:
+        """레지스트리 통계"""
+        return {
+            "base_size": len(self._keys),
+            "overflow_size": len(self._overflow_keys),
+            "memmap": isinstance(self._keys, np.memmap),
+            "store_path": self.store_path,
+        }
+
+    def _overflow_id(self, key: str, intern: bool) -> int:
+        """추가 사전 조회/등록"""
+        panel_id = self._overflow.get(key)
+        if panel_id is not None or not intern:
+            return MISSING_ID if panel_id is None else panel_id
+        with self._lock:
+            panel_id = self._overflow.get(key)
+            if panel_id is None:
+                panel_id = len(self._keys) + len(self._overflow_keys)
+                self._overflow_keys.append(key)
+                self._overflow[key] = panel_id
+        return panel_id
+
+
+# 프로세스 전역 레지스트리 싱글톤 (startup에서 merged.panel_data mb_sn으로 초기화)
+_panel_id_registry: Optional[PanelIdRegistry] = None
+_panel_id_registry_lock = threading.Lock()
+
+
+def init_panel_id_registry(mb_sns: Iterable[Any] = ()) -> PanelIdRegistry:
+    """
+    전역 레지스트리 생성 (startup에서 한 번 호출)
+
+    PANEL_ID_REGISTRY_PATH 저장소가 있으면 mb_sns 대신 저장소 사용.
+    이미 ID가 발급된 레지스트리가 있으면 ID가 바뀌지 않도록 기존 레지스트리를 그대로 반환.
+    """
+    global _panel_id_registry
+
+    from app.core.config import PANEL_ID_REGISTRY_PATH
+
+    with _panel_id_registry_lock:
+        if _panel_id_registry is None or len(_panel_id_registry) == 0:
+            _panel_id_registry = PanelIdRegistry(mb_sns, store_path=PANEL_ID_REGISTRY_PATH)
+            logger.info(f"[패널 ID] 레지스트리 초기화: {_panel_id_registry.stats()}")
+    return _panel_id_registry
+
+
+def get_panel_id_registry() -> PanelIdRegistry:
+    """전역 레지스트리 반환 (초기화 전이면 저장소 또는 빈 기본 사전으로 생성, 이후 intern으로 확장)"""
+    global _panel_id_registry
+
+    if _panel_id_registry is None:
+        from app.core.config import PANEL_ID_REGISTRY_PATH
+
+        with _panel_id_registry_lock:
+            if _panel_id_registry is None:
+                _panel_id_registry = PanelIdRegistry(store_path=PANEL_ID_REGISTRY_PATH)
+    return _panel_id_registry
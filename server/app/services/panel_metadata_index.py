@@ -0,0 +1,365 @@
+"""패널 메타데이터 로컬 컬럼 인덱스 (merged.panel_data → numpy 컬럼, 필터만 검색을 Pinecone 없이 평가)"""
+import math
+import re
+import threading
+import time
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 지역명 정규화 (PineconeFilterConverter / MetadataFilterExtractor와 동일한 규칙)
+REGION_MAPPING = {
+    "서울특별시": "서울", "서울시": "서울",
+    "부산광역시": "부산", "부산시": "부산",
+    "대구광역시": "대구", "대구시": "대구",
+    "인천광역시": "인천", "인천시": "인천",
+    "광주광역시": "광주", "광주시": "광주",
+    "대전광역시": "대전", "대전시": "대전",
+    "울산광역시": "울산", "울산시": "울산",
+    "세종특별자치시": "세종", "세종시": "세종",
+    "경기도": "경기", "강원도": "강원", "강원특별자치도": "강원",
+    "충청북도": "충북", "충북도": "충북",
+    "충청남도": "충남", "충남도": "충남",
+    "전라북도": "전북", "전북도": "전북", "전북특별자치도": "전북",
+    "전라남도": "전남", "전남도": "전남",
+    "경상북도": "경북", "경북도": "경북",
+    "경상남도": "경남", "경남도": "경남",
+    "제주특별자치도": "제주", "제주도": "제주", "제주시": "제주",
+}
+
+
+class UnsupportedFilterError(ValueError):
+    """로컬 인덱스로 평가할 수 없는 필터 (인덱스에 없는 필드/연산자 → Pinecone 경로로 폴백)"""
+
+
+def _normalize_gender(value: Any) -> Optional[str]:
+    if value in ("남", "남성", "남자", "M", "male"):
+        return "남"
+    if value in ("여", "여성", "여자", "F", "female"):
+        return "여"
+    return str(value) if value not in (None, "") else None
+
+
+def _to_number(value: Any) -> float:
+    """숫자 변환 ("3명", "45세" 등 앞부분 숫자 사용, 실패 시 NaN)"""
+    if isinstance(value, bool) or value is None or value == "":
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.search(r"-?\d+(\.\d+)?", str(value))
+    return float(match.group(0)) if match else math.nan
+
+
+def _income_bounds(value: Any) -> Tuple[float, float]:
+    """
+    소득 구간 문자열 → (min, max) 만원 단위
+
+    예: "월 300~399만원" → (300, 399), "월 100만원 미만" → (0, 100), "월 1000만원 이상" → (1000, inf)
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value), float(value)
+    numbers = [float(n) for n in re.findall(r"\d+", str(value or "").replace(",", ""))]
+    if not numbers:
+        return math.nan, math.nan
+    if len(numbers) >= 2:
+        return numbers[0], numbers[1]
+    if "미만" in str(value) or "이하" in str(value):
+        return 0.0, numbers[0]
+    if "이상" in str(value) or "초과" in str(value):
+        return numbers[0], math.inf
+    return numbers[0], numbers[0]
+
+
+def _age_group(row: Dict[str, Any]) -> Optional[str]:
+    if row.get("연령대"):
+        return str(row["연령대"])
+    age = _to_number(row.get("age"))
+    return f"{int(age // 10 * 10)}대" if not math.isnan(age) else None
+
+
+# Pinecone 메타데이터 필드 → merged.panel_data 행에서 값 추출
+CATEGORICAL_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "성별": lambda row: _normalize_gender(row.get("gender") or row.get("성별")),
+    "지역": lambda row: REGION_MAPPING.get(row.get("location") or row.get("지역"), row.get("location") or row.get("지역")),
+    "지역구": lambda row: row.get("detail_location") or row.get("지역구"),
+    "연령대": _age_group,
+    "결혼여부": lambda row: row.get("결혼여부"),
+    "학력": lambda row: row.get("최종학력") or row.get("학력"),
+}
+NUMERIC_FIELDS: Dict[str, Callable[[Dict[str, Any]], float]] = {
+    "나이": lambda row: _to_number(row.get("age", row.get("나이"))),
+    "자녀수": lambda row: _to_number(row.get("자녀수")),
+    "가족수": lambda row: _to_number(row.get("가족수")),
+    "개인소득_min": lambda row: _income_bounds(row.get("월평균 개인소득"))[0],
+    "개인소득_max": lambda row: _income_bounds(row.get("월평균 개인소득"))[1],
+    "가구소득_min": lambda row: _income_bounds(row.get("월평균 가구소득"))[0],
+    "가구소득_max": lambda row: _income_bounds(row.get("월평균 가구소득"))[1],
+}
+
+_RANGE_OPS = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+
+class PanelMetadataIndex:
+    """
+    필터만 검색(빈 쿼리 + 외부 필터)용 로컬 컬럼 인덱스
+
+    - 범주형 필드: 값 사전 + int32 코드 배열, 값별 bool 비트맵은 처음 조회 시 만들어 재사용
+    - 숫자형 필드: float64 배열 (값 없음 = NaN, 비교 결과 항상 False → Pinecone과 동일하게 제외)
+    - PineconeFilterConverter 출력({"카테고리": {필드: 조건}})을 전 카테고리 AND로 평가
+    - 인덱스에 없는 필드(coverage 등)나 연산자는 UnsupportedFilterError → 호출 측은 Pinecone으로 폴백
+    - 결과 수 제한 없음, 네트워크 호출 없음 (최초 1회 merged 데이터 로드 제외)
+    """
+
+    def __init__(self, loader: Optional[Callable[[], Dict[str, Dict[str, Any]]]] = None):
+        """
+        Args:
+            loader: {mb_sn: 패널 데이터} 반환 함수 (ensure_loaded()에서 최초 1회 호출)
+        """
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self.loaded = False
+        self.mb_sns: np.ndarray = np.empty(0, dtype=object)
+        self._codes: Dict[str, np.ndarray] = {}
+        self._vocab: Dict[str, Dict[str, int]] = {}
+        self._numeric: Dict[str, np.ndarray] = {}
+        self._bitmaps: Dict[Tuple[str, str], np.ndarray] = {}
+        self.build_seconds = 0.0
+        self.queries = 0
+        self.unsupported = 0
+
+    def __len__(self) -> int:
+        return len(self.mb_sns)
+
+    def build(self, panels: Iterable[Dict[str, Any]]) -> "PanelMetadataIndex":
+        """패널 데이터(merged.panel_data 평탄화 행)로 컬럼 생성"""
+        build_start = time.time()
+        rows = [row for row in panels if row.get("mb_sn")]
+
+        codes: Dict[str, np.ndarray] = {}
+        vocab: Dict[str, Dict[str, int]] = {}
+        for field, extract in CATEGORICAL_FIELDS.items():
+            field_vocab: Dict[str, int] = {}
+            column = np.full(len(rows), -1, dtype=np.int32)
+            for i, row in enumerate(rows):
+                value = extract(row)
+                if value in (None, ""):
+                    continue
+                column[i] = field_vocab.setdefault(str(value), len(field_vocab))
+            codes[field] = column
+            vocab[field] = field_vocab
+
+        numeric = {
+            field: np.fromiter((extract(row) for row in rows), dtype=np.float64, count=len(rows))
+            for field, extract in NUMERIC_FIELDS.items()
+        }
+
+        with self._lock:
+            self.mb_sns = np.array([str(row["mb_sn"]) for row in rows], dtype=object)
+            self._codes = codes
+            self._vocab = vocab
+            self._numeric = numeric
+            self._bitmaps = {}
+            self.loaded = True
+            self.build_seconds = time.time() - build_start
+
+        logger.info(f"[로컬 필터 인덱스] 생성 완료: {len(rows)}개 패널, {self.build_seconds:.2f}초")
+        return self
+
+    def ensure_loaded(self) -> bool:
+        """최초 호출 시 loader로 인덱스 생성. 사용 가능 여부(패널 1개 이상) 반환"""
+        if not self.loaded and self.loader is not None:
+            with self._build_lock:
+                if not self.loaded:
+                    try:
+                        self.build((self.loader() or {}).values())
+                    except Exception as e:
+                        logger.warning(f"[로컬 필터 인덱스] 생성 실패, Pinecone 필터 검색 사용: {e}")
+                        return False
+        return self.loaded and len(self.mb_sns) > 0
+
+    def match(self, category_filters: Dict[str, Dict[str, Any]]) -> np.ndarray:
+        """
+        카테고리별 필터를 모두 만족하는 행 마스크
+
+        Raises:
+            UnsupportedFilterError: 인덱스로 평가할 수 없는 필터
+        """
+        mask = np.ones(len(self.mb_sns), dtype=bool)
+        for topic_filter in (category_filters or {}).values():
+            if topic_filter:
+                mask &= self._eval_filter(topic_filter)
+        return mask
+
+    def split_filters(
+        self,
+        category_filters: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        카테고리별 필터를 (로컬 평가 가능, 나머지)로 분리
+
+        Returns:
+            (로컬 필터, Pinecone에서 확인해야 하는 필터) - 둘 다 {"카테고리": {필드: 조건}}
+        """
+        local: Dict[str, Dict[str, Any]] = {}
+        residual: Dict[str, Dict[str, Any]] = {}
+        for category, topic_filter in (category_filters or {}).items():
+            for key, condition in (topic_filter or {}).items():
+                target = local if self._is_supported(key, condition) else residual
+                target.setdefault(category, {})[key] = condition
+        return local, residual
+
+    def search(self, category_filters: Dict[str, Dict[str, Any]]) -> Optional[List[str]]:
+        """
+        필터를 만족하는 전체 mb_sn (제한 없음)
+
+        Returns:
+            mb_sn 리스트 또는 None (인덱스 미사용/평가 불가 → Pinecone 폴백)
+        """
+        if not self.ensure_loaded():
+            return None
+        try:
+            mask = self.match(category_filters)
+        except UnsupportedFilterError as e:
+            self.unsupported += 1
+            logger.info(f"[로컬 필터 인덱스] 평가 불가 → Pinecone 사용: {e}")
+            return None
+        self.queries += 1
+        return self.mb_sns[mask].tolist()
+
+    def selectivity(self, filter_dict: Dict[str, Any]) -> Optional[float]:
+        """
+        Pinecone 필터 하나를 만족하는 패널 비율 (검색 플래너의 선택도 추정용)
+
+        Returns:
+            0.0~1.0 또는 None (인덱스 미사용/평가 불가)
+        """
+        if not filter_dict:
+            return 1.0
+        if not self.ensure_loaded():
+            return None
+        try:
+            return float(self._eval_filter(filter_dict).mean())
+        except UnsupportedFilterError:
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        return {
+            "loaded": self.loaded,
+            "panels": len(self.mb_sns),
+            "fields": sorted(list(self._codes) + list(self._numeric)),
+            "cached_bitmaps": len(self._bitmaps),
+            "build_seconds": round(self.build_seconds, 3),
+            "queries": self.queries,
+            "unsupported": self.unsupported,
+        }
+
+    # ===== 필터 평가 =====
+
+    def _is_supported(self, key: str, condition: Any) -> bool:
+        """필드 조건 하나를 로컬에서 평가할 수 있는지 여부"""
+        try:
+            self._eval_filter({key: condition})
+            return True
+        except UnsupportedFilterError:
+            return False
+
+    def _eval_filter(self, filter_dict: Dict[str, Any]) -> np.ndarray:
+        """Pinecone 필터 하나 평가 (필드 조건 AND, $and / $or 지원)"""
+        mask = np.ones(len(self.mb_sns), dtype=bool)
+        for key, condition in filter_dict.items():
+            if key == "$and":
+                for sub_filter in condition:
+                    mask &= self._eval_filter(sub_filter)
+            elif key == "$or":
+                any_mask = np.zeros(len(self.mb_sns), dtype=bool)
+                for sub_filter in condition:
+                    any_mask |= self._eval_filter(sub_filter)
+                mask &= any_mask
+            else:
+                mask &= self._eval_field(key, condition)
+        return mask
+
+    def _eval_field(self, field: str, condition: Any) -> np.ndarray:
+        """필드 조건 평가 (스칼라는 $eq)"""
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+
+        mask = np.ones(len(self.mb_sns), dtype=bool)
+        for op, operand in condition.items():
+            if field in self._codes:
+                mask &= self._eval_categorical(field, op, operand)
+            elif field in self._numeric:
+                mask &= self._eval_numeric(field, op, operand)
+            else:
+                raise UnsupportedFilterError(f"인덱스에 없는 필드: {field}")
+        return mask
+
+    def _eval_categorical(self, field: str, op: str, operand: Any) -> np.ndarray:
+        if op == "$eq":
+            return self._bitmap(field, operand)
+        if op == "$ne":
+            return (self._codes[field] >= 0) & ~self._bitmap(field, operand)
+        if op in ("$in", "$nin"):
+            any_mask = np.zeros(len(self.mb_sns), dtype=bool)
+            for value in operand or []:
+                any_mask |= self._bitmap(field, value)
+            return any_mask if op == "$in" else (self._codes[field] >= 0) & ~any_mask
+        raise UnsupportedFilterError(f"범주형 필드 '{field}'에 지원하지 않는 연산자: {op}")
+
+    def _eval_numeric(self, field: str, op: str, operand: Any) -> np.ndarray:
+        column = self._numeric[field]
+        if op in _RANGE_OPS:
+            return _RANGE_OPS[op](column, _to_number(operand))
+        if op == "$eq":
+            return column == _to_number(operand)
+        if op == "$ne":
+            return ~np.isnan(column) & (column != _to_number(operand))
+        if op in ("$in", "$nin"):
+            values = np.array([_to_number(v) for v in operand or []], dtype=np.float64)
+            hit = np.isin(column, values)
+            return hit if op == "$in" else ~np.isnan(column) & ~hit
+        raise UnsupportedFilterError(f"숫자형 필드 '{field}'에 지원하지 않는 연산자: {op}")
+
+    def _bitmap(self, field: str, value: Any) -> np.ndarray:
+        """값별 bool 비트맵 (캐시, 사전에 없는 값은 전부 False)"""
+        key = (field, str(value))
+        bitmap = self._bitmaps.get(key)
+        if bitmap is None:
+            code = self._vocab[field].get(str(value))
+            if code is None:
+                return np.zeros(len(self.mb_sns), dtype=bool)
+            bitmap = self._codes[field] == code
+            self._bitmaps[key] = bitmap
+        return bitmap
+
+
+# 프로세스 전역 인덱스 싱글톤 (설정 기반 지연 초기화, merged 데이터는 첫 필터 검색 시 로드)
+_panel_metadata_index: Optional[PanelMetadataIndex] = None
+_panel_metadata_index_lock = threading.Lock()
+
+
+def get_panel_metadata_index() -> Optional[PanelMetadataIndex]:
+    """설정(LOCAL_FILTER_INDEX_ENABLED)에 따른 전역 로컬 필터 인덱스 반환 (비활성화 시 None)"""
+    global _panel_metadata_index
+
+    from app.core.config import LOCAL_FILTER_INDEX_ENABLED
+
+    if not LOCAL_FILTER_INDEX_ENABLED:
+        return None
+
+    if _panel_metadata_index is None:
+        with _panel_metadata_index_lock:
+            if _panel_metadata_index is None:
+                from app.utils.merged_data_loader import load_merged_data
+                _panel_metadata_index = PanelMetadataIndex(loader=load_merged_data)
+    return _panel_metadata_index
@@ -1,8 +1,12 @@
 """Pinecone 검색 파이프라인"""
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import asyncio
 import logging
 import time
 
+import numpy as np
+
 from .metadata_extractor import MetadataExtractor
 from .metadata_filter_extractor import MetadataFilterExtractor
 from .category_classifier import CategoryClassifier
@@ -10,9 +14,32 @@ from .text_generator import CategoryTextGenerator
 from .embedding_generator import EmbeddingGenerator
 from .pinecone_searcher import PineconePanelSearcher
 from .pinecone_result_filter import PineconeResultFilter
+from .query_planner import FusedQueryPlanner
+from .llm_cache import LLMStageCache
+from .embedding_cache import EmbeddingCache
+from .panel_metadata_index import PanelMetadataIndex
+from .filter_relaxation import FilterRelaxationPlanner, start_relaxation_log
+from .pinecone_provider import PineconeIndexProvider
 
 logger = logging.getLogger(__name__)
 
+# 1~2단계 실행 방식 ("staged": 메타데이터 추출 → 카테고리 분류 순차 LLM 호출, "fused": 결합 플래너 1회 호출)
+PLANNER_MODE_STAGED = "staged"
+PLANNER_MODE_FUSED = "fused"
+PLANNER_MODES = (PLANNER_MODE_STAGED, PLANNER_MODE_FUSED)
+
+# 단계별 타임아웃 (초, "text"는 search/asearch 공통, 나머지는 asearch 전용)
+DEFAULT_STAGE_TIMEOUTS: Dict[str, float] = {
+    "metadata": 35.0,    # 1단계: 메타데이터 추출 (LLM)
+    "classify": 35.0,    # 2단계: 카테고리 분류 (LLM)
+    "text": 35.0,        # 3단계: 카테고리별 텍스트 생성 (LLM, 카테고리당)
+    "embedding": 30.0,   # 4단계: 임베딩 생성 (OpenAI)
+    "search": 120.0,     # 5단계: 단계적 필터링 (Pinecone)
+}
+
+# OpenAI text-embedding-3-small embedding dimension
+EMBEDDING_DIMENSION = 1536
+
 
 class PanelSearchPipeline:
     """전체 검색 파이프라인 (Pinecone + LLM 기반 메타데이터 필터)"""
@@ -23,7 +50,23 @@ class PanelSearchPipeline:
         pinecone_index_name: str,
         category_config: Dict[str, Any],
         anthropic_api_key: str,
-        openai_api_key: str
+        openai_api_key: str,
+        result_filter_mode: str = "progressive",
+        result_filter_max_workers: int = 5,
+        score_fusion: str = "last",
+        selectivity_order: bool = False,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+        text_max_workers: int = 5,
+        planner_mode: str = PLANNER_MODE_STAGED,
+        llm_cache: Optional[LLMStageCache] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        embedding_batch: bool = True,
+        metadata_index: Optional[PanelMetadataIndex] = None,
+        exhaustive_chunk_size: int = 1000,
+        in_chunk_size: int = 1000,
+        in_max_workers: int = 4,
+        relaxation_max_candidates: int = 4,
+        index_provider: Optional[PineconeIndexProvider] = None
     ):
         """
         Args:
@@ -32,14 +75,58 @@ class PanelSearchPipeline:
             category_config: 카테고리 설정 딕셔너리
             anthropic_api_key: Anthropic API 키
             openai_api_key: OpenAI API 키
+            result_filter_mode: 5단계 결과 필터 실행 모드 ("progressive" 또는 "parallel")
+            result_filter_max_workers: parallel 모드 동시 Pinecone 쿼리 수
+            score_fusion: 최종 정렬 점수 결합 방식 ("last", "max", "mean", "rrf")
+            selectivity_order: progressive 모드에서 metadata_index 선택도가 낮은 카테고리부터 실행할지 여부
+            stage_timeouts: 단계별 타임아웃 (초, DEFAULT_STAGE_TIMEOUTS 덮어쓰기)
+            text_max_workers: 3단계 텍스트 생성 동시 LLM 호출 수
+            planner_mode: 1~2단계 실행 방식 ("staged" 또는 "fused", fused 실패 시 staged로 폴백)
+            llm_cache: LLM 단계 결과 캐시 (메타데이터 추출/분류/텍스트 생성/플래너 공용, None이면 미사용)
+            embedding_cache: 임베딩 캐시 (None이면 미사용)
+            embedding_batch: 4단계 임베딩을 한 번의 배치 요청으로 생성할지 여부
+            metadata_index: 필터만 검색용 로컬 메타데이터 인덱스 (None이면 항상 Pinecone 사용)
+            exhaustive_chunk_size: 필터만 검색 전수 모드에서 Pinecone 확인 요청당 mb_sn 수
+            in_chunk_size: 후보 mb_sn $in 필터 분할 기준 (초과 시 chunk별 동시 검색 후 top_k 병합)
+            in_max_workers: $in 분할 검색 동시 요청 수
+            relaxation_max_candidates: 메타데이터 필터 결과가 0개일 때 동시에 시도할 완화 후보 수 (전체 제거 제외)
+            index_provider: 공유 Pinecone 인덱스 제공자 (None이면 검색기 전용으로 생성)
         """
-        self.metadata_extractor = MetadataExtractor(anthropic_api_key)
+        self.stage_timeouts = {**DEFAULT_STAGE_TIMEOUTS, **(stage_timeouts or {})}
+        self.text_max_workers = max(1, int(text_max_workers))
+        self.metadata_index = metadata_index
+        self.exhaustive_chunk_size = max(1, int(exhaustive_chunk_size))
+        self.metadata_extractor = MetadataExtractor(anthropic_api_key, cache=llm_cache)
         self.filter_extractor = MetadataFilterExtractor(anthropic_api_key)  # ⭐ LLM 기반 필터 추출기
-        self.category_classifier = CategoryClassifier(category_config, anthropic_api_key)
-        self.text_generator = CategoryTextGenerator(anthropic_api_key)
-        self.embedding_generator = EmbeddingGenerator(openai_api_key)
-        self.searcher = PineconePanelSearcher(pinecone_api_key, pinecone_index_name, category_config)
-        self.result_filter = PineconeResultFilter(self.searcher)
+        self.category_classifier = CategoryClassifier(category_config, anthropic_api_key, cache=llm_cache)
+        self.text_generator = CategoryTextGenerator(anthropic_api_key, cache=llm_cache)
+        self.embedding_generator = EmbeddingGenerator(openai_api_key, cache=embedding_cache, batch=embedding_batch)
+        self.searcher = PineconePanelSearcher(
+            pinecone_api_key,
+            pinecone_index_name,
+            category_config,
+            in_chunk_size=in_chunk_size,
+            in_max_workers=in_max_workers,
+            relaxation_planner=FilterRelaxationPlanner(metadata_index, max_candidates=relaxation_max_candidates),
+            index_provider=index_provider
+        )
+        self.result_filter = PineconeResultFilter(
+            self.searcher,
+            mode=result_filter_mode,
+            max_workers=result_filter_max_workers,
+            score_fusion=score_fusion,
+            metadata_index=metadata_index,
+            selectivity_order=selectivity_order
+        )
+
+        if planner_mode not in PLANNER_MODES:
+            logger.warning(f"[파이프라인] 알 수 없는 planner_mode '{planner_mode}', '{PLANNER_MODE_STAGED}' 사용")
+            planner_mode = PLANNER_MODE_STAGED
+        self.planner_mode = planner_mode
+        self.query_planner = (
+            FusedQueryPlanner(self.metadata_extractor, self.category_classifier)
+            if planner_mode == PLANNER_MODE_FUSED else None
+        )
 
     def search(self, query: str, top_k: int = None, external_filters: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
         """
@@ -55,23 +142,32 @@ class PanelSearchPipeline:
             mb_sn 리스트
         """
         start_time = time.time()
+        relaxations = start_relaxation_log()
 
         # 빈 쿼리이고 외부 필터만 있는 경우
         if (not query or not query.strip()) and external_filters:
             logger.info("[검색] 빈 쿼리, 외부 필터만으로 검색")
+            # ⭐ 전수 모드: 로컬 메타데이터 인덱스(+ 필요 시 Pinecone 전수 확인)로 조건을 만족하는 전체 패널 반환
+            exhaustive_results = self._exhaustive_filter_search(external_filters, top_k, start_time)
+            if exhaustive_results is not None:
+                return exhaustive_results
             # 필터만으로 검색 진행 (임베딩 생성 불필요)
             metadata = {}
-            # 외부 필터의 카테고리로 classified 초기화 (필터만으로 검색 가능하도록)
-            classified = {cat: {} for cat in external_filters.keys()}
+            planned_classified = None
             final_count = top_k  # top_k가 None이면 전체 반환
-            logger.info(f"[검색] 외부 필터 카테고리: {list(classified.keys())}")
+            logger.info(f"[검색] 외부 필터 카테고리: {list(external_filters.keys())}")
         else:
-            # 1단계: 메타데이터 추출
+            # 1단계: 메타데이터 추출 (fused 모드면 카테고리 분류까지 한 번에)
             step_start = time.time()
             logger.info("[1단계] 메타데이터 추출 시작")
+            planned_classified = None
             try:
                 if query and query.strip():
-                    metadata = self.metadata_extractor.extract(query)
+                    plan = self.query_planner.plan(query) if self.query_planner else None
+                    if plan is not None:
+                        metadata, planned_classified = plan
+                    else:
+                        metadata = self.metadata_extractor.extract(query)
                 else:
                     metadata = {}
                 step_time = time.time() - step_start
@@ -80,63 +176,23 @@ class PanelSearchPipeline:
                 logger.warning(f"[1단계 경고] 메타데이터 추출 실패 (계속 진행): {e}")
                 metadata = {}  # 빈 메타데이터로 계속 진행
             
-            # ⭐ 메타데이터 추출 실패 시 필터 폴백 처리
-            if not metadata:
-                if external_filters:
-                    # 필터가 있으면 필터만으로 검색 진행
-                    logger.warning("[경고] 메타데이터 추출 실패, 필터만으로 검색 진행")
-                    # 필터만 검색 모드로 전환
-                    classified = {cat: {} for cat in external_filters.keys()}
-                    final_count = top_k  # top_k가 None이면 전체 반환
-                    logger.info(f"[검색] 외부 필터 카테고리: {list(classified.keys())}")
-                else:
-                    # 필터도 없으면 검색 불가
-                    logger.error("[ERROR] 메타데이터 추출 실패 - 빈 메타데이터 반환, 필터도 없음")
-                    return []
-            
-            # ⭐ top_k 결정: query에서 추출 또는 파라미터 사용
-            final_count = None  # 기본값: None (전체 반환)
+            if not self._check_metadata(metadata, external_filters):
+                return []
             
-            if top_k is not None:
-                # 파라미터로 명시적 전달
-                final_count = top_k
-                logger.info(f"\n[인원수] 파라미터로 {final_count}명 지정됨")
-            else:
-                # metadata에서 인원수 추출 시도
-                extracted_count = metadata.get("인원수")
-                if extracted_count and isinstance(extracted_count, int) and extracted_count > 0:
-                    final_count = extracted_count
-                    logger.info(f"\n[인원수] 쿼리에서 {final_count}명 추출됨")
-                else:
-                    # ⭐ 명수 미명시 → None으로 유지 (필터링 후 남은 모든 후보 반환)
-                    final_count = None
-                    logger.info(f"\n[인원수] 쿼리에서 인원수 미명시 → 조건 만족하는 전체 패널 반환")
-
-            # 인원수 키 제거 (검색 조건이 아닌 결과 개수 지정용)
-            if "인원수" in metadata:
-                metadata.pop("인원수")
-                logger.info(f"[메타데이터 정리] '인원수' 키 제거 완료")
+            final_count = self._resolve_final_count(metadata, top_k)
 
         # 2단계: 카테고리 분류
         step_start = time.time()
         logger.info(f"[2단계] 카테고리 분류 시작 (메타데이터: {metadata})")
         try:
-            if metadata:
+            if metadata and planned_classified is not None:
+                logger.info("[2단계] 결합 플래너 분류 결과 사용 (LLM 호출 생략)")
+                classified = self._fallback_classified(planned_classified, metadata, external_filters)
+            elif metadata:
                 classified = self.category_classifier.classify(metadata)
-                if not classified:
-                    logger.warning(f"[2단계 경고] 카테고리 분류 결과가 비어있음 (메타데이터: {metadata})")
-                    # rule-based 폴백이 이미 시도되었을 수 있으므로, 메타데이터가 있으면 외부 필터와 병합 시도
-                    if external_filters:
-                        logger.info(f"[2단계] 외부 필터와 병합 시도: {external_filters}")
-                        classified = {cat: {} for cat in external_filters.keys()}
+                classified = self._fallback_classified(classified, metadata, external_filters)
             else:
-                # 메타데이터가 없으면 외부 필터의 카테고리 사용
-                if external_filters:
-                    classified = {cat: {} for cat in external_filters.keys()}
-                    logger.info(f"[2단계] 메타데이터 없음, 외부 필터 카테고리 사용: {list(classified.keys())}")
-                else:
-                    classified = {}
-                    logger.warning(f"[2단계] 메타데이터와 외부 필터 모두 없음")
+                classified = self._classified_from_external_filters(external_filters)
             step_time = time.time() - step_start
             logger.info(f"[2단계 완료] 카테고리 분류: {step_time:.2f}초, 결과: {classified}")
         except Exception as e:
@@ -149,39 +205,17 @@ class PanelSearchPipeline:
                 logger.info(f"[Fallback] 인원수만 지정됨 ({final_count}명), 쿼리 텍스트 직접 검색으로 폴백")
                 # 쿼리 텍스트를 직접 임베딩해서 검색
                 try:
-                    # 모든 카테고리에서 검색 (기본정보 카테고리 사용)
-                    category_config = self.category_classifier.category_config
-                    default_category = "기본정보"  # 기본 카테고리
-                    
-                    # 쿼리 텍스트를 직접 임베딩
-                    query_text_embedding = self.embedding_generator.generate(query)
+                    query_text_embedding = self.embedding_generator.generate({self.DEFAULT_CATEGORY: query}).get(self.DEFAULT_CATEGORY)
                     
                     # Pinecone에서 검색 (필터 없이)
-                    searcher = self.searcher
-                    results = searcher.search_by_category(
+                    results = self.searcher.search_by_category(
                         query_text_embedding,
-                        default_category,
+                        self.DEFAULT_CATEGORY,
                         top_k=final_count * 10 if final_count else 10000,  # 여유있게 검색
                         filter_mb_sns=None,
                         metadata_filter=None
                     )
-                    
-                    # ⭐ 유사도 점수 기준으로 정렬 (내림차순) - Pinecone이 이미 정렬하지만 확실히 하기 위해
-                    # Pinecone의 query()는 이미 유사도 점수 기준 내림차순으로 정렬된 결과를 반환하지만,
-                    # 명시적으로 정렬하여 상위 유사도 패널만 반환하도록 보장
-                    sorted_results = sorted(results, key=lambda x: x.get("score", 0.0), reverse=True)
-                    
-                    # 최종 개수만큼 반환 (상위 유사도 패널만)
-                    final_results = sorted_results[:final_count] if final_count else sorted_results
-                    mb_sns_with_scores = [{"mb_sn": r["mb_sn"], "score": r["score"]} for r in final_results]
-                    
-                    # 디버그: 상위 5개 점수 로깅
-                    if final_results:
-                        top_scores = [r["score"] for r in final_results[:5]]
-                        logger.info(f"[Fallback] 쿼리 텍스트 직접 검색 완료: {len(mb_sns_with_scores)}개 패널 (상위 5개 점수: {top_scores})")
-                    else:
-                        logger.info(f"[Fallback] 쿼리 텍스트 직접 검색 완료: {len(mb_sns_with_scores)}개 패널")
-                    return mb_sns_with_scores
+                    return self._format_query_fallback_results(results, final_count)
                 except Exception as e:
                     logger.error(f"[Fallback] 쿼리 텍스트 직접 검색 실패: {e}", exc_info=True)
                     return []
@@ -190,29 +224,7 @@ class PanelSearchPipeline:
                 return []  # 노트북과 동일하게 즉시 종료
 
         # 2.5단계: 카테고리별 메타데이터 필터 추출 및 정규화
-        step_start = time.time()
-        logger.info("[2.5단계] 카테고리별 메타데이터 필터 추출 시작")
-        category_filters = {}
-        
-        # ⭐ 옵션 2: 외부 필터와 쿼리 필터 중 하나만 사용 (병합하지 않음)
-        # 쿼리에서 추출한 필터 확인 (비교용)
-        query_extracted_filters = {}
-        for category in classified.keys():
-            cat_filter = self.filter_extractor.extract_filters(metadata, category)
-            if cat_filter:
-                query_extracted_filters[category] = cat_filter
-        
-        if external_filters:
-            # 외부 필터가 있으면 외부 필터만 사용 (쿼리 필터 무시)
-            logger.info(f"[2.5단계] 외부 필터만 사용 (쿼리 필터 무시)")
-            category_filters.update(external_filters)
-        else:
-            # 외부 필터가 없으면 쿼리에서 추출한 필터만 사용
-            logger.info(f"[2.5단계] 쿼리 필터만 사용 (외부 필터 없음)")
-            category_filters.update(query_extracted_filters)
-        
-        step_time = time.time() - step_start
-        logger.info(f"[2.5단계 완료] 필터 추출: {step_time:.2f}초, 결과: {category_filters}")
+        category_filters = self._build_category_filters(classified, metadata, external_filters)
 
         # ⭐ 필터만 검색하는 경우 (빈 쿼리 + 외부 필터만): 임베딩 생성 생략하고 바로 필터 검색
         is_filter_only_search = (not query or not query.strip()) and external_filters and not metadata
@@ -220,42 +232,16 @@ class PanelSearchPipeline:
         if is_filter_only_search:
             logger.info("[검색] 필터만 검색 모드 - 임베딩 생성 생략, 메타데이터 필터만으로 검색")
             
-            # 랜덤 벡터 생성 (Pinecone 검색에 필요하지만 유사도는 무시)
-            import numpy as np
-            dimension = 1536  # OpenAI text-embedding-3-small embedding dimension
-            random_vector = np.random.rand(dimension).astype(np.float32).tolist()
-            norm = np.linalg.norm(random_vector)
-            if norm > 0:
-                random_vector = (np.array(random_vector) / norm).tolist()
-            
             # 각 카테고리별로 동일한 랜덤 벡터 사용 (유사도는 무시하고 필터만 적용)
-            embeddings = {}
             category_order = list(category_filters.keys())
-            for category in category_order:
-                embeddings[category] = random_vector
+            embeddings = self._random_embeddings(category_order)
             
             logger.info(f"[검색] 랜덤 벡터 생성 완료, 카테고리: {category_order}")
         else:
-            # 3단계: 자연어 텍스트 생성 (병렬 처리)
+            # 3단계: 자연어 텍스트 생성 (카테고리 병렬, 결과는 classified 순서 유지)
             step_start = time.time()
-            logger.info("[3단계] 자연어 텍스트 생성 시작 (병렬)")
-            texts = {}
-            
-            if classified:
-                # ⭐ 노트북과 동일: 순차 처리로 변경 (카테고리 순서 보장)
-                # 병렬 처리는 성능 향상이지만 카테고리 순서가 달라질 수 있어 노트북과 다를 수 있음
-                # 노트북: for category, items in classified.items(): text = self.text_generator.generate(...)
-                for category, items in classified.items():
-                    try:
-                        # ⭐ 노트북과 동일: full_metadata_dict=metadata로 키워드 인자 전달
-                        text = self.text_generator.generate(category, items, full_metadata_dict=metadata)
-                        if text and text.strip():
-                            texts[category] = text
-                        else:
-                            logger.warning(f"[WARN] 텍스트 생성 결과가 비어있음 ({category})")
-                    except Exception as e:
-                        logger.error(f"[ERROR] 텍스트 생성 중 예외 발생 ({category}): {e}", exc_info=True)
-            
+            logger.info(f"[3단계] 자연어 텍스트 생성 시작 (병렬, 최대 {self.text_max_workers}개 동시)")
+            texts = self._generate_texts(classified, metadata)
             step_time = time.time() - step_start
             logger.info(f"[3단계 완료] 텍스트 생성: {step_time:.2f}초, 카테고리 수: {len(texts)}")
 
@@ -267,21 +253,7 @@ class PanelSearchPipeline:
                 if texts:
                     embeddings = self.embedding_generator.generate(texts)
                 else:
-                    # 텍스트가 없으면 랜덤 벡터 사용
-                    logger.warning(f"[4단계] ⚠️ 텍스트 없음, 랜덤 벡터 사용 (유사도 기반 검색 불가)")
-                    logger.warning(f"[4단계] ⚠️ classified 카테고리: {list(classified.keys()) if classified else []}")
-                    import numpy as np
-                    dimension = 1536
-                    random_vector = np.random.rand(dimension).astype(np.float32).tolist()
-                    norm = np.linalg.norm(random_vector)
-                    if norm > 0:
-                        random_vector = (np.array(random_vector) / norm).tolist()
-                    
-                    embeddings = {}
-                    for category in classified.keys() if classified else []:
-                        embeddings[category] = random_vector
-                    
-                    logger.warning(f"[4단계] ⚠️ 랜덤 벡터로 검색 (필터만 적용, 유사도 무시)")
+                    embeddings = self._random_embeddings_for_empty_texts(classified)
                 
                 step_time = time.time() - step_start
                 logger.info(f"[4단계 완료] 임베딩 생성: {step_time:.2f}초, 카테고리 수: {len(embeddings)}")
@@ -312,6 +284,457 @@ class PanelSearchPipeline:
         step_time = time.time() - step_start
         logger.info(f"[5단계 완료] 단계적 필터링: {step_time:.2f}초, 최종 결과: {len(final_results)}개")
 
+        return self._format_results(final_results, start_time, relaxations)
+
+    async def asearch(self, query: str, top_k: int = None, external_filters: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        search()의 비동기 버전
+
+        LLM/임베딩/Pinecone 호출을 모두 비동기 클라이언트로 수행하므로 워커 스레드를 점유하지 않음.
+        단계별 타임아웃(self.stage_timeouts)을 적용하며, 상위에서 태스크가 취소되면
+        진행 중인 네트워크 호출도 함께 취소됨.
+
+        Args/Returns: search()와 동일
+        """
+        start_time = time.time()
+        relaxations = start_relaxation_log()
+
+        if (not query or not query.strip()) and external_filters:
+            logger.info("[검색] 빈 쿼리, 외부 필터만으로 검색")
+            # 최초 호출 시 merged 데이터 로드, Pinecone 전수 확인이 있으므로 스레드에서 실행
+            exhaustive_results = await asyncio.to_thread(self._exhaustive_filter_search, external_filters, top_k, start_time)
+            if exhaustive_results is not None:
+                return exhaustive_results
+            metadata = {}
+            planned_classified = None
+            final_count = top_k
+            logger.info(f"[검색] 외부 필터 카테고리: {list(external_filters.keys())}")
+        else:
+            # 1단계: 메타데이터 추출 (fused 모드면 카테고리 분류까지 한 번에)
+            step_start = time.time()
+            logger.info("[1단계] 메타데이터 추출 시작")
+            planned_classified = None
+            try:
+                if query and query.strip():
+                    plan = None
+                    if self.query_planner:
+                        try:
+                            plan = await self._with_timeout("metadata", self.query_planner.aplan(query))
+                        except asyncio.TimeoutError:
+                            plan = None
+                    if plan is not None:
+                        metadata, planned_classified = plan
+                    else:
+                        metadata = await self._with_timeout("metadata", self.metadata_extractor.aextract(query))
+                else:
+                    metadata = {}
+                step_time = time.time() - step_start
+                logger.info(f"[1단계 완료] 메타데이터 추출: {step_time:.2f}초, 결과: {metadata}")
+            except Exception as e:
+                logger.warning(f"[1단계 경고] 메타데이터 추출 실패 (계속 진행): {e!r}")
+                metadata = {}
+
+            if not self._check_metadata(metadata, external_filters):
+                return []
+
+            final_count = self._resolve_final_count(metadata, top_k)
+
+        # 2단계: 카테고리 분류
+        step_start = time.time()
+        logger.info(f"[2단계] 카테고리 분류 시작 (메타데이터: {metadata})")
+        try:
+            if metadata and planned_classified is not None:
+                logger.info("[2단계] 결합 플래너 분류 결과 사용 (LLM 호출 생략)")
+                classified = self._fallback_classified(planned_classified, metadata, external_filters)
+            elif metadata:
+                classified = await self._with_timeout("classify", self.category_classifier.aclassify(metadata))
+                classified = self._fallback_classified(classified, metadata, external_filters)
+            else:
+                classified = self._classified_from_external_filters(external_filters)
+            step_time = time.time() - step_start
+            logger.info(f"[2단계 완료] 카테고리 분류: {step_time:.2f}초, 결과: {classified}")
+        except Exception as e:
+            logger.warning(f"[2단계 경고] 카테고리 분류 실패 (계속 진행): {e!r}", exc_info=True)
+            classified = {}
+
+        if not classified:
+            if final_count is not None and not metadata and not external_filters:
+                logger.info(f"[Fallback] 인원수만 지정됨 ({final_count}명), 쿼리 텍스트 직접 검색으로 폴백")
+                try:
+                    query_embeddings = await self._with_timeout(
+                        "embedding", self.embedding_generator.agenerate({self.DEFAULT_CATEGORY: query})
+                    )
+                    results = await self._with_timeout("search", self.searcher.asearch_by_category(
+                        query_embeddings.get(self.DEFAULT_CATEGORY),
+                        self.DEFAULT_CATEGORY,
+                        top_k=final_count * 10 if final_count else 10000,
+                        filter_mb_sns=None,
+                        metadata_filter=None
+                    ))
+                    return self._format_query_fallback_results(results, final_count)
+                except Exception as e:
+                    logger.error(f"[Fallback] 쿼리 텍스트 직접 검색 실패: {e!r}", exc_info=True)
+                    return []
+            else:
+                logger.error("[ERROR] 카테고리 분류 실패 - 빈 분류 결과")
+                return []
+
+        # 2.5단계: 카테고리별 메타데이터 필터 추출 및 정규화 (LLM 호출 없음)
+        category_filters = self._build_category_filters(classified, metadata, external_filters)
+
+        is_filter_only_search = (not query or not query.strip()) and external_filters and not metadata
+
+        if is_filter_only_search:
+            logger.info("[검색] 필터만 검색 모드 - 임베딩 생성 생략, 메타데이터 필터만으로 검색")
+            category_order = list(category_filters.keys())
+            embeddings = self._random_embeddings(category_order)
+        else:
+            # 3단계: 자연어 텍스트 생성 (카테고리 병렬, 결과는 classified 순서 유지)
+            step_start = time.time()
+            logger.info(f"[3단계] 자연어 텍스트 생성 시작 (병렬, 최대 {self.text_max_workers}개 동시)")
+            texts = await self._agenerate_texts(classified, metadata)
+            step_time = time.time() - step_start
+            logger.info(f"[3단계 완료] 텍스트 생성: {step_time:.2f}초, 카테고리 수: {len(texts)}")
+
+            # 4단계: 임베딩 생성
+            step_start = time.time()
+            logger.info("[4단계] 임베딩 생성 시작")
+
+            try:
+                if texts:
+                    embeddings = await self._with_timeout("embedding", self.embedding_generator.agenerate(texts))
+                else:
+                    embeddings = self._random_embeddings_for_empty_texts(classified)
+
+                step_time = time.time() - step_start
+                logger.info(f"[4단계 완료] 임베딩 생성: {step_time:.2f}초, 카테고리 수: {len(embeddings)}")
+            except Exception as e:
+                logger.error(f"[4단계 에러] 임베딩 생성 실패: {e!r}", exc_info=True)
+                embeddings = {}
+
+            if not embeddings:
+                logger.warning("[경고] 임베딩이 비어있음, 검색 불가")
+                return []
+
+            category_order = list(classified.keys()) if classified else list(embeddings.keys())
+
+        # 5단계: 단계적 필터링 검색
+        step_start = time.time()
+        logger.info("[5단계] 단계적 필터링 검색 시작")
+
+        final_results = await self._with_timeout("search", self.result_filter.afilter_by_categories(
+            embeddings=embeddings,
+            category_order=category_order,
+            final_count=final_count,
+            topic_filters=category_filters
+        ))
+        step_time = time.time() - step_start
+        logger.info(f"[5단계 완료] 단계적 필터링: {step_time:.2f}초, 최종 결과: {len(final_results)}개")
+
+        return self._format_results(final_results, start_time, relaxations)
+
+    # ===== search / asearch 공통 헬퍼 =====
+
+    # 인원수만 지정된 쿼리의 직접 검색에 사용할 카테고리
+    DEFAULT_CATEGORY = "기본정보"
+
+    async def _with_timeout(self, stage: str, coro):
+        """단계별 타임아웃 적용 (초과 시 asyncio.TimeoutError, 진행 중 호출은 취소됨)"""
+        timeout = self.stage_timeouts.get(stage)
+        if not timeout:
+            return await coro
+        try:
+            return await asyncio.wait_for(coro, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"[asearch] '{stage}' 단계 타임아웃 ({timeout:g}초 초과)")
+            raise
+
+    def _generate_texts(self, classified: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, str]:
+        """
+        3단계: 카테고리별 텍스트 병렬 생성 (스레드풀, 동시 호출 수 제한)
+
+        ⭐ 결과는 classified 키 순서로 조립하므로 노트북의 순차 처리와 동일한 순서 보장.
+        카테고리별 타임아웃/실패 시 해당 카테고리만 메타데이터 나열 텍스트로 폴백.
+        """
+        if not classified:
+            return {}
+
+        workers = min(self.text_max_workers, len(classified))
+        timeout = self.stage_timeouts.get("text")
+        deadline = None
+        if timeout:
+            # 카테고리당 타임아웃 × 실행 라운드 수 (대기열에서 기다린 시간 보정)
+            deadline = time.time() + timeout * ((len(classified) + workers - 1) // workers)
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                category: executor.submit(self.text_generator.generate, category, items, full_metadata_dict=metadata)
+                for category, items in classified.items()
+            }
+            results = {}
+            for category, future in futures.items():
+                try:
+                    remaining = max(deadline - time.time(), 0) if deadline else None
+                    results[category] = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    future.cancel()
+                    results[category] = self._fallback_text(category, classified[category], "타임아웃")
+                except Exception as e:
+                    logger.error(f"[ERROR] 텍스트 생성 중 예외 발생 ({category}): {e}", exc_info=True)
+                    results[category] = self._fallback_text(category, classified[category], "예외")
+        finally:
+            # 타임아웃된 호출은 기다리지 않음 (백그라운드에서 종료)
+            executor.shutdown(wait=False)
+
+        return self._collect_texts(classified, results)
+
+    async def _agenerate_texts(self, classified: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, str]:
+        """3단계 비동기 버전 (asyncio.gather + Semaphore, 카테고리별 타임아웃)"""
+        if not classified:
+            return {}
+
+        semaphore = asyncio.Semaphore(self.text_max_workers)
+
+        async def _one(category: str, items: Any) -> str:
+            async with semaphore:
+                try:
+                    return await self._with_timeout(
+                        "text", self.text_generator.agenerate(category, items, full_metadata_dict=metadata)
+                    )
+                except asyncio.TimeoutError:
+                    return self._fallback_text(category, items, "타임아웃")
+                except Exception as e:
+                    logger.error(f"[ERROR] 텍스트 생성 중 예외 발생 ({category}): {e!r}", exc_info=True)
+                    return self._fallback_text(category, items, "예외")
+
+        outputs = await asyncio.gather(*(_one(category, items) for category, items in classified.items()))
+        return self._collect_texts(classified, dict(zip(classified.keys(), outputs)))
+
+    @staticmethod
+    def _fallback_text(category: str, items: Any, reason: str) -> str:
+        """텍스트 생성 실패 시 메타데이터 나열로 폴백 (CategoryTextGenerator와 동일한 형식)"""
+        fallback_text = ", ".join(items) if isinstance(items, list) else ""
+        logger.warning(f"[WARN] 텍스트 생성 {reason} ({category}), 폴백 사용: {fallback_text}")
+        return fallback_text
+
+    @staticmethod
+    def _collect_texts(classified: Dict[str, Any], results: Dict[str, str]) -> Dict[str, str]:
+        """classified 순서대로 비어있지 않은 텍스트만 수집"""
+        texts = {}
+        for category in classified.keys():
+            text = results.get(category)
+            if text and text.strip():
+                texts[category] = text
+            else:
+                logger.warning(f"[WARN] 텍스트 생성 결과가 비어있음 ({category})")
+        return texts
+
+    def _exhaustive_filter_search(
+        self,
+        external_filters: Dict[str, Dict[str, Any]],
+        top_k: Optional[int],
+        start_time: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        필터만 검색 전수 모드 (MAX_TOP_K 상한 없이 조건을 만족하는 전체 패널, 정확한 total 보고)
+
+        - 로컬 메타데이터 인덱스로 평가 가능한 조건은 로컬에서 평가
+        - 인덱스에 없는 조건(coverage 등)은 로컬 결과를 후보로 Pinecone에서 chunk 단위 전수 확인
+        - 인덱스를 사용할 수 없으면 None → 기존 랜덤 벡터 단계적 필터링 (결과가 상한에 잘릴 수 있음)
+        """
+        if self.metadata_index is None or not self.metadata_index.ensure_loaded():
+            return None
+
+        step_start = time.time()
+        local_filters, residual_filters = self.metadata_index.split_filters(external_filters)
+        mb_sns = self.metadata_index.search(local_filters)
+        if mb_sns is None:
+            return None
+        logger.info(f"[검색] 로컬 필터 인덱스 평가: {(time.time() - step_start) * 1000:.2f}ms, {len(mb_sns)}개 패널")
+
+        if residual_filters:
+            pinecone_start = time.time()
+            random_vector = self._random_embeddings([self.DEFAULT_CATEGORY])[self.DEFAULT_CATEGORY]
+            try:
+                for category, metadata_filter in residual_filters.items():
+                    if not mb_sns:
+                        break
+                    mb_sns = self.searcher.match_mb_sns(
+                        random_vector, category, mb_sns, metadata_filter, chunk_size=self.exhaustive_chunk_size
+                    )
+            except Exception as e:
+                logger.warning(f"[검색] Pinecone 전수 확인 실패, 단계적 필터링으로 대체: {e}")
+                return None
+            logger.info(
+                f"[검색] Pinecone 전수 확인 ({list(residual_filters.keys())}): "
+                f"{time.time() - pinecone_start:.2f}초, {len(mb_sns)}개 패널 (chunk={self.exhaustive_chunk_size})"
+            )
+
+        total = len(mb_sns)
+        if top_k:
+            mb_sns = mb_sns[:top_k]
+
+        # 필터 일치 여부만 의미가 있으므로 점수는 모두 1.0
+        results = self._format_results([{"mb_sn": mb_sn, "score": 1.0} for mb_sn in mb_sns], start_time)
+        results["total"] = total
+        results["exact"] = True
+        return results
+
+    def _check_metadata(self, metadata: Dict[str, Any], external_filters: Optional[Dict[str, Dict[str, Any]]]) -> bool:
+        """메타데이터 추출 실패 시 필터 폴백 가능 여부 확인 (False면 검색 불가)"""
+        if metadata:
+            return True
+
+        if external_filters:
+            # 필터가 있으면 필터만으로 검색 진행
+            logger.warning("[경고] 메타데이터 추출 실패, 필터만으로 검색 진행")
+            logger.info(f"[검색] 외부 필터 카테고리: {list(external_filters.keys())}")
+            return True
+
+        # 필터도 없으면 검색 불가
+        logger.error("[ERROR] 메타데이터 추출 실패 - 빈 메타데이터 반환, 필터도 없음")
+        return False
+
+    def _resolve_final_count(self, metadata: Dict[str, Any], top_k: Optional[int]) -> Optional[int]:
+        """
+        top_k 결정: 파라미터 우선, 없으면 쿼리에서 추출한 인원수 사용
+
+        metadata의 "인원수" 키는 검색 조건이 아니므로 제거함 (in-place)
+        """
+        if top_k is not None:
+            # 파라미터로 명시적 전달
+            final_count = top_k
+            logger.info(f"\n[인원수] 파라미터로 {final_count}명 지정됨")
+        else:
+            # metadata에서 인원수 추출 시도
+            extracted_count = metadata.get("인원수")
+            if extracted_count and isinstance(extracted_count, int) and extracted_count > 0:
+                final_count = extracted_count
+                logger.info(f"\n[인원수] 쿼리에서 {final_count}명 추출됨")
+            else:
+                # ⭐ 명수 미명시 → None으로 유지 (필터링 후 남은 모든 후보 반환)
+                final_count = None
+                logger.info(f"\n[인원수] 쿼리에서 인원수 미명시 → 조건 만족하는 전체 패널 반환")
+
+        # 인원수 키 제거 (검색 조건이 아닌 결과 개수 지정용)
+        if "인원수" in metadata:
+            metadata.pop("인원수")
+            logger.info(f"[메타데이터 정리] '인원수' 키 제거 완료")
+
+        return final_count
+
+    def _classified_from_external_filters(self, external_filters: Optional[Dict[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """메타데이터가 없을 때 외부 필터의 카테고리로 분류 결과 구성"""
+        if external_filters:
+            classified = {cat: {} for cat in external_filters.keys()}
+            logger.info(f"[2단계] 메타데이터 없음, 외부 필터 카테고리 사용: {list(classified.keys())}")
+            return classified
+
+        logger.warning(f"[2단계] 메타데이터와 외부 필터 모두 없음")
+        return {}
+
+    def _fallback_classified(
+        self,
+        classified: Dict[str, Any],
+        metadata: Dict[str, Any],
+        external_filters: Optional[Dict[str, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """분류 결과가 비어있으면 외부 필터 카테고리로 대체"""
+        if classified:
+            return classified
+
+        logger.warning(f"[2단계 경고] 카테고리 분류 결과가 비어있음 (메타데이터: {metadata})")
+        # rule-based 폴백이 이미 시도되었을 수 있으므로, 메타데이터가 있으면 외부 필터와 병합 시도
+        if external_filters:
+            logger.info(f"[2단계] 외부 필터와 병합 시도: {external_filters}")
+            return {cat: {} for cat in external_filters.keys()}
+        return classified
+
+    def _build_category_filters(
+        self,
+        classified: Dict[str, Any],
+        metadata: Dict[str, Any],
+        external_filters: Optional[Dict[str, Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """2.5단계: 카테고리별 메타데이터 필터 추출 (rule-based, LLM 호출 없음)"""
+        step_start = time.time()
+        logger.info("[2.5단계] 카테고리별 메타데이터 필터 추출 시작")
+        category_filters = {}
+        
+        # ⭐ 옵션 2: 외부 필터와 쿼리 필터 중 하나만 사용 (병합하지 않음)
+        # 쿼리에서 추출한 필터 확인 (비교용)
+        query_extracted_filters = {}
+        for category in classified.keys():
+            cat_filter = self.filter_extractor.extract_filters(metadata, category)
+            if cat_filter:
+                query_extracted_filters[category] = cat_filter
+        
+        if external_filters:
+            # 외부 필터가 있으면 외부 필터만 사용 (쿼리 필터 무시)
+            logger.info(f"[2.5단계] 외부 필터만 사용 (쿼리 필터 무시)")
+            category_filters.update(external_filters)
+        else:
+            # 외부 필터가 없으면 쿼리에서 추출한 필터만 사용
+            logger.info(f"[2.5단계] 쿼리 필터만 사용 (외부 필터 없음)")
+            category_filters.update(query_extracted_filters)
+        
+        step_time = time.time() - step_start
+        logger.info(f"[2.5단계 완료] 필터 추출: {step_time:.2f}초, 결과: {category_filters}")
+        return category_filters
+
+    @staticmethod
+    def _random_embeddings(categories: List[str]) -> Dict[str, List[float]]:
+        """모든 카테고리에 동일한 랜덤 단위 벡터 할당 (Pinecone 검색에 필요하지만 유사도는 무시)"""
+        random_vector = np.random.rand(EMBEDDING_DIMENSION).astype(np.float32)
+        norm = np.linalg.norm(random_vector)
+        if norm > 0:
+            random_vector = random_vector / norm
+        random_vector = random_vector.tolist()
+        return {category: random_vector for category in categories}
+
+    def _random_embeddings_for_empty_texts(self, classified: Dict[str, Any]) -> Dict[str, List[float]]:
+        """텍스트가 하나도 생성되지 않았을 때 랜덤 벡터로 대체 (필터만 적용, 유사도 무시)"""
+        logger.warning(f"[4단계] ⚠️ 텍스트 없음, 랜덤 벡터 사용 (유사도 기반 검색 불가)")
+        logger.warning(f"[4단계] ⚠️ classified 카테고리: {list(classified.keys()) if classified else []}")
+        embeddings = self._random_embeddings(list(classified.keys()) if classified else [])
+        logger.warning(f"[4단계] ⚠️ 랜덤 벡터로 검색 (필터만 적용, 유사도 무시)")
+        return embeddings
+
+    def _format_query_fallback_results(self, results: List[Dict[str, Any]], final_count: Optional[int]) -> Dict[str, Any]:
+        """인원수만 지정된 쿼리의 직접 검색 결과 정리"""
+        # ⭐ 유사도 점수 기준으로 정렬 (내림차순) - Pinecone이 이미 정렬하지만 확실히 하기 위해
+        # Pinecone의 query()는 이미 유사도 점수 기준 내림차순으로 정렬된 결과를 반환하지만,
+        # 명시적으로 정렬하여 상위 유사도 패널만 반환하도록 보장
+        sorted_results = sorted(results, key=lambda x: x.get("score", 0.0), reverse=True)
+        
+        # 최종 개수만큼 반환 (상위 유사도 패널만)
+        final_results = sorted_results[:final_count] if final_count else sorted_results
+        
+        # 디버그: 상위 5개 점수 로깅
+        if final_results:
+            top_scores = [r["score"] for r in final_results[:5]]
+            logger.info(f"[Fallback] 쿼리 텍스트 직접 검색 완료: {len(final_results)}개 패널 (상위 5개 점수: {top_scores})")
+        else:
+            logger.info(f"[Fallback] 쿼리 텍스트 직접 검색 완료: {len(final_results)}개 패널")
+
+        # search()의 일반 결과와 같은 형태로 반환
+        return {
+            "mb_sns": [r["mb_sn"] for r in final_results],
+            "scores": {r["mb_sn"]: r["score"] for r in final_results}
+        }
+
+    def _format_results(
+        self,
+        final_results: List[Dict[str, Any]],
+        start_time: float,
+        relaxations: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        최종 결과를 {"mb_sns": [...], "scores": {...}} 형태로 변환
+
+        메타데이터 필터 완화가 적용된 경우 "relaxations"(카테고리별 적용된 완화)를 함께 반환
+        """
         total_time = time.time() - start_time
         logger.info(f"[검색 완료] 총 소요 시간: {total_time:.2f}초, 결과: {len(final_results)}개 패널")
 
@@ -319,5 +742,6 @@ class PanelSearchPipeline:
         mb_sns = [r["mb_sn"] for r in final_results]
         score_map = {r["mb_sn"]: r["score"] for r in final_results}
         
+        if relaxations:
+            return {"mb_sns": mb_sns, "scores": score_map, "relaxations": relaxations}
         return {"mb_sns": mb_sns, "scores": score_map}
-
@@ -0,0 +1,223 @@
+"""Pinecone 클라이언트/인덱스 공유 제공자 (프로세스 전역, 연결 풀 재사용 + 인덱스 통계 TTL 캐시)"""
+import threading
+import time
+from typing import Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 차원을 알 수 없을 때 기본값 (OpenAI text-embedding-3-small)
+DEFAULT_DIMENSION = 1536
+
+
+class PineconeIndexProvider:
+    """
+    Pinecone 클라이언트와 인덱스 핸들을 한 번만 만들어 모든 모듈이 공유
+
+    - 클라이언트/인덱스(HTTP 연결 풀, 선택적으로 gRPC)와 비동기 인덱스는 최초 사용 시 한 번 생성
+    - describe_index_stats 결과는 stats_ttl초 동안 캐시 (차원은 바뀌지 않으므로 한 번 조회 후 고정)
+    - startup(lifespan)에서 warm()을 호출하면 첫 요청의 연결/통계 조회 지연 제거
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        index_name: str,
+        stats_ttl: float = 60.0,
+        pool_maxsize: int = 0,
+        use_grpc: bool = False
+    ):
+        """
+        Args:
+            api_key: Pinecone API 키
+            index_name: Pinecone 인덱스 이름
+            stats_ttl: 인덱스 통계 캐시 유효 시간 (초)
+            pool_maxsize: 인덱스 HTTP 연결 풀 크기 (0이면 SDK 기본값)
+            use_grpc: gRPC 클라이언트 사용 여부 (pinecone[grpc] 미설치 시 HTTP)
+        """
+        self.api_key = api_key
+        self.index_name = index_name
+        self.stats_ttl = stats_ttl
+        self.pool_maxsize = max(0, int(pool_maxsize))
+        self.use_grpc = use_grpc
+
+        self._lock = threading.Lock()
+        self._client = None
+        self._index = None
+        self._async_index = None
+        self._async_index_unavailable = False
+        self._dimension: Optional[int] = None
+        self._stats: Optional[Dict[str, Any]] = None
+        self._stats_at = 0.0
+        self.stats_hits = 0
+        self.stats_misses = 0
+
+    @property
+    def client(self):
+        """Pinecone 클라이언트 (지연 생성)"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def _create_client(self):
+        if self.use_grpc:
+            try:
+                from pinecone.grpc import PineconeGRPC
+                logger.info("[Pinecone] gRPC 클라이언트 사용")
+                return PineconeGRPC(api_key=self.api_key)
+            except ImportError:
+                logger.warning("[Pinecone] pinecone[grpc] 미설치, HTTP 클라이언트 사용")
+
+        from pinecone import Pinecone
+        return Pinecone(api_key=self.api_key)
+
+    def index(self):
+        """공유 인덱스 핸들 (지연 생성, 연결 풀 재사용)"""
+        if self._index is None:
+            client = self.client
+            with self._lock:
+                if self._index is None:
+                    if self.pool_maxsize:
+                        try:
+                            self._index = client.Index(self.index_name, connection_pool_maxsize=self.pool_maxsize)
+                        except TypeError:
+                            # 구버전 SDK는 connection_pool_maxsize 미지원
+                            self._index = client.Index(self.index_name)
+                    else:
+                        self._index = client.Index(self.index_name)
+                    logger.info(f"✅ Pinecone 공유 인덱스 연결: {self.index_name}")
+        return self._index
+
+    def async_index(self):
+        """
+        공유 asyncio 인덱스 (pinecone>=6, 지연 생성)
+
+        지원되지 않으면 None 반환 → 호출 측에서 동기 인덱스를 스레드에서 실행
+        describe_index는 블로킹 호출이므로 이벤트 루프에서는 asyncio.to_thread로 호출
+        """
+        if self._async_index is not None or self._async_index_unavailable:
+            return self._async_index
+
+        client = self.client
+        with self._lock:
+            if self._async_index is None and not self._async_index_unavailable:
+                try:
+                    host = client.describe_index(self.index_name).host
+                    self._async_index = client.IndexAsyncio(host=host)
+                    logger.info(f"✅ Pinecone 비동기 인덱스 초기화 완료: {self.index_name}")
+                except Exception as e:
+                    self._async_index_unavailable = True
+                    logger.warning(f"Pinecone 비동기 인덱스 사용 불가 ({e}), 동기 인덱스를 스레드에서 실행")
+        return self._async_index
+
+    async def aclose(self) -> None:
+        """비동기 인덱스의 aiohttp 세션 정리 (lifespan shutdown, 다음 사용 시 다시 생성)"""
+        with self._lock:
+            async_index = self._async_index
+            self._async_index = None
+            self._async_index_unavailable = False
+        if async_index is not None:
+            try:
+                await async_index.close()
+                logger.info(f"[Pinecone] 비동기 인덱스 정리 완료: {self.index_name}")
+            except Exception as e:
+                logger.warning(f"[Pinecone] 비동기 인덱스 정리 실패: {e}")
+
+    @property
+    def async_index_resolved(self) -> bool:
+        """비동기 인덱스 생성 시도 완료 여부 (이후 async_index()는 블로킹 없이 반환)"""
+        return self._async_index is not None or self._async_index_unavailable
+
+    def stats(self, force: bool = False) -> Dict[str, Any]:
+        """인덱스 통계 (dimension, total_vector_count, index_fullness) - stats_ttl초 캐시"""
+        now = time.time()
+        if not force and self._stats is not None and now - self._stats_at < self.stats_ttl:
+            self.stats_hits += 1
+            return self._stats
+
+        raw = self.index().describe_index_stats()
+        stats = {
+            "dimension": raw.get("dimension", DEFAULT_DIMENSION),
+            "total_vector_count": raw.get("total_vector_count", 0),
+            "index_fullness": raw.get("index_fullness", 0),
+        }
+        with self._lock:
+            self._stats = stats
+            self._stats_at = now
+            self.stats_misses += 1
+            if self._dimension is None and stats["dimension"]:
+                self._dimension = int(stats["dimension"])
+        return stats
+
+    def dimension(self) -> int:
+        """인덱스 차원 (최초 1회 통계 조회, 이후 고정)"""
+        if self._dimension is None:
+            try:
+                self.stats()
+            except Exception as e:
+                logger.warning(f"[Pinecone] 인덱스 차원 조회 실패, 기본값 {DEFAULT_DIMENSION} 사용: {e}")
+                return DEFAULT_DIMENSION
+        return self._dimension or DEFAULT_DIMENSION
+
+    def warm(self) -> Dict[str, Any]:
+        """연결 생성 + 통계/차원 조회 (startup 워밍업용, 블로킹)"""
+        warm_start = time.time()
+        self.index()
+        stats = self.stats(force=True)
+        logger.info(
+            f"[Pinecone] 공유 인덱스 워밍업 완료: {self.index_name}, dimension={stats['dimension']}, "
+            f"vectors={stats['total_vector_count']} ({time.time() - warm_start:.2f}초)"
+        )
+        return stats
+
+    def info(self) -> Dict[str, Any]:
+        """제공자 상태 (헬스/상태 API용, 네트워크 호출 없음)"""
+        return {
+            "index_name": self.index_name,
+            "connected": self._index is not None,
+            "async_index": self._async_index is not None,
+            "grpc": self.use_grpc,
+            "dimension": self._dimension,
+            "stats_age_seconds": round(time.time() - self._stats_at, 1) if self._stats is not None else None,
+            "stats_ttl": self.stats_ttl,
+            "stats_hits": self.stats_hits,
+            "stats_misses": self.stats_misses,
+        }
+
+
+# 프로세스 전역 제공자 싱글톤 (설정 기반)
+_pinecone_provider: Optional[PineconeIndexProvider] = None
+_pinecone_provider_lock = threading.Lock()
+
+
+def get_pinecone_provider() -> PineconeIndexProvider:
+    """설정(PINECONE_API_KEY, PINECONE_INDEX_NAME 등)으로 만든 전역 Pinecone 제공자 반환"""
+    global _pinecone_provider
+
+    if _pinecone_provider is None:
+        from app.core.config import (
+            PINECONE_API_KEY,
+            PINECONE_INDEX_NAME,
+            PINECONE_STATS_TTL,
+            PINECONE_POOL_MAXSIZE,
+            PINECONE_USE_GRPC,
+        )
+
+        with _pinecone_provider_lock:
+            if _pinecone_provider is None:
+                _pinecone_provider = PineconeIndexProvider(
+                    PINECONE_API_KEY,
+                    PINECONE_INDEX_NAME,
+                    stats_ttl=PINECONE_STATS_TTL,
+                    pool_maxsize=PINECONE_POOL_MAXSIZE,
+                    use_grpc=PINECONE_USE_GRPC
+                )
+    return _pinecone_provider
+
+
+async def close_pinecone_provider() -> None:
+    """전역 제공자의 비동기 인덱스 정리 (제공자를 만든 적이 없으면 아무것도 하지 않음)"""
+    if _pinecone_provider is not None:
+        await _pinecone_provider.aclose()
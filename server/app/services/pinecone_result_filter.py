@@ -1,33 +1,165 @@
 """Pinecone 결과 필터"""
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Iterable, Tuple
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+# 실행 모드
+# - progressive: 이전 단계 후보(mb_sn)로 다음 카테고리 검색을 제한 (노트북과 동일, 직렬)
+# - parallel: 모든 카테고리를 동시에 전체 후보군에서 검색 후 로컬에서 교집합/정렬
+FILTER_MODE_PROGRESSIVE = "progressive"
+FILTER_MODE_PARALLEL = "parallel"
+FILTER_MODES = (FILTER_MODE_PROGRESSIVE, FILTER_MODE_PARALLEL)
+
+# Pinecone 단일 쿼리 최대 top_k
+MAX_TOP_K = 10000
+
+# 최종 정렬 점수 결합 방식 (단계별 점수 테이블 기반, 추가 Pinecone 쿼리 없음)
+# - last: 마지막 카테고리 점수 (노트북과 동일, 기본값)
+# - max: 카테고리별 점수 중 최댓값
+# - mean: 카테고리별 점수 평균
+# - rrf: Reciprocal Rank Fusion (카테고리별 순위 기반, 점수 스케일 차이에 강함)
+SCORE_FUSION_LAST = "last"
+SCORE_FUSION_MAX = "max"
+SCORE_FUSION_MEAN = "mean"
+SCORE_FUSION_RRF = "rrf"
+SCORE_FUSIONS = (SCORE_FUSION_LAST, SCORE_FUSION_MAX, SCORE_FUSION_MEAN, SCORE_FUSION_RRF)
+
+# RRF 상수 (일반적으로 60 사용)
+RRF_K = 60
+
+
+class CandidatePool:
+    """
+    단계별 후보 mb_sn 집합 (순서 있는 리스트 + 멤버십 확인용 set)
+
+    - ids: 점수 순서가 유지된 후보 리스트 (Pinecone $in 필터, 최종 정렬에 사용)
+    - in 연산은 set으로 O(1) (리스트 in 연산의 O(n·m) 단계 비용 제거)
+    """
+
+    __slots__ = ("ids", "_members")
+
+    def __init__(self, ids: Iterable[str] = ()):
+        self.ids: List[str] = list(ids)
+        self._members = set(self.ids)
+
+    def __contains__(self, mb_sn: object) -> bool:
+        return mb_sn in self._members
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+
+def fuse_scores(
+    stage_scores: List[Dict[str, float]],
+    candidates: Iterable[str],
+    method: str = SCORE_FUSION_LAST,
+    rrf_k: int = RRF_K
+) -> Dict[str, float]:
+    """
+    단계(카테고리)별 {mb_sn: 점수} 테이블을 하나의 최종 점수로 결합
+
+    Args:
+        stage_scores: 카테고리 순서대로 쌓인 {mb_sn: 점수} 리스트
+        candidates: 최종 후보 mb_sn
+        method: 결합 방식 ("last", "max", "mean", "rrf")
+        rrf_k: RRF 상수
+
+    Returns:
+        {mb_sn: 결합 점수}
+    """
+    if not stage_scores:
+        return {mb_sn: 0.0 for mb_sn in candidates}
+
+    if method == SCORE_FUSION_RRF:
+        # 단계별 순위 (1부터 시작, 점수 내림차순)
+        stage_ranks = []
+        for scores in stage_scores:
+            ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+            stage_ranks.append({mb_sn: rank for rank, (mb_sn, _) in enumerate(ranked, start=1)})
+
+        return {
+            mb_sn: sum(1.0 / (rrf_k + ranks[mb_sn]) for ranks in stage_ranks if mb_sn in ranks)
+            for mb_sn in candidates
+        }
+
+    fused = {}
+    for mb_sn in candidates:
+        values = [scores[mb_sn] for scores in stage_scores if mb_sn in scores]
+        if not values:
+            fused[mb_sn] = 0.0
+        elif method == SCORE_FUSION_MAX:
+            fused[mb_sn] = max(values)
+        elif method == SCORE_FUSION_MEAN:
+            fused[mb_sn] = sum(values) / len(values)
+        else:
+            # last: 후보는 모든 단계를 통과했으므로 마지막으로 점수가 기록된 단계 값 사용
+            fused[mb_sn] = values[-1]
+    return fused
+
 
 class PineconeResultFilter:
     """카테고리 순서에 따라 단계적으로 mb_sn을 필터링 (Pinecone 최적화)"""
 
-    def __init__(self, pinecone_searcher):
+    def __init__(
+        self,
+        pinecone_searcher,
+        mode: str = FILTER_MODE_PROGRESSIVE,
+        max_workers: int = 5,
+        score_fusion: str = SCORE_FUSION_LAST,
+        metadata_index=None,
+        selectivity_order: bool = False
+    ):
+        """
+        Args:
+            pinecone_searcher: PineconePanelSearcher 인스턴스
+            mode: 실행 모드 ("progressive" 또는 "parallel")
+            max_workers: parallel 모드에서 동시에 실행할 Pinecone 쿼리 수
+            score_fusion: 최종 정렬 점수 결합 방식 ("last", "max", "mean", "rrf")
+            metadata_index: 카테고리 필터 선택도 추정용 로컬 메타데이터 인덱스 (PanelMetadataIndex)
+            selectivity_order: progressive 모드에서 선택도가 낮은(후보를 많이 줄이는) 카테고리부터 실행할지 여부
+        """
+        if mode not in FILTER_MODES:
+            logger.warning(f"[결과 필터] 알 수 없는 모드 '{mode}', '{FILTER_MODE_PROGRESSIVE}' 사용")
+            mode = FILTER_MODE_PROGRESSIVE
+        if score_fusion not in SCORE_FUSIONS:
+            logger.warning(f"[결과 필터] 알 수 없는 점수 결합 방식 '{score_fusion}', '{SCORE_FUSION_LAST}' 사용")
+            score_fusion = SCORE_FUSION_LAST
+
         self.searcher = pinecone_searcher
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.score_fusion = score_fusion
+        self.metadata_index = metadata_index
+        self.selectivity_order = selectivity_order and metadata_index is not None
 
     def filter_by_categories(
         self,
         embeddings: Dict[str, List[float]],
         category_order: List[str],
         final_count: int = None,  # ⭐ None일 경우 전체 반환
-        topic_filters: Dict[str, Dict[str, Any]] = None
+        topic_filters: Dict[str, Dict[str, Any]] = None,
+        mode: Optional[str] = None,
+        score_fusion: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        카테고리 순서대로 단계적으로 필터링하여 최종 mb_sn 리스트 반환
+        카테고리 순서대로 필터링하여 최종 mb_sn 리스트 반환
 
         Args:
             embeddings: {"카테고리명": [임베딩 벡터]}
             category_order: 카테고리 순서 (예: ["기본정보", "직업소득", "자동차"])
             final_count: 최종 출력할 mb_sn 개수 (None이면 조건 만족하는 전체 반환)
             topic_filters: topic별 메타데이터 필터 (예: {"기본정보": {...}, "직업소득": {...}})
+            mode: 실행 모드 (None이면 생성 시 지정한 모드 사용)
+            score_fusion: 최종 점수 결합 방식 (None이면 생성 시 지정한 방식 사용)
 
         Returns:
             최종 선별된 mb_sn 리스트
@@ -35,194 +167,499 @@ class PineconeResultFilter:
         if not category_order:
             return []
 
-        filter_start = time.time()
+        mode = mode or self.mode
+        score_fusion = score_fusion or self.score_fusion
+        if mode == FILTER_MODE_PARALLEL:
+            return self._filter_parallel(embeddings, category_order, final_count, topic_filters, score_fusion)
 
-        # 첫 번째 카테고리로 초기 선별
-        first_category = category_order[0]
-        first_embedding = embeddings.get(first_category)
+        return self._filter_progressive(embeddings, category_order, final_count, topic_filters, score_fusion)
 
-        if first_embedding is None:
+    async def afilter_by_categories(
+        self,
+        embeddings: Dict[str, List[float]],
+        category_order: List[str],
+        final_count: int = None,
+        topic_filters: Dict[str, Dict[str, Any]] = None,
+        mode: Optional[str] = None,
+        score_fusion: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """filter_by_categories()의 비동기 버전 (searcher.asearch_by_category 사용)"""
+        if not category_order:
+            return []
+
+        mode = mode or self.mode
+        score_fusion = score_fusion or self.score_fusion
+        if mode == FILTER_MODE_PARALLEL:
+            return await self._afilter_parallel(embeddings, category_order, final_count, topic_filters, score_fusion)
+
+        return await self._afilter_progressive(embeddings, category_order, final_count, topic_filters, score_fusion)
+
+    # ===== progressive 모드 =====
+
+    def _filter_progressive(
+        self,
+        embeddings: Dict[str, List[float]],
+        category_order: List[str],
+        final_count: int = None,
+        topic_filters: Dict[str, Dict[str, Any]] = None,
+        score_fusion: str = SCORE_FUSION_LAST
+    ) -> List[Dict[str, Any]]:
+        """카테고리 순서대로 이전 단계 후보로 검색 범위를 좁혀가며 필터링 (직렬)"""
+        if embeddings.get(category_order[0]) is None:
             return []
 
+        # 선택도 기반 실행 순서 (점수 결합은 원래 category_order 기준)
+        execution_order = self._plan_category_order(embeddings, category_order, topic_filters)
+
+        # 첫 번째 카테고리로 초기 선별
+        first_category = execution_order[0]
+        first_embedding = embeddings.get(first_category)
+
         # 🎯 첫 번째 카테고리의 메타데이터 필터 가져오기
         first_filter = (topic_filters or {}).get(first_category, {})
         has_metadata_filter = bool(first_filter)
 
-
-        # ⭐ 노트북과 완전히 동일: 초기 검색 수 결정
-        if final_count is None:
-            # 명수 미명시
-            if has_metadata_filter:
-                initial_count = 10000  # 노트북과 동일: 메타데이터 조건 만족하는 모든 패널 검색
-            else:
-                initial_count = 10000  # 노트북과 동일: 벡터 유사도 높은 상위 10000개 검색
-        else:
-            # 명수 명시됨
-            if has_metadata_filter:
-                initial_count = 10000  # 노트북과 동일: 메타데이터 조건 만족하는 모든 패널 검색
-            else:
-                initial_count = max(final_count * 10, 2000)  # 노트북과 동일: 여유있게 검색
-
         first_results = self.searcher.search_by_category(
             query_embedding=first_embedding,
             category=first_category,
-            top_k=initial_count,
+            top_k=self._initial_top_k(final_count, has_metadata_filter),
             filter_mb_sns=None,  # 첫 단계는 전체 검색
             metadata_filter=first_filter
         )
 
-        # ⭐ 메타데이터 필터 사용 시 - 필터 조건 만족하는 패널 중 유사도 높은 순으로 정렬
-        if has_metadata_filter:
-            # 필터 조건을 만족하는 패널의 유사도 점수 수집
-            filtered_mb_sn_scores = {}
-            for r in first_results:
-                mb_sn = r.get("mb_sn", "")
-                if mb_sn:
-                    score = r.get("score", 0.0)
-                    # 최고 점수만 유지 (여러 카테고리에서 같은 mb_sn이 나올 수 있음)
-                    if mb_sn not in filtered_mb_sn_scores or score > filtered_mb_sn_scores[mb_sn]:
-                        filtered_mb_sn_scores[mb_sn] = score
-            
-            # ⭐ 유사도 점수 기준으로 정렬 (필터 조건 만족하는 패널 중에서)
-            sorted_filtered = sorted(
-                filtered_mb_sn_scores.items(), 
-                key=lambda x: x[1], 
-                reverse=True  # 높은 점수부터
-            )
-            
-            # ⭐ 노트북과 동일: 필터가 있을 때는 전체 유지 (조기 제한 없음)
-            # 노트북: candidate_mb_sns = [mb_sn for mb_sn, score in sorted_mb_sns]  # 전체 유지
-            candidate_mb_sns = [mb_sn for mb_sn, score in sorted_filtered]
-            
-        else:
-            # 필터 없을 때 (노트북과 동일)
-            # ✅ 정렬 순서 유지하며 후보군 구성 (노트북과 동일)
-            first_sorted = sorted(
-                [r for r in first_results if r.get("mb_sn")],
-                key=lambda x: x["score"],
-                reverse=True
-            )
-            candidate_mb_sns = list(OrderedDict.fromkeys(r["mb_sn"] for r in first_sorted))
+        candidate_mb_sns, first_scores = self._collect_first_stage(first_results, has_metadata_filter, final_count)
 
-            if final_count is not None and not has_metadata_filter:
-                candidate_mb_sns = candidate_mb_sns[:max(final_count * 10, 10000)]
+        # 카테고리별 {mb_sn: 점수} 테이블 (최종 정렬 시 재검색 없이 재사용)
+        stage_scores: Dict[str, Dict[str, float]] = {first_category: first_scores}
 
         # 후보가 없으면 빈 리스트 반환
         if len(candidate_mb_sns) == 0:
             return []
 
         # 나머지 카테고리로 점진적 필터링
-        for i, category in enumerate(category_order[1:], start=2):
+        for category in execution_order[1:]:
             embedding = embeddings.get(category)
 
             if embedding is None:
                 continue
 
+            # 후보가 비어있으면 필터링 중단
+            if len(candidate_mb_sns) == 0:
+                break
+
             # 🎯 현재 카테고리의 메타데이터 필터 가져오기
             category_filter = (topic_filters or {}).get(category, {})
             has_category_filter = bool(category_filter)
 
+            results = self.searcher.search_by_category(
+                query_embedding=embedding,
+                category=category,
+                top_k=self._stage_top_k(len(candidate_mb_sns), final_count, has_category_filter),
+                filter_mb_sns=candidate_mb_sns.ids,  # 이전 단계에서 선별된 mb_sn들로 제한
+                metadata_filter=category_filter
+            )
+
+            candidate_mb_sns, stage_scores[category] = self._collect_stage(
+                results, candidate_mb_sns, has_category_filter, final_count
+            )
+
+        return self._finalize(
+            [stage_scores[c] for c in category_order if c in stage_scores], candidate_mb_sns, final_count, score_fusion
+        )
+
+    async def _afilter_progressive(
+        self,
+        embeddings: Dict[str, List[float]],
+        category_order: List[str],
+        final_count: int = None,
+        topic_filters: Dict[str, Dict[str, Any]] = None,
+        score_fusion: str = SCORE_FUSION_LAST
+    ) -> List[Dict[str, Any]]:
+        """_filter_progressive()의 비동기 버전 (단계 간 의존성 때문에 직렬 실행)"""
+        if embeddings.get(category_order[0]) is None:
+            return []
+
+        # 선택도 추정은 최초 1회 merged 데이터 로드가 있을 수 있으므로 스레드에서 실행
+        execution_order = await asyncio.to_thread(self._plan_category_order, embeddings, category_order, topic_filters)
+
+        first_category = execution_order[0]
+        first_embedding = embeddings.get(first_category)
+
+        first_filter = (topic_filters or {}).get(first_category, {})
+        has_metadata_filter = bool(first_filter)
+
+        first_results = await self.searcher.asearch_by_category(
+            query_embedding=first_embedding,
+            category=first_category,
+            top_k=self._initial_top_k(final_count, has_metadata_filter),
+            filter_mb_sns=None,
+            metadata_filter=first_filter
+        )
+
+        candidate_mb_sns, first_scores = self._collect_first_stage(first_results, has_metadata_filter, final_count)
+        stage_scores: Dict[str, Dict[str, float]] = {first_category: first_scores}
+
+        if len(candidate_mb_sns) == 0:
+            return []
+
+        for category in execution_order[1:]:
+            embedding = embeddings.get(category)
+
+            if embedding is None:
+                continue
 
-            # 후보가 비어있으면 필터링 중단
             if len(candidate_mb_sns) == 0:
                 break
 
-            # ⭐ 노트북과 완전히 동일: 후보 수에 따라 검색 수 결정
-            if final_count is None and has_category_filter:
-                # 명수 미명시 + 메타데이터 필터 O → 충분히 큰 수
-                search_count = min(len(candidate_mb_sns) * 3, 10000)
-            else:
-                # 명수 명시 or 필터 없음 → 적당히
-                search_count = min(len(candidate_mb_sns) * 2, 10000)
-
-            search_count = max(search_count, 1)
+            category_filter = (topic_filters or {}).get(category, {})
+            has_category_filter = bool(category_filter)
 
-            results = self.searcher.search_by_category(
+            results = await self.searcher.asearch_by_category(
                 query_embedding=embedding,
                 category=category,
-                top_k=search_count,
-                filter_mb_sns=candidate_mb_sns,  # 이전 단계에서 선별된 mb_sn들로 제한
+                top_k=self._stage_top_k(len(candidate_mb_sns), final_count, has_category_filter),
+                filter_mb_sns=candidate_mb_sns.ids,
                 metadata_filter=category_filter
             )
 
-            # ⭐ 메타데이터 필터 여부에 따라 다른 전략
-            if has_category_filter:
-                # 메타데이터 필터 O → 필터 조건 만족하는 패널 중 유사도 높은 순으로 정렬
-                filtered_mb_sns = set([r["mb_sn"] for r in results if r.get("mb_sn") in candidate_mb_sns])
-                
-                # mb_sn별 최고 점수로 정렬 (여러 카테고리에서 같은 mb_sn이 나올 수 있음)
-                mb_sn_scores = {}
-                for r in results:
-                    mb_sn = r.get("mb_sn", "")
-                    if mb_sn in filtered_mb_sns:
-                        score = r.get("score", 0.0)
-                        if mb_sn not in mb_sn_scores or score > mb_sn_scores[mb_sn]:
-                            mb_sn_scores[mb_sn] = score
-                
-                # ⭐ 유사도 점수 기준으로 정렬 (필터 조건 만족하는 패널 중에서)
-                sorted_mb_sns = sorted(mb_sn_scores.items(), key=lambda x: x[1], reverse=True)
-                
-                # ⭐ 노트북과 동일: 필터가 있을 때는 전체 유지 (조기 제한 없음)
-                # 노트북: candidate_mb_sns = [mb_sn for mb_sn, score in sorted_mb_sns]  # 전체 유지
-                candidate_mb_sns = [mb_sn for mb_sn, score in sorted_mb_sns]
-                
-            else:
-                # 메타데이터 필터 X → 벡터 유사도 기반 상위 선별 (노트북과 완전히 동일)
-                mb_sn_scores = {}
-                for r in results:
-                    mb_sn = r.get("mb_sn", "")
-                    if mb_sn in candidate_mb_sns:
-                        if mb_sn not in mb_sn_scores or r.get("score", 0.0) > mb_sn_scores[mb_sn]:
-                            mb_sn_scores[mb_sn] = r.get("score", 0.0)
-
-                sorted_mb_sns = sorted(mb_sn_scores.items(), key=lambda x: x[1], reverse=True)
-                
-                # ⭐ 노트북과 완전히 동일: 다음 단계를 위한 후보 수 결정
-                if final_count is None:
-                    # 명수 미명시 → 전체 유지
-                    next_candidate_count = len(sorted_mb_sns)
-                else:
-                    # 명수 명시 → 여유있게, 노트북과 동일하게 최소 10000개 보장
-                    next_candidate_count = max(final_count * 3, 10000)
-                
-                candidate_mb_sns = [mb_sn for mb_sn, score in sorted_mb_sns[:next_candidate_count]]
-
-        # ⭐ 노트북 기반: 최종 결과도 score 정렬 보장 (마지막 카테고리 점수만 사용)
-        # 노트북과 동일하게 마지막 카테고리의 점수만 사용하여 정렬
-        final_results = self.searcher.search_by_category(
-            query_embedding=embeddings[category_order[-1]],
-            category=category_order[-1],
-            top_k=len(candidate_mb_sns),
-            filter_mb_sns=candidate_mb_sns
+            candidate_mb_sns, stage_scores[category] = self._collect_stage(
+                results, candidate_mb_sns, has_category_filter, final_count
+            )
+
+        return self._finalize(
+            [stage_scores[c] for c in category_order if c in stage_scores], candidate_mb_sns, final_count, score_fusion
+        )
+
+    def _plan_category_order(
+        self,
+        embeddings: Dict[str, List[float]],
+        category_order: List[str],
+        topic_filters: Optional[Dict[str, Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        progressive 모드 실행 순서 결정
+
+        - selectivity_order가 꺼져 있으면 category_order 그대로 (노트북과 동일)
+        - 켜져 있으면 카테고리 메타데이터 필터의 선택도(로컬 인덱스 기준 조건 만족 패널 비율)가 낮은 순으로 정렬
+          → 첫 단계 후보가 작아져 이후 단계의 $in 목록과 스캔 벡터 수가 줄어듦
+        - 필터가 없거나 평가할 수 없는 카테고리는 선택도 1.0 (뒤로), 같은 선택도는 원래 순서 유지
+        """
+        active = [c for c in category_order if embeddings.get(c) is not None]
+        if not self.selectivity_order or len(active) < 2 or not any((topic_filters or {}).get(c) for c in active):
+            return active
+
+        estimates = {}
+        for category in active:
+            category_filter = (topic_filters or {}).get(category)
+            selectivity = None
+            if category_filter:
+                try:
+                    selectivity = self.metadata_index.selectivity(category_filter)
+                except Exception as e:
+                    logger.warning(f"[결과 필터] {category} 선택도 추정 실패: {e}")
+            estimates[category] = 1.0 if selectivity is None else selectivity
+
+        planned = sorted(active, key=lambda c: estimates[c])
+        if planned != active:
+            logger.info(
+                "[결과 필터] 선택도 기반 실행 순서: "
+                + " → ".join(f"{c}({estimates[c]:.3f})" for c in planned)
+                + f" (원래 순서: {' → '.join(active)})"
+            )
+        return planned
+
+    def _initial_top_k(self, final_count: Optional[int], has_metadata_filter: bool) -> int:
+        """첫 번째 카테고리 검색 수 결정 (노트북과 완전히 동일)"""
+        if final_count is None:
+            # 명수 미명시
+            if has_metadata_filter:
+                return MAX_TOP_K  # 노트북과 동일: 메타데이터 조건 만족하는 모든 패널 검색
+            return MAX_TOP_K  # 노트북과 동일: 벡터 유사도 높은 상위 10000개 검색
+
+        # 명수 명시됨
+        if has_metadata_filter:
+            return MAX_TOP_K  # 노트북과 동일: 메타데이터 조건 만족하는 모든 패널 검색
+        return max(final_count * 10, 2000)  # 노트북과 동일: 여유있게 검색
+
+    def _stage_top_k(self, candidate_count: int, final_count: Optional[int], has_category_filter: bool) -> int:
+        """후속 카테고리 검색 수 결정 (노트북과 완전히 동일: 후보 수에 따라)"""
+        if final_count is None and has_category_filter:
+            # 명수 미명시 + 메타데이터 필터 O → 충분히 큰 수
+            search_count = min(candidate_count * 3, MAX_TOP_K)
+        else:
+            # 명수 명시 or 필터 없음 → 적당히
+            search_count = min(candidate_count * 2, MAX_TOP_K)
+
+        return max(search_count, 1)
+
+    def _collect_first_stage(
+        self,
+        first_results: List[Dict[str, Any]],
+        has_metadata_filter: bool,
+        final_count: Optional[int]
+    ) -> Tuple[CandidatePool, Dict[str, float]]:
+        """첫 번째 카테고리 결과로 초기 후보군과 점수 테이블 구성"""
+        if final_count is None and len(first_results) >= MAX_TOP_K:
+            logger.warning(
+                f"⚠️ 첫 단계 결과가 Pinecone top_k 상한({MAX_TOP_K})에 도달 - 조건 만족 패널이 더 있을 수 있음 (total은 하한값)"
+            )
+        # ⭐ 메타데이터 필터 사용 시 - 필터 조건 만족하는 패널 중 유사도 높은 순으로 정렬
+        if has_metadata_filter:
+            # 필터 조건을 만족하는 패널의 유사도 점수 수집
+            filtered_mb_sn_scores = {}
+            for r in first_results:
+                mb_sn = r.get("mb_sn", "")
+                if mb_sn:
+                    score = r.get("score", 0.0)
+                    # 최고 점수만 유지 (여러 카테고리에서 같은 mb_sn이 나올 수 있음)
+                    if mb_sn not in filtered_mb_sn_scores or score > filtered_mb_sn_scores[mb_sn]:
+                        filtered_mb_sn_scores[mb_sn] = score
+            
+            # ⭐ 유사도 점수 기준으로 정렬 (필터 조건 만족하는 패널 중에서)
+            sorted_filtered = sorted(
+                filtered_mb_sn_scores.items(), 
+                key=lambda x: x[1], 
+                reverse=True  # 높은 점수부터
+            )
+            
+            # ⭐ 노트북과 동일: 필터가 있을 때는 전체 유지 (조기 제한 없음)
+            # 노트북: candidate_mb_sns = [mb_sn for mb_sn, score in sorted_mb_sns]  # 전체 유지
+            candidate_mb_sns = CandidatePool(mb_sn for mb_sn, score in sorted_filtered)
+            return candidate_mb_sns, filtered_mb_sn_scores
+
+        # 필터 없을 때 (노트북과 동일)
+        # ✅ 정렬 순서 유지하며 후보군 구성 (노트북과 동일)
+        first_sorted = sorted(
+            [r for r in first_results if r.get("mb_sn")],
+            key=lambda x: x["score"],
+            reverse=True
         )
+        candidate_mb_sns = list(OrderedDict.fromkeys(r["mb_sn"] for r in first_sorted))
+
+        if final_count is not None:
+            candidate_mb_sns = candidate_mb_sns[:max(final_count * 10, 10000)]
+
+        first_scores = {}
+        for r in first_sorted:
+            # 내림차순 정렬이므로 처음 나온 점수가 최고 점수
+            first_scores.setdefault(r["mb_sn"], r["score"])
+        return CandidatePool(candidate_mb_sns), first_scores
 
-        final_scores = {}
-        for r in final_results:
+    def _collect_stage(
+        self,
+        results: List[Dict[str, Any]],
+        candidate_mb_sns: CandidatePool,
+        has_category_filter: bool,
+        final_count: Optional[int]
+    ) -> Tuple[CandidatePool, Dict[str, float]]:
+        """후속 카테고리 결과로 후보군을 좁히고 해당 단계 점수 테이블 반환"""
+        # 이전 단계 후보에 포함된 결과만 mb_sn별 최고 점수로 집계 (멤버십은 set으로 O(1))
+        mb_sn_scores: Dict[str, float] = {}
+        for r in results:
             mb_sn = r.get("mb_sn", "")
             if mb_sn in candidate_mb_sns:
                 score = r.get("score", 0.0)
-                # 최고 점수만 유지 (여러 카테고리에서 같은 mb_sn이 나올 수 있음)
-                if mb_sn not in final_scores or score > final_scores[mb_sn]:
-                    final_scores[mb_sn] = score
+                if mb_sn not in mb_sn_scores or score > mb_sn_scores[mb_sn]:
+                    mb_sn_scores[mb_sn] = score
+
+        # ⭐ 유사도 점수 기준으로 정렬
+        sorted_mb_sns = sorted(mb_sn_scores.items(), key=lambda x: x[1], reverse=True)
 
-        # ⭐ 노트북과 동일: 마지막 카테고리 점수 기준으로 정렬 (내림차순)
+        # ⭐ 노트북과 완전히 동일: 다음 단계를 위한 후보 수 결정
+        if has_category_filter or final_count is None:
+            # 메타데이터 필터 O → 필터 조건 만족하는 패널 전체 유지 (조기 제한 없음)
+            # 명수 미명시 → 전체 유지
+            next_candidate_count = len(sorted_mb_sns)
+        else:
+            # 명수 명시 → 여유있게, 노트북과 동일하게 최소 10000개 보장
+            next_candidate_count = max(final_count * 3, 10000)
+        
+        return CandidatePool(mb_sn for mb_sn, score in sorted_mb_sns[:next_candidate_count]), mb_sn_scores
+
+    def _finalize(
+        self,
+        stage_scores: List[Dict[str, float]],
+        candidate_mb_sns: Iterable[str],
+        final_count: Optional[int],
+        score_fusion: str,
+        mode_label: str = ""
+    ) -> List[Dict[str, Any]]:
+        """단계별 점수 결합 → 정렬 → final_count 적용"""
+        # ⭐ 최종 점수: 단계별 점수 테이블을 결합 (재검색 쿼리 없음)
+        # 기본값 "last"는 노트북과 동일하게 마지막 카테고리 점수만 사용
+        final_scores = fuse_scores(stage_scores, candidate_mb_sns, score_fusion)
+
+        # 결합 점수 기준으로 정렬 (내림차순)
         final_sorted = sorted(final_scores.items(), key=lambda x: x[1], reverse=True)
         
         # ⭐ 노트북과 동일: 최소 유사도 점수 필터링 없이 모든 결과 반환
         final_mb_sns = [mb_sn for mb_sn, score in final_sorted]
         
+        label = f"{mode_label}, " if mode_label else ""
         if final_count is not None:
             final_mb_sns = final_mb_sns[:final_count]
             logger.info(
-                f"✅ 최종 {len(final_mb_sns)}개 패널 선별 완료 ({final_count}명 요청)"
+                f"✅ 최종 {len(final_mb_sns)}개 패널 선별 완료 ({final_count}명 요청, {label}점수 결합: {score_fusion})"
             )
         else:
             logger.info(
-                f"✅ 최종 {len(final_mb_sns)}개 패널 선별 완료 (조건 만족하는 전체 반환)"
+                f"✅ 최종 {len(final_mb_sns)}개 패널 선별 완료 (조건 만족하는 전체 반환, {label}점수 결합: {score_fusion})"
             )
 
         # ⭐ 노트북과 동일: mb_sn과 score 함께 반환 (페이지네이션 정렬에 사용)
-        final_results = [{"mb_sn": mb_sn, "score": final_scores.get(mb_sn, 0.0)} for mb_sn in final_mb_sns]
+        return [{"mb_sn": mb_sn, "score": final_scores.get(mb_sn, 0.0)} for mb_sn in final_mb_sns]
+
+    # ===== parallel 모드 =====
 
-        return final_results
+    @staticmethod
+    def _scores_from_results(results: List[Dict[str, Any]]) -> Dict[str, float]:
+        """검색 결과를 {mb_sn: 최고 점수}로 변환"""
+        scores: Dict[str, float] = {}
+        for r in results:
+            mb_sn = r.get("mb_sn", "")
+            if not mb_sn:
+                continue
+            score = r.get("score", 0.0)
+            if mb_sn not in scores or score > scores[mb_sn]:
+                scores[mb_sn] = score
+        return scores
 
+    def _search_category_scores(
+        self,
+        embedding: List[float],
+        category: str,
+        top_k: int,
+        metadata_filter: Dict[str, Any] = None
+    ) -> Dict[str, float]:
+        """단일 카테고리를 전체 후보군에서 검색하여 {mb_sn: 최고 점수} 반환 (parallel 모드용)"""
+        results = self.searcher.search_by_category(
+            query_embedding=embedding,
+            category=category,
+            top_k=top_k,
+            filter_mb_sns=None,
+            metadata_filter=metadata_filter
+        )
+        return self._scores_from_results(results)
+
+    async def _asearch_category_scores(
+        self,
+        embedding: List[float],
+        category: str,
+        top_k: int,
+        metadata_filter: Dict[str, Any] = None
+    ) -> Dict[str, float]:
+        """_search_category_scores()의 비동기 버전"""
+        results = await self.searcher.asearch_by_category(
+            query_embedding=embedding,
+            category=category,
+            top_k=top_k,
+            filter_mb_sns=None,
+            metadata_filter=metadata_filter
+        )
+        return self._scores_from_results(results)
+
+    def _filter_parallel(
+        self,
+        embeddings: Dict[str, List[float]],
+        category_order: List[str],
+        final_count: int = None,
+        topic_filters: Dict[str, Dict[str, Any]] = None,
+        score_fusion: str = SCORE_FUSION_LAST
+    ) -> List[Dict[str, Any]]:
+        """
+        모든 카테고리를 동시에 검색한 뒤 로컬에서 교집합 및 정렬
+
+        progressive 모드와 달리 각 카테고리가 이전 단계 후보로 제한되지 않으므로
+        카테고리별 상위 MAX_TOP_K개 밖에 있는 패널은 교집합에서 빠질 수 있음
+        (대신 Pinecone 왕복이 카테고리 수와 무관하게 1회 수준으로 줄어듦)
+        """
+        filter_start = time.time()
+
+        # 첫 번째 카테고리 임베딩이 없으면 progressive 모드와 동일하게 빈 결과
+        if embeddings.get(category_order[0]) is None:
+            return []
+
+        active_categories = [c for c in category_order if embeddings.get(c) is not None]
+
+        with ThreadPoolExecutor(max_workers=min(len(active_categories), self.max_workers)) as executor:
+            futures = {
+                # 요청 컨텍스트(필터 완화 기록 등)를 워커 스레드로 전달
+                category: executor.submit(
+                    contextvars.copy_context().run,
+                    self._search_category_scores,
+                    embeddings[category],
+                    category,
+                    MAX_TOP_K,
+                    (topic_filters or {}).get(category, {})
+                )
+                for category in active_categories
+            }
+            category_scores = {category: future.result() for category, future in futures.items()}
+
+        return self._merge_parallel(category_scores, active_categories, final_count, score_fusion, filter_start)
+
+    async def _afilter_parallel(
+        self,
+        embeddings: Dict[str, List[float]],
+        category_order: List[str],
+        final_count: int = None,
+        topic_filters: Dict[str, Dict[str, Any]] = None,
+        score_fusion: str = SCORE_FUSION_LAST
+    ) -> List[Dict[str, Any]]:
+        """_filter_parallel()의 비동기 버전 (asyncio.gather + 세마포어로 동시 쿼리 수 제한)"""
+        filter_start = time.time()
+
+        if embeddings.get(category_order[0]) is None:
+            return []
+
+        active_categories = [c for c in category_order if embeddings.get(c) is not None]
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def _search(category: str) -> Dict[str, float]:
+            async with semaphore:
+                return await self._asearch_category_scores(
+                    embeddings[category],
+                    category,
+                    MAX_TOP_K,
+                    (topic_filters or {}).get(category, {})
+                )
+
+        results = await asyncio.gather(*(_search(c) for c in active_categories))
+        category_scores = dict(zip(active_categories, results))
+
+        return self._merge_parallel(category_scores, active_categories, final_count, score_fusion, filter_start)
+
+    def _merge_parallel(
+        self,
+        category_scores: Dict[str, Dict[str, float]],
+        active_categories: List[str],
+        final_count: Optional[int],
+        score_fusion: str,
+        filter_start: float
+    ) -> List[Dict[str, Any]]:
+        """카테고리별 점수 테이블을 교집합 후 결합 점수로 정렬"""
+        search_time = time.time() - filter_start
+        logger.info(
+            f"[결과 필터] parallel 모드: {len(active_categories)}개 카테고리 동시 검색 {search_time:.2f}초 "
+            f"({', '.join(f'{c}={len(category_scores[c])}' for c in active_categories)})"
+        )
+
+        # 카테고리 순서대로 교집합 (작은 집합부터 줄어들도록 set 연산)
+        candidate_set = set(category_scores[active_categories[0]])
+        for category in active_categories[1:]:
+            candidate_set &= category_scores[category].keys()
+            if not candidate_set:
+                break
+
+        if not candidate_set:
+            logger.info("✅ 최종 0개 패널 선별 완료 (카테고리 교집합 없음)")
+            return []
+
+        # ⭐ progressive 모드와 동일한 점수 결합 후 정렬 (내림차순)
+        return self._finalize(
+            [category_scores[c] for c in active_categories],
+            candidate_set,
+            final_count,
+            score_fusion,
+            mode_label="parallel"
+        )
@@ -1,27 +1,50 @@
 """Pinecone 검색기"""
 import os
-from typing import Dict, Any, List, Optional
-from pinecone import Pinecone
+import asyncio
+import heapq
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+from .filter_relaxation import FilterRelaxationPlanner, record_relaxation
+from .pinecone_provider import PineconeIndexProvider
+
 logger = logging.getLogger(__name__)
 
 
 class PineconePanelSearcher:
-    """Pinecone 벡터DB 검색 (전체 topic 메타데이터 필터 지원 + Fallback)"""
+    """Pinecone 벡터DB 검색 (전체 topic 메타데이터 필터 지원 + 완화 재검색)"""
 
-    def __init__(self, pinecone_api_key: str, index_name: str, category_config: Dict[str, Any]):
+    def __init__(
+        self,
+        pinecone_api_key: str,
+        index_name: str,
+        category_config: Dict[str, Any],
+        in_chunk_size: int = 1000,
+        in_max_workers: int = 4,
+        relaxation_planner: Optional[FilterRelaxationPlanner] = None,
+        index_provider: Optional[PineconeIndexProvider] = None
+    ):
         """
         Args:
             pinecone_api_key: Pinecone API 키
             index_name: Pinecone 인덱스 이름
             category_config: 카테고리 설정 딕셔너리
+            in_chunk_size: mb_sn $in 필터 한 요청에 담을 최대 후보 수 (초과 시 분할 검색)
+            in_max_workers: 분할 검색 동시 요청 수
+            relaxation_planner: 메타데이터 필터 결과가 0개일 때 쓰는 완화 플래너 (None이면 필터 전체 제거만 시도)
+            index_provider: 공유 Pinecone 인덱스 제공자 (None이면 이 검색기 전용으로 생성)
         """
         self.category_config = category_config
+        self.index_name = index_name
+        self.in_chunk_size = max(1, int(in_chunk_size))
+        self.in_max_workers = max(1, int(in_max_workers))
+        self.relaxation_planner = relaxation_planner
 
-        # Pinecone 초기화
-        pc = Pinecone(api_key=pinecone_api_key)
-        self.index = pc.Index(index_name)
+        # Pinecone 초기화 (공유 제공자의 인덱스/연결 풀 재사용, 비동기 인덱스는 첫 asearch 시 지연 초기화)
+        self.provider = index_provider or PineconeIndexProvider(pinecone_api_key, index_name)
+        self.index = self.provider.index()
 
         logger.info(f"✅ Pinecone 검색기 초기화 완료: {index_name}")
 
@@ -74,7 +97,7 @@ class PineconePanelSearcher:
         metadata_filter: Dict[str, Any] = None
     ) -> List[Dict[str, Any]]:
         """
-        특정 카테고리로 Pinecone 검색 (메타데이터 필터 + Fallback 지원)
+        특정 카테고리로 Pinecone 검색 (메타데이터 필터 + 완화 재검색 지원)
 
         Args:
             query_embedding: 쿼리 임베딩 벡터
@@ -94,80 +117,313 @@ class PineconePanelSearcher:
         if filter_mb_sns is not None and len(filter_mb_sns) == 0:
             return []
 
-        # 카테고리에 해당하는 Pinecone topic 가져오기
-        pinecone_topic = self.category_config.get(category, {}).get("pinecone_topic", category)
-
-        # 기본 필터: topic
-        filter_dict = {"topic": pinecone_topic}
-
-        # mb_sn 필터 추가 (이전 단계에서 선별된 mb_sn들로 제한)
-        if filter_mb_sns:
-            filter_dict["mb_sn"] = {"$in": filter_mb_sns}
+        # ⭐ 노트북과 동일: top_k를 그대로 사용 (제한 없음), 무응답 필터링 없이 모든 결과 포함
+        def _query(relaxed_filter: Optional[Dict[str, Any]]) -> List[Any]:
+            return self._query_matches(query_embedding, category, top_k, filter_mb_sns, relaxed_filter)
 
         # 🎯 1차 시도: 메타데이터 필터 적용
         if metadata_filter:
-            filter_with_metadata = filter_dict.copy()
-            # 리스트 값을 $in 연산자로 변환
-            for key, value in metadata_filter.items():
-                if isinstance(value, list):
-                    # 리스트인 경우 $in 연산자 사용
-                    filter_with_metadata[key] = {"$in": value}
-                elif isinstance(value, dict):
-                    # 이미 Pinecone 필터 형식인 경우 (예: {"$lte": 300})
-                    filter_with_metadata[key] = value
-                else:
-                    # 단일 값인 경우 그대로 사용
-                    filter_with_metadata[key] = value
-
-            # Pinecone 검색 (메타데이터 필터 포함)
-            # ⭐ 노트북과 동일: top_k를 그대로 사용 (제한 없음)
             try:
-                search_results = self.index.query(
-                    vector=query_embedding,
-                    top_k=top_k,
-                    include_metadata=True,
-                    filter=filter_with_metadata
-                )
+                valid_results = _query(metadata_filter)
+            except Exception as e:
+                logger.warning(f"Pinecone 검색 오류 (메타데이터 필터): {e}, 완화 재검색 시도")
+                valid_results = []
 
-                # ⭐ 노트북과 동일: 무응답 필터링 제거 (모든 결과 포함)
-                valid_results = list(search_results.matches)
-
-                # 🔄 Fallback: 결과가 0개면 메타데이터 필터 없이 재검색
-                if len(valid_results) == 0:
-                    search_results = self.index.query(
-                        vector=query_embedding,
-                        top_k=top_k,
-                        include_metadata=True,
-                        filter=filter_dict  # 메타데이터 필터 제거
-                    )
-                    valid_results = list(search_results.matches)
+            # 🔄 결과가 0개(또는 오류)면 완화 계획에 따라 조건을 빼거나 넓혀 동시 재검색
+            if len(valid_results) == 0:
+                plan = self._plan_relaxations(metadata_filter)
+                with ThreadPoolExecutor(max_workers=min(self.in_max_workers, len(plan))) as executor:
+                    relaxed_results = list(executor.map(
+                        lambda step: self._try_relaxation(_query, step), plan
+                    ))
+                valid_results = self._pick_relaxation(category, plan, relaxed_results)
+        else:
+            # 메타데이터 필터 없이 검색
+            try:
+                valid_results = _query(None)
             except Exception as e:
-                logger.warning(f"Pinecone 검색 오류 (메타데이터 필터): {e}, Fallback 시도")
-                # Fallback: 메타데이터 필터 없이 재검색
-                search_results = self.index.query(
-                    vector=query_embedding,
-                    top_k=top_k,
-                    include_metadata=True,
-                    filter=filter_dict
+                logger.error(f"Pinecone 검색 오류: {e}")
+                return []
+
+        return self._to_matches(valid_results, top_k)
+
+    async def asearch_by_category(
+        self,
+        query_embedding: List[float],
+        category: str,
+        top_k: int,
+        filter_mb_sns: List[str] = None,
+        metadata_filter: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        search_by_category()의 비동기 버전 (Pinecone asyncio 인덱스 사용)
+
+        Args/Returns: search_by_category()와 동일
+        """
+        if top_k <= 0:
+            return []
+
+        if filter_mb_sns is not None and len(filter_mb_sns) == 0:
+            return []
+
+        async def _query(relaxed_filter: Optional[Dict[str, Any]]) -> List[Any]:
+            return await self._aquery_matches(query_embedding, category, top_k, filter_mb_sns, relaxed_filter)
+
+        if metadata_filter:
+            try:
+                valid_results = await _query(metadata_filter)
+            except Exception as e:
+                logger.warning(f"Pinecone 검색 오류 (메타데이터 필터): {e}, 완화 재검색 시도")
+                valid_results = []
+
+            if len(valid_results) == 0:
+                # 선택도 추정은 최초 1회 merged 데이터 로드가 있을 수 있으므로 스레드에서 실행
+                plan = await asyncio.to_thread(self._plan_relaxations, metadata_filter)
+                relaxed_results = await asyncio.gather(
+                    *(self._atry_relaxation(_query, step) for step in plan)
                 )
-                # ⭐ 노트북과 동일: 무응답 필터링 제거
-                valid_results = list(search_results.matches)
+                valid_results = self._pick_relaxation(category, plan, relaxed_results)
         else:
-            # 메타데이터 필터 없이 검색
-            # ⭐ 노트북과 동일: top_k를 그대로 사용 (제한 없음)
             try:
-                search_results = self.index.query(
+                valid_results = await _query(None)
+            except Exception as e:
+                logger.error(f"Pinecone 검색 오류: {e}")
+                return []
+
+        return self._to_matches(valid_results, top_k)
+
+    # ===== 메타데이터 필터 완화 =====
+
+    def _plan_relaxations(self, metadata_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """완화 계획 (플래너가 없으면 기존과 동일하게 메타데이터 필터 전체 제거만 시도)"""
+        if self.relaxation_planner is not None:
+            try:
+                return self.relaxation_planner.plan(metadata_filter)
+            except Exception as e:
+                logger.warning(f"메타데이터 필터 완화 계획 실패, 전체 제거로 재검색: {e}")
+        return [{"label": "메타데이터 필터 제외", "dropped": list(metadata_filter), "broadened": [], "filter": None}]
+
+    @staticmethod
+    def _try_relaxation(query, step: Dict[str, Any]) -> Optional[List[Any]]:
+        """완화 후보 하나 실행 (오류 시 None)"""
+        try:
+            return query(step["filter"])
+        except Exception as e:
+            logger.warning(f"Pinecone 완화 재검색 오류 ({step['label']}): {e}")
+            return None
+
+    @staticmethod
+    async def _atry_relaxation(query, step: Dict[str, Any]) -> Optional[List[Any]]:
+        """_try_relaxation()의 비동기 버전"""
+        try:
+            return await query(step["filter"])
+        except Exception as e:
+            logger.warning(f"Pinecone 완화 재검색 오류 ({step['label']}): {e}")
+            return None
+
+    def _pick_relaxation(
+        self,
+        category: str,
+        plan: List[Dict[str, Any]],
+        relaxed_results: List[Optional[List[Any]]]
+    ) -> List[Any]:
+        """계획 순서상 첫 번째로 결과가 있는 완화를 선택하고 기록"""
+        for step, results in zip(plan, relaxed_results):
+            if results:
+                logger.info(
+                    f"[Pinecone] {category} 메타데이터 필터 완화 적용: {step['label']} "
+                    f"(후보 {len(plan)}개 동시 시도, 결과 {len(results)}개)"
+                )
+                record_relaxation({
+                    "category": category,
+                    "applied": step["label"],
+                    "dropped": step["dropped"],
+                    "broadened": step["broadened"],
+                    "results": len(results),
+                })
+                return results
+
+        if all(results is None for results in relaxed_results):
+            logger.error(f"Pinecone 검색 오류: {category} 완화 재검색 모두 실패")
+        record_relaxation({"category": category, "applied": None, "dropped": [], "broadened": [], "results": 0})
+        return []
+
+    # ===== 단일/분할 쿼리 =====
+
+    def _query_matches(
+        self,
+        query_embedding: List[float],
+        category: str,
+        top_k: int,
+        filter_mb_sns: Optional[List[str]],
+        metadata_filter: Optional[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        쿼리 한 번의 매치 목록
+
+        ⭐ 후보가 in_chunk_size를 넘으면 $in 목록을 chunk로 나눠 동시 검색 후 점수 기준 top_k 병합
+        (chunk마다 top_k개를 가져오므로 전체 top_k는 단일 요청과 동일)
+        """
+        if filter_mb_sns and len(filter_mb_sns) > self.in_chunk_size:
+            chunk_start = time.time()
+            chunks = self._split_candidates(filter_mb_sns)
+
+            def _query_chunk(chunk: List[str]):
+                filter_dict, filter_with_metadata = self._build_filters(category, chunk, metadata_filter)
+                return self.index.query(
                     vector=query_embedding,
                     top_k=top_k,
                     include_metadata=True,
-                    filter=filter_dict
+                    filter=filter_with_metadata or filter_dict
                 )
-                # ⭐ 노트북과 동일: 무응답 필터링 제거
-                valid_results = list(search_results.matches)
-            except Exception as e:
-                logger.error(f"Pinecone 검색 오류: {e}")
-                return []
 
+            with ThreadPoolExecutor(max_workers=min(self.in_max_workers, len(chunks))) as executor:
+                responses = list(executor.map(_query_chunk, chunks))
+            valid_results = self._merge_chunk_matches(responses, top_k)
+            self._log_chunked(category, filter_mb_sns, chunks, valid_results, chunk_start)
+            return valid_results
+
+        filter_dict, filter_with_metadata = self._build_filters(category, filter_mb_sns, metadata_filter)
+        search_results = self.index.query(
+            vector=query_embedding,
+            top_k=top_k,
+            include_metadata=True,
+            filter=filter_with_metadata or filter_dict
+        )
+        return list(search_results.matches)
+
+    async def _aquery_matches(
+        self,
+        query_embedding: List[float],
+        category: str,
+        top_k: int,
+        filter_mb_sns: Optional[List[str]],
+        metadata_filter: Optional[Dict[str, Any]]
+    ) -> List[Any]:
+        """_query_matches()의 비동기 버전 (분할 검색 동시 요청 수는 Semaphore로 제한)"""
+        if filter_mb_sns and len(filter_mb_sns) > self.in_chunk_size:
+            chunk_start = time.time()
+            chunks = self._split_candidates(filter_mb_sns)
+            semaphore = asyncio.Semaphore(self.in_max_workers)
+
+            async def _query_chunk(chunk: List[str]):
+                filter_dict, filter_with_metadata = self._build_filters(category, chunk, metadata_filter)
+                async with semaphore:
+                    return await self._aquery(query_embedding, top_k, filter_with_metadata or filter_dict)
+
+            responses = await asyncio.gather(*(_query_chunk(chunk) for chunk in chunks))
+            valid_results = self._merge_chunk_matches(responses, top_k)
+            self._log_chunked(category, filter_mb_sns, chunks, valid_results, chunk_start)
+            return valid_results
+
+        filter_dict, filter_with_metadata = self._build_filters(category, filter_mb_sns, metadata_filter)
+        search_results = await self._aquery(query_embedding, top_k, filter_with_metadata or filter_dict)
+        return list(search_results.matches)
+
+    def _split_candidates(self, filter_mb_sns: List[str]) -> List[List[str]]:
+        """후보 목록을 in_chunk_size 단위로 분할"""
+        return [filter_mb_sns[i:i + self.in_chunk_size] for i in range(0, len(filter_mb_sns), self.in_chunk_size)]
+
+    @staticmethod
+    def _merge_chunk_matches(responses: List[Any], top_k: int) -> List[Any]:
+        """chunk별 응답을 점수 내림차순으로 병합해 상위 top_k개 반환"""
+        all_matches = [match for response in responses for match in response.matches]
+        return heapq.nlargest(top_k, all_matches, key=lambda match: match.score or 0.0)
+
+    def _log_chunked(
+        self,
+        category: str,
+        filter_mb_sns: List[str],
+        chunks: List[List[str]],
+        valid_results: List[Any],
+        chunk_start: float
+    ) -> None:
+        logger.info(
+            f"[Pinecone] {category} $in 분할 검색: 후보 {len(filter_mb_sns)}개 → {len(chunks)}개 chunk "
+            f"(chunk={self.in_chunk_size}, 동시 {self.in_max_workers}), "
+            f"{time.time() - chunk_start:.2f}초, 결과 {len(valid_results)}개"
+        )
+
+    def match_mb_sns(
+        self,
+        query_embedding: List[float],
+        category: str,
+        mb_sns: List[str],
+        metadata_filter: Dict[str, Any],
+        chunk_size: int = 1000
+    ) -> List[str]:
+        """
+        후보 mb_sn 중 메타데이터 필터를 만족하는 전체 mb_sn (누락 없는 전수 확인)
+
+        - 후보를 chunk_size 단위로 나눠 {"mb_sn": {"$in": chunk}} + 필터로 조회
+        - 결과가 top_k에 도달하면 잘렸을 수 있으므로 chunk를 반으로 나눠 다시 조회
+        - search_by_category와 달리 0개 결과 시 필터 없는 재검색(Fallback)을 하지 않음
+
+        Returns:
+            필터를 만족하는 mb_sn 리스트 (입력 순서 유지)
+        """
+        matched = set()
+        pending = [mb_sns[i:i + chunk_size] for i in range(0, len(mb_sns), max(1, chunk_size))]
+        while pending:
+            chunk = pending.pop()
+            _, filter_with_metadata = self._build_filters(category, chunk, metadata_filter)
+            top_k = min(len(chunk) * 2, 10000)
+            response = self.index.query(
+                vector=query_embedding,
+                top_k=top_k,
+                include_metadata=True,
+                filter=filter_with_metadata
+            )
+            if len(response.matches) >= top_k and len(chunk) > 1:
+                half = len(chunk) // 2
+                pending.extend([chunk[:half], chunk[half:]])
+                continue
+            matched.update((match.metadata or {}).get("mb_sn", "") for match in response.matches)
+
+        return [mb_sn for mb_sn in mb_sns if mb_sn in matched]
+
+    def _build_filters(
+        self,
+        category: str,
+        filter_mb_sns: Optional[List[str]],
+        metadata_filter: Optional[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        topic/mb_sn 기본 필터와 메타데이터 포함 필터 생성
+
+        Returns:
+            (기본 필터, 메타데이터 포함 필터 또는 None)
+        """
+        # 카테고리에 해당하는 Pinecone topic 가져오기
+        pinecone_topic = self.category_config.get(category, {}).get("pinecone_topic", category)
+
+        # 기본 필터: topic
+        filter_dict = {"topic": pinecone_topic}
+
+        # mb_sn 필터 추가 (이전 단계에서 선별된 mb_sn들로 제한)
+        if filter_mb_sns:
+            filter_dict["mb_sn"] = {"$in": filter_mb_sns}
+
+        if not metadata_filter:
+            return filter_dict, None
+
+        filter_with_metadata = filter_dict.copy()
+        # 리스트 값을 $in 연산자로 변환
+        for key, value in metadata_filter.items():
+            if isinstance(value, list):
+                # 리스트인 경우 $in 연산자 사용
+                filter_with_metadata[key] = {"$in": value}
+            elif isinstance(value, dict):
+                # 이미 Pinecone 필터 형식인 경우 (예: {"$lte": 300})
+                filter_with_metadata[key] = value
+            else:
+                # 단일 값인 경우 그대로 사용
+                filter_with_metadata[key] = value
+
+        return filter_dict, filter_with_metadata
+
+    def _to_matches(self, valid_results: List[Any], top_k: int) -> List[Dict[str, Any]]:
+        """Pinecone 매치를 결과 딕셔너리로 변환"""
         # ⭐ 노트북과 동일: Pinecone이 이미 정렬된 결과를 그대로 사용 (재정렬하지 않음)
         # 결과 변환 (상위 top_k개만)
         matches = []
@@ -187,3 +443,29 @@ class PineconePanelSearcher:
 
         return matches
 
+    def _get_async_index(self):
+        """Pinecone asyncio 인덱스 반환 (공유 제공자, 지원되지 않으면 None → 동기 인덱스를 스레드에서 실행)"""
+        return self.provider.async_index()
+
+    async def _aquery(self, vector: List[float], top_k: int, filter_dict: Dict[str, Any]):
+        """비동기 Pinecone 쿼리"""
+        if not self.provider.async_index_resolved:
+            # describe_index는 블로킹 호출이므로 최초 1회만 스레드에서 실행
+            await asyncio.to_thread(self._get_async_index)
+
+        async_index = self._get_async_index()
+        if async_index is not None:
+            return await async_index.query(
+                vector=vector,
+                top_k=top_k,
+                include_metadata=True,
+                filter=filter_dict
+            )
+
+        return await asyncio.to_thread(
+            self.index.query,
+            vector=vector,
+            top_k=top_k,
+            include_metadata=True,
+            filter=filter_dict
+        )
@@ -0,0 +1,218 @@
+"""Precomputed 클러스터링 산출물 캐시 (세션 버전별 직렬화된 응답 보관)"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
+import logging
+
+from fastapi.responses import Response
+
+logger = logging.getLogger(__name__)
+
+
+class PrecomputedArtifactCache:
+    """
+    Precomputed UMAP/매핑/프로필/비교 분석 응답 캐시
+
+    - Precomputed 데이터는 마이그레이션 스크립트를 다시 실행하기 전까지 바뀌지 않으므로
+      세션 버전 (session_id, updated_at) 단위로 직렬화된 응답 바이트(JSON/바이너리)를 보관
+    - 버전 확인은 clustering_sessions 1행 조회 (probe_interval초 이내면 생략)
+    - 버전이 바뀌면 모든 응답 폐기, 버전을 확인할 수 없으면(DB 오류) 이전 버전 응답 유지
+    - 세션이 없으면(파일 시스템 fallback 응답) 캐시하지 않음
+    - 응답 수(max_payloads)와 바이트 합(max_bytes) 두 기준으로 용량 제한 (LRU 제거)
+    """
+
+    def __init__(
+        self,
+        precomputed_name: str = "hdbscan_default",
+        probe_interval: float = 5.0,
+        max_payloads: int = 512,
+        max_bytes: int = 128 * 1024 * 1024,
+        probe: Optional[Callable[[str], Awaitable[Optional[tuple]]]] = None
+    ):
+        """
+        Args:
+            precomputed_name: clustering_sessions.precomputed_name
+            probe_interval: 버전 확인 주기 (초, 0이면 요청마다 확인)
+            max_payloads: 보관할 응답 수 (LRU)
+            max_bytes: 보관할 응답 바이트 합 상한 (단일 응답이 이보다 크면 보관하지 않음)
+            probe: 버전 조회 함수 (None이면 clustering_loader.probe_precomputed_version)
+        """
+        self.precomputed_name = precomputed_name
+        self.probe_interval = max(0.0, float(probe_interval))
+        self.max_payloads = max(1, int(max_payloads))
+        self.max_bytes = max(1, int(max_bytes))
+        self._probe = probe
+
+        self._lock = threading.Lock()
+        self._payloads: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()  # key → (body, media_type)
+        self._bytes = 0
+        self._build_locks: Dict[str, List[Any]] = {}  # key → [asyncio.Lock, 사용 중인 요청 수] (생성 중인 키만 보관)
+        self._version: Optional[tuple] = None
+        self._probed_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.probes = 0
+        self.probe_errors = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    async def current_version(self) -> Optional[tuple]:
+        """세션 버전 (probe_interval초 동안 재사용, 바뀌면 보관된 응답 폐기)"""
+        if self._version is not None and time.time() - self._probed_at < self.probe_interval:
+            return self._version
+
+        probe = self._probe
+        if probe is None:
+            from app.utils.clustering_loader import probe_precomputed_version
+            probe = probe_precomputed_version
+
+        try:
+            version = await probe(self.precomputed_name)
+        except Exception as e:
+            self.probe_errors += 1
+            logger.warning(f"[Precomputed Cache] 버전 확인 실패, 이전 버전 유지: {e}")
+            return self._version
+
+        with self._lock:
+            self.probes += 1
+            self._probed_at = time.time()
+            if version != self._version:
+                if self._payloads:
+                    self.invalidations += 1
+                    logger.info(f"[Precomputed Cache] 세션 버전 변경 {self._version} → {version}, 응답 {len(self._payloads)}개 폐기")
+                self._payloads.clear()
+                self._bytes = 0
+                self._version = version
+        return version
+
+    async def get_or_build(self, key: str, build: Callable[[], Awaitable[Response]]) -> Response:
+        """
+        캐시된 응답 반환, 없으면 build()로 만들고 성공 응답(200)만 직렬화된 바이트로 보관
+
+        Args:
+            key: 응답 키 (엔드포인트 + 파라미터)
+            build: 응답(JSONResponse/Response)을 만드는 코루틴 함수 (HTTPException은 그대로 전달)
+
+        Returns:
+            캐시된 바이트로 만든 Response 또는 build()가 만든 Response (캐시 불가 시)
+        """
+        version = await self.current_version()
+        if version is None:
+            return await build()
+
+        cached = self._lookup(key, version)
+        if cached is not None:
+            return Response(content=cached[0], media_type=cached[1])
+
+        # 같은 키는 한 번만 생성 (첫 요청이 만드는 동안 나머지는 대기 후 캐시 사용)
+        # 키별 락은 생성이 끝나고 기다리는 요청이 없으면 제거 (클라이언트가 정하는 키로 무한히 늘지 않도록)
+        entry = self._build_locks.get(key)
+        if entry is None:
+            entry = self._build_locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                cached = self._lookup(key, version)
+                if cached is not None:
+                    return Response(content=cached[0], media_type=cached[1])
+                return await self._build_and_store(key, version, build)
+        finally:
+            entry[1] -= 1
+            if entry[1] <= 0 and self._build_locks.get(key) is entry:
+                del self._build_locks[key]
+
+    async def _build_and_store(self, key: str, version: tuple, build: Callable[[], Awaitable[Response]]) -> Response:
+        """build() 실행 후 성공 응답(200)만 보관 (키별 락 보유 상태에서 호출)"""
+        self.misses += 1
+        build_start = time.time()
+        response = await build()
+        body = getattr(response, "body", None)
+        if getattr(response, "status_code", None) != 200 or not isinstance(body, (bytes, bytearray)):
+            return response
+
+        if len(body) > self.max_bytes:
+            logger.warning(f"[Precomputed Cache] 응답 크기 {len(body)}B가 예산 {self.max_bytes}B를 초과하여 캐시하지 않음: {key}")
+            return response
+
+        with self._lock:
+            if self._version == version:
+                previous = self._payloads.pop(key, None)
+                if previous is not None:
+                    self._bytes -= len(previous[0])
+                self._payloads[key] = (bytes(body), response.media_type or "application/json")
+                self._bytes += len(body)
+                while len(self._payloads) > self.max_payloads or self._bytes > self.max_bytes:
+                    _, (evicted_body, _) = self._payloads.popitem(last=False)
+                    self._bytes -= len(evicted_body)
+                    self.evictions += 1
+        logger.info(f"[Precomputed Cache] 응답 저장: {key} ({len(body):,} bytes, {time.time() - build_start:.2f}초)")
+        return response
+
+    def _lookup(self, key: str, version: tuple) -> Optional[Tuple[bytes, str]]:
+        with self._lock:
+            if self._version != version:
+                return None
+            cached = self._payloads.get(key)
+            if cached is not None:
+                self._payloads.move_to_end(key)
+                self.hits += 1
+            return cached
+
+    def clear(self) -> int:
+        """보관된 응답 비우기 (다음 요청에서 버전도 다시 확인). 삭제된 응답 수 반환"""
+        with self._lock:
+            removed = len(self._payloads)
+            self._payloads.clear()
+            self._bytes = 0
+            self._build_locks.clear()
+            self._version = None
+            self._probed_at = 0.0
+            return removed
+
+    def info(self) -> Dict[str, Any]:
+        """캐시 상태 (네트워크 호출 없음)"""
+        with self._lock:
+            return {
+                "version": list(self._version) if self._version else None,
+                "payloads": len(self._payloads),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "probe_interval": self.probe_interval,
+                "hits": self.hits,
+                "misses": self.misses,
+                "probes": self.probes,
+                "probe_errors": self.probe_errors,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+# 프로세스 전역 캐시 싱글톤 (설정 기반, hdbscan_default)
+_precomputed_cache: Optional[PrecomputedArtifactCache] = None
+_precomputed_cache_lock = threading.Lock()
+
+
+def get_precomputed_cache() -> Optional[PrecomputedArtifactCache]:
+    """설정(PRECOMPUTED_CACHE_*)으로 만든 전역 Precomputed 캐시 (비활성화 시 None)"""
+    global _precomputed_cache
+
+    from app.core.config import (
+        PRECOMPUTED_CACHE_ENABLED,
+        PRECOMPUTED_VERSION_PROBE_INTERVAL,
+        PRECOMPUTED_CACHE_MAX_PAYLOADS,
+        PRECOMPUTED_CACHE_MAX_BYTES,
+    )
+    if not PRECOMPUTED_CACHE_ENABLED:
+        return None
+
+    if _precomputed_cache is None:
+        with _precomputed_cache_lock:
+            if _precomputed_cache is None:
+                _precomputed_cache = PrecomputedArtifactCache(
+                    probe_interval=PRECOMPUTED_VERSION_PROBE_INTERVAL,
+                    max_payloads=PRECOMPUTED_CACHE_MAX_PAYLOADS,
+                    max_bytes=PRECOMPUTED_CACHE_MAX_BYTES
+                )
+    return _precomputed_cache
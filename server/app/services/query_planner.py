@@ -0,0 +1,192 @@
+"""결합 쿼리 플래너 (메타데이터 추출 + 카테고리 분류를 LLM 1회 호출로 수행)"""
+import json
+import time
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+
+from .metadata_extractor import MetadataExtractor
+from .category_classifier import CategoryClassifier
+from .llm_cache import LLMStageCache, STAGE_PLAN, normalize_query
+
+logger = logging.getLogger(__name__)
+
+# 플래너 결과: (메타데이터, 카테고리 분류 결과)
+QueryPlan = Tuple[Dict[str, Any], Dict[str, List[str]]]
+
+
+class PlanValidationError(ValueError):
+    """플래너 출력이 category_config / 메타데이터와 맞지 않음 (단계별 경로로 폴백)"""
+
+
+class FusedQueryPlanner:
+    """
+    메타데이터 추출(1단계)과 카테고리 분류(2단계)를 하나의 구조화 출력 LLM 호출로 수행
+
+    - 프롬프트/정규화/토큰 매핑은 MetadataExtractor, CategoryClassifier 로직을 그대로 재사용
+    - 카테고리별 Pinecone 필터(2.5단계)는 기존과 동일하게 rule-based MetadataFilterExtractor가 담당
+    - 출력 검증에 실패하면 None을 반환하고, 파이프라인은 기존 단계별 경로로 폴백
+    """
+
+    # 결합 출력 형식 변경 시 올려서 LLM 캐시 무효화
+    PROMPT_VERSION = "v1"
+
+    def __init__(self, metadata_extractor: MetadataExtractor, category_classifier: CategoryClassifier):
+        """
+        Args:
+            metadata_extractor: 메타데이터 추출기 (프롬프트, 정규화, LLM 클라이언트 재사용)
+            category_classifier: 카테고리 분류기 (category_config, 토큰 매핑 재사용)
+        """
+        self.metadata_extractor = metadata_extractor
+        self.category_classifier = category_classifier
+        self.cache = metadata_extractor.cache
+
+    def plan(self, query: str) -> Optional[QueryPlan]:
+        """
+        쿼리에서 메타데이터와 카테고리 분류를 한 번에 추출
+
+        Returns:
+            (metadata, classified) 또는 None (호출/검증 실패 시)
+        """
+        plan_start = time.time()
+        cache_key, cached = self._cache_lookup(query)
+        if cached is not None:
+            return cached
+        try:
+            if not self.metadata_extractor._has_api_key():
+                return None
+            response = self.metadata_extractor.client.messages.create(
+                **self.metadata_extractor._request_kwargs(self._build_prompt(query))
+            )
+            return self._cache_store(cache_key, self._parse_plan(response.content[0].text, plan_start))
+        except Exception as e:
+            logger.warning(f"[결합 플래너] 실패 -> 단계별 경로로 폴백: {e}")
+            return None
+
+    async def aplan(self, query: str) -> Optional[QueryPlan]:
+        """plan()의 비동기 버전 (AsyncAnthropic 사용)"""
+        plan_start = time.time()
+        cache_key, cached = self._cache_lookup(query)
+        if cached is not None:
+            return cached
+        try:
+            if not self.metadata_extractor._has_api_key():
+                return None
+            response = await self.metadata_extractor.async_client.messages.create(
+                **self.metadata_extractor._request_kwargs(self._build_prompt(query))
+            )
+            return self._cache_store(cache_key, self._parse_plan(response.content[0].text, plan_start))
+        except Exception as e:
+            logger.warning(f"[결합 플래너] 실패 -> 단계별 경로로 폴백: {e!r}")
+            return None
+
+    def _cache_lookup(self, query: str):
+        """캐시 조회 → (캐시 키, 캐시된 플랜 또는 None)"""
+        if self.cache is None:
+            return None, None
+        version = "/".join([
+            self.PROMPT_VERSION,
+            self.metadata_extractor.PROMPT_VERSION,
+            self.category_classifier.PROMPT_VERSION,
+        ])
+        payload = {"query": normalize_query(query), "categories": sorted(self.category_classifier.category_config.keys())}
+        cache_key = LLMStageCache.make_key(STAGE_PLAN, self.metadata_extractor.model, version, payload)
+        cached = self.cache.get(STAGE_PLAN, cache_key)
+        if cached is None:
+            return cache_key, None
+        logger.info("[결합 플래너] 캐시 적중")
+        return cache_key, (cached["metadata"], cached["classified"])
+
+    def _cache_store(self, cache_key: Optional[str], plan: QueryPlan) -> QueryPlan:
+        """검증을 통과한 플랜 캐시 저장"""
+        if self.cache is not None and cache_key and plan[0]:
+            self.cache.set(STAGE_PLAN, cache_key, {"metadata": plan[0], "classified": plan[1]})
+        return plan
+
+    def _build_prompt(self, query: str) -> str:
+        """메타데이터 추출 프롬프트 + 카테고리 분류 지시 + 결합 출력 형식"""
+        category_desc = "\n".join([
+            f"- {cat}: {info.get('description', ', '.join(info.get('keywords', [])))}"
+            for cat, info in self.category_classifier.category_config.items()
+        ])
+
+        return f"""{self.metadata_extractor._build_prompt(query)}
+
+=== 추가 작업: 카테고리 분류 ===
+
+추출한 메타데이터의 각 "키 이름"을 아래 카테고리 중 정확히 하나에 배정하세요.
+("인원수" 키는 검색 조건이 아니므로 분류하지 않습니다)
+
+{category_desc}
+
+=== 최종 출력 형식 (위의 출력 형식 대신 반드시 이 형식 사용) ===
+
+{{
+  "metadata": {{"지역": "서울", "연령대": "20대", "성별": "남자", "인원수": 10}},
+  "categories": {{"기본정보": ["지역", "연령대", "성별"]}}
+}}
+
+규칙:
+1. "metadata"에는 위 추출 규칙에 따른 메타데이터를 그대로 넣으세요.
+2. "categories"의 키는 반드시 위 카테고리 이름 중 하나여야 합니다.
+3. "categories"의 값에는 "metadata"에 있는 키 이름만 넣으세요 (값이나 문장 금지).
+
+JSON만 반환하세요:"""
+
+    def _parse_plan(self, text: str, plan_start: float) -> QueryPlan:
+        """LLM 출력 파싱 및 검증 (실패 시 PlanValidationError)"""
+        if "```json" in text:
+            text = text.split("```json", 1)[1].split("```", 1)[0]
+        elif "```" in text:
+            text = text.split("```", 1)[1].split("```", 1)[0]
+
+        try:
+            parsed = json.loads(text.strip())
+        except json.JSONDecodeError as e:
+            raise PlanValidationError(f"JSON 파싱 실패: {e}")
+
+        if not isinstance(parsed, dict):
+            raise PlanValidationError("최상위 JSON이 객체가 아님")
+        raw_metadata = parsed.get("metadata")
+        raw_categories = parsed.get("categories")
+        if not isinstance(raw_metadata, dict) or not isinstance(raw_categories, dict):
+            raise PlanValidationError("'metadata' 또는 'categories' 필드 누락")
+
+        metadata = self.metadata_extractor._normalize_metadata(raw_metadata)
+        classified = self._validate_categories(raw_categories, metadata)
+
+        plan_time = time.time() - plan_start
+        logger.info(f"[결합 플래너] 완료: {plan_time:.2f}초, 메타데이터: {metadata}, 분류: {classified}")
+        return metadata, classified
+
+    def _validate_categories(self, raw_categories: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, List[str]]:
+        """카테고리 이름을 category_config로 검증하고 {"카테고리명": ["키: 값", ...]}으로 매핑"""
+        category_config = self.category_classifier.category_config
+        unknown = [cat for cat in raw_categories if cat not in category_config]
+        if unknown:
+            raise PlanValidationError(f"category_config에 없는 카테고리: {unknown}")
+
+        # 인원수는 분류 대상이 아님 (파이프라인에서 top_k로 사용 후 제거)
+        search_metadata = {k: v for k, v in metadata.items() if k != "인원수"}
+
+        classified: Dict[str, List[str]] = {}
+        used_keys: set = set()
+        for cat, tokens in raw_categories.items():
+            if isinstance(tokens, str):
+                tokens = [tokens]
+            if not isinstance(tokens, list):
+                raise PlanValidationError(f"카테고리 '{cat}'의 값이 리스트가 아님")
+            for token in tokens:
+                meta_key = self.category_classifier._match_llm_token_to_key(str(token), search_metadata, used_keys)
+                if meta_key is None:
+                    continue
+                classified.setdefault(cat, []).append(f"{meta_key}: {search_metadata[meta_key]}")
+                used_keys.add(meta_key)
+
+        if search_metadata and not classified:
+            raise PlanValidationError("분류된 메타데이터 키가 없음")
+
+        unassigned = set(search_metadata) - used_keys
+        if unassigned:
+            logger.warning(f"[결합 플래너] 분류되지 않은 메타데이터 키: {sorted(unassigned)}")
+
+        return classified
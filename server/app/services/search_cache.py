@@ -0,0 +1,195 @@
+"""검색 결과 캐시 (LRU + TTL + 바이트 예산)"""
+import copy
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def canonicalize_filters(filters: Any) -> Any:
+    """
+    필터를 순서 무관한 정규 형태로 변환
+
+    - dict: 키 정렬 (json.dumps sort_keys로 처리)
+    - 스칼라 리스트 ($in 값 등): 정렬 + 중복 제거
+    - 빈 dict/list/None은 None으로 통일
+    """
+    if isinstance(filters, dict):
+        canonical = {str(k): canonicalize_filters(v) for k, v in filters.items()}
+        canonical = {k: v for k, v in canonical.items() if v is not None}
+        return canonical or None
+    if isinstance(filters, (list, tuple, set)):
+        items = [canonicalize_filters(v) for v in filters]
+        if all(isinstance(v, (str, int, float, bool)) for v in items):
+            return sorted(set(items), key=lambda v: (type(v).__name__, v)) or None
+        return items or None
+    return filters
+
+
+def make_search_cache_key(query: str, top_k: Optional[int], external_filters: Optional[Dict[str, Any]]) -> str:
+    """캐시 키 생성: 정규화된 쿼리 | top_k | 정규화된 Pinecone 필터(JSON)"""
+    normalized_query = re.sub(r"\s+", " ", (query or "").strip()).lower()
+    filters_json = json.dumps(canonicalize_filters(external_filters), ensure_ascii=False, sort_keys=True)
+    return f"{normalized_query}|{top_k}|{filters_json}"
+
+
+class SearchResultCache:
+    """
+    검색 결과 캐시
+
+    - 값: 파이프라인 결과 전체 ({"mb_sns", "scores"}와 relaxations/total/exact 등 부가 필드, 유사도 순서/점수 보존)
+    - 최근 사용 순서(LRU)로 제거, TTL 초과 시 만료
+    - 항목 수(max_entries)와 직렬화 크기 합(max_bytes) 두 기준으로 용량 제한
+    """
+
+    def __init__(self, max_entries: int = 100, ttl_seconds: float = 600.0, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (초, 0 이하면 만료 없음)
+            max_bytes: 저장된 결과의 직렬화 크기 합 상한
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_bytes = max(1, int(max_bytes))
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (미스/만료 시 None). 반환값은 복사본"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            entry["hits"] += 1
+            self.hits += 1
+            return self._copy_result(entry["result"])
+
+    def set(self, key: str, result: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        검색 결과 저장
+
+        Args:
+            key: make_search_cache_key()로 만든 키
+            result: {"mb_sns": [...], "scores": {...}, ...} (relaxations/total/exact 등 부가 필드도 그대로 보존)
+            meta: 조회용 부가 정보 (query, top_k, filters 등)
+
+        Returns:
+            저장 여부 (단일 결과가 바이트 예산보다 크면 저장하지 않음)
+        """
+        stored = self._copy_result(result)
+        stored.setdefault("mb_sns", [])
+        stored.setdefault("scores", {})
+        size = self._estimate_bytes(stored)
+        if size > self.max_bytes:
+            logger.warning(f"[Cache] 결과 크기 {size}B가 예산 {self.max_bytes}B를 초과하여 캐시하지 않음")
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = {
+                "result": stored,
+                "bytes": size,
+                "created_at": time.time(),
+                "timestamp": datetime.now().isoformat(),
+                "hits": 0,
+                "meta": meta or {},
+            }
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+        return True
+
+    def clear(self) -> int:
+        """캐시 비우기. 삭제된 항목 수 반환"""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return removed
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 지표 (hit rate, 용량 사용률 등)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cache_size": len(self._entries),
+                "cache_max_size": self.max_entries,
+                "cache_usage_percent": round(len(self._entries) / self.max_entries * 100, 2),
+                "cache_bytes": self._bytes,
+                "cache_max_bytes": self.max_bytes,
+                "cache_bytes_usage_percent": round(self._bytes / self.max_bytes * 100, 2),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+            }
+
+    def items(self) -> List[Dict[str, Any]]:
+        """캐시 항목 요약 (최근 사용 순)"""
+        with self._lock:
+            summary = []
+            for key, entry in reversed(self._entries.items()):
+                summary.append({
+                    "key": key,
+                    **entry["meta"],
+                    "result_count": len(entry["result"]["mb_sns"]),
+                    "bytes": entry["bytes"],
+                    "hits": entry["hits"],
+                    "timestamp": entry["timestamp"],
+                    "expired": self._is_expired(entry),
+                })
+            return summary
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        return self.ttl_seconds > 0 and time.time() - entry["created_at"] > self.ttl_seconds
+
+    def _remove(self, key: str) -> None:
+        """항목 제거 (락 보유 상태에서 호출)"""
+        entry = self._entries.pop(key)
+        self._bytes -= entry["bytes"]
+
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """결과 복사 (mb_sns/scores는 얕은 복사, 나머지 부가 필드는 깊은 복사)"""
+        copied = {k: copy.deepcopy(v) for k, v in result.items() if k not in ("mb_sns", "scores")}
+        if "mb_sns" in result:
+            copied["mb_sns"] = list(result["mb_sns"])
+        if "scores" in result:
+            copied["scores"] = dict(result["scores"])
+        return copied
+
+    @staticmethod
+    def _estimate_bytes(result: Dict[str, Any]) -> int:
+        """결과 크기 추정 (부가 필드 포함 JSON 직렬화 기준)"""
+        return len(json.dumps(result, ensure_ascii=False, default=str).encode("utf-8"))
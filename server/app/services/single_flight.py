@@ -0,0 +1,75 @@
+"""동일 요청 동시 실행 병합 (single-flight)"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 비동기 작업을 한 번만 실행하고 결과를 공유
+
+    - 첫 요청이 태스크를 만들고, 이후 요청은 같은 태스크를 기다림
+    - 기다리는 요청 하나가 취소되어도 공유 태스크는 계속 실행 (asyncio.shield)
+    - 기다리는 요청이 모두 취소되면 공유 태스크도 취소 (불필요한 LLM/Pinecone 호출 중단), 다음 동일 요청은 새로 실행
+    - 작업이 끝나면 키를 제거하므로 결과 캐싱은 하지 않음 (캐시는 호출 측 책임)
+    """
+
+    def __init__(self, name: str = "single-flight"):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self.calls = 0        # do() 호출 수
+        self.executions = 0   # 실제 실행 수
+        self.coalesced = 0    # 진행 중 작업에 합류한 수
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key로 작업 실행 (진행 중이면 합류)
+
+        Args:
+            key: 요청 정규 키
+            func: 실제 작업 코루틴을 만드는 함수 (합류 시 호출되지 않음)
+        """
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda _t, k=key: self._forget(k, _t))
+        else:
+            self.coalesced += 1
+            logger.info(f"[{self.name}] 진행 중인 동일 요청에 합류: {key[:80]}")
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # 이 요청만 취소 → 남은 대기자가 없을 때만 공유 작업 취소
+            if not task.done() and self._inflight.get(key) is task:
+                self._waiters[key] -= 1
+                if self._waiters[key] <= 0:
+                    logger.info(f"[{self.name}] 대기 요청이 모두 취소되어 작업 취소: {key[:80]}")
+                    # 취소 완료 콜백 전에 들어온 동일 요청이 죽어가는 작업에 합류하지 않도록 즉시 키 제거
+                    self._forget(key, task)
+                    task.cancel()
+            raise
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        """완료된 작업 제거"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 지표 (coalescing_ratio = 합류 수 / 전체 호출 수)"""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalescing_ratio": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+            "inflight": len(self._inflight),
+        }
@@ -1,21 +1,29 @@
 """카테고리별 텍스트 생성기"""
-from typing import Dict, List
-from anthropic import Anthropic
+from typing import Dict, List, Any, Optional
+from anthropic import Anthropic, AsyncAnthropic
 import logging
 
+from .llm_cache import LLMStageCache, STAGE_TEXT
+
 logger = logging.getLogger(__name__)
 
 
 class CategoryTextGenerator:
     """카테고리별 메타데이터를 자연어 텍스트로 변환 (LLM 사용)"""
 
-    def __init__(self, api_key: str):
+    # 프롬프트 템플릿/카테고리 지침 변경 시 올려서 LLM 캐시 무효화
+    PROMPT_VERSION = "v1"
+
+    def __init__(self, api_key: str, cache: Optional[LLMStageCache] = None):
         """
         Args:
             api_key: Anthropic API 키
+            cache: LLM 단계 결과 캐시 (None이면 캐시 미사용)
         """
         self.client = Anthropic(api_key=api_key)
+        self.async_client = AsyncAnthropic(api_key=api_key)  # asearch 경로용 비동기 클라이언트
         self.model = "claude-haiku-4-5-20251001"  # ⭐ haiku 사용
+        self.cache = cache
 
         # 🔹 공통 프롬프트 템플릿 (하나의 통합 구조)
         self.master_template = """
@@ -820,74 +828,151 @@ IT: 노트북, 태블릿PC, 데스크탑, 무선 이어폰, 스마트 워치, 
             logger.warning(f"[WARN] metadata_items가 비어있음 ({category})")
             return ""
 
-        metadata_dict = {}
-        for item in metadata_items:
-            if ": " in item:
-                key, value = item.split(": ", 1)
-                metadata_dict[key] = value
+        metadata_dict = self._parse_items(metadata_items)
+        cache_key, cached = self._cache_lookup(category, metadata_dict)
+        if cached is not None:
+            return cached
         
         try:
             text = self._generate_text_with_llm(category, metadata_dict)
-            if text and text.strip():
-                logger.info(f"[{category}] {text[:80]}...")
-                return text
-            else:
-                # 빈 텍스트 반환 시 폴백
-                fallback_text = ", ".join(metadata_items)
-                logger.warning(f"[WARN] LLM이 빈 텍스트 반환 ({category}), 폴백 사용: {fallback_text}")
-                return fallback_text
+            return self._cache_store(cache_key, self._finalize_text(category, text, metadata_items), metadata_items)
         except Exception as e:
             # 예외 발생 시 폴백
             fallback_text = ", ".join(metadata_items)
             logger.error(f"[ERROR] 텍스트 생성 실패 ({category}): {e}, 폴백 사용: {fallback_text}", exc_info=True)
             return fallback_text
 
+    async def agenerate(self, category: str, metadata_items: List[str], full_metadata_dict: Dict[str, str] = None) -> str:
+        """generate()의 비동기 버전 (AsyncAnthropic 사용)"""
+        if not metadata_items:
+            logger.warning(f"[WARN] metadata_items가 비어있음 ({category})")
+            return ""
+
+        metadata_dict = self._parse_items(metadata_items)
+        cache_key, cached = self._cache_lookup(category, metadata_dict)
+        if cached is not None:
+            return cached
+
+        try:
+            text = await self._agenerate_text_with_llm(category, metadata_dict)
+            return self._cache_store(cache_key, self._finalize_text(category, text, metadata_items), metadata_items)
+        except Exception as e:
+            fallback_text = ", ".join(metadata_items)
+            logger.error(f"[ERROR] 텍스트 생성 실패 ({category}): {e}, 폴백 사용: {fallback_text}", exc_info=True)
+            return fallback_text
+
+    def _cache_lookup(self, category: str, metadata_dict: Dict[str, str]):
+        """캐시 조회 → (캐시 키, 캐시된 텍스트 또는 None)"""
+        if self.cache is None:
+            return None, None
+        payload = {"category": category, "metadata": metadata_dict}
+        cache_key = LLMStageCache.make_key(STAGE_TEXT, self.model, self.PROMPT_VERSION, payload)
+        cached = self.cache.get(STAGE_TEXT, cache_key)
+        if cached is not None:
+            logger.info(f"[{category}] 캐시 적중: {cached[:80]}...")
+        return cache_key, cached
+
+    def _cache_store(self, cache_key: Optional[str], text: str, metadata_items: List[str]) -> str:
+        """생성 텍스트 캐시 저장 (LLM 실패로 메타데이터 나열 폴백이 반환된 경우는 저장하지 않음)"""
+        if self.cache is None or not cache_key or not text:
+            return text
+        fallback_texts = {
+            ", ".join(metadata_items),
+            ", ".join([f"{k}: {v}" for k, v in self._parse_items(metadata_items).items()]),
+        }
+        if text not in fallback_texts:
+            self.cache.set(STAGE_TEXT, cache_key, text)
+        return text
+
+    def _parse_items(self, metadata_items: List[str]) -> Dict[str, str]:
+        """["키: 값", ...] 형식을 딕셔너리로 변환"""
+        metadata_dict = {}
+        for item in metadata_items:
+            if ": " in item:
+                key, value = item.split(": ", 1)
+                metadata_dict[key] = value
+        return metadata_dict
+
+    def _finalize_text(self, category: str, text: str, metadata_items: List[str]) -> str:
+        """생성 결과 확인 (빈 텍스트면 메타데이터 나열로 폴백)"""
+        if text and text.strip():
+            logger.info(f"[{category}] {text[:80]}...")
+            return text
+
+        # 빈 텍스트 반환 시 폴백
+        fallback_text = ", ".join(metadata_items)
+        logger.warning(f"[WARN] LLM이 빈 텍스트 반환 ({category}), 폴백 사용: {fallback_text}")
+        return fallback_text
+
+    def _build_prompt(self, category: str, metadata_dict: Dict[str, str]) -> str:
+        """카테고리 지침 + 메타데이터로 LLM 프롬프트 생성"""
+        metadata_str = ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
+        instruction = self.category_instructions.get(category, self.default_instruction)
+
+        # category_instruction에 metadata를 포맷팅
+        # ⭐ {값} 같은 예시 템플릿을 이스케이프하기 위해 먼저 {{ }} 처리
+        # {값} → {{값}}으로 변환하여 .format()이 무시하도록 함
+        if "{metadata}" in instruction:
+            # 먼저 {값} 같은 예시를 이스케이프
+            instruction_escaped = instruction.replace("{값}", "{{값}}")
+            instruction = instruction_escaped.format(metadata=metadata_str)
+            # 다시 원래대로 복원 (LLM에게는 {값}으로 보여야 함)
+            instruction = instruction.replace("{{값}}", "{값}")
+
+        return self.master_template.format(
+            metadata=metadata_str,
+            category_instruction=instruction.strip()
+        )
+
+    def _request_kwargs(self, prompt: str) -> Dict[str, Any]:
+        """텍스트 생성 LLM 요청 파라미터 (동기/비동기 공통)"""
+        return {
+            "model": self.model,
+            "max_tokens": 256,
+            "temperature": 0.3,
+            "messages": [{"role": "user", "content": prompt}],
+            "timeout": 30.0  # 30초 타임아웃
+        }
+
+    def _extract_text(self, response, category: str, metadata_dict: Dict[str, str]) -> str:
+        """LLM 응답에서 문장 추출"""
+        # ⭐ 응답 내용 안전하게 추출
+        if not response.content or len(response.content) == 0:
+            logger.warning(f"[WARN] LLM 응답이 비어있음 (category: {category})")
+            return ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
+        
+        # 첫 번째 content 블록의 text 추출
+        first_content = response.content[0]
+        if hasattr(first_content, 'text'):
+            text = first_content.text.strip()
+        elif isinstance(first_content, str):
+            text = first_content.strip()
+        else:
+            logger.warning(f"[WARN] LLM 응답 형식이 예상과 다름 (category: {category}, type: {type(first_content)})")
+            return ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
+        
+        text = text.replace('"', '').replace("'", '').replace('```', '').strip()
+        return text
+
     def _generate_text_with_llm(self, category: str, metadata_dict: Dict[str, str]) -> str:
         """LLM을 사용하여 자연스러운 문장 생성"""
         try:
-            metadata_str = ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
-            instruction = self.category_instructions.get(category, self.default_instruction)
-
-            # category_instruction에 metadata를 포맷팅
-            # ⭐ {값} 같은 예시 템플릿을 이스케이프하기 위해 먼저 {{ }} 처리
-            # {값} → {{값}}으로 변환하여 .format()이 무시하도록 함
-            if "{metadata}" in instruction:
-                # 먼저 {값} 같은 예시를 이스케이프
-                instruction_escaped = instruction.replace("{값}", "{{값}}")
-                instruction = instruction_escaped.format(metadata=metadata_str)
-                # 다시 원래대로 복원 (LLM에게는 {값}으로 보여야 함)
-                instruction = instruction.replace("{{값}}", "{값}")
-
-            prompt = self.master_template.format(
-                metadata=metadata_str,
-                category_instruction=instruction.strip()
-            )
-
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=256,
-                temperature=0.3,
-                messages=[{"role": "user", "content": prompt}],
-                timeout=30.0  # 30초 타임아웃
-            )
-
-            # ⭐ 응답 내용 안전하게 추출
-            if not response.content or len(response.content) == 0:
-                logger.warning(f"[WARN] LLM 응답이 비어있음 (category: {category})")
-                return ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
-            
-            # 첫 번째 content 블록의 text 추출
-            first_content = response.content[0]
-            if hasattr(first_content, 'text'):
-                text = first_content.text.strip()
-            elif isinstance(first_content, str):
-                text = first_content.strip()
-            else:
-                logger.warning(f"[WARN] LLM 응답 형식이 예상과 다름 (category: {category}, type: {type(first_content)})")
-                return ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
-            
-            text = text.replace('"', '').replace("'", '').replace('```', '').strip()
-            return text
+            prompt = self._build_prompt(category, metadata_dict)
+            response = self.client.messages.create(**self._request_kwargs(prompt))
+            return self._extract_text(response, category, metadata_dict)
+        except KeyError as e:
+            logger.error(f"[ERROR] LLM 생성 실패 (KeyError): {e}, category: {category}, metadata: {metadata_dict}")
+            return ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
+        except Exception as e:
+            logger.error(f"[ERROR] LLM 생성 실패: {e}, category: {category}, metadata: {metadata_dict}")
+            return ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
+
+    async def _agenerate_text_with_llm(self, category: str, metadata_dict: Dict[str, str]) -> str:
+        """_generate_text_with_llm()의 비동기 버전"""
+        try:
+            prompt = self._build_prompt(category, metadata_dict)
+            response = await self.async_client.messages.create(**self._request_kwargs(prompt))
+            return self._extract_text(response, category, metadata_dict)
         except KeyError as e:
             logger.error(f"[ERROR] LLM 생성 실패 (KeyError): {e}, category: {category}, metadata: {metadata_dict}")
             return ", ".join([f"{k}: {v}" for k, v in metadata_dict.items()])
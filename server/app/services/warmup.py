@@ -0,0 +1,189 @@
+"""startup 워밍업 (무거운 컴포넌트를 lifespan에서 미리 로드하고 컴포넌트별 준비 상태 기록)"""
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Dict, Any, Iterable
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 컴포넌트 상태
+WARMUP_PENDING = "pending"
+WARMUP_RUNNING = "running"
+WARMUP_READY = "ready"
+WARMUP_FAILED = "failed"
+WARMUP_SKIPPED = "skipped"
+
+# 컴포넌트별 상태 ({"status", "seconds", "error"}) - /health에서 조회
+_warmup_state: Dict[str, Dict[str, Any]] = {}
+
+
+async def _warm_pinecone() -> bool:
+    """공유 Pinecone 인덱스 제공자 (연결 풀 생성 + 인덱스 통계/차원 조회)"""
+    from app.core.config import PINECONE_SEARCH_ENABLED, PINECONE_API_KEY
+    if not (PINECONE_SEARCH_ENABLED and PINECONE_API_KEY):
+        return False
+    from app.services.pinecone_provider import get_pinecone_provider
+    await asyncio.to_thread(get_pinecone_provider().warm)
+    return True
+
+
+async def _warm_db() -> bool:
+    """공유 DB 엔진 (서버 이벤트 루프에 연결 풀 바인딩 + 첫 연결 생성)"""
+    from sqlalchemy import text
+    from app.db.engine_registry import get_async_engine
+    engine = get_async_engine()
+    if engine is None:
+        return False
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return True
+
+
+async def _warm_category_config() -> bool:
+    """category_config.json (lru_cache)"""
+    from app.core.config import load_category_config
+    await asyncio.to_thread(load_category_config)
+    return True
+
+
+async def _warm_pipeline() -> bool:
+    """검색 파이프라인 싱글톤 (LLM/임베딩 SDK 클라이언트, 검색기 생성)"""
+    from app.core.config import PINECONE_SEARCH_ENABLED, PINECONE_API_KEY
+    if not (PINECONE_SEARCH_ENABLED and PINECONE_API_KEY):
+        return False
+    from app.api.search import _get_pipeline
+    await asyncio.to_thread(_get_pipeline)
+    return True
+
+
+async def _warm_merged_data() -> bool:
+    """merged.panel_data 메모리 캐시 (패널 상세/로컬 필터 인덱스/레지스트리 공용)"""
+    from app.utils.merged_data_loader import load_merged_data_from_db
+    await load_merged_data_from_db()
+    return True
+
+
+async def _warm_metadata_index() -> bool:
+    """필터만 검색용 로컬 메타데이터 인덱스 (merged 데이터 캐시를 먼저 채운 뒤 컬럼 생성)"""
+    from app.services.panel_metadata_index import get_panel_metadata_index
+    index = get_panel_metadata_index()
+    if index is None:
+        return False
+    # 동시에 실행 중인 merged_data 워밍업과는 로더의 비동기 락으로 한 번만 로드
+    from app.utils.merged_data_loader import load_merged_data_from_db
+    await load_merged_data_from_db()
+    if not await asyncio.to_thread(index.ensure_loaded):
+        raise RuntimeError("로컬 필터 인덱스를 만들 패널 데이터가 없습니다")
+    return True
+
+
+async def _warm_panel_id_registry() -> bool:
+    """패널 ID(mb_sn) ↔ int32 레지스트리 (memmap 저장소가 없으면 merged.panel_data mb_sn으로 생성)"""
+    from app.core.config import PANEL_ID_REGISTRY_PRELOAD, PANEL_ID_REGISTRY_PATH
+    from app.services.panel_id_registry import init_panel_id_registry
+
+    mb_sns = []
+    if PANEL_ID_REGISTRY_PRELOAD and not (PANEL_ID_REGISTRY_PATH and os.path.exists(PANEL_ID_REGISTRY_PATH)):
+        from app.utils.merged_data_loader import load_merged_data_from_db
+        mb_sns = list((await load_merged_data_from_db()).keys())
+    await asyncio.to_thread(init_panel_id_registry, mb_sns)
+    return True
+
+
+async def _warm_precomputed_umap() -> bool:
+    """Precomputed UMAP 뷰 1회 실행 (pandas/DB 드라이버 로드, 세션 ID·좌표 조회 경로 준비)"""
+    from app.api.precomputed import get_precomputed_umap
+    # 라우트 함수를 직접 호출하므로 Query/Header 기본값 대신 명시적으로 None 전달 (기본 json 형식으로 캐시 채움)
+    await get_precomputed_umap(point_format=None, accept=None)
+    return True
+
+
+async def _warm_ml_libs() -> bool:
+    """클러스터링 의존 라이브러리 (sklearn/scipy/hdbscan, app.clustering 하위 모듈 - 첫 클러스터링 요청의 import 지연 제거)"""
+    import importlib
+
+    def _import_all():
+        for module_name in (
+            "app.clustering.integrated_pipeline",
+            "app.clustering.data_preprocessor",
+            "app.clustering.algorithms.hdbscan",
+            "app.clustering.compare",
+            "joblib",
+        ):
+            importlib.import_module(module_name)
+
+    await asyncio.to_thread(_import_all)
+    return True
+
+
+# 컴포넌트 이름 → 워밍업 함수 (True: 준비 완료, False: 설정상 건너뜀)
+WARMUP_COMPONENTS: Dict[str, Callable[[], Awaitable[bool]]] = {
+    "db": _warm_db,
+    "pinecone": _warm_pinecone,
+    "category_config": _warm_category_config,
+    "pipeline": _warm_pipeline,
+    "merged_data": _warm_merged_data,
+    "metadata_index": _warm_metadata_index,
+    "panel_id_registry": _warm_panel_id_registry,
+    "precomputed_umap": _warm_precomputed_umap,
+    "ml_libs": _warm_ml_libs,
+}
+
+
+async def _run_component(name: str, timeout: float) -> None:
+    state = _warmup_state[name]
+    state["status"] = WARMUP_RUNNING
+    component_start = time.time()
+    try:
+        warmed = await asyncio.wait_for(WARMUP_COMPONENTS[name](), timeout=timeout or None)
+        state["status"] = WARMUP_READY if warmed else WARMUP_SKIPPED
+    except asyncio.TimeoutError:
+        state["status"] = WARMUP_FAILED
+        state["error"] = f"타임아웃 ({timeout:g}초)"
+    except Exception as e:
+        state["status"] = WARMUP_FAILED
+        state["error"] = f"{type(e).__name__}: {e}"
+    state["seconds"] = round(time.time() - component_start, 3)
+
+    if state["status"] == WARMUP_FAILED:
+        logger.warning(f"[Startup] 워밍업 실패: {name} ({state['error']}, 첫 요청 시 로드)")
+    else:
+        logger.info(f"[Startup] 워밍업 {state['status']}: {name} ({state['seconds']:.2f}초)")
+
+
+async def run_warmup(components: Iterable[str], timeout: float = 120.0) -> Dict[str, Dict[str, Any]]:
+    """
+    지정한 컴포넌트를 동시에 워밍업 (실패해도 예외를 올리지 않고 상태만 기록)
+
+    Args:
+        components: WARMUP_COMPONENTS 이름 목록 (알 수 없는 이름은 무시)
+        timeout: 컴포넌트별 타임아웃 (초, 0이면 무제한)
+
+    Returns:
+        컴포넌트별 상태
+    """
+    names = []
+    for name in components:
+        if name not in WARMUP_COMPONENTS:
+            logger.warning(f"[Startup] 알 수 없는 워밍업 컴포넌트 무시: {name}")
+        elif name not in names:
+            names.append(name)
+
+    for name in names:
+        _warmup_state[name] = {"status": WARMUP_PENDING, "seconds": None, "error": None}
+
+    warmup_start = time.time()
+    await asyncio.gather(*(_run_component(name, timeout) for name in names))
+    logger.info(f"[Startup] 워밍업 완료: {len(names)}개 컴포넌트, {time.time() - warmup_start:.2f}초")
+    return get_warmup_status()
+
+
+def get_warmup_status() -> Dict[str, Dict[str, Any]]:
+    """컴포넌트별 워밍업 상태 (복사본)"""
+    return {name: dict(state) for name, state in _warmup_state.items()}
+
+
+def is_warm() -> bool:
+    """워밍업 대상 컴포넌트가 모두 끝났는지 여부 (실패/건너뜀 포함, 진행 중이면 False)"""
+    return all(state["status"] not in (WARMUP_PENDING, WARMUP_RUNNING) for state in _warmup_state.values())
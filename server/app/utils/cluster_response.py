@@ -0,0 +1,210 @@
+"""클러스터링 응답 빌더 (열 배열 기반, 행 단위 DataFrame 순회 없음)"""
+import json
+import random
+import struct
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+
+def sample_indices(n: int, sample: Optional[int], seed: int = 42) -> Optional[np.ndarray]:
+    """
+    재현 가능한 샘플 인덱스 (random.seed(seed) + random.sample(목록, sample)과 같은 선택/순서)
+
+    Returns:
+        인덱스 배열 또는 None (샘플링 불필요)
+    """
+    if sample is None or sample <= 0 or sample >= n:
+        return None
+    return np.asarray(random.Random(seed).sample(range(n), sample), dtype=np.int64)
+
+
+def umap_point_records(
+    panel_ids: np.ndarray,
+    umap_x: np.ndarray,
+    umap_y: np.ndarray,
+    clusters: np.ndarray
+) -> List[Dict[str, Any]]:
+    """
+    UMAP 포인트 목록 [{x, y, cluster, panelId}, ...]
+
+    ⭐ 열마다 tolist()로 한 번에 Python 값으로 변환한 뒤 zip (행마다 Series를 만들지 않음)
+    """
+    return [
+        {'x': x, 'y': y, 'cluster': cluster, 'panelId': panel_id}
+        for x, y, cluster, panel_id in zip(
+            np.asarray(umap_x, dtype=np.float64).tolist(),
+            np.asarray(umap_y, dtype=np.float64).tolist(),
+            np.asarray(clusters, dtype=np.int64).tolist(),
+            np.asarray(panel_ids).astype(str).tolist()
+        )
+    ]
+
+
+def coordinate_pairs(umap_x: np.ndarray, umap_y: np.ndarray) -> List[List[float]]:
+    """UMAP 좌표 [[x, y], ...]"""
+    return np.column_stack((
+        np.asarray(umap_x, dtype=np.float64),
+        np.asarray(umap_y, dtype=np.float64)
+    )).tolist()
+
+
+def cluster_size_list(clusters: np.ndarray, include_noise: bool = False) -> List[Dict[str, Any]]:
+    """
+    클러스터별 크기 목록 [{id, size, percentage}, ...] (클러스터 ID 순, percentage는 전체 포인트 대비)
+
+    Args:
+        clusters: 포인트별 클러스터 라벨
+        include_noise: True면 노이즈(-1)도 포함
+    """
+    clusters = np.asarray(clusters, dtype=np.int64)
+    total = len(clusters)
+    if total == 0:
+        return []
+
+    cluster_ids, counts = np.unique(clusters, return_counts=True)
+    return [
+        {'id': cluster_id, 'size': count, 'percentage': count / total * 100}
+        for cluster_id, count in zip(cluster_ids.tolist(), counts.tolist())
+        if include_noise or cluster_id != -1
+    ]
+
+
+def cluster_stats(clusters: np.ndarray, is_search: np.ndarray) -> Dict[int, Dict[str, Any]]:
+    """
+    클러스터별 통계 {cluster_id: {size, percentage, search_count, search_percentage}}
+
+    클러스터마다 전체 배열을 다시 훑지 않고 np.unique(return_inverse) + np.bincount 한 번으로 집계
+
+    Args:
+        clusters: 포인트별 클러스터 라벨 (노이즈 -1 포함)
+        is_search: 포인트별 검색 결과 여부
+    """
+    clusters = np.asarray(clusters, dtype=np.int64)
+    total = len(clusters)
+    if total == 0:
+        return {}
+
+    cluster_ids, inverse = np.unique(clusters, return_inverse=True)
+    sizes = np.bincount(inverse, minlength=len(cluster_ids))
+    search_counts = np.bincount(
+        inverse,
+        weights=np.asarray(is_search, dtype=np.float64),
+        minlength=len(cluster_ids)
+    ).astype(np.int64)
+
+    return {
+        cluster_id: {
+            'size': size,
+            'percentage': size / total * 100,
+            'search_count': search_count,
+            'search_percentage': search_count / max(1, size) * 100
+        }
+        for cluster_id, size, search_count in zip(cluster_ids.tolist(), sizes.tolist(), search_counts.tolist())
+    }
+
+
+# UMAP 포인트 전송 형식
+# - json: 포인트별 객체 [{x, y, cluster, panelId}, ...] (기본, 기존 클라이언트 호환)
+# - columnar: 열별 배열 {x: [...], y: [...], cluster: [...], panel_ids: [...]}
+# - binary: 아래 레이아웃의 float32/int32 바이너리 (패널 ID는 /api/precomputed/panel-ids 사전 참조)
+POINT_FORMATS = ("json", "columnar", "binary")
+UMAP_BINARY_MEDIA_TYPE = "application/octet-stream"
+
+# 바이너리 레이아웃 (little-endian)
+#   magic b"UMAP" | uint32 version | uint32 header_len | header JSON (UTF-8, 4바이트 정렬 공백 패딩)
+#   float32 x[n] | float32 y[n] | int32 cluster[n] | (header.panel_index일 때) int32 panel_index[n]
+UMAP_BINARY_MAGIC = b"UMAP"
+UMAP_BINARY_VERSION = 1
+_UMAP_BINARY_PREFIX = struct.Struct("<4sII")
+
+
+def resolve_point_format(format_param: Optional[str], accept: Optional[str]) -> str:
+    """
+    응답 형식 결정 (쿼리 파라미터 우선, 없으면 Accept 헤더)
+
+    Raises:
+        ValueError: 지원하지 않는 format 값
+    """
+    if format_param:
+        point_format = format_param.strip().lower()
+        if point_format not in POINT_FORMATS:
+            raise ValueError(f"지원하지 않는 format입니다: {format_param} (가능: {', '.join(POINT_FORMATS)})")
+        return point_format
+    if accept and UMAP_BINARY_MEDIA_TYPE in accept.lower():
+        return "binary"
+    return "json"
+
+
+def umap_point_columns(
+    panel_ids: np.ndarray,
+    umap_x: np.ndarray,
+    umap_y: np.ndarray,
+    clusters: np.ndarray,
+    cluster_key: str = 'cluster'
+) -> Dict[str, List[Any]]:
+    """UMAP 포인트 열별 배열 {x, y, <cluster_key>, panel_ids} (columnar 형식)"""
+    return {
+        'x': np.asarray(umap_x, dtype=np.float64).tolist(),
+        'y': np.asarray(umap_y, dtype=np.float64).tolist(),
+        cluster_key: np.asarray(clusters, dtype=np.int64).tolist(),
+        'panel_ids': np.asarray(panel_ids).astype(str).tolist(),
+    }
+
+
+def encode_umap_binary(
+    header: Dict[str, Any],
+    umap_x: np.ndarray,
+    umap_y: np.ndarray,
+    clusters: np.ndarray,
+    panel_index: Optional[np.ndarray] = None
+) -> bytes:
+    """
+    UMAP 포인트를 바이너리로 인코딩 (좌표 float32, 클러스터/패널 인덱스 int32)
+
+    Args:
+        header: 포인트 외 응답 정보 (클러스터 목록, 메타데이터 등), n/columns/panel_index는 자동 설정
+        panel_index: 패널 ID 사전 내 위치 (None이면 사전 순서와 같음)
+    """
+    n = len(umap_x)
+    columns = [
+        np.asarray(umap_x, dtype='<f4'),
+        np.asarray(umap_y, dtype='<f4'),
+        np.asarray(clusters, dtype='<i4'),
+    ]
+    column_names = ['x:float32', 'y:float32', 'cluster:int32']
+    if panel_index is not None:
+        columns.append(np.asarray(panel_index, dtype='<i4'))
+        column_names.append('panel_index:int32')
+
+    header_bytes = json.dumps(
+        {**header, 'n': n, 'columns': column_names, 'panel_index': panel_index is not None},
+        ensure_ascii=False,
+        separators=(',', ':')
+    ).encode('utf-8')
+    header_bytes += b' ' * (-len(header_bytes) % 4)  # 열 배열을 4바이트 경계에서 시작 (클라이언트 TypedArray 뷰)
+
+    return b''.join([
+        _UMAP_BINARY_PREFIX.pack(UMAP_BINARY_MAGIC, UMAP_BINARY_VERSION, len(header_bytes)),
+        header_bytes,
+        *(column.tobytes() for column in columns),
+    ])
+
+
+def decode_umap_binary(payload: bytes) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """encode_umap_binary의 역변환 (스크립트/테스트용) → (header, {열 이름: 배열})"""
+    magic, version, header_len = _UMAP_BINARY_PREFIX.unpack_from(payload, 0)
+    if magic != UMAP_BINARY_MAGIC or version != UMAP_BINARY_VERSION:
+        raise ValueError(f"UMAP 바이너리 형식이 아닙니다: magic={magic!r}, version={version}")
+
+    offset = _UMAP_BINARY_PREFIX.size
+    header = json.loads(payload[offset:offset + header_len])
+    offset += header_len
+
+    n = header['n']
+    arrays = {}
+    for column in header['columns']:
+        name, dtype = column.split(':')
+        arrays[name] = np.frombuffer(payload, dtype='<f4' if dtype == 'float32' else '<i4', count=n, offset=offset)
+        offset += 4 * n
+    return header, arrays
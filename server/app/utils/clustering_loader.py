@@ -1,16 +1,18 @@
 """클러스터링 데이터 NeonDB 로더"""
-import os
 import sys
 import json
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from pathlib import Path
-import pandas as pd
 import numpy as np
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from dotenv import load_dotenv
+
+from app.db.engine_registry import get_async_engine, get_async_sessionmaker
+
+if TYPE_CHECKING:
+    import pandas as pd  # 런타임에는 DataFrame을 만드는 로더 안에서 import (서버 시작 시간 단축)
 
 logger = logging.getLogger(__name__)
 
@@ -27,22 +29,46 @@ def _is_valid_uuid(session_id: str) -> bool:
 
 
 def _get_db_session():
-    """NeonDB 세션 생성 (check_clustering_db.py와 동일한 방식)"""
-    load_dotenv(override=True)
-    uri = os.getenv("ASYNC_DATABASE_URI")
-    if not uri:
+    """NeonDB 공유 엔진/세션 팩토리 (engine_registry 연결 풀 재사용, 호출 측에서 dispose하지 않음)"""
+    engine = get_async_engine()
+    if engine is None:
         logger.error("[Clustering Loader] ASYNC_DATABASE_URI 환경변수가 설정되지 않았습니다.")
         return None, None
-    
-    # postgresql://를 postgresql+psycopg://로 변환
-    if uri.startswith("postgresql://"):
-        uri = uri.replace("postgresql://", "postgresql+psycopg://", 1)
-    elif "postgresql+asyncpg" in uri:
-        uri = uri.replace("postgresql+asyncpg", "postgresql+psycopg", 1)
-    
-    engine = create_async_engine(uri, echo=False, pool_pre_ping=True)
-    SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
-    return engine, SessionLocal
+    return engine, get_async_sessionmaker()
+
+
+# clustering_sessions 조회 컬럼 (세션 로드/Precomputed 번들 공용)
+_SESSION_COLUMNS = """
+    session_id, created_at, updated_at,
+    n_samples, n_clusters, algorithm, optimal_k, strategy,
+    silhouette_score, davies_bouldin_score, calinski_harabasz_score,
+    request_params, feature_types, algorithm_info,
+    filter_info, processor_info, is_precomputed, precomputed_name
+"""
+
+
+def _session_row_to_dict(row) -> Dict[str, Any]:
+    """clustering_sessions 행 → 세션 정보 딕셔너리 (JSONB 컬럼은 dict로 파싱)"""
+    return {
+        'session_id': str(row.session_id),
+        'created_at': row.created_at.isoformat() if row.created_at else None,
+        'updated_at': row.updated_at.isoformat() if row.updated_at else None,
+        'n_samples': row.n_samples,
+        'n_clusters': row.n_clusters,
+        'algorithm': row.algorithm,
+        'optimal_k': row.optimal_k,
+        'strategy': row.strategy,
+        'silhouette_score': float(row.silhouette_score) if row.silhouette_score is not None else None,
+        'davies_bouldin_score': float(row.davies_bouldin_score) if row.davies_bouldin_score is not None else None,
+        'calinski_harabasz_score': float(row.calinski_harabasz_score) if row.calinski_harabasz_score is not None else None,
+        'request_params': row.request_params if isinstance(row.request_params, dict) else json.loads(row.request_params) if row.request_params else {},
+        'feature_types': row.feature_types if isinstance(row.feature_types, dict) else json.loads(row.feature_types) if row.feature_types else {},
+        'algorithm_info': row.algorithm_info if isinstance(row.algorithm_info, dict) else json.loads(row.algorithm_info) if row.algorithm_info else {},
+        'filter_info': row.filter_info if isinstance(row.filter_info, dict) else json.loads(row.filter_info) if row.filter_info else {},
+        'processor_info': row.processor_info if isinstance(row.processor_info, dict) else json.loads(row.processor_info) if row.processor_info else {},
+        'is_precomputed': row.is_precomputed,
+        'precomputed_name': row.precomputed_name,
+    }
 
 
 async def load_clustering_session_from_db(session_id: str) -> Optional[Dict[str, Any]]:
@@ -68,13 +94,8 @@ async def load_clustering_session_from_db(session_id: str) -> Optional[Dict[str,
         async with SessionLocal() as session:
             # merged 스키마에서 세션 정보 조회
             result = await session.execute(
-                text("""
-                    SELECT 
-                        session_id, created_at, updated_at,
-                        n_samples, n_clusters, algorithm, optimal_k, strategy,
-                        silhouette_score, davies_bouldin_score, calinski_harabasz_score,
-                        request_params, feature_types, algorithm_info,
-                        filter_info, processor_info, is_precomputed, precomputed_name
+                text(f"""
+                    SELECT {_SESSION_COLUMNS}
                     FROM merged.clustering_sessions
                     WHERE session_id = :session_id
                 """),
@@ -89,44 +110,23 @@ async def load_clustering_session_from_db(session_id: str) -> Optional[Dict[str,
             logger.info(f"[Clustering Loader] 세션 정보 로드 완료: session_id={session_id}, n_samples={row.n_samples}, n_clusters={row.n_clusters}")
             
             # 딕셔너리로 변환
-            session_data = {
-                'session_id': str(row.session_id),
-                'created_at': row.created_at.isoformat() if row.created_at else None,
-                'updated_at': row.updated_at.isoformat() if row.updated_at else None,
-                'n_samples': row.n_samples,
-                'n_clusters': row.n_clusters,
-                'algorithm': row.algorithm,
-                'optimal_k': row.optimal_k,
-                'strategy': row.strategy,
-                'silhouette_score': float(row.silhouette_score) if row.silhouette_score is not None else None,
-                'davies_bouldin_score': float(row.davies_bouldin_score) if row.davies_bouldin_score is not None else None,
-                'calinski_harabasz_score': float(row.calinski_harabasz_score) if row.calinski_harabasz_score is not None else None,
-                'request_params': row.request_params if isinstance(row.request_params, dict) else json.loads(row.request_params) if row.request_params else {},
-                'feature_types': row.feature_types if isinstance(row.feature_types, dict) else json.loads(row.feature_types) if row.feature_types else {},
-                'algorithm_info': row.algorithm_info if isinstance(row.algorithm_info, dict) else json.loads(row.algorithm_info) if row.algorithm_info else {},
-                'filter_info': row.filter_info if isinstance(row.filter_info, dict) else json.loads(row.filter_info) if row.filter_info else {},
-                'processor_info': row.processor_info if isinstance(row.processor_info, dict) else json.loads(row.processor_info) if row.processor_info else {},
-                'is_precomputed': row.is_precomputed,
-                'precomputed_name': row.precomputed_name,
-            }
+            session_data = _session_row_to_dict(row)
             
             return session_data
             
     except Exception as e:
         logger.error(f"[Clustering Loader] 세션 로드 실패: session_id={session_id}, 오류: {str(e)}", exc_info=True)
         return None
-    finally:
-        if engine:
-            await engine.dispose()
 
 
-async def load_panel_cluster_mappings_from_db(session_id: str) -> Optional[pd.DataFrame]:
+async def load_panel_cluster_mappings_from_db(session_id: str) -> Optional["pd.DataFrame"]:
     """
     NeonDB에서 패널-클러스터 매핑 로드
     
     Returns:
         DataFrame (mb_sn, cluster_id) 또는 None
     """
+    import pandas as pd
     logger.info(f"[Clustering Loader] 매핑 로드 시작: session_id={session_id}")
     
     # UUID 형식 검증
@@ -169,18 +169,16 @@ async def load_panel_cluster_mappings_from_db(session_id: str) -> Optional[pd.Da
     except Exception as e:
         logger.error(f"[Clustering Loader] 매핑 로드 실패: session_id={session_id}, 오류: {str(e)}", exc_info=True)
         return None
-    finally:
-        if engine:
-            await engine.dispose()
 
 
-async def load_umap_coordinates_from_db(session_id: str) -> Optional[pd.DataFrame]:
+async def load_umap_coordinates_from_db(session_id: str) -> Optional["pd.DataFrame"]:
     """
     NeonDB에서 UMAP 좌표 로드
     
     Returns:
         DataFrame (mb_sn, umap_x, umap_y) 또는 None
     """
+    import pandas as pd
     logger.info(f"[Clustering Loader] UMAP 좌표 로드 시작: session_id={session_id}")
     
     # UUID 형식 검증
@@ -228,9 +226,6 @@ async def load_umap_coordinates_from_db(session_id: str) -> Optional[pd.DataFram
     except Exception as e:
         logger.error(f"[Clustering Loader] UMAP 좌표 로드 실패: session_id={session_id}, 오류: {str(e)}", exc_info=True)
         return None
-    finally:
-        if engine:
-            await engine.dispose()
 
 
 async def load_cluster_profiles_from_db(session_id: str) -> Optional[List[Dict[str, Any]]]:
@@ -312,9 +307,6 @@ async def load_cluster_profiles_from_db(session_id: str) -> Optional[List[Dict[s
     except Exception as e:
         logger.error(f"[Clustering Loader] 프로필 로드 실패: session_id={session_id}, 오류: {str(e)}", exc_info=True)
         return None
-    finally:
-        if engine:
-            await engine.dispose()
 
 
 async def get_precomputed_session_id(precomputed_name: str = "hdbscan_default") -> Optional[str]:
@@ -357,9 +349,6 @@ async def get_precomputed_session_id(precomputed_name: str = "hdbscan_default")
     except Exception as e:
         logger.error(f"[Clustering Loader] Precomputed 세션 ID 조회 실패: name={precomputed_name}, 오류: {str(e)}", exc_info=True)
         return None
-    finally:
-        if engine:
-            await engine.dispose()
 
 
 async def load_full_clustering_data_from_db(session_id: str) -> Optional[Dict[str, Any]]:
@@ -369,6 +358,7 @@ async def load_full_clustering_data_from_db(session_id: str) -> Optional[Dict[st
     Returns:
         artifacts 딕셔너리 (data, labels, meta 포함) 또는 None
     """
+    import pandas as pd
     logger.info(f"[Clustering Loader] 전체 클러스터링 데이터 로드 시작: session_id={session_id}")
     
     # 1. 세션 정보 로드
@@ -442,3 +432,202 @@ async def load_full_clustering_data_from_db(session_id: str) -> Optional[Dict[st
     
     return artifacts
 
+
+class PrecomputedBundle:
+    """
+    Precomputed 클러스터링 번들 (세션 메타데이터 + UMAP 좌표/클러스터 열 배열)
+
+    - 패널 순서는 mb_sn 오름차순 (load_umap_coordinates_from_db와 동일)
+    - 클러스터 매핑이 없는 좌표는 labels=-1, mapped=False
+    - version = (session_id, updated_at) - 마이그레이션으로 세션이 갱신되면 달라짐
+    """
+
+    def __init__(
+        self,
+        name: str,
+        session: Dict[str, Any],
+        panel_ids: np.ndarray,
+        umap_x: np.ndarray,
+        umap_y: np.ndarray,
+        labels: np.ndarray,
+        mapped: np.ndarray
+    ):
+        self.name = name
+        self.session = session
+        self.session_id: str = session['session_id']
+        self.version = _session_version(session)
+        self.panel_ids = panel_ids
+        self.umap_x = umap_x
+        self.umap_y = umap_y
+        self.labels = labels
+        self.mapped = mapped
+        self.loaded_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self.panel_ids)
+
+    @property
+    def n_mapped(self) -> int:
+        return int(self.mapped.sum())
+
+    def to_frame(self, mapped_only: bool = True) -> "pd.DataFrame":
+        """
+        DataFrame (mb_sn, umap_x, umap_y, cluster)
+
+        Args:
+            mapped_only: True면 클러스터 매핑이 있는 패널만 (좌표/매핑 inner merge와 동일)
+        """
+        import pandas as pd
+        mask = self.mapped if mapped_only else slice(None)
+        return pd.DataFrame({
+            'mb_sn': self.panel_ids[mask],
+            'umap_x': self.umap_x[mask],
+            'umap_y': self.umap_y[mask],
+            'cluster': self.labels[mask],
+        })
+
+
+def _session_version(session: Dict[str, Any]) -> tuple:
+    return (session['session_id'], session.get('updated_at') or session.get('created_at'))
+
+
+async def _probe_precomputed_version(conn, precomputed_name: str) -> Optional[tuple]:
+    """Precomputed 세션 버전 (session_id, updated_at) - JSONB 컬럼 없이 1행만 조회"""
+    result = await conn.execute(
+        text("""
+            SELECT session_id, created_at, updated_at
+            FROM merged.clustering_sessions
+            WHERE is_precomputed = TRUE AND precomputed_name = :precomputed_name
+            ORDER BY created_at DESC
+            LIMIT 1
+        """),
+        {"precomputed_name": precomputed_name}
+    )
+    row = result.fetchone()
+    if not row:
+        return None
+    changed_at = row.updated_at or row.created_at
+    return (str(row.session_id), changed_at.isoformat() if changed_at else None)
+
+
+async def probe_precomputed_version(precomputed_name: str = "hdbscan_default") -> Optional[tuple]:
+    """
+    Precomputed 세션 버전 조회 (캐시 무효화 판단용, 작은 SQL 한 번)
+
+    Returns:
+        (session_id, updated_at ISO 문자열) 또는 None (세션 없음, DB 미설정)
+
+    Raises:
+        DB 오류는 그대로 전달 (호출 측에서 캐시 유지 여부 결정)
+    """
+    engine = get_async_engine()
+    if engine is None:
+        return None
+    async with engine.connect() as conn:
+        return await _probe_precomputed_version(conn, precomputed_name)
+
+
+# Precomputed 번들 캐시 (precomputed_name → PrecomputedBundle)
+_bundle_cache: Dict[str, PrecomputedBundle] = {}
+_bundle_lock = asyncio.Lock()
+
+
+def peek_precomputed_bundle(precomputed_name: str = "hdbscan_default") -> Optional[PrecomputedBundle]:
+    """캐시된 Precomputed 번들 (DB 조회/버전 확인 없음, 아직 로드 전이면 None)"""
+    return _bundle_cache.get(precomputed_name)
+
+
+async def load_precomputed_bundle(
+    precomputed_name: str = "hdbscan_default",
+    force: bool = False
+) -> Optional[PrecomputedBundle]:
+    """
+    Precomputed 세션 메타데이터 + UMAP 좌표 + 클러스터 ID를 한 연결에서 로드 (프로세스 캐시)
+
+    1. 세션 버전(session_id, updated_at) 1행 조회
+    2. 버전이 캐시와 같으면 캐시 반환
+    3. 다르면 같은 연결에서 세션 메타데이터와 umap_coordinates ⋈ panel_cluster_mappings 조회 후 열 배열로 변환
+
+    DB 조회가 실패하면 이전 캐시가 있을 때 그대로 반환
+
+    Args:
+        precomputed_name: clustering_sessions.precomputed_name
+        force: True면 버전이 같아도 다시 로드
+
+    Returns:
+        PrecomputedBundle 또는 None (세션/좌표 없음, DB 미설정)
+    """
+    cached = _bundle_cache.get(precomputed_name)
+
+    engine = get_async_engine()
+    if engine is None:
+        logger.error("[Clustering Loader] ASYNC_DATABASE_URI 환경변수가 설정되지 않았습니다.")
+        return cached
+
+    try:
+        async with engine.connect() as conn:
+            version = await _probe_precomputed_version(conn, precomputed_name)
+            if version is None:
+                logger.warning(f"[Clustering Loader] Precomputed 세션을 찾을 수 없음: name={precomputed_name}")
+                return None
+            if not force and cached is not None and cached.version == version:
+                return cached
+
+            # 동시에 들어온 요청은 한 번만 로드
+            async with _bundle_lock:
+                cached = _bundle_cache.get(precomputed_name)
+                if not force and cached is not None and cached.version == version:
+                    return cached
+
+                load_start = time.time()
+                result = await conn.execute(
+                    text(f"""
+                        SELECT {_SESSION_COLUMNS}
+                        FROM merged.clustering_sessions
+                        WHERE session_id = :session_id
+                    """),
+                    {"session_id": version[0]}
+                )
+                session_data = _session_row_to_dict(result.fetchone())
+
+                result = await conn.execute(
+                    text("""
+                        SELECT u.mb_sn, u.umap_x, u.umap_y, m.cluster_id
+                        FROM merged.umap_coordinates u
+                        LEFT JOIN merged.panel_cluster_mappings m
+                            ON m.session_id = u.session_id AND m.mb_sn = u.mb_sn
+                        WHERE u.session_id = :session_id
+                        ORDER BY u.mb_sn
+                    """),
+                    {"session_id": session_data['session_id']}
+                )
+                rows = result.fetchall()
+                if not rows:
+                    logger.warning(f"[Clustering Loader] UMAP 좌표 데이터 없음: session_id={session_data['session_id']}")
+                    return None
+
+                mb_sns, xs, ys, cluster_ids = zip(*rows)
+                mapped = np.fromiter((c is not None for c in cluster_ids), dtype=bool, count=len(rows))
+                bundle = PrecomputedBundle(
+                    precomputed_name,
+                    session_data,
+                    panel_ids=np.array([str(mb_sn) for mb_sn in mb_sns], dtype=object),
+                    umap_x=np.asarray(xs, dtype=np.float64),
+                    umap_y=np.asarray(ys, dtype=np.float64),
+                    labels=np.fromiter((-1 if c is None else c for c in cluster_ids), dtype=np.int32, count=len(rows)),
+                    mapped=mapped,
+                )
+                _bundle_cache[precomputed_name] = bundle
+                logger.info(
+                    f"[Clustering Loader] Precomputed 번들 로드 완료: name={precomputed_name}, "
+                    f"session_id={bundle.session_id}, 좌표={len(bundle)}개, 매핑={bundle.n_mapped}개 "
+                    f"({time.time() - load_start:.2f}초)"
+                )
+                return bundle
+
+    except Exception as e:
+        if cached is not None:
+            logger.warning(f"[Clustering Loader] Precomputed 번들 갱신 확인 실패, 캐시 사용: name={precomputed_name}, 오류: {str(e)}")
+            return cached
+        logger.error(f"[Clustering Loader] Precomputed 번들 로드 실패: name={precomputed_name}, 오류: {str(e)}", exc_info=True)
+        return None
@@ -37,37 +37,19 @@ async def load_merged_data_from_db() -> Dict[str, Any]:
             return _merged_data_cache
         
         try:
-            # 환경변수를 직접 읽어서 엔진 생성 (모듈 로드 시점의 engine 사용 방지)
-            import os
-            from dotenv import load_dotenv
-            from sqlalchemy.ext.asyncio import create_async_engine
-            import sys
+            from app.db.engine_registry import get_async_engine
             
-            load_dotenv(override=True)
-            
-            uri = os.getenv("ASYNC_DATABASE_URI")
-            if not uri:
+            # 공유 엔진 (연결 풀 재사용, 요청마다 TLS/인증 연결을 새로 만들지 않음)
+            engine = get_async_engine()
+            if engine is None:
                 logger.error("[Merged Data] ASYNC_DATABASE_URI 환경변수가 설정되지 않았습니다.")
                 return _load_merged_data_from_json_fallback()
             
-            # postgresql://를 postgresql+psycopg://로 변환
-            if uri.startswith("postgresql://"):
-                uri = uri.replace("postgresql://", "postgresql+psycopg://", 1)
-            elif "postgresql+asyncpg" in uri:
-                uri = uri.replace("postgresql+asyncpg", "postgresql+psycopg", 1)
-            
-            # Windows 이벤트 루프 정책 설정
-            if sys.platform == 'win32':
-                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-            
-            # 새 엔진 생성
-            temp_engine = create_async_engine(uri, echo=False, pool_pre_ping=True, poolclass=None)
-            
             logger.info(f"[Merged Data] merged.panel_data 테이블에서 로드 시작...")
             
-            async with temp_engine.begin() as conn:
-                # merged 스키마로 search_path 설정
-                await conn.execute(text('SET search_path TO "merged", public'))
+            async with engine.begin() as conn:
+                # merged 스키마로 search_path 설정 (트랜잭션 범위, 공유 연결에 남지 않음)
+                await conn.execute(text('SET LOCAL search_path TO "merged", public'))
                 
                 # merged.panel_data 테이블에서 모든 데이터 조회
                 result = await conn.execute(text("""
@@ -120,8 +102,6 @@ async def load_merged_data_from_db() -> Dict[str, Any]:
                 logger.info(f"[Merged Data] 딕셔너리 변환 완료: {len(_merged_data_cache)}개 패널")
                 return _merged_data_cache
                 
-            await temp_engine.dispose()
-                
         except Exception as e:
             logger.error(f"[ERROR] merged.panel_data 로드 실패: {str(e)}", exc_info=True)
             # Fallback: JSON 파일 시도
@@ -253,37 +233,20 @@ async def get_panels_from_merged_db_batch(panel_ids: list[str]) -> Dict[str, Dic
                 logger.info(f"[Merged Data] 캐시에서 일부 패널 조회: {len(result)}/{len(panel_ids)}개, 나머지는 DB에서 조회")
         
         # 캐시가 없거나 일부만 있으면 DB에서 직접 조회
-        import os
-        from dotenv import load_dotenv
-        from sqlalchemy.ext.asyncio import create_async_engine
-        import sys
+        from app.db.engine_registry import get_async_engine
         
-        load_dotenv(override=True)
-        
-        uri = os.getenv("ASYNC_DATABASE_URI")
-        if not uri:
+        # 공유 엔진 (연결 풀 재사용)
+        engine = get_async_engine()
+        if engine is None:
             logger.error("[Merged Data] ASYNC_DATABASE_URI 환경변수가 설정되지 않았습니다.")
             return {}
         
-        # postgresql://를 postgresql+psycopg://로 변환
-        if uri.startswith("postgresql://"):
-            uri = uri.replace("postgresql://", "postgresql+psycopg://", 1)
-        elif "postgresql+asyncpg" in uri:
-            uri = uri.replace("postgresql+asyncpg", "postgresql+psycopg", 1)
-        
-        # Windows 이벤트 루프 정책 설정
-        if sys.platform == 'win32':
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        
-        # 새 엔진 생성
-        temp_engine = create_async_engine(uri, echo=False, pool_pre_ping=True, poolclass=None)
-        
         logger.info(f"[Merged Data] DB에서 배치 패널 조회 시작: {len(panel_ids)}개")
         
         try:
-            async with temp_engine.begin() as conn:
-                # merged 스키마로 search_path 설정
-                await conn.execute(text('SET search_path TO "merged", public'))
+            async with engine.begin() as conn:
+                # merged 스키마로 search_path 설정 (트랜잭션 범위, 공유 연결에 남지 않음)
+                await conn.execute(text('SET LOCAL search_path TO "merged", public'))
                 
                 # 여러 패널을 한 번에 조회 (IN 절 사용)
                 result = await conn.execute(
@@ -332,15 +295,10 @@ async def get_panels_from_merged_db_batch(panel_ids: list[str]) -> Dict[str, Dic
                     result_dict[mb_sn] = panel_data
                 
                 logger.info(f"[Merged Data] DB에서 배치 패널 조회 완료: {len(result_dict)}개")
-                await temp_engine.dispose()
                 return result_dict
                 
         except Exception as db_error:
             logger.error(f"[Merged Data] DB 배치 조회 중 오류 발생: {str(db_error)}", exc_info=True)
-            try:
-                await temp_engine.dispose()
-            except:
-                pass
             raise
             
     except Exception as e:
@@ -370,37 +328,20 @@ async def get_panel_from_merged_db(panel_id: str) -> Optional[Dict[str, Any]]:
                 logger.info(f"[Merged Data] 캐시에 패널 없음: {panel_id}, DB에서 조회 시도")
         
         # 캐시가 없거나 패널이 없으면 DB에서 직접 조회
-        import os
-        from dotenv import load_dotenv
-        from sqlalchemy.ext.asyncio import create_async_engine
-        import sys
+        from app.db.engine_registry import get_async_engine
         
-        load_dotenv(override=True)
-        
-        uri = os.getenv("ASYNC_DATABASE_URI")
-        if not uri:
+        # 공유 엔진 (연결 풀 재사용)
+        engine = get_async_engine()
+        if engine is None:
             logger.error("[Merged Data] ASYNC_DATABASE_URI 환경변수가 설정되지 않았습니다.")
             return None
         
-        # postgresql://를 postgresql+psycopg://로 변환
-        if uri.startswith("postgresql://"):
-            uri = uri.replace("postgresql://", "postgresql+psycopg://", 1)
-        elif "postgresql+asyncpg" in uri:
-            uri = uri.replace("postgresql+asyncpg", "postgresql+psycopg", 1)
-        
-        # Windows 이벤트 루프 정책 설정
-        if sys.platform == 'win32':
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        
-        # 새 엔진 생성
-        temp_engine = create_async_engine(uri, echo=False, pool_pre_ping=True, poolclass=None)
-        
         logger.info(f"[Merged Data] DB에서 패널 조회 시작: {panel_id}")
         
         try:
-            async with temp_engine.begin() as conn:
-                # merged 스키마로 search_path 설정
-                await conn.execute(text('SET search_path TO "merged", public'))
+            async with engine.begin() as conn:
+                # merged 스키마로 search_path 설정 (트랜잭션 범위, 공유 연결에 남지 않음)
+                await conn.execute(text('SET LOCAL search_path TO "merged", public'))
                 
                 # 특정 패널 조회
                 result = await conn.execute(
@@ -412,14 +353,12 @@ async def get_panel_from_merged_db(panel_id: str) -> Optional[Dict[str, Any]]:
                 
                 if not row:
                     logger.warning(f"[Merged Data] 패널을 찾을 수 없음: {panel_id}")
-                    await temp_engine.dispose()
                     return None
                 
                 row_dict = dict(row)
                 mb_sn = row_dict.get('mb_sn')
                 if not mb_sn:
                     logger.warning(f"[Merged Data] 패널 데이터에 mb_sn이 없음: {panel_id}")
-                    await temp_engine.dispose()
                     return None
                 
                 # base_profile JSONB 파싱
@@ -450,15 +389,10 @@ async def get_panel_from_merged_db(panel_id: str) -> Optional[Dict[str, Any]]:
                     panel_data['quick_answers'] = quick_answers
                 
                 logger.info(f"[Merged Data] DB에서 패널 조회 완료: {panel_id}")
-                await temp_engine.dispose()
                 return panel_data
                 
         except Exception as db_error:
             logger.error(f"[Merged Data] DB 조회 중 오류 발생: {panel_id}, 오류: {str(db_error)}", exc_info=True)
-            try:
-                await temp_engine.dispose()
-            except:
-                pass
             # 에러를 다시 발생시켜 상위에서 처리하도록
             raise
             
@@ -0,0 +1,84 @@
+"""
+결과 필터 단계(_collect_stage) 후보 멤버십 마이크로 벤치마크
+
+기존 방식(후보 리스트에 대한 in 연산, O(n·m))과 CandidatePool(set 멤버십, O(n))의
+단계 처리 시간을 후보 1k / 10k / 50k개 기준으로 비교 (Pinecone 호출 없음)
+
+사용법:
+    python scripts/benchmark_candidate_membership.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+server_dir = project_root / "server"
+sys.path.insert(0, str(server_dir))
+
+from app.services.pinecone_result_filter import CandidatePool, PineconeResultFilter, MAX_TOP_K
+
+CANDIDATE_SIZES = [1_000, 10_000, 50_000]
+
+
+def legacy_collect_stage(results, candidate_mb_sns):
+    """변경 전 구현 (리스트 멤버십)"""
+    filtered_mb_sns = set([r["mb_sn"] for r in results if r.get("mb_sn") in candidate_mb_sns])
+    mb_sn_scores = {}
+    for r in results:
+        mb_sn = r.get("mb_sn", "")
+        if mb_sn in filtered_mb_sns:
+            score = r.get("score", 0.0)
+            if mb_sn not in mb_sn_scores or score > mb_sn_scores[mb_sn]:
+                mb_sn_scores[mb_sn] = score
+    sorted_mb_sns = sorted(mb_sn_scores.items(), key=lambda x: x[1], reverse=True)
+    return [mb_sn for mb_sn, score in sorted_mb_sns], mb_sn_scores
+
+
+def make_stage(candidate_count: int):
+    """후보 리스트와 한 단계 Pinecone 결과(후보 3배 또는 MAX_TOP_K, 절반은 후보 밖) 생성"""
+    candidates = [f"w{i:07d}" for i in range(candidate_count)]
+    result_count = min(candidate_count * 3, MAX_TOP_K)
+    results = []
+    for i in range(result_count):
+        mb_sn = random.choice(candidates) if i % 2 == 0 else f"x{i:07d}"
+        results.append({"mb_sn": mb_sn, "score": random.random()})
+    return candidates, results
+
+
+def timed(func, repeat: int) -> float:
+    """최소 실행 시간 (ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    random.seed(42)
+    result_filter = PineconeResultFilter.__new__(PineconeResultFilter)
+
+    print(f"{'후보 수':>8} | {'결과 수':>7} | {'리스트 in (ms)':>14} | {'CandidatePool (ms)':>18} | {'배율':>7}")
+    print("-" * 68)
+    for candidate_count in CANDIDATE_SIZES:
+        candidates, results = make_stage(candidate_count)
+        pool = CandidatePool(candidates)
+
+        legacy = legacy_collect_stage(results, candidates)
+        current = result_filter._collect_stage(results, pool, True, None)
+        assert legacy[0] == current[0].ids and legacy[1] == current[1], "결과 불일치"
+
+        # 리스트 in 연산은 50k에서 수 초가 걸리므로 반복 횟수를 줄임
+        legacy_ms = timed(lambda: legacy_collect_stage(results, candidates), 1 if candidate_count > 10_000 else 3)
+        pool_ms = timed(lambda: result_filter._collect_stage(results, CandidatePool(candidates), True, None), 5)
+        print(
+            f"{candidate_count:>8,} | {len(results):>7,} | {legacy_ms:>14.2f} | {pool_ms:>18.2f} | "
+            f"{legacy_ms / pool_ms:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+클러스터링 응답 빌더 벤치마크 (app/utils/cluster_response.py)
+
+전체 패널 규모의 합성 UMAP 데이터로 /api/precomputed/clustering, /api/precomputed/umap,
+/api/clustering/cluster-around-search 응답 목록/통계 생성 시간을 측정하고
+기존 iterrows / 클러스터별 반복 방식과 비교 (DB 없이 실행)
+
+사용법:
+    python scripts/benchmark_cluster_response.py
+    python scripts/benchmark_cluster_response.py --rows 35000 --clusters 40 --budget-ms 50
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+server_dir = project_root / "server"
+sys.path.insert(0, str(server_dir))
+
+from app.utils.cluster_response import (
+    umap_point_records,
+    coordinate_pairs,
+    cluster_size_list,
+    cluster_stats,
+)
+
+
+def make_frame(n_rows: int, n_clusters: int, seed: int = 0) -> pd.DataFrame:
+    """to_frame()과 같은 열 구성의 합성 데이터 (mb_sn, umap_x, umap_y, cluster)"""
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(-1, n_clusters, size=n_rows).astype(np.int32)
+    return pd.DataFrame({
+        'mb_sn': np.array([f"w{100000000 + i}" for i in range(n_rows)], dtype=object),
+        'umap_x': rng.normal(size=n_rows),
+        'umap_y': rng.normal(size=n_rows),
+        'cluster': labels,
+    })
+
+
+def best_of(fn, repeat: int) -> float:
+    """repeat회 실행 중 최소 시간 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+# 기존 구현 (비교용)
+def legacy_clustering(df):
+    umap_data = [
+        {'x': float(row['umap_x']), 'y': float(row['umap_y']), 'cluster': int(row['cluster']), 'panelId': str(row['mb_sn'])}
+        for _, row in df.iterrows()
+    ]
+    counts = df['cluster'].value_counts().to_dict()
+    clusters = sorted(
+        ({'id': int(c), 'size': int(n), 'percentage': float(n / len(df) * 100)} for c, n in counts.items() if c != -1),
+        key=lambda x: x['id']
+    )
+    return umap_data, clusters
+
+
+def legacy_umap(df):
+    coordinates, panel_ids, labels = [], [], []
+    for _, row in df.iterrows():
+        coordinates.append([float(row['umap_x']), float(row['umap_y'])])
+        panel_ids.append(str(row['mb_sn']))
+        labels.append(int(row['cluster']))
+    return coordinates, panel_ids, labels
+
+
+def legacy_stats(clusters, is_search):
+    stats = {}
+    for cluster_id in np.unique(clusters):
+        mask = clusters == cluster_id
+        size = int(mask.sum())
+        search_count = int(is_search[mask].sum())
+        stats[int(cluster_id)] = {
+            'size': size,
+            'percentage': float(size / len(clusters) * 100),
+            'search_count': search_count,
+            'search_percentage': float(search_count / max(1, size) * 100)
+        }
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="클러스터링 응답 빌더 벤치마크")
+    parser.add_argument("--rows", type=int, default=35000, help="패널 수 (기본: 35000)")
+    parser.add_argument("--clusters", type=int, default=40, help="클러스터 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최소값 사용)")
+    parser.add_argument("--budget-ms", type=float, default=50, help="빌더별 시간 상한 (ms, 0이면 검사 안 함)")
+    parser.add_argument("--skip-legacy", action="store_true", help="기존 iterrows 구현 측정 생략")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.clusters)
+    clusters = df['cluster'].to_numpy()
+    rng = np.random.default_rng(1)
+    is_search = rng.random(len(df)) < 0.05
+
+    def build_clustering():
+        umap_data = umap_point_records(
+            df['mb_sn'].to_numpy(), df['umap_x'].to_numpy(), df['umap_y'].to_numpy(), clusters
+        )
+        return umap_data, cluster_size_list(clusters)
+
+    def build_umap():
+        return (
+            coordinate_pairs(df['umap_x'].to_numpy(), df['umap_y'].to_numpy()),
+            df['mb_sn'].astype(str).tolist(),
+            df['cluster'].astype('int64').tolist(),
+        )
+
+    def build_stats():
+        return cluster_stats(clusters, is_search)
+
+    # 결과가 기존 구현과 같은지 먼저 확인
+    if not args.skip_legacy:
+        assert build_clustering() == legacy_clustering(df), "/clustering 결과 불일치"
+        assert build_umap() == legacy_umap(df), "/umap 결과 불일치"
+        assert build_stats() == legacy_stats(clusters, is_search), "cluster_stats 결과 불일치"
+
+    cases = [
+        ("/precomputed/clustering", build_clustering, lambda: legacy_clustering(df)),
+        ("/precomputed/umap", build_umap, lambda: legacy_umap(df)),
+        ("cluster_stats", build_stats, lambda: legacy_stats(clusters, is_search)),
+    ]
+
+    print(f"패널 {args.rows:,}개, 클러스터 {args.clusters}개 (최소 {args.repeat}회)")
+    print(f"{'빌더':<26} | {'열 배열 (ms)':>12} | {'기존 (ms)':>10} | {'배율':>7}")
+    print("-" * 66)
+    over_budget = []
+    for name, fn, legacy_fn in cases:
+        new_ms = best_of(fn, args.repeat)
+        if args.skip_legacy:
+            print(f"{name:<26} | {new_ms:>12.1f} | {'-':>10} | {'-':>7}")
+        else:
+            legacy_ms = best_of(legacy_fn, 1)
+            print(f"{name:<26} | {new_ms:>12.1f} | {legacy_ms:>10.1f} | {legacy_ms / max(new_ms, 1e-6):>6.0f}x")
+        if args.budget_ms and new_ms > args.budget_ms:
+            over_budget.append(f"{name} {new_ms:.1f} ms")
+
+    assert not over_budget, f"시간 상한 {args.budget_ms:.0f} ms 초과: {over_budget}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+서버 import 시간 벤치마크 (python -X importtime)
+
+새 인터프리터에서 `import app.main`을 실행해 누적 import 시간이 큰 모듈을 출력하고,
+무거운 ML/LLM 라이브러리(sklearn, scipy, hdbscan, umap, anthropic, pandas)가 시작 시점에
+로드되지 않는지 확인 (클러스터링/UMAP 엔드포인트 첫 요청 또는 ml_libs 워밍업에서 로드)
+
+사용법:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --budget-ms 800 --top 30
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+server_dir = project_root / "server"
+sys.path.insert(0, str(server_dir))
+
+# 시작 시점에 로드되면 안 되는 최상위 패키지
+LAZY_PACKAGES = ["sklearn", "scipy", "hdbscan", "umap", "anthropic", "joblib", "pandas"]
+
+# "import time:      self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def profile_import(target: str):
+    """새 인터프리터에서 target을 import하고 (모듈, 자체 us, 누적 us, 깊이) 목록 반환"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=str(server_dir),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"import {target} 실패 (exit {proc.returncode})")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 import 시간 벤치마크")
+    parser.add_argument("--target", default="app.main", help="import할 모듈 (기본: app.main)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 모듈 수")
+    parser.add_argument("--budget-ms", type=float, default=0, help="전체 import 시간 상한 (ms, 0이면 검사 안 함)")
+    args = parser.parse_args()
+
+    rows = profile_import(args.target)
+    target_row = next((row for row in rows if row[0] == args.target), None)
+    total_ms = target_row[2] / 1000 if target_row else sum(row[1] for row in rows) / 1000
+
+    # 최상위 import(깊이 0) + app.* 모듈을 누적 시간 순으로 출력
+    shown = [row for row in rows if row[3] == 0 or row[0].startswith("app.")]
+    shown.sort(key=lambda row: row[2], reverse=True)
+
+    print(f"import {args.target}: {total_ms:.1f} ms ({len(rows)}개 모듈)")
+    print(f"{'모듈':<48} | {'누적 (ms)':>9} | {'자체 (ms)':>9}")
+    print("-" * 74)
+    for module, self_us, cumulative_us, _ in shown[:args.top]:
+        print(f"{module:<48} | {cumulative_us / 1000:>9.1f} | {self_us / 1000:>9.1f}")
+
+    loaded = {row[0].split(".")[0] for row in rows}
+    eager = [name for name in LAZY_PACKAGES if name in loaded]
+    print()
+    print(f"지연 로드 대상 ({', '.join(LAZY_PACKAGES)}): {'모두 미로드' if not eager else '로드됨 ' + ', '.join(eager)}")
+
+    assert not eager, f"시작 시점에 무거운 패키지가 로드됨: {eager}"
+    if args.budget_ms:
+        assert total_ms <= args.budget_ms, f"import 시간 {total_ms:.1f} ms > 상한 {args.budget_ms:.1f} ms"
+
+
+if __name__ == "__main__":
+    main()
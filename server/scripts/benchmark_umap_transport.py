@@ -0,0 +1,97 @@
+"""
+UMAP 포인트 전송 형식 벤치마크 (json / columnar / binary)
+
+전체 패널 규모의 합성 데이터로 /api/precomputed/clustering 포인트 부분의
+응답 크기와 디코딩 시간을 비교 (DB 없이 실행, 디코딩은 Python 기준)
+
+사용법:
+    python scripts/benchmark_umap_transport.py
+    python scripts/benchmark_umap_transport.py --rows 35000 --min-size-ratio 5
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+server_dir = project_root / "server"
+sys.path.insert(0, str(server_dir))
+
+from app.utils.cluster_response import (
+    umap_point_records,
+    umap_point_columns,
+    encode_umap_binary,
+    decode_umap_binary,
+)
+
+
+def best_of(fn, repeat: int) -> float:
+    """repeat회 실행 중 최소 시간 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UMAP 포인트 전송 형식 벤치마크")
+    parser.add_argument("--rows", type=int, default=35000, help="패널 수 (기본: 35000)")
+    parser.add_argument("--clusters", type=int, default=40, help="클러스터 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최소값 사용)")
+    parser.add_argument("--min-size-ratio", type=float, default=5, help="json 대비 binary 크기 축소 배율 하한 (0이면 검사 안 함)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    panel_ids = np.array([f"w{100000000 + i}" for i in range(args.rows)], dtype=object)
+    umap_x = rng.normal(size=args.rows)
+    umap_y = rng.normal(size=args.rows)
+    clusters = rng.integers(-1, args.clusters, size=args.rows).astype(np.int32)
+
+    payloads = {
+        "json": json.dumps(
+            {'umap_coordinates': umap_point_records(panel_ids, umap_x, umap_y, clusters)},
+            ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8'),
+        "columnar": json.dumps(
+            {'umap_columns': umap_point_columns(panel_ids, umap_x, umap_y, clusters)},
+            ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8'),
+        "binary": encode_umap_binary({}, umap_x, umap_y, clusters),
+    }
+    # binary 포인트의 패널 ID 사전 (/api/precomputed/panel-ids, 세션 버전당 한 번)
+    dictionary = json.dumps({'panel_ids': panel_ids.astype(str).tolist()}, separators=(',', ':')).encode('utf-8')
+
+    decoders = {
+        "json": lambda payload: json.loads(payload),
+        "columnar": lambda payload: json.loads(payload),
+        "binary": decode_umap_binary,
+    }
+
+    json_size = len(payloads["json"])
+    print(f"패널 {args.rows:,}개 (디코딩은 최소 {args.repeat}회)")
+    print(f"{'형식':<10} | {'크기 (KB)':>10} | {'json 대비':>9} | {'디코딩 (ms)':>11}")
+    print("-" * 50)
+    for name, payload in payloads.items():
+        decode_ms = best_of(lambda: decoders[name](payload), args.repeat)
+        print(f"{name:<10} | {len(payload) / 1024:>10.1f} | {json_size / len(payload):>8.1f}x | {decode_ms:>11.2f}")
+    print(f"{'(사전)':<10} | {len(dictionary) / 1024:>10.1f} | {'-':>9} | {'-':>11}")
+
+    # 디코딩 결과가 원본과 같은지 확인 (좌표는 float32 정밀도)
+    header, arrays = decode_umap_binary(payloads["binary"])
+    assert header['n'] == args.rows
+    assert np.allclose(arrays['x'], umap_x.astype(np.float32)) and np.allclose(arrays['y'], umap_y.astype(np.float32))
+    assert np.array_equal(arrays['cluster'], clusters)
+
+    size_ratio = json_size / len(payloads["binary"])
+    if args.min_size_ratio:
+        assert size_ratio >= args.min_size_ratio, f"binary 크기 축소 {size_ratio:.1f}x < 하한 {args.min_size_ratio:.1f}x"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""UMAP 포인트 전송 형식 테스트 (바이너리 round-trip, format 결정)"""
+import struct
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from app.api.precomputed import _resolve_point_format
+from app.utils.cluster_response import (
+    UMAP_BINARY_MAGIC,
+    UMAP_BINARY_MEDIA_TYPE,
+    UMAP_BINARY_VERSION,
+    decode_umap_binary,
+    encode_umap_binary,
+    resolve_point_format,
+)
+
+UMAP_X = np.array([0.5, -1.25, 3.0])
+UMAP_Y = np.array([2.0, 0.0, -0.75])
+CLUSTERS = np.array([0, -1, 2])
+
+
+@pytest.mark.parametrize("panel_index", [None, np.array([2, 0, 1])])
+def test_binary_round_trip(panel_index):
+    header = {"n_clusters": 2, "session_id": "세션"}
+    payload = encode_umap_binary(header, UMAP_X, UMAP_Y, CLUSTERS, panel_index=panel_index)
+    decoded_header, arrays = decode_umap_binary(payload)
+
+    assert decoded_header["n"] == 3
+    assert decoded_header["session_id"] == "세션"
+    assert decoded_header["panel_index"] is (panel_index is not None)
+    np.testing.assert_array_equal(arrays["x"], UMAP_X.astype(np.float32))
+    np.testing.assert_array_equal(arrays["y"], UMAP_Y.astype(np.float32))
+    np.testing.assert_array_equal(arrays["cluster"], CLUSTERS)
+    if panel_index is None:
+        assert "panel_index" not in arrays
+    else:
+        np.testing.assert_array_equal(arrays["panel_index"], panel_index)
+
+
+@pytest.mark.parametrize("name_len", range(4))
+def test_columns_start_on_4_byte_boundary(name_len):
+    payload = encode_umap_binary({"name": "a" * name_len}, UMAP_X, UMAP_Y, CLUSTERS)
+    _, _, header_len = struct.unpack_from("<4sII", payload, 0)
+    columns_offset = 12 + header_len
+    assert columns_offset % 4 == 0
+    assert len(payload) == columns_offset + 3 * 4 * len(UMAP_X)
+    assert decode_umap_binary(payload)[0]["name"] == "a" * name_len
+
+
+@pytest.mark.parametrize("magic, version", [(b"NOPE", UMAP_BINARY_VERSION), (UMAP_BINARY_MAGIC, UMAP_BINARY_VERSION + 1)])
+def test_decode_rejects_bad_prefix(magic, version):
+    payload = encode_umap_binary({}, UMAP_X, UMAP_Y, CLUSTERS)
+    tampered = struct.pack("<4sI", magic, version) + payload[8:]
+    with pytest.raises(ValueError):
+        decode_umap_binary(tampered)
+
+
+@pytest.mark.parametrize("format_param, accept, expected", [
+    (None, None, "json"),
+    (None, "application/json", "json"),
+    (None, UMAP_BINARY_MEDIA_TYPE, "binary"),
+    ("columnar", UMAP_BINARY_MEDIA_TYPE, "columnar"),
+    (" JSON ", UMAP_BINARY_MEDIA_TYPE, "json"),
+    ("binary", None, "binary"),
+])
+def test_resolve_point_format(format_param, accept, expected):
+    assert resolve_point_format(format_param, accept) == expected
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        resolve_point_format("csv", None)
+    with pytest.raises(HTTPException) as exc_info:
+        _resolve_point_format("csv", None)
+    assert exc_info.value.status_code == 400
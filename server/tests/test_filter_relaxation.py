@@ -0,0 +1,47 @@
+"""메타데이터 필터 완화 플래너 테스트"""
+from app.services.filter_relaxation import FilterRelaxationPlanner, _broaden_range
+from app.services.panel_metadata_index import PanelMetadataIndex
+
+PANELS = [
+    {"mb_sn": "p1", "gender": "남", "location": "서울", "age": 34},
+    {"mb_sn": "p2", "gender": "여", "location": "경기", "age": 27},
+    {"mb_sn": "p3", "gender": "여", "location": "서울", "age": 45},
+    {"mb_sn": "p4", "gender": "남", "location": "부산", "age": 61},
+    {"mb_sn": "p5", "gender": "남", "location": "경기", "age": 52},
+]
+
+
+def test_single_condition_is_broadened_then_removed():
+    plan = FilterRelaxationPlanner().plan({"연령대": "30대"})
+    assert [c["label"] for c in plan] == ["연령대 확장", "메타데이터 필터 제외"]
+    assert plan[0]["filter"] == {"연령대": {"$in": ["30대", "20대", "40대"]}}
+    assert plan[-1]["filter"] is None
+
+
+def test_broaden_range():
+    assert _broaden_range({"$lte": 500}) == {"$lte": 600}
+    assert _broaden_range({"$gte": 3}) == {"$gte": 2}
+    assert _broaden_range({"$eq": 3}) is None
+
+
+def test_most_selective_condition_relaxed_first():
+    index = PanelMetadataIndex().build(PANELS)
+    metadata_filter = {"지역": "서울", "연령대": "30대", "성별": "여"}
+    assert index.search({"기본정보": metadata_filter}) == []
+
+    plan = FilterRelaxationPlanner(index, max_candidates=4).plan(metadata_filter)
+    assert [c["label"] for c in plan] == [
+        "연령대 확장",
+        "연령대 제외",
+        "성별 제외",
+        "지역 제외",  # 빼도 로컬 추정 결과 0개 → 뒤로
+        "메타데이터 필터 제외",
+    ]
+    assert plan[3]["estimate"] == 0.0
+    for candidate in plan[:3]:
+        assert index.search({"기본정보": candidate["filter"]})
+
+
+def test_max_candidates_limits_plan():
+    plan = FilterRelaxationPlanner(max_candidates=1).plan({"지역": "서울", "성별": "여"})
+    assert [c["label"] for c in plan] == ["지역 제외", "메타데이터 필터 제외"]
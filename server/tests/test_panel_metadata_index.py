@@ -0,0 +1,67 @@
+"""로컬 패널 메타데이터 인덱스 테스트 (PineconeFilterConverter 출력 평가)"""
+import math
+
+from app.services.panel_metadata_index import PanelMetadataIndex, _income_bounds
+from app.services.pinecone_filter_converter import PineconeFilterConverter
+
+# merged.panel_data 평탄화 행 (값 표기가 섞여 있고 일부 필드 누락)
+PANELS = [
+    {"mb_sn": "p1", "gender": "남", "location": "서울특별시", "age": 34, "월평균 개인소득": "월 300~399만원"},
+    {"mb_sn": "p2", "gender": "여", "location": "경기", "age": 27, "월평균 개인소득": "월 100만원 미만"},
+    {"mb_sn": "p3", "gender": "여성", "location": "서울", "age": 45, "월평균 개인소득": "월 1000만원 이상"},
+    {"mb_sn": "p4", "location": "부산광역시"},
+    {"mb_sn": "p5", "gender": "남자", "location": "경기도", "age": "52세", "월평균 개인소득": "월 200~299만원"},
+]
+
+
+def _index() -> PanelMetadataIndex:
+    return PanelMetadataIndex().build(PANELS)
+
+
+def _search(filters_dict):
+    filters = PineconeFilterConverter.convert_to_pinecone_filters(filters_dict)
+    return _index().search(filters)
+
+
+def test_income_bounds():
+    assert _income_bounds("월 300~399만원") == (300, 399)
+    assert _income_bounds("월 100만원 미만") == (0, 100)
+    assert _income_bounds("월 1,000만원 이상") == (1000, math.inf)
+    assert _income_bounds(250) == (250, 250)
+    assert all(math.isnan(v) for v in _income_bounds(None))
+    assert all(math.isnan(v) for v in _income_bounds("모름"))
+
+
+def test_search_gender_region():
+    assert _search({"selectedGenders": ["여성"], "selectedRegions": ["서울특별시"]}) == ["p3"]
+    assert _search({"selectedGenders": ["남", "여"], "selectedRegions": ["경기"]}) == ["p2", "p5"]
+
+
+def test_search_age_range():
+    assert _search({"ageRange": [20, 39]}) == ["p1", "p2"]
+
+
+def test_search_income_range():
+    assert _search({"selectedIncomes": ["300~500만원"]}) == ["p1"]
+
+
+def test_negations_exclude_missing_values():
+    index = _index()
+    assert index.search({"기본정보": {"성별": {"$ne": "남"}}}) == ["p2", "p3"]
+    assert index.search({"기본정보": {"성별": {"$nin": ["남"]}}}) == ["p2", "p3"]
+    assert index.search({"기본정보": {"나이": {"$ne": 34}}}) == ["p2", "p3", "p5"]
+    assert index.search({"기본정보": {"나이": {"$nin": [34, 27]}}}) == ["p3", "p5"]
+    assert index.search({"기본정보": {"성별": {"$in": ["없는값"]}}}) == []
+
+
+def test_unsupported_filter_falls_back():
+    filters = PineconeFilterConverter.convert_to_pinecone_filters(
+        {"selectedRegions": ["서울"], "quickpollOnly": True}
+    )
+    index = _index()
+    assert index.search(filters) is None
+
+    local, residual = index.split_filters(filters)
+    assert local == {"기본정보": {"지역": "서울"}}
+    assert residual == {"기본정보": {"coverage": "qw"}}
+    assert index.search(local) == ["p1", "p3"]
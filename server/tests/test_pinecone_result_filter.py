@@ -0,0 +1,61 @@
+"""단계별 점수 결합(fuse_scores) / 후보 풀 테스트"""
+import pytest
+
+from app.services.pinecone_result_filter import (
+    CandidatePool,
+    PineconeResultFilter,
+    fuse_scores,
+    SCORE_FUSION_LAST,
+    SCORE_FUSION_MAX,
+    SCORE_FUSION_MEAN,
+    SCORE_FUSION_RRF,
+)
+
+# "b"는 두 번째 카테고리에 없음, "z"는 어느 카테고리에도 없음
+STAGE_SCORES = [
+    {"a": 0.9, "b": 0.8, "c": 0.7},
+    {"a": 0.5, "c": 0.95},
+]
+CANDIDATES = ["a", "b", "c", "z"]
+
+
+@pytest.mark.parametrize("method, expected", [
+    (SCORE_FUSION_LAST, {"a": 0.5, "b": 0.8, "c": 0.95, "z": 0.0}),
+    (SCORE_FUSION_MAX, {"a": 0.9, "b": 0.8, "c": 0.95, "z": 0.0}),
+    (SCORE_FUSION_MEAN, {"a": 0.7, "b": 0.8, "c": 0.825, "z": 0.0}),
+    (SCORE_FUSION_RRF, {"a": 1 / 61 + 1 / 62, "b": 1 / 62, "c": 1 / 63 + 1 / 61, "z": 0.0}),
+])
+def test_fuse_scores(method, expected):
+    assert fuse_scores(STAGE_SCORES, CANDIDATES, method) == pytest.approx(expected)
+
+
+def test_fuse_scores_without_stages():
+    assert fuse_scores([], ["a", "b"], SCORE_FUSION_RRF) == {"a": 0.0, "b": 0.0}
+
+
+def test_rrf_uses_rank_not_scale():
+    stage_scores = [{"a": 100.0, "b": 1.0}, {"a": 0.001, "b": 0.002}]
+    fused = fuse_scores(stage_scores, ["a", "b"], SCORE_FUSION_RRF, rrf_k=0)
+    assert fused["a"] == fused["b"] == pytest.approx(1.5)
+
+
+def test_candidate_pool_membership_and_order():
+    pool = CandidatePool(["c", "a", "b"])
+    assert list(pool) == ["c", "a", "b"]
+    assert len(pool) == 3
+    assert "a" in pool and "z" not in pool
+
+
+def test_collect_stage_keeps_intersection_in_score_order():
+    result_filter = PineconeResultFilter(None)
+    pool = CandidatePool(["a", "b", "c", "d"])
+    results = [
+        {"mb_sn": "x", "score": 0.99},  # 이전 단계 후보가 아니므로 제외
+        {"mb_sn": "c", "score": 0.9},
+        {"mb_sn": "a", "score": 0.7},
+        {"mb_sn": "c", "score": 0.6},   # 같은 패널의 낮은 점수는 무시
+        {"mb_sn": "d", "score": 0.8},
+    ]
+    next_pool, scores = result_filter._collect_stage(results, pool, has_category_filter=True, final_count=None)
+    assert list(next_pool) == ["c", "d", "a"]
+    assert scores == {"c": 0.9, "a": 0.7, "d": 0.8}
@@ -0,0 +1,60 @@
+"""Precomputed 응답 캐시 테스트 (버전 probe는 고정값)"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+from app.services.precomputed_cache import PrecomputedArtifactCache
+
+
+async def _probe(name):
+    return ("session", "v1")
+
+
+def test_concurrent_requests_build_once_and_release_lock():
+    builds = []
+
+    async def build():
+        builds.append(1)
+        await asyncio.sleep(0.01)
+        return Response(b"payload")
+
+    async def main():
+        cache = PrecomputedArtifactCache(probe=_probe)
+        responses = await asyncio.gather(*(cache.get_or_build("umap:json", build) for _ in range(3)))
+        return cache, responses
+
+    cache, responses = asyncio.run(main())
+    assert len(builds) == 1
+    assert all(r.body == b"payload" for r in responses)
+    assert cache._build_locks == {}
+
+
+def test_failed_build_releases_lock():
+    async def build():
+        raise HTTPException(status_code=404)
+
+    async def main():
+        cache = PrecomputedArtifactCache(probe=_probe)
+        with pytest.raises(HTTPException):
+            await cache.get_or_build("comparison:1:99", build)
+        return cache
+
+    cache = asyncio.run(main())
+    assert cache._build_locks == {}
+    assert cache.info()["payloads"] == 0
+
+
+def test_byte_budget_evicts_oldest():
+    async def main():
+        cache = PrecomputedArtifactCache(probe=_probe, max_bytes=250)
+        for i in range(3):
+            await cache.get_or_build(f"k{i}", lambda: asyncio.sleep(0, Response(b"x" * 100)))
+        await cache.get_or_build("big", lambda: asyncio.sleep(0, Response(b"x" * 300)))
+        return cache
+
+    info = asyncio.run(main()).info()
+    assert info["payloads"] == 2
+    assert info["bytes"] == 200
+    assert info["evictions"] == 1
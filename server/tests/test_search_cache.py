@@ -0,0 +1,66 @@
+"""검색 결과 캐시 테스트 (LRU/TTL/바이트 예산, 필터 정규화 키)"""
+from app.services import search_cache
+from app.services.search_cache import SearchResultCache, make_search_cache_key
+
+
+def _result(*mb_sns):
+    return {"mb_sns": list(mb_sns), "scores": {mb_sn: 0.5 for mb_sn in mb_sns}}
+
+
+def test_get_refreshes_lru_order():
+    cache = SearchResultCache(max_entries=2)
+    cache.set("a", _result("p1"))
+    cache.set("b", _result("p2"))
+    assert cache.get("a") is not None
+    cache.set("c", _result("p3"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(search_cache.time, "time", lambda: now[0])
+    cache = SearchResultCache(ttl_seconds=10)
+    cache.set("a", _result("p1"))
+    now[0] += 5
+    assert cache.get("a") is not None
+    now[0] += 6
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+
+def test_byte_budget_evicts_oldest():
+    size = SearchResultCache._estimate_bytes(_result("p1"))
+    cache = SearchResultCache(max_bytes=size * 2)
+    for key in ("a", "b", "c"):
+        assert cache.set(key, _result("p1"))
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.stats()["cache_bytes"] == size * 2
+
+
+def test_rejects_result_larger_than_budget():
+    cache = SearchResultCache(max_bytes=50)
+    assert cache.set("a", _result(*[f"p{i}" for i in range(20)])) is False
+    assert len(cache) == 0
+
+
+def test_key_ignores_filter_order_and_in_permutation():
+    first = {"기본정보": {"지역": {"$in": ["서울", "경기"]}, "성별": "여"}, "직업소득": {"개인소득_min": {"$lte": 500}}}
+    second = {"직업소득": {"개인소득_min": {"$lte": 500}}, "기본정보": {"성별": "여", "지역": {"$in": ["경기", "서울", "서울"]}}}
+    assert make_search_cache_key(" 서울  20대 ", 10, first) == make_search_cache_key("서울 20대", 10, second)
+    assert make_search_cache_key("q", 10, {}) == make_search_cache_key("q", 10, None)
+    assert make_search_cache_key("q", 10, first) != make_search_cache_key("q", 20, first)
+
+
+def test_get_returns_copy():
+    cache = SearchResultCache()
+    cache.set("a", {**_result("p1", "p2"), "relaxations": [{"label": "연령대 확장"}]})
+    result = cache.get("a")
+    result["mb_sns"].append("p3")
+    result["scores"]["p1"] = 0.0
+    result["relaxations"][0]["label"] = "changed"
+    assert cache.get("a") == {**_result("p1", "p2"), "relaxations": [{"label": "연령대 확장"}]}
@@ -0,0 +1,91 @@
+"""동일 요청 병합(single-flight) 테스트"""
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+def _work(calls, release: asyncio.Event, value="result"):
+    async def run():
+        calls.append(1)
+        await release.wait()
+        return value
+    return run
+
+
+def test_concurrent_calls_are_coalesced():
+    async def main():
+        flight, calls, release = SingleFlight(), [], asyncio.Event()
+        tasks = [asyncio.create_task(flight.do("k", _work(calls, release))) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(main())
+    assert results == ["result"] * 3
+    assert len(calls) == 1
+    assert flight.stats()["coalesced"] == 2
+    assert flight.stats()["inflight"] == 0
+
+
+def test_cancelling_one_waiter_keeps_shared_run():
+    async def main():
+        flight, calls, release = SingleFlight(), [], asyncio.Event()
+        first = asyncio.create_task(flight.do("k", _work(calls, release)))
+        second = asyncio.create_task(flight.do("k", _work(calls, release)))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return calls, await second
+
+    calls, result = asyncio.run(main())
+    assert result == "result"
+    assert len(calls) == 1
+
+
+def test_cancelling_all_waiters_cancels_shared_run():
+    async def main():
+        flight, release = SingleFlight(), asyncio.Event()
+        finished = []
+
+        async def work():
+            await release.wait()
+            finished.append(1)
+
+        tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        release.set()
+        await asyncio.sleep(0)
+        return flight, finished
+
+    flight, finished = asyncio.run(main())
+    assert finished == []
+    assert flight.stats()["inflight"] == 0
+
+
+def test_join_after_cancel_starts_fresh_run():
+    async def main():
+        flight, calls, release = SingleFlight(), [], asyncio.Event()
+        first = asyncio.create_task(flight.do("k", _work(calls, release, "old")))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        # 취소된 작업의 완료 콜백이 아직 실행되지 않은 시점에 같은 키로 요청
+        second = asyncio.create_task(flight.do("k", _work(calls, release, "new")))
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return calls, await second
+
+    calls, result = asyncio.run(main())
+    assert result == "new"
+    assert len(calls) == 2
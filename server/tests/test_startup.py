@@ -1,7 +1,7 @@
 """간단한 시작 테스트 스크립트"""
 import asyncio
 from app.main import app
-from app.db.session import engine, SessionLocal
+from app.db.engine_registry import get_async_engine, get_async_sessionmaker
 from sqlalchemy import text
 
 async def test_startup():
@@ -13,7 +13,9 @@ async def test_startup():
     print(f"  - Title: {app.title}")
     print(f"  - Version: {app.version}")
     
-    # 2. DB 엔진 체크
+    # 2. DB 엔진 체크 (공유 엔진은 이벤트 루프에 바인딩되므로 루프 안에서 조회)
+    engine = get_async_engine()
+    SessionLocal = get_async_sessionmaker()
     print(f"\n[OK] DB Engine: {engine is not None}")
     print(f"[OK] SessionLocal: {SessionLocal is not None}")
     